@@ -0,0 +1,200 @@
+"""창 소스 백엔드 - 세션별 선택 결과, 이벤트 vs 폴링 감지 지연/조회 횟수, sway IPC 왕복, gdbus 출력 파싱"""
+import os
+import json
+import time
+import select
+import socket
+import asyncio
+import tempfile
+import threading
+from pathlib import Path
+
+from common import summarize
+
+from models.records import WindowInfo
+from services.backends import candidates
+from services.backends.gnome_shell import GVariantText
+from services.backends.scripted import ScriptedWindowSource
+from services.backends.sway_ipc import SwayIpcSource, MAGIC, HEADER, GET_TREE, SUBSCRIBE, EVENT_WINDOW
+
+SESSIONS = {
+    "x11": {"DISPLAY": ":0", "XDG_SESSION_TYPE": "x11"},
+    "i3": {"DISPLAY": ":0", "XDG_SESSION_TYPE": "x11", "I3SOCK": "{sock}"},
+    "sway": {"WAYLAND_DISPLAY": "wayland-1", "XDG_SESSION_TYPE": "wayland", "DISPLAY": ":0",
+             "SWAYSOCK": "{sock}"},
+    "gnome-wayland": {"WAYLAND_DISPLAY": "wayland-0", "XDG_SESSION_TYPE": "wayland", "DISPLAY": ":0",
+                      "XDG_CURRENT_DESKTOP": "ubuntu:GNOME"},
+    "kde-wayland": {"WAYLAND_DISPLAY": "wayland-0", "XDG_SESSION_TYPE": "wayland", "DISPLAY": ":0",
+                    "XDG_CURRENT_DESKTOP": "KDE"},
+}
+
+GETWINDOWS_SAMPLE = (
+    "({uint64 2418410139: {'title': <'● parser.py - focus-guardian - Visual Studio Code'>, "
+    "'app-id': <'code.desktop'>, 'client-type': <uint32 0>, 'is-hidden': <false>, "
+    "'has-focus': <true>, 'width': <uint32 1920>, 'height': <uint32 1080>, "
+    "'wm-class': <'Code'>, 'pid': <uint64 4242>}, "
+    "uint64 2418410140: {'title': <\"Don't panic \\u2014 YouTube\">, 'app-id': <'firefox.desktop'>, "
+    "'has-focus': <false>, 'wm-class': <'firefox'>, 'sandboxed-app-id': <@ms nothing>}},)"
+)
+
+
+def selection(sock: str) -> dict:
+    """세션 환경별 후보 순서 (probe만, 실제 연결 없음)"""
+    return {name: [cls.name for cls in candidates({k: v.format(sock=sock) for k, v in env.items()})]
+            for name, env in SESSIONS.items()}
+
+
+def parse_gvariant(iterations: int) -> dict:
+    windows = GVariantText.parse(GETWINDOWS_SAMPLE)[0]
+    focused = next(props for props in windows.values() if props["has-focus"])
+    samples = []
+    for _ in range(iterations):
+        began = time.perf_counter()
+        GVariantText.parse(GETWINDOWS_SAMPLE)
+        samples.append(time.perf_counter() - began)
+    return {"windows": len(windows), "focused": focused["wm-class"], "pid": focused["pid"],
+            "other_title": windows[2418410140]["title"], **summarize(samples)}
+
+
+class FakeSway:
+    """sway IPC 흉내 - GET_TREE, SUBSCRIBE 응답과 window 이벤트 전송"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(path)
+        self.server.listen()
+        self.subscribers = []
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    @staticmethod
+    def _message(kind: int, payload) -> bytes:
+        data = json.dumps(payload).encode()
+        return MAGIC + HEADER.pack(len(data), kind) + data
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn: socket.socket):
+        while True:
+            header = conn.recv(len(MAGIC) + HEADER.size)
+            if not header:
+                return
+            length, kind = HEADER.unpack(header[len(MAGIC):])
+            if length:
+                conn.recv(length)
+            if kind == GET_TREE:
+                conn.sendall(self._message(GET_TREE, {"type": "root", "nodes": [{
+                    "type": "output", "nodes": [self.container(1, "Terminal", "foot")]}]}))
+            elif kind == SUBSCRIBE:
+                # 응답 전에 등록 (응답을 받자마자 보내는 이벤트도 전달되도록)
+                self.subscribers.append(conn)
+                conn.sendall(self._message(SUBSCRIBE, {"success": True}))
+
+    @staticmethod
+    def container(con_id: int, title: str, app_id: str) -> dict:
+        return {"id": con_id, "type": "con", "focused": True, "name": title, "app_id": app_id,
+                "pid": os.getpid(), "window_properties": None}
+
+    def focus(self, con_id: int, title: str, app_id: str):
+        event = self._message(EVENT_WINDOW, {"change": "focus",
+                                             "container": self.container(con_id, title, app_id)})
+        for conn in self.subscribers:
+            conn.sendall(event)
+
+    def close(self):
+        self.server.close()
+
+
+def sway_round_trip(tmp: Path, switches: int) -> dict:
+    """포커스 이벤트 전송 → drain → read_window까지"""
+    fake = FakeSway(str(tmp / "sway.sock"))
+    os.environ["SWAYSOCK"] = fake.path
+    source = SwayIpcSource()
+    try:
+        opened = source.open()
+        initial = source.read_window()
+        samples = []
+        for i in range(switches):
+            began = time.perf_counter()
+            fake.focus(100 + i, f"video {i} - YouTube — Mozilla Firefox", "firefox")
+            select.select([source.fileno()], [], [], 1)
+            # 한 번에 다 안 올 수 있으므로 창이 바뀔 때까지 소비
+            while not (source.drain() and source.read_window().window_id == str(100 + i)):
+                select.select([source.fileno()], [], [], 1)
+            samples.append(time.perf_counter() - began)
+        last = source.read_window()
+    finally:
+        source.close()
+        fake.close()
+        del os.environ["SWAYSOCK"]
+    return {
+        "opened": opened,
+        "initial": initial.app_name if initial else None,
+        "last": [last.app_name, last.title],
+        "event_to_window": summarize(samples),
+    }
+
+
+def detection(event_driven: bool, switches: int, gap: float, poll: float) -> dict:
+    """창을 gap초마다 바꿀 때 감지 지연과 조회 횟수 (이벤트 fd vs interval 폴링)"""
+    source = ScriptedWindowSource(WindowInfo("0", "start", "Code", "code"))
+    if event_driven:
+        source.open()
+    pushed_at = {}
+    latencies = []
+
+    async def main():
+        async def pusher():
+            for i in range(switches):
+                await asyncio.sleep(gap)
+                pushed_at[str(i + 1)] = time.perf_counter()
+                source.push(WindowInfo(str(i + 1), f"window {i}", "firefox", "firefox"))
+
+        task = asyncio.create_task(pusher())
+        current = None
+        async for window in source.windows(poll):
+            if window.window_id != current:
+                current = window.window_id
+                if current in pushed_at:
+                    latencies.append(time.perf_counter() - pushed_at[current])
+                # 폴링은 간격보다 짧게 머문 창을 건너뛰므로 마지막 창까지만
+                if current == str(switches):
+                    break
+        await task
+
+    began = time.perf_counter()
+    asyncio.run(main())
+    seconds = time.perf_counter() - began
+    source.close()
+    return {
+        "reads": source.reads,
+        "reads_per_minute": source.reads / seconds * 60,
+        "missed": switches - len(latencies),
+        "latency": summarize(latencies),
+    }
+
+
+def run(quick: bool = False) -> dict:
+    switches = 20 if quick else 100
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        sock = tmp / "probe.sock"
+        sock.touch()
+        return {
+            "selection": selection(str(sock)),
+            "gvariant": parse_gvariant(200 if quick else 2_000),
+            "sway_ipc": sway_round_trip(tmp, switches),
+            # 폴링 간격 0.1초, 창 전환 0.05초마다 (실제로는 0.5초/수십 초지만 비율은 같음)
+            "poll": detection(False, switches, gap=0.05, poll=0.1),
+            "event": detection(True, switches, gap=0.05, poll=0.1),
+        }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(quick=True), indent=2, ensure_ascii=False))
@@ -0,0 +1,99 @@
+"""AppClassifier.classify 처리량 - 규칙 수 10 ~ 5,000 (제목 규칙, 탭 URL 도메인 규칙)"""
+from common import seeded_random, throughput
+
+from services.window_monitor import AppClassifier, WindowInfo
+
+
+RULE_COUNTS = (10, 100, 1000, 5000)
+QUICK_RULE_COUNTS = (10, 100, 1000)
+
+WORDS = (
+    "alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel",
+    "india", "juliet", "kilo", "lima", "mike", "november", "oscar", "papa",
+)
+
+
+def make_categories(rule_count: int, seed: int = 1) -> list:
+    """규칙 rule_count개짜리 카테고리 설정 (리터럴 약 70%, 정규식 약 30%)"""
+    rng = seeded_random(seed)
+    types = ("entertainment", "work", "neutral")
+    categories = [
+        {"id": f"cat{i}", "name": f"Category {i}", "type": types[i % 3],
+         "apps": [], "title_patterns": [], "domains": []}
+        for i in range(max(3, rule_count // 50))
+    ]
+    for i in range(rule_count):
+        category = categories[i % len(categories)]
+        category["domains"].append(f"site{i}.example")
+        word = f"{rng.choice(WORDS)}{i}"
+        if rng.random() < 0.3:
+            category["title_patterns"].append(rf"{word}\s+\d+")
+        elif rng.random() < 0.5:
+            category["apps"].append(f"app{i}")
+        else:
+            category["title_patterns"].append(word.capitalize())
+    return categories
+
+
+def make_titles(count: int, rule_count: int, seed: int = 2) -> list:
+    """제목 목록 - 절반은 규칙에 걸리지 않음 (최악 경로)"""
+    rng = seeded_random(seed)
+    titles = []
+    for i in range(count):
+        if rng.random() < 0.5:
+            titles.append(f"Untitled document {i} - Editor")
+        else:
+            titles.append(f"{rng.choice(WORDS).capitalize()}{rng.randrange(rule_count)} - page {i}")
+    return titles
+
+
+def run(quick: bool = False) -> dict:
+    results = {}
+    iterations = 2000 if quick else 20000
+    for rule_count in (QUICK_RULE_COUNTS if quick else RULE_COUNTS):
+        categories = make_categories(rule_count)
+        # 규칙이 많으면 미스 경로가 느리므로 반복 수를 줄임
+        cold_iterations = max(500, min(iterations, 2_000_000 // rule_count))
+        titles = make_titles(cold_iterations, rule_count)
+        windows = [WindowInfo(str(i), t, "browser", "browser") for i, t in enumerate(titles)]
+
+        # 캐시 미스 경로: 매번 새로운 제목
+        classifier = AppClassifier(categories)
+        classifier.classify(windows[0])  # 규칙 컴파일은 측정에서 제외
+        it = iter(windows)
+        cold = throughput(lambda: classifier.classify(next(it)), cold_iterations - 1)
+
+        # 캐시 적중 경로: 소수의 제목이 반복
+        hot_windows = windows[:32]
+        for w in hot_windows:
+            classifier.classify(w)
+        n = 0
+
+        def classify_hot():
+            nonlocal n
+            classifier.classify(hot_windows[n & 31])
+            n += 1
+
+        hot = throughput(classify_hot, iterations)
+
+        # 탭 URL이 있는 창: 도메인 트라이 (캐시 미스, 모두 규칙에 걸림)
+        rng = seeded_random(3)
+        url_windows = [
+            WindowInfo(str(i), f"Page {i}", "browser", "browser",
+                       f"https://www.site{rng.randrange(rule_count)}.example/page/{i}")
+            for i in range(cold_iterations)
+        ]
+        it = iter(url_windows)
+        url_cold = throughput(lambda: classifier.classify(next(it)), cold_iterations)
+
+        results[str(rule_count)] = {
+            "uncached_per_sec": cold,
+            "cached_per_sec": hot,
+            "url_uncached_per_sec": url_cold,
+        }
+    return results
+
+
+if __name__ == "__main__":
+    import json
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,121 @@
+"""Database 쓰기/통계 지연 - 이력 0 ~ 1M 행 (전환 기록은 월별 파티션)"""
+import time
+import uuid
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from common import seeded_random, summarize
+
+from models.database import Database
+
+
+HISTORY_SIZES = (0, 10_000, 100_000, 1_000_000)
+QUICK_HISTORY_SIZES = (0, 1_000, 10_000)
+
+# 세션당 평균 전환 이벤트 수
+EVENTS_PER_SESSION = 20
+
+
+def populate(db: Database, rows: int, seed: int = 3):
+    """지난 1년에 걸친 switch_events rows개와 해당 세션 생성
+
+    전환 기록은 data.db의 기존 테이블에 넣어 두고, 다음에 열 때 월별 파티션으로 옮겨진다.
+    """
+    if rows == 0:
+        return
+    rng = seeded_random(seed)
+    now = datetime.now()
+    sessions = []
+    events = []
+    for s in range(max(1, rows // EVENTS_PER_SESSION)):
+        session_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        start = now - timedelta(days=rng.randrange(1, 365), minutes=rng.randrange(1440))
+        duration = rng.randrange(10, 90)
+        sessions.append((
+            session_id, start.isoformat(), (start + timedelta(minutes=duration)).isoformat(),
+            45, duration, "code", "coding", EVENTS_PER_SESSION, 10, 10, duration >= 45
+        ))
+        for e in range(EVENTS_PER_SESSION):
+            if len(events) >= rows:
+                break
+            events.append((
+                session_id, (start + timedelta(seconds=e * 30)).isoformat(),
+                "code", "firefox", e % 2 == 0, "continue" if e % 2 == 0 else "switch"
+            ))
+    db.conn.execute("BEGIN")
+    db.conn.executemany("""
+        INSERT INTO focus_sessions (id, start_time, end_time, target_duration, actual_duration,
+            app_name, category_id, switch_attempts, switches_blocked, switches_allowed, completed)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, sessions)
+    db.conn.executemany("""
+        INSERT INTO switch_events (session_id, timestamp, from_app, to_app, blocked, user_choice)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, events)
+    db.conn.commit()
+
+
+def measure(fn, iterations: int) -> dict:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def run(quick: bool = False) -> dict:
+    results = {}
+    for rows in (QUICK_HISTORY_SIZES if quick else HISTORY_SIZES):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = str(Path(tmp) / "bench.db")
+            db = Database(db_path)
+            populate(db, rows)
+            db.close()
+            # 기존 테이블 → 파티션 이동 (한 번만 일어나므로 열기 비용에서 제외)
+            start = time.perf_counter()
+            Database(db_path).close()
+            adopt_seconds = time.perf_counter() - start
+
+            # 스키마가 최신인 DB 열기 (시작 비용)
+            start = time.perf_counter()
+            db = Database(db_path)
+            open_seconds = time.perf_counter() - start
+
+            session_id = db.create_session(target_duration=45, app_name="code")
+            result = {
+                "open_us": open_seconds * 1e6,
+                "adopt_legacy_ms": adopt_seconds * 1e3,
+                "partitions": len(db.partitions.months()),
+                "record_switch_attempt": measure(
+                    lambda: db.record_switch_attempt(session_id, "code", "firefox", blocked=True,
+                                                     user_choice="continue"),
+                    100 if quick else 500
+                ),
+                "create_end_session": measure(
+                    lambda: db.end_session(db.create_session(target_duration=45)),
+                    50 if quick else 200
+                ),
+                "get_today_stats": measure(db.get_today_stats, 20 if quick else 100),
+                "get_active_session": measure(db.get_active_session, 20 if quick else 100),
+                # 최근 7일은 한두 달 파티션만, 1년은 전부 읽음
+                "daily_rollups_7d": measure(
+                    lambda: db.get_daily_rollups((date.today() - timedelta(days=7)).isoformat(),
+                                                 date.today().isoformat()),
+                    20 if quick else 100
+                ),
+                "daily_rollups_365d": measure(
+                    lambda: db.get_daily_rollups((date.today() - timedelta(days=365)).isoformat(),
+                                                 date.today().isoformat()),
+                    5 if quick else 20
+                ),
+            }
+            db.close()
+            results[str(rows)] = result
+    return results
+
+
+if __name__ == "__main__":
+    import json
+    print(json.dumps(run(quick=True), indent=2))
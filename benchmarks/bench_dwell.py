@@ -0,0 +1,124 @@
+"""카테고리별 체류 시간 집계 - 전환당 비용, 차트 데이터 계산(집계 셀 vs 원시 구간 합산), 시작 시 로드"""
+import json
+import time
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+from common import qt_app, summarize
+from bench_pipeline import load_categories
+
+from models.database import Database
+from models.records import WindowInfo
+from services.dwell_rollup import DwellRollup
+from services.replay import ScriptedWindowMonitor
+from services.window_monitor import AppClassifier
+from utils.workload import WorkloadGenerator
+
+
+class Clock:
+    """시뮬레이션 시각"""
+
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def simulate(rollup: DwellRollup, monitor: ScriptedWindowMonitor, clock: Clock,
+             days: int, hours: float = 8) -> tuple:
+    """하루 hours시간씩 days일 창 전환, 반환: (전환 지연 샘플, 원시 구간 목록)"""
+    classifier = rollup.session_manager.app_classifier
+    samples = []
+    intervals = []
+    first_day = clock.now.replace(hour=9, minute=0, second=0, microsecond=0) - timedelta(days=days - 1)
+    events = WorkloadGenerator(mix="mixed", seed=13).generate(float('inf'))
+    for day in range(days):
+        start = first_day + timedelta(days=day)
+        previous = None
+        for event in events:
+            if event.t >= hours * 3600 * (day + 1):
+                break
+            clock.now = start + timedelta(seconds=event.t - hours * 3600 * day)
+            window = WindowInfo(event.window_id, event.title, event.app_name, event.process_name)
+            if previous:
+                intervals.append((previous[0], clock.now, classifier.classify(previous[1]).id))
+            previous = (clock.now, window)
+            began = time.perf_counter()
+            monitor.push(window)
+            samples.append(time.perf_counter() - began)
+        clock.now = start + timedelta(hours=hours)
+        rollup.observe(None)
+        if previous:
+            intervals.append((previous[0], clock.now, classifier.classify(previous[1]).id))
+        rollup.flush()
+    return samples, intervals
+
+
+def per_call(fn, iterations: int) -> dict:
+    samples = []
+    for _ in range(iterations):
+        began = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - began)
+    return summarize(samples)
+
+
+def raw_charts(intervals: list, today: datetime):
+    """비교용: 원시 구간을 매번 합산 (주간 막대 + 카테고리별 분포)"""
+    first = (today - timedelta(days=6)).date()
+    daily, shares = {}, {}
+    for start, end, category_id in intervals:
+        if start.date() < first:
+            continue
+        seconds = (end - start).total_seconds()
+        daily[start.date()] = daily.get(start.date(), 0.0) + seconds
+        shares[category_id] = shares.get(category_id, 0.0) + seconds
+    return daily, shares
+
+
+def run(quick: bool = False) -> dict:
+    days = 30 if quick else 365
+    qt_app()
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(str(Path(tmp) / "dwell.db"))
+        monitor = ScriptedWindowMonitor()
+        monitor.start()
+        manager = SimpleNamespace(window_monitor=monitor, app_classifier=AppClassifier(load_categories()))
+        clock = Clock(datetime.now().replace(hour=20, minute=0, second=0, microsecond=0))
+        rollup = DwellRollup(db, manager, clock=clock)
+        rollup.start()
+
+        began = time.perf_counter()
+        samples, intervals = simulate(rollup, monitor, clock, days)
+        simulate_seconds = time.perf_counter() - began
+
+        def charts():
+            rollup.daily_totals(7, 'work')
+            rollup.distribution(7)
+            rollup.sparkline.values('work', clock.now)
+
+        week = rollup.daily_totals(7, 'work')
+        results = {
+            "days": days,
+            "switches": len(samples),
+            "switches_per_sec": len(samples) / simulate_seconds,
+            "window_changed": summarize(samples),
+            "cells": rollup.cell_count,
+            "raw_intervals": len(intervals),
+            "charts": per_call(charts, 500),
+            "raw_charts": per_call(lambda: raw_charts(intervals, clock.now), 20),
+            "week_work_minutes": [round(seconds / 60) for _, seconds in week],
+            "distribution": [(category.id, round(seconds / 60)) for category, seconds in rollup.distribution(7)],
+            "db_rows": db.conn.execute("SELECT COUNT(*) FROM category_dwell").fetchone()[0],
+        }
+        results["load"] = per_call(rollup.load, 50)
+        rollup.stop()
+        db.close()
+    return results
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(quick=True), indent=2, ensure_ascii=False))
@@ -0,0 +1,137 @@
+"""팀 집계 - 수집 서버 수신 처리량, 업로더 → 수집 서버 왕복 (재시도 포함)"""
+import gzip
+import json
+import time
+import uuid
+import tempfile
+import threading
+import http.client
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from common import qt_app
+from PySide6.QtCore import QEventLoop, QTimer
+
+from fleet_collector import CollectorServer
+from models.database import Database
+from services.fleet import FleetUploader, Outbox
+
+
+def make_batch(seat: str, days: int = 7) -> bytes:
+    today = date.today()
+    rollups = [{
+        "date": (today - timedelta(days=d)).isoformat(),
+        "focus_minutes": 180 + d, "sessions_completed": 3, "sessions_abandoned": 1,
+        "switch_attempts": 40, "switches_blocked": 12, "focus_phases_completed": 4,
+        "category_minutes": {"coding": 150, "browser_work": 30 + d},
+    } for d in range(1, days + 1)]
+    payload = {"version": 1, "batch_id": str(uuid.uuid4()), "seat": seat, "team": "team-a",
+               "created": datetime.now().isoformat(timespec='seconds'), "rollups": rollups}
+    return gzip.compress(json.dumps(payload).encode())
+
+
+def start_collector(db_path: str):
+    server = CollectorServer(("127.0.0.1", 0), db_path)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def ingest(port: int, batches: int, clients: int) -> float:
+    """clients개 연결(keep-alive)이 나눠서 전송, 초당 배치 수"""
+    bodies = [make_batch(f"seat-{i % 500}") for i in range(batches)]
+    errors = []
+
+    def worker(chunk):
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        for body in chunk:
+            conn.request("POST", "/v1/rollups", body=body,
+                         headers={"Content-Type": "application/json", "Content-Encoding": "gzip"})
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                errors.append(response.status)
+        conn.close()
+
+    threads = [threading.Thread(target=worker, args=(bodies[i::clients],)) for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    if errors:
+        raise RuntimeError(f"수집 실패 {len(errors)}건: {errors[:5]}")
+    return batches / elapsed
+
+
+def wait_for(condition, timeout: float = 10.0) -> bool:
+    loop = QEventLoop()
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        QTimer.singleShot(10, loop.quit)
+        loop.exec()
+    return condition()
+
+
+def round_trip(tmp: Path) -> dict:
+    """어제 세션이 있는 DB → 업로더 → (먼저 꺼진 서버로 실패) → 서버 기동 후 재시도 성공"""
+    qt_app()
+    db = Database(str(tmp / "app.db"))
+    yesterday = datetime.now() - timedelta(days=1)
+    session_id = db.create_session(target_duration=30, category_id="coding")
+    db.conn.execute("UPDATE focus_sessions SET start_time = ? WHERE id = ?",
+                    (yesterday.isoformat(), session_id))
+    db.end_session(session_id, completed=True, end_time=yesterday + timedelta(minutes=40))
+
+    server = start_collector(str(tmp / "down.db"))
+    dead_port = server.server_port
+    server.shutdown()
+    server.server_close()
+
+    outbox = Outbox(tmp / "outbox")
+    uploader = FleetUploader(db, f"http://127.0.0.1:{dead_port}/v1/rollups", team="team-a",
+                             outbox=outbox)
+    failures, uploads = [], []
+    uploader.upload_failed.connect(failures.append)
+    uploader.uploaded.connect(uploads.append)
+    uploader.sync()
+    wait_for(lambda: failures)
+    queued = len(outbox.pending())
+
+    server = start_collector(str(tmp / "collector.db"))
+    uploader.configure(f"http://127.0.0.1:{server.server_port}/v1/rollups", team="team-a")
+    uploader._retry_timer.start(0)  # 백오프 대기 생략
+    delivered = wait_for(lambda: uploads)
+    summary = server.writer.team_summary()
+    server.shutdown()
+    server.server_close()
+    db.close()
+    return {
+        "failed_attempts": len(failures),
+        "queued_while_down": queued,
+        "delivered": bool(delivered),
+        "outbox_after": len(outbox.pending()),
+        "collector_focus_minutes": summary[0]["focus_minutes"] if summary else None,
+    }
+
+
+def run(quick: bool = False) -> dict:
+    batches = 2_000 if quick else 20_000
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        server = start_collector(str(tmp / "ingest.db"))
+        rate = ingest(server.server_port, batches, clients=16)
+        commits = server.writer.commits
+        server.shutdown()
+        server.server_close()
+        result = {
+            "batches": batches,
+            "ingest_batches_per_sec": rate,
+            "batches_per_commit": batches / max(commits, 1),
+            "round_trip": round_trip(tmp),
+        }
+    return result
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(quick=True), indent=2))
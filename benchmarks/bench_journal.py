@@ -0,0 +1,57 @@
+"""세션 저널 - 하트비트/상태 기록 비용, 긴 세션 저널 복구 시간"""
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from common import summarize
+
+from models.journal import SessionJournal
+
+
+SESSION = {
+    "id": "00000000-0000-0000-0000-000000000000",
+    "target_duration": 480,
+    "app_name": "code",
+    "category_id": "coding",
+    "start_time": "2026-01-01T09:00:00",
+    "paused": False,
+    "pause_start": None,
+    "total_paused_seconds": 0.0,
+}
+
+
+def timed(fn, count: int) -> list:
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def run(quick: bool = False) -> dict:
+    # 8시간 세션, 15초 하트비트
+    beats = 8 * 60 * 4
+    transitions = 20 if quick else 100
+
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = SessionJournal(Path(tmp) / "session.journal")
+        journal.begin(SESSION)
+        heartbeat = timed(journal.heartbeat, beats)
+        state = timed(lambda: journal.record_state(SESSION), transitions)
+        size = journal.path.stat().st_size
+        journal.close()
+
+        recover = timed(lambda: SessionJournal(journal.path).recover(), 5 if quick else 20)
+
+    return {
+        "heartbeat": summarize(heartbeat),
+        "state_fsync": summarize(state),
+        "recover_8h": summarize(recover),
+        "journal_bytes_8h": size,
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(quick=True), indent=2))
@@ -0,0 +1,92 @@
+"""12시간 사용 시뮬레이션 중 메모리 증가량"""
+import gc
+import json
+import resource
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from common import seeded_random
+from bench_pipeline import build_pipeline
+
+from services.window_monitor import WindowInfo
+
+
+POLLS_PER_HOUR = 3600 * 2  # 500ms 폴링
+SESSION_POLLS = 45 * 60 * 2  # 45분 세션
+
+
+WARMUP_POLLS = 1000
+
+
+def make_day(seed: int = 5):
+    """폴링마다 반환될 창 시퀀스 (전환 간격 5초 ~ 2분, 제목 변화 포함)"""
+    rng = seeded_random(seed)
+    apps = [
+        ("Code", "code", "{n} - main.py - Visual Studio Code"),
+        ("firefox", "firefox", "Issue #{n} - GitHub - Mozilla Firefox"),
+        ("firefox", "firefox", "Video {n} - YouTube - Mozilla Firefox"),
+        ("Slack", "slack", "({n}) Slack - general"),
+        ("gnome-terminal-server", "gnome-terminal-", "user@host: ~/project{n}"),
+    ]
+    window = None
+    remaining = 0
+    while True:
+        if remaining == 0:
+            app_name, process, title = rng.choice(apps)
+            window = WindowInfo(
+                window_id=str(rng.randrange(1, 40)),
+                title=title.format(n=rng.randrange(1000)),
+                app_name=app_name,
+                process_name=process
+            )
+            remaining = rng.randrange(10, 240)
+        remaining -= 1
+        yield window
+
+
+def run(quick: bool = False) -> dict:
+    hours = 1 if quick else 12
+    with tempfile.TemporaryDirectory() as tmp:
+        db, monitor, notifications, manager = build_pipeline(str(Path(tmp) / "bench.db"))
+        day = make_day()
+
+        # 워밍업 (캐시, 지연 초기화 등)
+        for _ in range(WARMUP_POLLS):
+            monitor.push(next(day))
+        gc.collect()
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        hourly = []
+        manager.start_session(duration=45)
+        for polls in range(1, hours * POLLS_PER_HOUR + 1):
+            monitor.push(next(day))
+            if polls % SESSION_POLLS == 0:
+                manager.end_session(completed=True)
+                manager.start_session(duration=45)
+            if polls % POLLS_PER_HOUR == 0:
+                gc.collect()
+                hourly.append(tracemalloc.get_traced_memory()[0] - baseline)
+        manager.end_session(completed=False)
+
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        db.close()
+
+    return {
+        "simulated_hours": hours,
+        "polls": polls,
+        "switches_notified": notifications.reminder_count,
+        "traced_growth_bytes": current - baseline,
+        "traced_peak_bytes": peak - baseline,
+        "hourly_growth_bytes": hourly,
+        "max_rss_growth_kb": rss_after - rss_before,
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(quick=True), indent=2))
@@ -0,0 +1,101 @@
+"""집중 패턴 모델 - 갱신/추천 지연, 스냅샷 크기, DB 이력 부트스트랩, 추천이 습관을 따라가는지"""
+import json
+import time
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from common import seeded_random, summarize
+
+from models.database import Database
+from services.focus_patterns import FocusPatterns
+
+CATEGORIES = ("coding", "browser_work", "documents", None)
+
+
+def simulate(patterns: FocusPatterns, days: int, seed: int = 5) -> int:
+    """오전에는 길게(50~70분), 오후에는 짧게(15~30분) 집중하는 사용자, 반환: 세션 수"""
+    rng = seeded_random(seed)
+    start_day = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days)
+    sessions = 0
+    for day in range(days):
+        for hour in (9, 10, 11, 14, 15, 16):
+            start = start_day + timedelta(days=day, hours=hour)
+            minutes = rng.randrange(50, 71) if hour < 12 else rng.randrange(15, 31)
+            category = rng.choice(CATEGORIES)
+            for _ in range(rng.randrange(0, 6 if hour < 12 else 15)):
+                patterns.observe_switch(start, category, blocked=rng.random() < 0.5,
+                                        now=start.timestamp())
+            patterns.observe_session(start, minutes, completed=rng.random() < 0.8,
+                                     category=category, now=(start + timedelta(minutes=minutes)).timestamp())
+            sessions += 1
+    return sessions
+
+
+def per_call(fn, iterations: int) -> dict:
+    samples = []
+    for _ in range(iterations):
+        began = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - began)
+    return summarize(samples)
+
+
+def populate_db(db: Database, sessions: int, seed: int = 9):
+    rng = seeded_random(seed)
+    now = datetime.now()
+    rows = []
+    for i in range(sessions):
+        start = now - timedelta(days=180 * (sessions - i) / sessions, hours=rng.randrange(8))
+        duration = rng.randrange(10, 90)
+        rows.append((f"s{i}", start.isoformat(), (start + timedelta(minutes=duration)).isoformat(),
+                     45, duration, "coding", duration >= 45, rng.randrange(20), rng.randrange(10)))
+    db.conn.executemany("""
+        INSERT INTO focus_sessions (id, start_time, end_time, target_duration, actual_duration,
+            category_id, completed, switch_attempts, switches_blocked)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows)
+    db.conn.commit()
+
+
+def run(quick: bool = False) -> dict:
+    days = 60 if quick else 365
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        patterns = FocusPatterns(tmp / "patterns.json")
+        began = time.perf_counter()
+        sessions = simulate(patterns, days)
+        simulate_seconds = time.perf_counter() - began
+
+        morning = datetime.now().replace(hour=10, minute=0)
+        afternoon = datetime.now().replace(hour=15, minute=0)
+        start = datetime.now()
+        results = {
+            "sessions": sessions,
+            "observe_per_sec": sessions * 6 / simulate_seconds,  # 세션 1 + 전환 평균 ~5
+            "observe_session": per_call(
+                lambda: patterns.observe_session(start, 30, True, "coding"), 2_000),
+            "observe_switch": per_call(
+                lambda: patterns.observe_switch(start, "coding", True), 2_000),
+            "suggest_duration": per_call(
+                lambda: patterns.suggest_duration(morning), 2_000),
+            "suggest_morning": patterns.suggest_duration(morning)._asdict(),
+            "suggest_afternoon": patterns.suggest_duration(afternoon)._asdict(),
+        }
+        patterns.save()
+        results["snapshot_bytes"] = (tmp / "patterns.json").stat().st_size
+        results["load"] = per_call(FocusPatterns(tmp / "patterns.json").load, 50)
+
+        db = Database(str(tmp / "history.db"))
+        populate_db(db, 500 if quick else 5_000)
+        bootstrapped = FocusPatterns(tmp / "boot.json")
+        began = time.perf_counter()
+        bootstrapped.bootstrap(db)
+        results["bootstrap_ms"] = (time.perf_counter() - began) * 1e3
+        results["bootstrap_suggestion"] = bootstrapped.suggest_duration()._asdict()
+        db.close()
+    return results
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(quick=True), indent=2))
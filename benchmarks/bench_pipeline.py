@@ -0,0 +1,106 @@
+"""window_changed → 결정 지연 (SessionManager 경유, asyncio 파이프라인)"""
+import json
+import time
+import asyncio
+import tempfile
+from pathlib import Path
+
+from common import qt_app, summarize
+
+from models.database import Database
+from services.replay import NotificationSink, ScriptedWindowMonitor
+from services.window_monitor import AppClassifier, WindowInfo
+from services.session_manager import SessionManager
+from services.pipeline import AsyncPipeline
+
+
+DEFAULT_CONFIG = Path(__file__).resolve().parent.parent / "config" / "default_settings.json"
+
+
+def load_categories() -> list:
+    with open(DEFAULT_CONFIG, 'r', encoding='utf-8') as f:
+        return json.load(f)["categories"]
+
+
+def build_pipeline(db_path: str, auto_choice: str = "continue"):
+    """가짜 모니터/알림으로 구성한 세션 파이프라인"""
+    qt_app()
+    db = Database(db_path)
+    monitor = ScriptedWindowMonitor()
+    notifications = NotificationSink(choice=lambda _: auto_choice)
+    manager = SessionManager(
+        db=db,
+        window_monitor=monitor,
+        app_classifier=AppClassifier(load_categories()),
+        notification_service=notifications
+    )
+    return db, monitor, notifications, manager
+
+
+def run_async(windows: list, queue_size: int = 64) -> dict:
+    """asyncio 파이프라인 처리량 (프로브 대신 목록을 그대로 흘려 보냄)"""
+    decisions = []
+
+    async def source():
+        for window in windows:
+            yield window
+
+    async def main():
+        pipeline = AsyncPipeline(
+            read_window=None,
+            classifier=AppClassifier(load_categories()),
+            session_active=lambda: True,
+            on_decision=decisions.append,
+            queue_size=queue_size
+        )
+        start = time.perf_counter()
+        await pipeline.run(source())
+        return time.perf_counter() - start
+
+    seconds = asyncio.run(main())
+    return {
+        "queue_size": queue_size,
+        "windows": len(windows),
+        "decisions": len(decisions),
+        "windows_per_second": round(len(windows) / seconds, 1),
+    }
+
+
+def run(quick: bool = False) -> dict:
+    iterations = 500 if quick else 5000
+    work = [WindowInfo(f"w{i}", f"main.py - project{i % 7} - Visual Studio Code", "Code", "code")
+            for i in range(16)]
+    distractions = [WindowInfo(f"e{i}", f"Video {i} - YouTube - Mozilla Firefox", "firefox", "firefox")
+                    for i in range(16)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db, monitor, notifications, manager = build_pipeline(str(Path(tmp) / "bench.db"))
+        monitor.push(work[0])
+        manager.start_session(duration=45)
+
+        work_samples = []
+        distraction_samples = []
+        for i in range(iterations):
+            # 작업 창 간 전환 (허용 - 결정은 '무시')
+            start = time.perf_counter()
+            monitor.push(work[i % 16])
+            work_samples.append(time.perf_counter() - start)
+
+            # 엔터테인먼트 전환 (결정 = 토스트 표시 + 차단 기록)
+            start = time.perf_counter()
+            monitor.push(distractions[i % 16])
+            distraction_samples.append(notifications.reminders[-1] - start)
+
+        manager.end_session(completed=False)
+        db.close()
+
+    mixed = [w for pair in zip(work, distractions) for w in pair] * (iterations // 16)
+    return {
+        "work_switch": summarize(work_samples),
+        "distraction_to_reminder": summarize(distraction_samples),
+        "async_pipeline": [run_async(mixed, size) for size in (1, 64)],
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(quick=True), indent=2))
@@ -0,0 +1,124 @@
+"""방해 예측/토스트 미리 준비 - 토스트 표시 지연(새로 생성 vs 미리 준비), 다음 상태 예측 정확도"""
+import json
+import time
+
+from common import qt_app, seeded_random, summarize
+from bench_pipeline import load_categories
+
+from models.records import WindowInfo
+from services.distraction_predictor import DistractionPredictor, TransitionModel, state_key, state_type
+from services.notification import NotificationService
+from services.window_monitor import AppClassifier
+from utils.workload import WorkloadGenerator
+
+# 한 프레임 (60Hz)
+FRAME_SECONDS = 1 / 60
+
+
+def toast_latency(iterations: int, prewarm: bool) -> dict:
+    """show_focus_reminder 호출 + 이벤트 한 번 처리까지 (첫 프레임이 그려지는 시점)"""
+    app = qt_app()
+    service = NotificationService(sound_enabled=False)
+    samples = []
+    for _ in range(iterations):
+        if prewarm:
+            service.prewarm()
+            app.processEvents()
+        began = time.perf_counter()
+        toast = service.show_focus_reminder(remaining_minutes=12)
+        app.processEvents()
+        samples.append(time.perf_counter() - began)
+        toast.close()
+        toast.deleteLater()
+        app.processEvents()
+    result = summarize(samples)
+    result["within_frame"] = sum(s <= FRAME_SECONDS for s in samples) / len(samples)
+    return result
+
+
+def habitual_trace(seed: int = 21, windows: int = 40, successors: int = 3):
+    """
+    습관이 있는 사용자 트레이스 (무한 반복자)
+
+    WorkloadGenerator는 창을 서로 독립으로 고르므로(몰아치기 제외) 예측할 구조가 거의 없다.
+    여기서는 그 창들 중 windows개를 뽑아 창마다 선호하는 다음 창 successors개를 정해 두고,
+    80%는 그중에서, 20%는 아무 창으로나 넘어간다.
+    """
+    rng = seeded_random(seed)
+    pool, seen = [], set()
+    for event in WorkloadGenerator(mix="mixed", seed=seed).generate(float('inf')):
+        if (event.app_name, event.title) not in seen:
+            seen.add((event.app_name, event.title))
+            pool.append(WindowInfo(event.window_id, event.title, event.app_name, event.process_name))
+        if len(pool) >= windows:
+            break
+    habits = [rng.sample(range(windows), successors) for _ in range(windows)]
+    current = 0
+    while True:
+        yield pool[current]
+        if rng.random() < 0.8:
+            current = rng.choices(habits[current], weights=[4, 2, 1][:successors])[0]
+        else:
+            current = rng.randrange(windows)
+
+
+def prediction_accuracy(trace, events: int) -> dict:
+    """다음 상태(앱+분류 종류) 예측 적중률, 방해 전환 중 미리 준비된 비율"""
+    classifier = AppClassifier(load_categories())
+    model = TransitionModel()
+    top1 = top3 = predicted = 0
+    distractions = prewarmed = prewarm_calls = 0
+    previous = None
+    warm = False
+    for window in trace:
+        category_type = classifier.classify(window).type
+        state = state_key(window.app_name, category_type)
+        if state == previous:
+            continue
+        if previous:
+            candidates = model.predict(previous, DistractionPredictor.TOP_K)
+            if candidates:
+                predicted += 1
+                top1 += candidates[0][0] == state
+                top3 += any(candidate == state for candidate, _p in candidates)
+            if category_type == 'entertainment' and state_type(previous) != 'entertainment':
+                distractions += 1
+                prewarmed += warm
+            model.observe(previous, state)
+        # DistractionPredictor.predict_next와 같은 판단
+        probability = sum(p for candidate, p in model.predict(state, DistractionPredictor.TOP_K)
+                          if state_type(candidate) == 'entertainment')
+        warm = probability >= DistractionPredictor.PREWARM_PROBABILITY
+        prewarm_calls += warm
+        previous = state
+        if predicted >= events:
+            break
+    return {
+        "switches": predicted,
+        "top1_hit_rate": top1 / max(predicted, 1),
+        "top3_hit_rate": top3 / max(predicted, 1),
+        "distractions": distractions,
+        "distractions_prewarmed": prewarmed / max(distractions, 1),
+        "prewarm_per_switch": prewarm_calls / max(predicted, 1),
+    }
+
+
+def random_trace(seed: int = 21):
+    for event in WorkloadGenerator(mix="mixed", seed=seed).generate(float('inf')):
+        yield WindowInfo(event.window_id, event.title, event.app_name, event.process_name)
+
+
+def run(quick: bool = False) -> dict:
+    iterations = 30 if quick else 200
+    events = 5_000 if quick else 50_000
+    return {
+        "toast_cold": toast_latency(iterations, prewarm=False),
+        "toast_prewarmed": toast_latency(iterations, prewarm=True),
+        # 습관 트레이스에서의 효과, 독립 선택 트레이스는 하한선
+        "prediction_habitual": prediction_accuracy(habitual_trace(), events),
+        "prediction_random": prediction_accuracy(random_trace(), events),
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(quick=True), indent=2))
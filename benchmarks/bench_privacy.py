@@ -0,0 +1,57 @@
+"""창 제목 개인정보 처리 - 정규화/키 해시 처리량 (처음 보는 제목 vs 반복 제목)"""
+import json
+import os
+import time
+
+from common import seeded_random
+
+from utils.title_privacy import TitleProcessor, normalize_title
+
+
+TEMPLATES = (
+    "({n}) Slack - general",
+    "[{n}] Inbox - user@example.com - Mail",
+    "● main_{n}.py - project - Visual Studio Code",
+    "Video {n} - YouTube - Mozilla Firefox",
+    "Issue #{n} - GitHub - Mozilla Firefox",
+    "user@host: ~/project{n}",
+    "Inbox ({n}) - Thunderbird",
+)
+
+
+def titles(count: int, distinct: int, seed: int = 7):
+    """distinct 종류 안에서 반복되는 제목 목록"""
+    rng = seeded_random(seed)
+    return [rng.choice(TEMPLATES).format(n=rng.randrange(distinct)) for _ in range(count)]
+
+
+def per_sec(fn, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return len(items) / (time.perf_counter() - start)
+
+
+def run(quick: bool = False) -> dict:
+    count = 20_000 if quick else 200_000
+    key = os.urandom(32)
+    # 모두 다른 제목 (메모 적중 없음)
+    unique = [f"{title} {i}" for i, title in enumerate(titles(count, 1_000_000))]
+    # 실제 사용처럼 같은 제목이 반복됨
+    repeated = titles(count, 50)
+
+    def fresh_processor():
+        return TitleProcessor(mode='hash', key=key)
+
+    return {
+        "titles": count,
+        "normalize_per_sec": per_sec(normalize_title, unique),
+        "hash_cold_per_sec": per_sec(fresh_processor().process, unique),
+        "hash_memoized_per_sec": per_sec(fresh_processor().process, repeated),
+        "hash_no_normalize_per_sec": per_sec(
+            TitleProcessor(mode='hash', key=key, normalize=False).process, unique),
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(quick=True), indent=2))
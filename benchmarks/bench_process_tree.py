@@ -0,0 +1,127 @@
+"""프로세스 트리 - 창 전환당 해석 비용(처음/캐시), 터미널·Electron·Flatpak 분류 결과, 실제 /proc 조상 조회"""
+import os
+import json
+import time
+import tempfile
+from pathlib import Path
+
+from common import summarize
+from bench_pipeline import load_categories
+
+from models.records import WindowInfo
+from services.window_monitor import AppClassifier
+from utils.process_tree import ProcessTree
+
+# 터미널 탭 수 (전경 작업은 한 탭에서만)
+TERMINAL_TABS = 12
+
+
+class FakeProc:
+    """임시 디렉터리에 /proc 흉내 (stat, cmdline, task/<pid>/children)"""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._children = {}
+
+    def add(self, pid: int, ppid: int, comm: str, cmdline=(), pgrp: int = None,
+            tpgid: int = -1, start: int = None):
+        directory = self.root / str(pid)
+        (directory / "task" / str(pid)).mkdir(parents=True, exist_ok=True)
+        # pid (comm) state ppid pgrp session tty_nr tpgid ... starttime(22번째)
+        fields = ["S", ppid, pgrp or pid, pgrp or pid, 34816, tpgid] + [0] * 13 + [start or pid]
+        (directory / "stat").write_text(f"{pid} ({comm}) " + " ".join(map(str, fields)) + "\n")
+        (directory / "cmdline").write_bytes(b"\0".join(arg.encode() for arg in cmdline or [comm]))
+        self._children.setdefault(pid, [])
+        self._children.setdefault(ppid, []).append(pid)
+        for parent in (pid, ppid):
+            if (self.root / str(parent)).exists():
+                (self.root / str(parent) / "task" / str(parent) / "children").write_text(
+                    " ".join(map(str, self._children[parent])))
+
+
+def build_fake(root: Path) -> dict:
+    """데스크톱 세션 하나 - 창 PID 반환"""
+    proc = FakeProc(root)
+    proc.add(1, 0, "systemd")
+    proc.add(900, 1, "gnome-shell")
+    # 터미널: 탭마다 셸, 마지막 탭에서 vim 실행 중
+    proc.add(1000, 900, "gnome-terminal-")
+    for tab in range(TERMINAL_TABS):
+        shell = 1100 + tab
+        vim = 1200 + tab
+        running = tab == TERMINAL_TABS - 1
+        proc.add(shell, 1000, "bash", tpgid=vim if running else shell)
+        if running:
+            proc.add(vim, shell, "vim", ["vim", "parser.py"], pgrp=vim, tpgid=vim)
+    # Electron으로 감싼 Slack
+    proc.add(2000, 900, "electron", ["/usr/lib/electron/electron", "--no-sandbox",
+                                     "/usr/lib/slack/resources/app.asar"])
+    # Flatpak 앱 (bwrap 안)
+    proc.add(3000, 900, "flatpak", ["flatpak", "run", "--branch=stable", "com.discordapp.Discord"])
+    proc.add(3001, 3000, "bwrap", ["bwrap", "--args", "40", "--", "/app/bin/discord"])
+    # 평범한 앱
+    proc.add(4000, 900, "firefox")
+    return {
+        "terminal": (WindowInfo("0x1", "vim parser.py", "Gnome-terminal", "gnome-terminal-"), 1000),
+        "electron": (WindowInfo("0x2", "general - Team", "Electron", "electron"), 2000),
+        "flatpak": (WindowInfo("0x3", "#general", "bwrap", "bwrap"), 3001),
+        "firefox": (WindowInfo("0x4", "Mozilla Firefox", "firefox", "firefox"), 4000),
+    }
+
+
+def per_call(fn, iterations: int) -> dict:
+    samples = []
+    for _ in range(iterations):
+        began = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - began)
+    return summarize(samples)
+
+
+def real_proc(iterations: int) -> dict:
+    """실제 /proc에서 모든 프로세스의 조상 조회 (처음 한 바퀴 vs 캐시)"""
+    pids = [int(entry) for entry in os.listdir("/proc") if entry.isdigit()]
+    tree = ProcessTree()
+    began = time.perf_counter()
+    for pid in pids:
+        tree.ancestry(pid)
+    cold = (time.perf_counter() - began) / max(len(pids), 1)
+    began = time.perf_counter()
+    for _ in range(iterations):
+        for pid in pids:
+            tree.ancestry(pid)
+    warm = (time.perf_counter() - began) / max(len(pids) * iterations, 1)
+    return {
+        "processes": len(pids),
+        "ancestry_cold_us": cold * 1e6,
+        "ancestry_cached_us": warm * 1e6,
+        "resolve_self": per_call(lambda: tree.resolve(os.getpid()), iterations),
+    }
+
+
+def run(quick: bool = False) -> dict:
+    iterations = 200 if quick else 2_000
+    classifier = AppClassifier(load_categories())
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        windows = build_fake(Path(tmp))
+        for name, (window, pid) in windows.items():
+            tree = ProcessTree(tmp)
+            began = time.perf_counter()
+            resolved = tree.resolve(pid, window.title)
+            first = time.perf_counter() - began
+            fixed = WindowInfo(window.window_id, window.title, window.app_name,
+                               resolved or window.process_name, pid=pid)
+            results[name] = {
+                "resolved": resolved,
+                "category_before": classifier.classify(window).id,
+                "category_after": classifier.classify(fixed).id,
+                "first_us": first * 1e6,
+                "cached": per_call(lambda: tree.resolve(pid, window.title), iterations),
+            }
+    results["real_proc"] = real_proc(5 if quick else 50)
+    return results
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(quick=True), indent=2))
@@ -0,0 +1,111 @@
+"""창/분류 레코드 메모리 - 일반 dataclass + 새 문자열 vs __slots__ 레코드 + 인터닝"""
+import gc
+import json
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+
+from common import seeded_random
+from bench_pipeline import load_categories
+
+from models.records import WindowInfo
+from services.window_monitor import AppClassifier
+from utils.symbols import SymbolTable
+
+
+@dataclass
+class LegacyWindowInfo:
+    """이전 WindowInfo (인스턴스 __dict__ 사용)"""
+    window_id: str
+    title: str
+    app_name: str
+    process_name: str
+    url: Optional[str] = None
+
+
+APPS = (
+    ("Code", "code", "{n} - main.py - Visual Studio Code"),
+    ("firefox", "firefox", "Video {n} - YouTube - Mozilla Firefox"),
+    ("firefox", "firefox", "Issue #{n} - GitHub - Mozilla Firefox"),
+    ("Slack", "slack", "({n}) Slack - general"),
+    ("Gnome-terminal", "gnome-terminal-", "user@host: ~/project{n}"),
+)
+
+
+def fresh(text: str) -> str:
+    """subprocess 출력처럼 매번 새로 할당된 문자열"""
+    return text.encode('utf-8').decode('utf-8')
+
+
+def probe_outputs(count: int, seed: int = 11):
+    """폴링 결과 (window_id, title, app_name, process_name) - 제목 종류는 적당히 반복"""
+    rng = seeded_random(seed)
+    for _ in range(count):
+        app_name, process, title = rng.choice(APPS)
+        yield (str(rng.randrange(1, 40)), title.format(n=rng.randrange(200)), app_name, process)
+
+
+def retained(build) -> int:
+    """build()가 만든 객체들이 유지하는 바이트"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def legacy_classify(classifier: AppClassifier, window) -> dict:
+    """이전 분류 결과 형식 (호출마다 새 딕셔너리)"""
+    category = classifier.classify(window)
+    return {"id": category.id, "name": category.name, "type": category.type}
+
+
+def run(quick: bool = False) -> dict:
+    count = 20_000 if quick else 200_000
+    outputs = list(probe_outputs(count))
+    classifier = AppClassifier(load_categories())
+
+    def legacy_windows():
+        return [LegacyWindowInfo(fresh(w), fresh(t), fresh(a), fresh(p)) for w, t, a, p in outputs]
+
+    def compact_windows():
+        table = SymbolTable()
+        return [WindowInfo(table.intern(fresh(w)), fresh(t), table.intern(fresh(a)),
+                           table.intern(fresh(p)))
+                for w, t, a, p in outputs]
+
+    legacy = legacy_windows()
+    compact = compact_windows()
+    for window in compact[:1000]:
+        classifier.classify(window)  # 규칙 컴파일/캐시 워밍업은 측정에서 제외
+
+    window_legacy = retained(legacy_windows)
+    window_compact = retained(compact_windows)
+    # 타임라인처럼 분류 결과를 보관할 때
+    category_legacy = retained(lambda: [legacy_classify(classifier, w) for w in legacy])
+    category_compact = retained(lambda: [classifier.classify(w) for w in compact])
+
+    return {
+        "records": count,
+        "window_bytes_per_record": {
+            "legacy": round(window_legacy / count, 1),
+            "compact": round(window_compact / count, 1),
+        },
+        "category_bytes_per_result": {
+            "legacy": round(category_legacy / count, 1),
+            "compact": round(category_compact / count, 1),
+        },
+        "instance_size_bytes": {
+            "legacy": sys.getsizeof(legacy[0]) + sys.getsizeof(legacy[0].__dict__),
+            "compact": sys.getsizeof(compact[0]),
+        },
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(quick=True), indent=2))
@@ -0,0 +1,42 @@
+"""합성 트레이스 전체 파이프라인 재생 - 처리량, 지연, 트레이스 크기"""
+import os
+import json
+import tempfile
+from pathlib import Path
+
+from common import summarize
+from bench_pipeline import build_pipeline
+
+from services.replay import replay_fast
+from utils.traces import TraceWriter, read_trace
+from utils.workload import MIXES, WorkloadGenerator
+
+
+def run(quick: bool = False) -> dict:
+    hours = 1 if quick else 8
+    results = {}
+    for mix in MIXES:
+        with tempfile.TemporaryDirectory() as tmp:
+            trace_path = str(Path(tmp) / f"{mix}.trace.gz")
+            with TraceWriter(trace_path, meta={"mix": mix, "seed": 7}) as writer:
+                writer.write_all(WorkloadGenerator(mix=mix, seed=7).generate(hours * 3600))
+
+            db, monitor, notifications, manager = build_pipeline(str(Path(tmp) / "bench.db"))
+            manager.start_session(duration=hours * 60)
+            stats = replay_fast(read_trace(trace_path), monitor)
+            manager.end_session(completed=False)
+            db.close()
+
+            results[mix] = {
+                "trace_hours": hours,
+                "events": stats.events,
+                "trace_bytes": os.path.getsize(trace_path),
+                "reminders": notifications.reminder_count,
+                "events_per_sec": stats.events_per_second,
+                "latency": summarize(stats.latencies),
+            }
+    return results
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(quick=True), indent=2))
@@ -0,0 +1,114 @@
+"""이력 검색 - 색인 저장 처리량, 수년치 이력에서 검색 지연, 파이프라인 왕복 (plain/hash)"""
+import os
+import json
+import time
+import uuid
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from common import seeded_random, summarize
+from bench_pipeline import build_pipeline
+
+from models.database import Database
+from models.records import WindowInfo
+from services.search_index import SearchIndexer
+from utils.title_privacy import TitleProcessor
+from utils.workload import WorkloadGenerator
+
+# 세션마다 처음 보는 창 수 (SearchIndexer는 세션 안에서 같은 창을 한 번만 색인)
+WINDOWS_PER_SESSION = 40
+QUERIES = ("code", "github issue", "youtube", "models 123", "stack overflow python", "없는단어")
+
+
+def populate(db: Database, sessions: int, processor: TitleProcessor, seed: int = 11) -> float:
+    """지난 sessions/3일에 걸친 세션과 색인 생성, 색인 저장 처리량(행/초) 반환"""
+    rng = seeded_random(seed)
+    events = WorkloadGenerator(mix="mixed", seed=seed).generate(float('inf'))
+    now = datetime.now()
+    rows, batch, elapsed = 0, [], 0.0
+    db.conn.execute("BEGIN")
+    for i in range(sessions):
+        session_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        start = now - timedelta(days=i // 3, hours=rng.randrange(9, 18))
+        db.conn.execute("""
+            INSERT INTO focus_sessions (id, start_time, end_time, target_duration, actual_duration,
+                app_name, category_id, completed)
+            VALUES (?, ?, ?, 45, 45, 'Code', 'coding', 1)
+        """, (session_id, start.isoformat(), (start + timedelta(minutes=45)).isoformat()))
+        seen = set()
+        while len(seen) < WINDOWS_PER_SESSION:
+            event = next(events)
+            title = processor.index_terms(event.title)
+            if (event.app_name, title) in seen:
+                continue
+            seen.add((event.app_name, title))
+            batch.append((session_id, start.isoformat(), event.app_name, title, 'coding'))
+        if len(batch) >= SearchIndexer.MAX_PENDING or i == sessions - 1:
+            began = time.perf_counter()
+            db.index_history(batch)
+            elapsed += time.perf_counter() - began
+            rows += len(batch)
+            batch = []
+    db.conn.commit()
+    return rows / elapsed
+
+
+def search_latency(db: Database, processor: TitleProcessor, iterations: int) -> dict:
+    term = processor.term if processor.mode == 'hash' else None
+    results = {}
+    for query in QUERIES:
+        samples, found = [], 0
+        for _ in range(iterations):
+            began = time.perf_counter()
+            found = len(db.search_history(query, 20, title_term=term))
+            samples.append(time.perf_counter() - began)
+        results[query] = {"sessions": found, **summarize(samples)}
+    return results
+
+
+def round_trip(tmp: Path, processor: TitleProcessor) -> dict:
+    """창 전환 → SearchIndexer → 검색 (세션이 끝나면 저장됨)"""
+    db, monitor, _, manager = build_pipeline(str(tmp / f"trip-{processor.mode}.db"))
+    manager.title_processor = processor
+    indexer = SearchIndexer(db, manager)
+    monitor.start()
+    manager.start_session(duration=45)
+    for i, (app, title) in enumerate([("Code", "● parser.py - focus-guardian - Visual Studio Code"),
+                                      ("firefox", "(3) Issue #42 · org/focus-guardian · GitHub"),
+                                      ("Code", "● parser.py - focus-guardian - Visual Studio Code")]):
+        monitor.push(WindowInfo(str(i), title, app, app.lower()))
+    pending = len(indexer._pending)
+    manager.end_session(completed=True)
+    hits = indexer.search("parser")
+    github = indexer.search("issue 42")
+    db.close()
+    return {
+        "pending_before_end": pending,
+        "parser_hits": len(hits),
+        "issue_hits": len(github),
+        "snippet": hits[0]["snippet"] if hits else None,
+    }
+
+
+def run(quick: bool = False) -> dict:
+    sessions = 300 if quick else 3_300  # 하루 3세션 × 약 3년
+    results = {"sessions": sessions, "rows": sessions * WINDOWS_PER_SESSION}
+    key = os.urandom(32)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for mode in ("plain", "hash"):
+            processor = TitleProcessor(mode=mode, key=key)
+            db = Database(str(tmp / f"{mode}.db"))
+            rate = populate(db, sessions, processor)
+            results[mode] = {
+                "index_rows_per_sec": rate,
+                "search": search_latency(db, processor, 10 if quick else 50),
+                "round_trip": round_trip(tmp, processor),
+            }
+            db.close()
+    return results
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(quick=True), indent=2, ensure_ascii=False))
@@ -0,0 +1,105 @@
+"""엄격 모드 - 방해 창 전환부터 최소화/닫기 요청까지 지연 (asyncio 파이프라인, 이벤트 소스)"""
+import json
+import time
+import asyncio
+
+from common import summarize
+from bench_pipeline import load_categories
+
+from models.records import WindowInfo
+from services.backends.scripted import ScriptedWindowSource
+from services.enforcement import StrictEnforcer, StrictPolicy
+from services.pipeline import AsyncPipeline, FocusPolicy
+from services.window_monitor import AppClassifier
+
+# 한 프레임 (60Hz)
+FRAME_SECONDS = 1 / 60
+
+POLICY = {"default": "minimize", "apps": {"discord": "close", "telegram": "remind"}}
+WORK = WindowInfo("1", "main.py - focus-guardian - Visual Studio Code", "Code", "code")
+DISTRACTIONS = (
+    WindowInfo("2", "lofi beats - YouTube — Mozilla Firefox", "firefox", "firefox"),
+    WindowInfo("3", "#general | Discord", "discord", "discord"),
+    WindowInfo("4", "Telegram", "telegram", "telegram"),
+)
+
+
+def pipeline_latency(switches: int, gap: float = 0.01) -> dict:
+    """작업 창 → 방해 창 push부터 결정(엄격 모드 처리 포함)이 나올 때까지"""
+    source = ScriptedWindowSource(WORK)
+    source.open()
+    enforcer = StrictEnforcer(source.open_actions)
+    enforcer.configure(True, POLICY)
+    pushed_at = {}
+    samples = []
+    outcomes = {}
+
+    async def main():
+        finished = asyncio.Event()
+
+        def on_decision(decision):
+            window = decision.transition.new
+            if window.window_id in pushed_at:
+                samples.append(time.perf_counter() - pushed_at.pop(window.window_id))
+                outcome = decision.enforced.action if decision.enforced else "remind"
+                outcomes[outcome] = outcomes.get(outcome, 0) + 1
+                if len(samples) == switches:
+                    finished.set()
+
+        pipeline = AsyncPipeline(
+            read_window=source.read_window,
+            classifier=AppClassifier(load_categories()),
+            session_active=lambda: True,
+            on_decision=on_decision,
+            policy=FocusPolicy(enforcer)
+        )
+        task = asyncio.create_task(pipeline.run(source.windows(0.5)))
+        for i in range(switches):
+            await asyncio.sleep(gap)
+            distraction = DISTRACTIONS[i % len(DISTRACTIONS)]
+            # 매번 다른 창으로 보이도록 창 ID를 바꿈
+            window = WindowInfo(f"{distraction.window_id}{i}", distraction.title,
+                                distraction.app_name, distraction.process_name)
+            pushed_at[window.window_id] = time.perf_counter()
+            source.push(window)
+            await asyncio.sleep(gap)
+            # 창 관리자가 최소화/닫기 후 작업 창으로 돌려보낸 상태
+            source.push(WORK)
+        await asyncio.wait_for(finished.wait(), 5)
+        pipeline.stop()
+        await task
+
+    asyncio.run(main())
+    source.close()
+    result = summarize(samples)
+    result["within_frame"] = sum(s <= FRAME_SECONDS for s in samples) / len(samples)
+    result["outcomes"] = outcomes
+    result["requests"] = [action for action, _ in list(source.actions.log)[:4]]
+    return result
+
+
+def enforce_cost(iterations: int) -> dict:
+    """StrictEnforcer.enforce 한 번 (정책 조회 + 창 조작 요청 기록)"""
+    source = ScriptedWindowSource()
+    enforcer = StrictEnforcer(source.open_actions)
+    enforcer.configure(True, POLICY)
+    samples = []
+    for i in range(iterations):
+        window = DISTRACTIONS[i % 2]
+        began = time.perf_counter()
+        enforcer.enforce(window, WORK)
+        samples.append(time.perf_counter() - began)
+    return summarize(samples)
+
+
+def run(quick: bool = False) -> dict:
+    policy = StrictPolicy.from_config(POLICY)
+    return {
+        "policy": {window.app_name: policy.action_for(window) for window in DISTRACTIONS},
+        "enforce": enforce_cost(2_000 if quick else 20_000),
+        "pipeline": pipeline_latency(30 if quick else 300),
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(quick=True), indent=2, ensure_ascii=False))
@@ -0,0 +1,62 @@
+"""벤치마크 공통 도구 - 헤드리스 Qt, 측정 헬퍼
+
+가짜 창 소스와 알림 싱크는 services.replay의 ScriptedWindowMonitor, NotificationSink를 쓴다.
+"""
+import os
+import sys
+import time
+import random
+import statistics
+from pathlib import Path
+from typing import Callable, List
+
+# Qt는 화면 없이 실행
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+
+
+_app = None
+
+
+def qt_app() -> QApplication:
+    """헤드리스 QApplication (프로세스당 하나)"""
+    global _app
+    _app = QApplication.instance() or QApplication([])
+    return _app
+
+
+def summarize(samples: List[float]) -> dict:
+    """지연 샘플(초) 요약 - 마이크로초 단위"""
+    if not samples:
+        return {"n": 0}
+    ordered = sorted(samples)
+
+    def pct(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1e6
+
+    return {
+        "n": len(samples),
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "p50_us": pct(0.50),
+        "p95_us": pct(0.95),
+        "p99_us": pct(0.99),
+        "max_us": ordered[-1] * 1e6,
+    }
+
+
+def throughput(fn: Callable[[], None], iterations: int) -> float:
+    """초당 호출 수"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - start)
+
+
+def seeded_random(seed: int = 1234) -> random.Random:
+    """재현 가능한 난수 생성기"""
+    return random.Random(seed)
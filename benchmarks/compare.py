@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""두 벤치마크 결과 비교
+
+사용법:
+    python benchmarks/compare.py old.json new.json [--threshold 10]
+
+수치 항목마다 변화율을 출력하고, 임계값(%)을 넘게 나빠진 항목이 있으면 1로 종료한다.
+'_per_sec'로 끝나는 항목은 클수록, 나머지는 작을수록 좋은 것으로 본다.
+"""
+import sys
+import json
+import argparse
+
+
+def flatten(data, prefix=""):
+    """중첩 딕셔너리를 'a.b.c' 키로 평탄화 (수치만)"""
+    items = {}
+    if isinstance(data, dict):
+        for key, value in data.items():
+            items.update(flatten(value, f"{prefix}.{key}" if prefix else key))
+    elif isinstance(data, (int, float)) and not isinstance(data, bool):
+        items[prefix] = float(data)
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=10.0, help="회귀 판정 임계값 (%%)")
+    args = parser.parse_args()
+
+    with open(args.old, encoding='utf-8') as f:
+        old = flatten(json.load(f)["benchmarks"])
+    with open(args.new, encoding='utf-8') as f:
+        new = flatten(json.load(f)["benchmarks"])
+
+    regressions = 0
+    for key in sorted(old.keys() & new.keys()):
+        before, after = old[key], new[key]
+        if before == 0:
+            continue
+        change = (after - before) / before * 100
+        higher_is_better = key.endswith("_per_sec")
+        worse = -change if higher_is_better else change
+        flag = ""
+        if worse > args.threshold:
+            flag = "  <-- regression"
+            regressions += 1
+        print(f"{key:<60} {before:>14.2f} {after:>14.2f} {change:>+8.1f}%{flag}")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""자리 비움 감지 검증 - X 스크린세이버/logind 대신 스크립트로 유휴 시간과 잠금을 흉내
+
+가짜 시계로 유휴 시간을 돌리고 잠금 시그널을 직접 보내서, 세션 자동 일시정지/재개,
+창 폴링 중지, 자리 비운 시간이 집중 시간에서 빠지는지 확인한다.
+
+사용법:
+    python benchmarks/idle_standin.py
+"""
+import sys
+import json
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from bench_pipeline import build_pipeline
+
+from services.idle_detector import IdleDetector, ScriptedIdleSource
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def main():
+    failures = []
+    clock = FakeClock()
+    source = ScriptedIdleSource(clock=clock)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db, monitor, _, manager = build_pipeline(str(Path(tmp) / "idle.db"))
+        detector = IdleDetector(source=source, threshold=300)
+        manager.attach_idle_detector(detector)
+        monitor.start()
+        detector.start()
+
+        session = manager.start_session(duration=60)
+        # 세션 시작 30분 전으로 옮겨서 30분 집중한 상태로 만듦
+        session.start_time -= timedelta(minutes=30)
+        db.conn.execute("UPDATE focus_sessions SET start_time = ? WHERE id = ?",
+                        (session.start_time.isoformat(), session.id))
+
+        # 임계값 직전: 그대로 진행
+        clock.now += 299
+        detector.check()
+        if session.paused or not monitor._running:
+            failures.append("paused before threshold")
+
+        # 임계값 초과: 마지막 입력 시점(약 5분 전)부터 일시정지, 폴링 중지
+        clock.now += 2
+        detector.check()
+        if not session.paused:
+            failures.append("not paused after threshold")
+        if monitor._running:
+            failures.append("monitor still polling while idle")
+        idle_for = (datetime.now() - session.pause_start).total_seconds()
+        if not 290 <= idle_for <= 310:
+            failures.append(f"pause not backdated to last input ({idle_for:.0f}s)")
+
+        # 입력 복귀: 재개
+        source.touch()
+        detector.check()
+        if session.paused or not monitor._running:
+            failures.append("not resumed on activity")
+        if not 24 * 60 <= session.elapsed_seconds <= 26 * 60:
+            failures.append(f"idle time counted as focus ({session.elapsed_seconds}s)")
+
+        # 화면 잠금/해제
+        detector.set_locked(True)
+        locked_paused = session.paused
+        detector.set_locked(False)
+        if not locked_paused or session.paused:
+            failures.append("lock/unlock did not pause/resume")
+
+        # 직접 일시정지한 세션은 복귀해도 자동 재개하지 않음
+        manager.pause_session()
+        detector.set_locked(True)
+        detector.set_locked(False)
+        if not session.paused:
+            failures.append("manual pause resumed by idle detector")
+        manager.resume_session()
+
+        manager.end_session(completed=False)
+        if session.actual_duration not in (24, 25):
+            failures.append(f"recorded duration {session.actual_duration} min (expected ~25)")
+
+        detector.stop()
+        db.close()
+
+    print(json.dumps({"failures": failures}, indent=2, ensure_ascii=False))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""네이티브 메시징 호스트 검증 - 브라우저와 데몬을 대신하는 로컬 프로세스
+
+브라우저처럼 src/native_host.py를 자식 프로세스로 띄워 프레임 메시지를 보내고,
+데몬 대신 제어 소켓을 흉내 내는 서버가 전달된 browser.tab 호출을 기록한다.
+실제 실행 중인 Focus Guardian으로 보내려면 --socket을 지정한다.
+
+사용법:
+    python benchmarks/native_host_standin.py              # 스탠드인 데몬 사용
+    python benchmarks/native_host_standin.py --count 5000
+    python benchmarks/native_host_standin.py --socket $XDG_RUNTIME_DIR/focus-guardian-$(id -u).sock
+"""
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+
+from common import SRC_DIR, summarize
+
+from utils.native_messaging import read_message, write_message
+
+
+class StandInDaemon:
+    """browser.tab만 처리하는 최소 JSON-RPC 서버 (표준 라이브러리)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.tabs = []
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(path)
+        self._server.listen()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.close()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn: socket.socket):
+        with conn, conn.makefile('rwb') as stream:
+            for line in stream:
+                request = json.loads(line)
+                if request.get("method") == "browser.tab":
+                    self.tabs.append(request["params"])
+                    response = {"jsonrpc": "2.0", "id": request.get("id"), "result": True}
+                else:
+                    response = {"jsonrpc": "2.0", "id": request.get("id"),
+                                "error": {"code": -32601, "message": "not found"}}
+                stream.write(json.dumps(response).encode() + b"\n")
+                stream.flush()
+
+
+def make_tabs(count: int) -> list:
+    sites = [
+        ("https://www.youtube.com/watch?v={n}", "Video {n} - YouTube"),
+        ("https://github.com/org/project/issues/{n}", "Issue #{n} · org/project"),
+        ("https://stackoverflow.com/questions/{n}", "How to {n} - Stack Overflow"),
+        ("https://m.reddit.com/r/python/{n}", "r/python {n}"),
+    ]
+    tabs = []
+    for i in range(count):
+        url, title = sites[i % len(sites)]
+        tabs.append({"type": "tab", "url": url.format(n=i), "title": title.format(n=i),
+                     "browser": "firefox"})
+    return tabs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="네이티브 메시징 호스트 스탠드인")
+    parser.add_argument("--count", type=int, default=1000, help="보낼 탭 이벤트 수")
+    parser.add_argument("--socket", help="실제 제어 소켓 (생략 시 스탠드인 데몬)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        daemon = None
+        socket_path = args.socket
+        if socket_path is None:
+            socket_path = str(Path(tmp) / "standin.sock")
+            daemon = StandInDaemon(socket_path)
+            daemon.start()
+
+        host = subprocess.Popen(
+            [sys.executable, str(SRC_DIR / "native_host.py"), "focus_guardian@standin"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            env=dict(os.environ, FOCUS_GUARDIAN_SOCKET=socket_path)
+        )
+
+        failures = []
+        write_message(host.stdin, {"type": "ping"})
+        if read_message(host.stdout) != {"ok": True}:
+            failures.append("ping")
+
+        samples = []
+        tabs = make_tabs(args.count)
+        for tab in tabs:
+            start = time.perf_counter()
+            write_message(host.stdin, tab)
+            response = read_message(host.stdout)
+            samples.append(time.perf_counter() - start)
+            if not response or not response.get("ok"):
+                failures.append(f"tab: {response}")
+                break
+
+        write_message(host.stdin, {"type": "bogus"})
+        response = read_message(host.stdout)
+        if not response or response.get("ok") is not False:
+            failures.append("unknown message type accepted")
+
+        host.stdin.close()
+        exit_code = host.wait(timeout=5)
+        if exit_code != 0:
+            failures.append(f"host exit code {exit_code}")
+
+        if daemon:
+            daemon.stop()
+            if [t["url"] for t in daemon.tabs] != [t["url"] for t in tabs[:len(daemon.tabs)]] \
+                    or len(daemon.tabs) != len(tabs):
+                failures.append(f"daemon received {len(daemon.tabs)}/{len(tabs)} tabs")
+
+    print(json.dumps({
+        "tabs": len(samples),
+        "round_trip": summarize(samples),
+        "failures": failures,
+    }, indent=2, ensure_ascii=False))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""벤치마크 실행기 - 결과를 JSON으로 저장
+
+사용법:
+    python benchmarks/run.py                  # 전체 (1M 행, 12시간 시뮬레이션 포함)
+    python benchmarks/run.py --quick          # 빠른 확인용 축소 실행
+    python benchmarks/run.py --only classifier database
+"""
+import re
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import common  # noqa: E402  (src 경로, 오프스크린 Qt 설정)
+import bench_classifier  # noqa: E402
+import bench_database  # noqa: E402
+import bench_pipeline  # noqa: E402
+import bench_memory  # noqa: E402
+import bench_replay  # noqa: E402
+import bench_records  # noqa: E402
+import bench_privacy  # noqa: E402
+import bench_journal  # noqa: E402
+import bench_fleet  # noqa: E402
+import bench_search  # noqa: E402
+import bench_patterns  # noqa: E402
+import bench_prewarm  # noqa: E402
+import bench_process_tree  # noqa: E402
+import bench_backends  # noqa: E402
+import bench_dwell  # noqa: E402
+import bench_strict  # noqa: E402
+
+
+BENCHMARKS = {
+    "classifier": bench_classifier.run,
+    "database": bench_database.run,
+    "pipeline": bench_pipeline.run,
+    "memory": bench_memory.run,
+    "replay": bench_replay.run,
+    "records": bench_records.run,
+    "privacy": bench_privacy.run,
+    "journal": bench_journal.run,
+    "fleet": bench_fleet.run,
+    "search": bench_search.run,
+    "patterns": bench_patterns.run,
+    "prewarm": bench_prewarm.run,
+    "process_tree": bench_process_tree.run,
+    "backends": bench_backends.run,
+    "dwell": bench_dwell.run,
+    "strict": bench_strict.run,
+}
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def environment() -> dict:
+    """실행 환경 정보 (결과 비교용)"""
+    import sqlite3
+    import PySide6
+
+    init_source = (common.SRC_DIR / "__init__.py").read_text(encoding='utf-8')
+    version = re.search(r'__version__ = "([^"]+)"', init_source).group(1)
+
+    try:
+        revision = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, timeout=5, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except Exception:
+        revision = ""
+
+    return {
+        "version": version,
+        "git_revision": revision,
+        "python": platform.python_version(),
+        "pyside6": PySide6.__version__,
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Focus Guardian 벤치마크")
+    parser.add_argument("--quick", action="store_true", help="축소 실행")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="일부만 실행")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/<시각>.json)")
+    args = parser.parse_args()
+
+    results = {
+        "environment": environment(),
+        "quick": args.quick,
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "benchmarks": {},
+    }
+    for name in (args.only or BENCHMARKS):
+        print(f"[bench] {name} ...", file=sys.stderr)
+        start = time.perf_counter()
+        results["benchmarks"][name] = BENCHMARKS[name](quick=args.quick)
+        print(f"[bench] {name} done in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""창 활동 트레이스 도구
+
+사용법:
+    python benchmarks/trace.py generate --mix mixed --hours 8 --seed 1 -o day.trace.gz
+    python benchmarks/trace.py info day.trace.gz
+    python benchmarks/trace.py replay day.trace.gz [--speed 60 | --fast]
+
+실제 트레이스 기록은 앱 실행 시 `python src/main.py --record-trace day.trace.gz`.
+"""
+import sys
+import json
+import argparse
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import summarize  # noqa: E402
+from bench_pipeline import build_pipeline  # noqa: E402
+
+from services.replay import TraceReplayer, replay_fast  # noqa: E402
+from utils.traces import TraceWriter, read_trace, read_trace_meta  # noqa: E402
+from utils.workload import MIXES, WorkloadGenerator  # noqa: E402
+
+
+def cmd_generate(args):
+    generator = WorkloadGenerator(mix=args.mix, seed=args.seed, burst_probability=args.burst)
+    meta = {"mix": args.mix, "seed": args.seed, "hours": args.hours, "burst": args.burst}
+    with TraceWriter(args.output, meta=meta) as writer:
+        writer.write_all(generator.generate(args.hours * 3600))
+    print(args.output)
+
+
+def cmd_info(args):
+    events = list(read_trace(args.trace))
+    apps = Counter(e.app_name for e in events)
+    print(json.dumps({
+        "meta": read_trace_meta(args.trace),
+        "events": len(events),
+        "duration_seconds": events[-1].t if events else 0,
+        "distinct_titles": len({e.title for e in events}),
+        "apps": dict(apps.most_common()),
+    }, indent=2, ensure_ascii=False))
+
+
+def cmd_replay(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        db, monitor, notifications, manager = build_pipeline(str(Path(tmp) / "replay.db"))
+        manager.start_session(duration=24 * 60)
+        if args.fast:
+            stats = replay_fast(read_trace(args.trace), monitor)
+        else:
+            stats = TraceReplayer(read_trace(args.trace), monitor, speed=args.speed).run()
+        manager.end_session(completed=False)
+        db.close()
+
+    print(json.dumps({
+        "events": stats.events,
+        "trace_seconds": stats.trace_seconds,
+        "wall_seconds": stats.wall_seconds,
+        "events_per_sec": stats.events_per_second,
+        "reminders": notifications.reminder_count,
+        "latency": summarize(stats.latencies),
+        "lateness": summarize(stats.lateness),
+    }, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="창 활동 트레이스 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("generate", help="합성 트레이스 생성")
+    gen.add_argument("--mix", choices=sorted(MIXES), default="mixed")
+    gen.add_argument("--hours", type=float, default=8)
+    gen.add_argument("--seed", type=int, default=0)
+    gen.add_argument("--burst", type=float, default=0.15, help="alt-tab 버스트 확률")
+    gen.add_argument("-o", "--output", required=True)
+    gen.set_defaults(func=cmd_generate)
+
+    info = sub.add_parser("info", help="트레이스 요약")
+    info.add_argument("trace")
+    info.set_defaults(func=cmd_info)
+
+    rep = sub.add_parser("replay", help="세션 파이프라인으로 재생")
+    rep.add_argument("trace")
+    rep.add_argument("--speed", type=float, default=1.0, help="재생 배속 (기본: 실시간)")
+    rep.add_argument("--fast", action="store_true", help="가능한 한 빠르게 재생")
+    rep.set_defaults(func=cmd_replay)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+// 활성 탭이 바뀌거나 활성 탭의 URL/제목이 바뀌면 네이티브 호스트로 전송
+const HOST = "focus_guardian";
+const api = typeof browser !== "undefined" ? browser : chrome;
+const BROWSER = typeof browser !== "undefined" ? "firefox" : "chrome";
+
+let port = null;
+
+function connect() {
+  port = api.runtime.connectNative(HOST);
+  port.onDisconnect.addListener(() => {
+    // 호스트가 종료되면 다음 이벤트에서 다시 연결
+    port = null;
+  });
+}
+
+function send(tab) {
+  if (!tab || !tab.active || !tab.url) {
+    return;
+  }
+  if (!port) {
+    connect();
+  }
+  port.postMessage({ type: "tab", url: tab.url, title: tab.title || "", browser: BROWSER });
+}
+
+api.tabs.onActivated.addListener((activeInfo) => {
+  api.tabs.get(activeInfo.tabId).then(send);
+});
+
+api.tabs.onUpdated.addListener((tabId, changeInfo, tab) => {
+  if (changeInfo.url || changeInfo.title) {
+    send(tab);
+  }
+});
+
+api.windows.onFocusChanged.addListener((windowId) => {
+  if (windowId === api.windows.WINDOW_ID_NONE) {
+    return;
+  }
+  api.tabs.query({ active: true, windowId }).then((tabs) => send(tabs[0]));
+});
@@ -89,6 +89,40 @@ echo -e "${GREEN}✓ 앱 바로가기 생성 완료${NC}"
 # 5. 설정 디렉토리 생성
 mkdir -p ~/.config/focus-guardian
 
+# 6. 브라우저 네이티브 메시징 호스트 등록 (browser-extension/ 확장용)
+cat > "$SCRIPT_DIR/native-host.sh" << EOF
+#!/bin/bash
+exec "$SCRIPT_DIR/venv/bin/python" "$SCRIPT_DIR/src/native_host.py" "\$@"
+EOF
+chmod +x "$SCRIPT_DIR/native-host.sh"
+
+mkdir -p ~/.mozilla/native-messaging-hosts
+cat > ~/.mozilla/native-messaging-hosts/focus_guardian.json << EOF
+{
+  "name": "focus_guardian",
+  "description": "Focus Guardian browser helper",
+  "path": "$SCRIPT_DIR/native-host.sh",
+  "type": "stdio",
+  "allowed_extensions": ["focus-guardian@localhost"]
+}
+EOF
+
+# Chrome/Chromium은 확장 ID가 필요 (chrome://extensions 에서 확인 후 FG_CHROME_EXTENSION_ID로 지정)
+if [ -n "$FG_CHROME_EXTENSION_ID" ]; then
+    for dir in ~/.config/google-chrome ~/.config/chromium; do
+        mkdir -p "$dir/NativeMessagingHosts"
+        cat > "$dir/NativeMessagingHosts/focus_guardian.json" << EOF
+{
+  "name": "focus_guardian",
+  "description": "Focus Guardian browser helper",
+  "path": "$SCRIPT_DIR/native-host.sh",
+  "type": "stdio",
+  "allowed_origins": ["chrome-extension://$FG_CHROME_EXTENSION_ID/"]
+}
+EOF
+    done
+fi
+
 echo ""
 echo -e "${GREEN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
 echo -e "${GREEN}🎉 Focus Guardian 설치가 완료되었습니다!${NC}"
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Focus Guardian 제어 도구 - 제어 소켓으로 실행 중인 엔진 조작
+
+사용법:
+    python src/fgctl.py status
+    python src/fgctl.py start [--duration 45]
+    python src/fgctl.py pause | resume | stop | extend [--minutes 5]
+    python src/fgctl.py stats [--refresh]
+    python src/fgctl.py window
+    python src/fgctl.py search "검색어" [--limit 20]
+    python src/fgctl.py choice continue|extend|switch
+    python src/fgctl.py watch          # 이벤트 스트림 (JSON Lines)
+"""
+import sys
+import json
+import argparse
+from pathlib import Path
+
+# 모듈 경로 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from services.ipc import IpcClient, IpcError
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="fgctl", description="Focus Guardian 제어 도구")
+    parser.add_argument("--socket", help="제어 소켓 경로")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("status", help="현재 세션")
+    start = sub.add_parser("start", help="세션 시작")
+    start.add_argument("--duration", type=int, help="집중 시간 (분)")
+    sub.add_parser("pause", help="일시정지")
+    sub.add_parser("resume", help="재개")
+    stop = sub.add_parser("stop", help="세션 종료")
+    stop.add_argument("--completed", action="store_true", help="완료로 기록")
+    extend = sub.add_parser("extend", help="세션 연장")
+    extend.add_argument("--minutes", type=int, default=5)
+    stats = sub.add_parser("stats", help="오늘의 통계")
+    stats.add_argument("--refresh", action="store_true", help="DB에서 다시 읽기")
+    sub.add_parser("window", help="현재 활성 창")
+    search = sub.add_parser("search", help="세션/창 이력 검색")
+    search.add_argument("query")
+    search.add_argument("--limit", type=int, default=20)
+    choice = sub.add_parser("choice", help="대기 중인 리마인더에 응답 (헤드리스)")
+    choice.add_argument("choice", choices=["continue", "extend", "switch"])
+    sub.add_parser("watch", help="이벤트 구독")
+    args = parser.parse_args()
+
+    calls = {
+        "status": ("session.status", {}),
+        "start": ("session.start", {"duration": getattr(args, "duration", None)}),
+        "pause": ("session.pause", {}),
+        "resume": ("session.resume", {}),
+        "stop": ("session.stop", {"completed": getattr(args, "completed", False)}),
+        "extend": ("session.extend", {"minutes": getattr(args, "minutes", 5)}),
+        "stats": ("stats.refresh" if getattr(args, "refresh", False) else "stats.today", {}),
+        "window": ("window.current", {}),
+        "search": ("history.search", {"query": getattr(args, "query", None),
+                                      "limit": getattr(args, "limit", 20)}),
+        "choice": ("session.choice", {"choice": getattr(args, "choice", None)}),
+    }
+
+    try:
+        with IpcClient(args.socket) as client:
+            if args.command == "watch":
+                for event in client.events():
+                    print(json.dumps(event, ensure_ascii=False), flush=True)
+                return
+            method, params = calls[args.command]
+            print(json.dumps(client.call(method, **params), indent=2, ensure_ascii=False))
+    except (FileNotFoundError, ConnectionRefusedError):
+        print("Focus Guardian이 실행 중이 아닙니다.", file=sys.stderr)
+        sys.exit(2)
+    except IpcError as e:
+        print(f"오류: {e.message}", file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""팀 집계 수집 서버 (참고 구현) - FleetUploader가 보낸 배치를 SQLite에 저장
+
+요청 스레드는 배치를 검증해서 큐에 넣고, 쓰기 스레드 하나가 쌓인 배치를 모아 한 트랜잭션으로
+커밋한 뒤(그룹 커밋) 응답한다. 같은 batch_id는 한 번만 반영되고, 같은 좌석의 같은 날짜는
+나중 값으로 덮어쓰므로 업로더의 재전송은 안전하다. 표준 라이브러리만 사용한다.
+
+사용법:
+    python src/fleet_collector.py --port 8787 --db fleet.db [--token SECRET]
+    curl localhost:8787/v1/teams            # 팀/날짜별 합계
+
+    설정: "fleet": {"enabled": true, "endpoint": "http://host:8787/v1/rollups", "team": "..."}
+"""
+import sys
+import zlib
+import json
+import queue
+import sqlite3
+import argparse
+import threading
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+
+
+SCHEMA = [
+    """
+        CREATE TABLE IF NOT EXISTS batches (
+            batch_id TEXT PRIMARY KEY,
+            seat TEXT NOT NULL,
+            team TEXT,
+            received_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS rollups (
+            seat TEXT NOT NULL,
+            team TEXT,
+            date DATE NOT NULL,
+            focus_minutes INTEGER,
+            sessions_completed INTEGER,
+            sessions_abandoned INTEGER,
+            switch_attempts INTEGER,
+            switches_blocked INTEGER,
+            focus_phases_completed INTEGER,
+            category_minutes TEXT,
+            PRIMARY KEY (seat, date)
+        ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_rollups_team_date ON rollups(team, date)",
+]
+
+ROLLUP_FIELDS = ('focus_minutes', 'sessions_completed', 'sessions_abandoned',
+                 'switch_attempts', 'switches_blocked', 'focus_phases_completed')
+# 요청 본문 상한 (압축 해제 후)
+MAX_BODY = 4 * 1024 * 1024
+
+
+class BatchError(ValueError):
+    """잘못된 배치 (400)"""
+
+
+def parse_batch(body: bytes, encoding: str) -> dict:
+    """요청 본문 → 검증된 배치"""
+    if encoding == 'gzip':
+        # 압축 폭탄 방지 - 상한까지만 풀어 봄
+        try:
+            body = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(body, MAX_BODY + 1)
+        except zlib.error as e:
+            raise BatchError(f"gzip 해제 실패: {e}")
+    if len(body) > MAX_BODY:
+        raise BatchError("본문이 너무 큽니다")
+    try:
+        batch = json.loads(body)
+    except ValueError as e:
+        raise BatchError(f"JSON 파싱 실패: {e}")
+    if not isinstance(batch, dict) or batch.get('version') != 1:
+        raise BatchError("지원하지 않는 배치 버전")
+    for key in ('batch_id', 'seat'):
+        if not isinstance(batch.get(key), str) or not batch[key]:
+            raise BatchError(f"{key}가 없습니다")
+    if not isinstance(batch.get('team', ''), str):
+        raise BatchError("team은 문자열이어야 합니다")
+    rollups = batch.get('rollups')
+    if not isinstance(rollups, list):
+        raise BatchError("rollups는 목록이어야 합니다")
+    for rollup in rollups:
+        if not isinstance(rollup, dict) or not isinstance(rollup.get('date'), str):
+            raise BatchError("rollup에 date가 없습니다")
+        for field in ROLLUP_FIELDS:
+            value = rollup.get(field, 0)
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise BatchError(f"rollup.{field}는 정수여야 합니다")
+        category_minutes = rollup.get('category_minutes', {})
+        if not isinstance(category_minutes, dict) or not all(
+                isinstance(minutes, (int, float)) and not isinstance(minutes, bool)
+                for minutes in category_minutes.values()):
+            raise BatchError("rollup.category_minutes는 카테고리 → 숫자 객체여야 합니다")
+    return batch
+
+
+class BatchWriter:
+    """쓰기 전용 스레드 - 대기 중인 배치를 한 트랜잭션으로 묶어 커밋"""
+
+    MAX_GROUP = 1000
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in SCHEMA:
+            self.conn.execute(statement)
+        self.conn.commit()
+        self._queue: "queue.Queue[Tuple[dict, Future]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="fleet-writer", daemon=True)
+        self.batches_written = 0
+        self.commits = 0
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+        self.conn.close()
+
+    def submit(self, batch: dict) -> Future:
+        future = Future()
+        self._queue.put((batch, future))
+        return future
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            group = [item]
+            while len(group) < self.MAX_GROUP:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._write(group)
+                    return
+                group.append(item)
+            self._write(group)
+
+    def _write(self, group: List[Tuple[dict, Future]]):
+        # 배치마다 SAVEPOINT - 하나가 실패해도 그 배치만 되돌리고 나머지는 같이 커밋
+        results = []
+        try:
+            with self.conn:
+                self.conn.execute("BEGIN")
+                for batch, _future in group:
+                    self.conn.execute("SAVEPOINT batch")
+                    try:
+                        results.append(self._insert(batch))
+                    except sqlite3.Error as e:
+                        self.conn.execute("ROLLBACK TO batch")
+                        results.append(e)
+                    self.conn.execute("RELEASE batch")
+        except sqlite3.Error as e:
+            for _batch, future in group:
+                future.set_exception(e)
+            return
+        self.commits += 1
+        for (_batch, future), result in zip(group, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                self.batches_written += 1
+                future.set_result(result)
+
+    def _insert(self, batch: dict) -> bool:
+        """배치 하나 반영 (이미 받은 batch_id면 False)"""
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO batches (batch_id, seat, team) VALUES (?, ?, ?)",
+            (batch['batch_id'], batch['seat'], batch.get('team', ''))
+        )
+        if cursor.rowcount == 0:
+            return False
+        self.conn.executemany(f"""
+            INSERT OR REPLACE INTO rollups
+                (seat, team, date, {', '.join(ROLLUP_FIELDS)}, category_minutes)
+            VALUES (?, ?, ?, {', '.join('?' for _ in ROLLUP_FIELDS)}, ?)
+        """, [
+            (batch['seat'], batch.get('team', ''), rollup['date'],
+             *(rollup.get(field, 0) for field in ROLLUP_FIELDS),
+             json.dumps(rollup.get('category_minutes', {})))
+            for rollup in batch['rollups']
+        ])
+        return True
+
+    def team_summary(self) -> List[dict]:
+        """팀/날짜별 합계 (읽기는 별도 연결 - WAL이라 쓰기와 동시에 가능)"""
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute(f"""
+                SELECT team, date, COUNT(*) AS seats,
+                       {', '.join(f'SUM({field}) AS {field}' for field in ROLLUP_FIELDS)}
+                FROM rollups GROUP BY team, date ORDER BY team, date
+            """).fetchall()
+            return [dict(row) for row in rows]
+        finally:
+            conn.close()
+
+
+class CollectorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문을 따로 쓰므로 Nagle + 지연 ACK로 응답마다 ~40ms 멈추는 것 방지
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _reply(self, status: int, payload: dict):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _authorized(self) -> bool:
+        token = self.server.token
+        return not token or self.headers.get("Authorization") == f"Bearer {token}"
+
+    def do_POST(self):
+        if self.path != "/v1/rollups":
+            return self._reply(404, {"error": "not found"})
+        if not self._authorized():
+            return self._reply(401, {"error": "unauthorized"})
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            return self._reply(411, {"error": "bad length"})
+        if length <= 0 or length > MAX_BODY:
+            return self._reply(413 if length else 411, {"error": "bad length"})
+        body = self.rfile.read(length)
+        try:
+            batch = parse_batch(body, self.headers.get("Content-Encoding", ""))
+        except BatchError as e:
+            return self._reply(400, {"error": str(e)})
+        try:
+            accepted = self.server.writer.submit(batch).result(timeout=30)
+        except Exception as e:
+            return self._reply(503, {"error": str(e)})
+        self._reply(200, {"batch_id": batch['batch_id'], "duplicate": not accepted})
+
+    def do_GET(self):
+        if self.path != "/v1/teams":
+            return self._reply(404, {"error": "not found"})
+        if not self._authorized():
+            return self._reply(401, {"error": "unauthorized"})
+        self._reply(200, {"teams": self.server.writer.team_summary()})
+
+
+class CollectorServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, db_path: str, token: str = "", verbose: bool = False):
+        super().__init__(address, CollectorHandler)
+        self.token = token
+        self.verbose = verbose
+        self.writer = BatchWriter(db_path)
+        self.writer.start()
+
+    def server_close(self):
+        super().server_close()
+        self.writer.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Focus Guardian 팀 집계 수집 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--db", default="fleet.db", help="저장할 SQLite 파일")
+    parser.add_argument("--token", default="", help="Bearer 토큰 (지정 시 필수)")
+    parser.add_argument("--verbose", action="store_true", help="요청 로그 출력")
+    args = parser.parse_args()
+
+    server = CollectorServer((args.host, args.port), args.db, token=args.token,
+                             verbose=args.verbose)
+    print(f"수집 서버: http://{args.host}:{server.server_port}/v1/rollups", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
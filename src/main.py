@@ -1,96 +1,382 @@
 #!/usr/bin/env python3
 """Focus Guardian - 집중력 향상 데스크톱 애플리케이션"""
 import sys
-import json
+import signal
+import argparse
 from pathlib import Path
 
 # 모듈 경로 추가
 sys.path.insert(0, str(Path(__file__).parent))
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
+from utils.profiling import StartupProfiler
+from utils.metrics import metrics
 
-from models.database import Database
-from services.window_monitor import WindowMonitor, AppClassifier
-from services.notification import NotificationService
-from services.session_manager import SessionManager
-from ui.main_window import MainWindow
 
+def parse_args(argv: list) -> argparse.Namespace:
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(prog="focus-guardian")
+    parser.add_argument(
+        "--profile-startup", action="store_true",
+        help="시작 단계별 소요 시간을 stderr에 출력"
+    )
+    parser.add_argument(
+        "--metrics-file", metavar="PATH",
+        help="핫 패스 메트릭을 주기적으로 JSON 파일에 저장"
+    )
+    parser.add_argument(
+        "--metrics-socket", metavar="PATH", nargs="?", const="",
+        help="로컬 UNIX 소켓으로 메트릭 제공 (경로 생략 시 $XDG_RUNTIME_DIR 사용)"
+    )
+    parser.add_argument(
+        "--record-trace", metavar="PATH",
+        help="창 전환을 트레이스 파일로 기록 (benchmarks/trace.py로 재생)"
+    )
+    parser.add_argument(
+        "--async-pipeline", action="store_true",
+        help="QTimer 폴링 대신 작업 스레드의 asyncio 파이프라인으로 창 감시/분류"
+    )
+    parser.add_argument(
+        "--monitor-backend", metavar="NAME", default="auto",
+        help="활성 창 소스 (auto | sway-ipc | xlib | gnome-dbus | x11-subprocess | scripted)"
+    )
+    parser.add_argument(
+        "--headless", action="store_true",
+        help="UI 없이 모니터/분류기/세션 엔진만 실행 (QtWidgets 미사용, 제어 소켓으로 조작)"
+    )
+    parser.add_argument(
+        "--attach", action="store_true",
+        help="UI만 실행하고 실행 중인 헤드리스 데몬에 연결"
+    )
+    parser.add_argument(
+        "--control-socket", metavar="PATH",
+        help="제어 소켓 경로 (기본: $XDG_RUNTIME_DIR/focus-guardian-<uid>.sock)"
+    )
+    # Qt 인자는 QApplication에 그대로 전달
+    args, _ = parser.parse_known_args(argv[1:])
+    return args
 
-def load_config() -> dict:
-    """설정 파일 로드"""
-    # 사용자 설정 경로
-    user_config = Path.home() / ".config" / "focus-guardian" / "settings.json"
-
-    # 기본 설정 경로
-    default_config = Path(__file__).parent.parent / "config" / "default_settings.json"
-
-    config = {}
 
-    # 기본 설정 로드
-    if default_config.exists():
-        with open(default_config, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+def install_signal_handlers(app):
+    """SIGTERM/SIGINT에도 정리 단계를 거치도록 (로그아웃 시 메트릭 저장 등)"""
+    from PySide6.QtCore import QTimer
 
-    # 사용자 설정으로 덮어쓰기
-    if user_config.exists():
-        with open(user_config, 'r', encoding='utf-8') as f:
-            user_settings = json.load(f)
-            config.update(user_settings)
+    signal.signal(signal.SIGTERM, lambda *_: app.quit())
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    # 파이썬 시그널 핸들러가 실행될 수 있도록 주기적으로 인터프리터로 복귀
+    timer = QTimer(app)
+    timer.timeout.connect(lambda: None)
+    timer.start(500)
 
-    return config
 
+def create_gui_app(argv: list):
+    """QApplication 생성"""
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import Qt
 
-def main():
     # 고DPI 지원
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
 
-    app = QApplication(sys.argv)
+    app = QApplication(argv)
     app.setApplicationName("Focus Guardian")
     app.setApplicationDisplayName("Focus Guardian")
     app.setQuitOnLastWindowClosed(False)  # 트레이로 최소화 허용
+    return app
 
-    # 설정 로드
-    config = load_config()
 
-    # 데이터베이스 초기화
-    db = Database()
+def run_attached(args) -> int:
+    """UI만 실행하고 헤드리스 데몬에 연결"""
+    app = create_gui_app(sys.argv)
 
-    # 서비스 초기화
-    window_monitor = WindowMonitor(poll_interval=500)
+    from services.ipc import QtIpcClient
+    from services.config_service import ConfigService
+    from services.notification import NotificationService
+    from services.remote import RemoteSessionManager, RemoteTodayStats
+    from ui.main_window import MainWindow
 
-    app_classifier = AppClassifier(
-        categories=config.get('categories', [])
-    )
+    client = QtIpcClient(args.control_socket)
+    if not client.connect_to_server():
+        print("헤드리스 데몬에 연결할 수 없습니다. 먼저 --headless로 실행하세요.")
+        return 1
+    client.disconnected.connect(app.quit)
 
-    notification_config = config.get('notification', {})
+    # 데몬의 리마인더는 이 GUI의 토스트로 표시
+    notification_config = ConfigService().snapshot.notification
     notification_service = NotificationService(
         position=notification_config.get('position', 'top-right'),
         messages=notification_config.get('messages'),
         sound_enabled=notification_config.get('sound', True)
     )
+    session_manager = RemoteSessionManager(client, notification_service)
+    today_stats = RemoteTodayStats(client)
+    main_window = MainWindow(session_manager=session_manager, today_stats=today_stats)
+    main_window.show()
 
-    session_manager = SessionManager(
-        db=db,
-        window_monitor=window_monitor,
-        app_classifier=app_classifier,
-        notification_service=notification_service
-    )
+    install_signal_handlers(app)
+    return app.exec()
 
-    # 창 모니터링 시작
-    window_monitor.start()
 
-    # 메인 윈도우 생성
-    main_window = MainWindow(session_manager=session_manager)
-    main_window.show()
+def main():
+    args = parse_args(sys.argv)
+    if args.attach:
+        sys.exit(run_attached(args))
+
+    headless = args.headless
+    profiler = StartupProfiler(enabled=args.profile_startup)
+    # 메트릭 출력 대상이 있을 때만 계측 활성화
+    metrics.enabled = bool(args.metrics_file) or args.metrics_socket is not None
+
+    # 1단계: 트레이 아이콘과 메인 윈도우를 최대한 빨리 표시
+    with profiler.stage("qapplication"):
+        from PySide6.QtCore import QTimer
+        if headless:
+            # 헤드리스: QtWidgets를 로드하지 않음
+            from PySide6.QtCore import QCoreApplication
+            app = QCoreApplication(sys.argv)
+            app.setApplicationName("Focus Guardian")
+        else:
+            app = create_gui_app(sys.argv)
+
+    with profiler.stage("load config"):
+        from services.config_service import ConfigService
+        # 기본 설정과 사용자 설정을 병합한 불변 스냅샷 (디스크 캐시 사용)
+        config_service = ConfigService()
+        config = config_service.snapshot
+
+    with profiler.stage("database"):
+        from models.database import Database
+        # 스키마 버전이 같으면 DDL 생략
+        db = Database()
+
+    with profiler.stage("services"):
+        from services.window_monitor import WindowMonitor, AppClassifier
+        from services.session_manager import SessionManager
+        from services.today_stats import TodayStats
+
+        # 분류기는 첫 분류 시 컴파일
+        app_classifier = AppClassifier(rules=config.rules)
+
+        # 모니터는 창 표시 후에 시작 (백엔드는 그때 세션에 맞게 선택)
+        from services.backends import backend_names
+        if args.monitor_backend not in ('auto', *backend_names()):
+            print(f"알 수 없는 모니터 백엔드: {args.monitor_backend} "
+                  f"(가능: auto, {', '.join(backend_names())})", file=sys.stderr)
+            sys.exit(2)
+        if args.async_pipeline:
+            from services.pipeline_bridge import PipelineBridge
+            window_monitor = PipelineBridge(app_classifier, poll_interval=500,
+                                            backend=args.monitor_backend)
+        else:
+            window_monitor = WindowMonitor(poll_interval=500, backend=args.monitor_backend)
+
+        # 브라우저 확장이 보고한 탭 URL (제어 소켓의 browser.tab)
+        from services.browser_tabs import BrowserTabs
+        browser_tabs = BrowserTabs()
+        window_monitor.attach_browser_tabs(browser_tabs)
+
+        if headless:
+            # 리마인더는 제어 소켓 구독자에게 이벤트로 전달
+            from services.control import RemoteNotificationService
+            notification_service = RemoteNotificationService()
+        else:
+            # 토스트 위젯은 첫 알림 시점에 생성
+            from services.notification import NotificationService
+            notification_config = config.notification
+            notification_service = NotificationService(
+                position=notification_config.get('position', 'top-right'),
+                messages=notification_config.get('messages'),
+                sound_enabled=notification_config.get('sound', True)
+            )
+
+        # 전환 기록의 창 제목은 설정에 따라 정규화 + 키 해시해서 저장
+        from utils.title_privacy import TitleProcessor
+        from models.journal import SessionJournal
+        session_manager = SessionManager(
+            db=db,
+            window_monitor=window_monitor,
+            app_classifier=app_classifier,
+            notification_service=notification_service,
+            title_processor=TitleProcessor.from_config(config.privacy),
+            journal=SessionJournal()
+        )
+        session_manager.apply_focus_settings(config.focus)
+        if args.async_pipeline:
+            session_manager.attach_pipeline(window_monitor)
+
+        # 자리 비움/화면 잠금 시 세션 일시정지 + 창 폴링 중지
+        idle_detector = None
+        if config.focus.get('pause_when_idle', True):
+            from services.idle_detector import IdleDetector, LockWatcher
+            idle_detector = IdleDetector(
+                threshold=config.focus.get('idle_threshold', 5) * 60,
+                lock_watcher=LockWatcher()
+            )
+            session_manager.attach_idle_detector(idle_detector)
+
+        # 세션/창 이력 검색 색인 (창 전환 스트림에서 배치로 저장)
+        from services.search_index import SearchIndexer
+        search_indexer = SearchIndexer(db, session_manager)
+
+        # 다음 창 미리 분류 + 방해 가능성이 높으면 토스트 미리 준비
+        from services.distraction_predictor import DistractionPredictor
+        distraction_predictor = DistractionPredictor(session_manager)
+
+        # 시간대/요일/카테고리별 집중 패턴 (스냅샷이 없으면 창을 띄운 뒤 DB 이력으로 채움)
+        from services.focus_patterns import FocusPatterns
+        focus_patterns = FocusPatterns()
+        patterns_loaded = focus_patterns.load()
+        focus_patterns.attach(session_manager)
+
+        # 날짜/카테고리별 체류 시간 (최근 기간 셀만 메모리에, 창 전환 스트림으로 갱신)
+        from services.dwell_rollup import DwellRollup
+        dwell_rollup = DwellRollup(db, session_manager)
+        dwell_rollup.set_categories(config.categories)
+        if idle_detector:
+            dwell_rollup.attach_idle_detector(idle_detector)
+
+        # 오늘의 통계 (시작 시 한 번만 DB 조회)
+        today_stats = TodayStats(session_manager=session_manager)
+
+    if not headless:
+        with profiler.stage("main window"):
+            from ui.main_window import MainWindow
+
+            main_window = MainWindow(session_manager=session_manager, today_stats=today_stats,
+                                     focus_patterns=focus_patterns, dwell_rollup=dwell_rollup)
+            main_window.show()
+
+    # 설정 파일이 바뀌면 재시작 없이 새 스냅샷 적용
+    def apply_config(snapshot):
+        app_classifier.set_rules(snapshot.rules)
+        session_manager.apply_focus_settings(snapshot.focus)
+        dwell_rollup.set_categories(snapshot.categories)
+        configure_fleet(snapshot.fleet)
+        session_manager.title_processor = TitleProcessor.from_config(snapshot.privacy)
+        if idle_detector:
+            idle_detector.set_threshold(snapshot.focus.get('idle_threshold', 5) * 60)
+        if not headless:
+            notification_service.update_settings(
+                position=snapshot.notification.get('position', 'top-right'),
+                messages=snapshot.notification.get('messages'),
+                sound_enabled=snapshot.notification.get('sound', True)
+            )
+
+    config_service.config_changed.connect(apply_config)
+
+    # 2단계: 이벤트 루프가 돌기 시작한 뒤 나머지 서비스 초기화
+    def deferred_init():
+        if headless:
+            # 제어 소켓이 데몬의 유일한 조작 수단 - 이미 다른 데몬이 쓰고 있으면 같은 DB에
+            # 전환 기록을 쓰는 두 번째 데몬이 되지 않도록 아무것도 시작하지 않고 종료
+            with profiler.stage("control socket"):
+                if not start_control():
+                    print("제어 소켓을 열 수 없어 헤드리스 데몬을 종료합니다")
+                    app.exit(1)
+                    return
+        # 복구된 세션이 이력과 시그널로 두 번 반영되지 않도록 복구보다 먼저
+        # (채우기 전에는 추천 버튼이 숨어 있음)
+        if not patterns_loaded:
+            with profiler.stage("focus patterns"):
+                focus_patterns.bootstrap(db)
+            if not headless:
+                main_window.refresh_suggestion()
+        # 비정상 종료로 남은 세션은 UI/통계가 시그널을 받을 수 있게 된 뒤 복구
+        with profiler.stage("recover session"):
+            session_manager.recover_session()
+        with profiler.stage("distraction model"):
+            distraction_predictor.bootstrap(db)
+        with profiler.stage("start monitor"):
+            window_monitor.start()
+        search_indexer.start()
+        dwell_rollup.start()
+        if idle_detector:
+            with profiler.stage("idle detector"):
+                idle_detector.start()
+        if args.record_trace:
+            from services.replay import TraceRecorder
+            recorders.append(TraceRecorder(window_monitor, args.record_trace))
+            recorders[-1].start()
+        with profiler.stage("watch config"):
+            config_service.watch()
+        if not headless:
+            with profiler.stage("control socket"):
+                start_control()
+        configure_fleet(config.fleet)
+        with profiler.stage("archive partitions"):
+            # 지난 달 전환 기록 파티션은 VACUUM 후 읽기 전용으로 (이미 정리된 달은 건너뜀)
+            db.archive_partitions()
+        if metrics.enabled:
+            with profiler.stage("metrics"):
+                start_metrics()
+        profiler.mark("first event loop tick")
+        profiler.report()
+
+    metrics_services = []
+    recorders = []
+    control_services = []
+    fleet_uploaders = []
+
+    def configure_fleet(fleet):
+        """팀 집계 업로드 (옵트인) - 설정 변경 시 켜고 끄기"""
+        if not fleet.get('enabled'):
+            for uploader in fleet_uploaders:
+                uploader.stop()
+            fleet_uploaders.clear()
+            return
+        if fleet_uploaders:
+            fleet_uploaders[0].configure(fleet['endpoint'], fleet.get('team', ''),
+                                         fleet.get('token', ''))
+            return
+        from services.fleet import FleetUploader
+        uploader = FleetUploader(db, fleet['endpoint'], team=fleet.get('team', ''),
+                                 token=fleet.get('token', ''))
+        uploader.upload_failed.connect(lambda message: print(f"팀 집계 업로드: {message}",
+                                                             file=sys.stderr))
+        uploader.start()
+        fleet_uploaders.append(uploader)
+
+    def start_control() -> bool:
+        from services.ipc import IpcServer
+        from services.control import ControlApi
+        server = IpcServer(args.control_socket)
+        api = ControlApi(
+            server, session_manager, today_stats,
+            remote_notifications=notification_service if headless else None,
+            browser_tabs=browser_tabs,
+            search_indexer=search_indexer
+        )
+        if not server.start():
+            return False
+        control_services.append(api)
+        return True
+
+    def start_metrics():
+        from services.metrics_service import StallDetector, MetricsServer, MetricsFileWriter
+        metrics_services.append(StallDetector())
+        if args.metrics_file:
+            metrics_services.append(MetricsFileWriter(args.metrics_file))
+        if args.metrics_socket is not None:
+            metrics_services.append(MetricsServer(args.metrics_socket or None))
+        for service in metrics_services:
+            service.start()
+
+    QTimer.singleShot(0, deferred_init)
+    install_signal_handlers(app)
 
     # 앱 실행
     exit_code = app.exec()
 
     # 정리
-    window_monitor.stop()
+    for service in metrics_services + recorders + control_services + fleet_uploaders:
+        service.stop()
+    if idle_detector:
+        idle_detector.stop()
+    window_monitor.close()
+    session_manager.close()
+    search_indexer.stop()
+    dwell_rollup.stop()
+    focus_patterns.save()
     db.close()
 
     sys.exit(exit_code)
@@ -2,9 +2,25 @@
 import sqlite3
 import json
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterator, List, Optional
 import uuid
+from functools import wraps
+
+from models.migrations import migrate
+from models.partitions import SwitchPartitions
+from models.records import SwitchEvent, PhaseRecord
+from utils.title_privacy import search_words
+from utils.metrics import metrics
+
+
+def timed_write(method):
+    """쓰기 메서드 지연 계측 (커밋 포함)"""
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        with metrics.timer("db.write_seconds"):
+            return method(*args, **kwargs)
+    return wrapper
 
 
 class Database:
@@ -18,106 +34,20 @@ class Database:
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
-        self._create_tables()
-
-    def _create_tables(self):
-        """데이터베이스 테이블 생성"""
-        cursor = self.conn.cursor()
-
-        # 사용자 설정
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS settings (
-                id INTEGER PRIMARY KEY,
-                default_duration INTEGER DEFAULT 45,
-                break_interval INTEGER DEFAULT 15,
-                pomodoro_mode BOOLEAN DEFAULT 0,
-                strict_mode BOOLEAN DEFAULT 0,
-                notification_enabled BOOLEAN DEFAULT 1,
-                notification_position TEXT DEFAULT 'top-right',
-                notification_duration INTEGER DEFAULT 5,
-                notification_sound BOOLEAN DEFAULT 1,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # 앱 카테고리
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS app_categories (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                type TEXT CHECK(type IN ('work', 'entertainment', 'neutral')),
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # 앱 정의
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS apps (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                category_id TEXT,
-                app_name TEXT NOT NULL,
-                process_name TEXT,
-                title_pattern TEXT,
-                FOREIGN KEY (category_id) REFERENCES app_categories(id)
-            )
-        """)
-
-        # 집중 세션
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS focus_sessions (
-                id TEXT PRIMARY KEY,
-                start_time TIMESTAMP NOT NULL,
-                end_time TIMESTAMP,
-                target_duration INTEGER NOT NULL,
-                actual_duration INTEGER,
-                app_name TEXT,
-                category_id TEXT,
-                switch_attempts INTEGER DEFAULT 0,
-                switches_blocked INTEGER DEFAULT 0,
-                switches_allowed INTEGER DEFAULT 0,
-                completed BOOLEAN DEFAULT 0,
-                FOREIGN KEY (category_id) REFERENCES app_categories(id)
-            )
-        """)
-
-        # 창 전환 이벤트
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS switch_events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id TEXT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                from_app TEXT,
-                to_app TEXT,
-                blocked BOOLEAN,
-                user_choice TEXT CHECK(user_choice IN ('continue', 'extend', 'switch', NULL)),
-                FOREIGN KEY (session_id) REFERENCES focus_sessions(id)
-            )
-        """)
-
-        # 일일 통계
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS daily_stats (
-                date DATE PRIMARY KEY,
-                total_focus_time INTEGER,
-                sessions_completed INTEGER,
-                sessions_abandoned INTEGER,
-                distraction_score REAL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
 
-        # 인덱스 생성
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sessions_start_time ON focus_sessions(start_time)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_switch_events_session ON switch_events(session_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_switch_events_timestamp ON switch_events(timestamp)")
+        # 스키마가 최신이면 PRAGMA 읽기 한 번으로 끝남
+        self.schema_version = migrate(self.conn)
 
-        # 기본 설정 삽입 (없는 경우)
-        cursor.execute("SELECT COUNT(*) FROM settings")
-        if cursor.fetchone()[0] == 0:
-            cursor.execute("INSERT INTO settings (id) VALUES (1)")
+        # switch_events는 월별 파티션 파일에 저장 (메모리 DB는 기존 테이블 그대로)
+        self.partitions: Optional[SwitchPartitions] = None
+        if db_path != ':memory:':
+            self.partitions = SwitchPartitions(self.conn, Path(db_path).parent / "partitions")
+            self.partitions.adopt_legacy()
 
-        self.conn.commit()
+    def _commit(self):
+        """커밋 (지연 계측)"""
+        with metrics.timer("db.commit_seconds"):
+            self.conn.commit()
 
     # === 설정 관련 메서드 ===
     def get_settings(self) -> dict:
@@ -127,6 +57,7 @@ class Database:
         row = cursor.fetchone()
         return dict(row) if row else {}
 
+    @timed_write
     def update_settings(self, **kwargs):
         """설정 업데이트"""
         allowed_fields = [
@@ -143,9 +74,10 @@ class Database:
 
         cursor = self.conn.cursor()
         cursor.execute(f"UPDATE settings SET {set_clause}, updated_at = ? WHERE id = 1", values)
-        self.conn.commit()
+        self._commit()
 
     # === 세션 관련 메서드 ===
+    @timed_write
     def create_session(self, target_duration: int, app_name: str = None, category_id: str = None) -> str:
         """새 집중 세션 생성"""
         session_id = str(uuid.uuid4())
@@ -154,26 +86,34 @@ class Database:
             INSERT INTO focus_sessions (id, start_time, target_duration, app_name, category_id)
             VALUES (?, ?, ?, ?, ?)
         """, (session_id, datetime.now().isoformat(), target_duration, app_name, category_id))
-        self.conn.commit()
+        self._commit()
         return session_id
 
-    def end_session(self, session_id: str, completed: bool = False):
-        """세션 종료"""
+    @timed_write
+    def end_session(self, session_id: str, completed: bool = False,
+                    paused_seconds: float = 0, end_time: datetime = None) -> Optional[int]:
+        """세션 종료 (일시정지/자리 비움을 뺀 실제 집중 시간(분) 반환)
+
+        end_time: 종료 시각 (기본은 지금, 비정상 종료 복구 시 마지막 하트비트)
+        """
         cursor = self.conn.cursor()
         cursor.execute("SELECT start_time FROM focus_sessions WHERE id = ?", (session_id,))
         row = cursor.fetchone()
         if not row:
-            return
+            return None
 
         start_time = datetime.fromisoformat(row['start_time'])
-        actual_duration = int((datetime.now() - start_time).total_seconds() / 60)
+        end_time = end_time or datetime.now()
+        focused = (end_time - start_time).total_seconds() - paused_seconds
+        actual_duration = max(0, int(focused / 60))
 
         cursor.execute("""
             UPDATE focus_sessions
             SET end_time = ?, actual_duration = ?, completed = ?
             WHERE id = ?
-        """, (datetime.now().isoformat(), actual_duration, completed, session_id))
-        self.conn.commit()
+        """, (end_time.isoformat(), actual_duration, completed, session_id))
+        self._commit()
+        return actual_duration
 
     def get_active_session(self) -> Optional[dict]:
         """현재 활성 세션 가져오기"""
@@ -186,14 +126,21 @@ class Database:
         row = cursor.fetchone()
         return dict(row) if row else None
 
+    @timed_write
     def record_switch_attempt(self, session_id: str, from_app: str, to_app: str,
-                               blocked: bool, user_choice: str = None):
-        """창 전환 시도 기록"""
+                               blocked: bool, user_choice: str = None,
+                               from_title: str = None, to_title: str = None):
+        """창 전환 시도 기록 (제목은 TitleProcessor를 거친 값만 전달)"""
+        # 파티션(월)과 timestamp가 같은 시각을 기준으로 하도록 직접 지정 (UTC)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        schema = self.partitions.current(now) if self.partitions else 'main'
         cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO switch_events (session_id, from_app, to_app, blocked, user_choice)
-            VALUES (?, ?, ?, ?, ?)
-        """, (session_id, from_app, to_app, blocked, user_choice))
+        cursor.execute(f"""
+            INSERT INTO {schema}.switch_events
+                (session_id, timestamp, from_app, to_app, blocked, user_choice, from_title, to_title)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (session_id, now.strftime('%Y-%m-%d %H:%M:%S'), from_app, to_app, blocked,
+              user_choice, from_title, to_title))
 
         # 세션 통계 업데이트
         if blocked:
@@ -209,7 +156,141 @@ class Database:
                 WHERE id = ?
             """, (session_id,))
 
-        self.conn.commit()
+        self._commit()
+
+    def record_switch(self, event: SwitchEvent):
+        """창 전환 시도 기록 (레코드)"""
+        self.record_switch_attempt(
+            event.session_id, event.from_app, event.to_app,
+            blocked=event.blocked, user_choice=event.user_choice,
+            from_title=event.from_title, to_title=event.to_title
+        )
+
+    @timed_write
+    def record_phases(self, phases: List[PhaseRecord]):
+        """뽀모도로 단계 기록 (사이클 단위로 한 트랜잭션)"""
+        if not phases:
+            return
+        self.conn.executemany("""
+            INSERT INTO phase_history
+                (session_id, phase, cycle, position, start_time, end_time, planned_seconds, completed)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [(p.session_id, p.phase, p.cycle, p.position, p.start_time.isoformat(),
+               p.end_time.isoformat(), p.planned_seconds, p.completed) for p in phases])
+        self._commit()
+
+    def _switch_events(self, columns: str, start: datetime, end: datetime,
+                       where: str = "", params: tuple = ()) -> Iterator[tuple]:
+        """start ~ end(로컬, end 미포함) 전환 기록 조회 (SQL, 파라미터)들 - 걸친 달의 파티션만 읽음"""
+        # switch_events.timestamp는 UTC (CURRENT_TIMESTAMP)
+        first = start.astimezone(timezone.utc).replace(tzinfo=None)
+        last = end.astimezone(timezone.utc).replace(tzinfo=None)
+        if self.partitions:
+            yield from self.partitions.select(columns, where, first, last, params)
+            return
+        condition = "timestamp >= ? AND timestamp < ?" + (f" AND ({where})" if where else "")
+        yield (f"SELECT {columns} FROM switch_events WHERE {condition}",
+               [first.strftime('%Y-%m-%d %H:%M:%S'), last.strftime('%Y-%m-%d %H:%M:%S'), *params])
+
+    def get_switch_events(self, start: datetime, end: datetime,
+                          session_id: str = None) -> List[dict]:
+        """기간(로컬 시각, end 미포함) 내 전환 기록 (시간순)"""
+        events = []
+        for sql, params in self._switch_events(
+            "session_id, timestamp, from_app, to_app, blocked, user_choice, from_title, to_title",
+            start, end, "session_id = ?" if session_id else "", (session_id,) if session_id else ()
+        ):
+            # 파티션 묶음은 달 순서대로 나옴
+            rows = self.conn.execute(f"SELECT * FROM ({sql}) ORDER BY timestamp", params)
+            events.extend(dict(row) for row in rows)
+        return events
+
+    def archive_partitions(self, before: str = None, compress: bool = False) -> List[str]:
+        """지난 달 전환 기록 파티션을 읽기 전용으로 정리 (SwitchPartitions.archive)"""
+        return self.partitions.archive(before, compress) if self.partitions else []
+
+    # === 검색 관련 메서드 ===
+    @timed_write
+    def index_history(self, entries: List[tuple]):
+        """검색 색인 추가 - (session_id, seen_at, app, title, category) 목록을 한 트랜잭션으로"""
+        if not entries:
+            return
+        self.conn.executemany("""
+            INSERT INTO history_fts (session_id, seen_at, app, title, category)
+            VALUES (?, ?, ?, ?, ?)
+        """, entries)
+        self._commit()
+
+    def search_history(self, query: str, limit: int = 20,
+                       title_term: Callable[[str], str] = None) -> List[dict]:
+        """
+        세션/창 이력 검색 - 관련도순 세션 목록 (snippet에 일치 부분을 [ ]로 표시)
+
+        Args:
+            query: 검색어 (단어마다 앞부분 일치, 모든 단어 포함)
+            limit: 최대 세션 수
+            title_term: 제목이 단어별 해시로 색인된 경우 단어 → 토큰 (TitleProcessor.term)
+        """
+        words = search_words(query)
+        if not words:
+            return []
+        if title_term:
+            # 해시된 제목은 정확히 같은 단어만 일치
+            clauses = [f'({{app category}} : "{w}"* OR title : "{title_term(w)}")' for w in words]
+            snippet_column = 0
+        else:
+            clauses = [f'{{app title category}} : "{w}"*' for w in words]
+            snippet_column = 1
+
+        cursor = self.conn.cursor()
+        # 색인에서 상위 후보만 뽑은 뒤 세션별로 묶음 (이력이 길어도 후보 수는 고정).
+        # 한 세션의 창이 후보를 채워 세션이 limit개보다 적으면 후보를 넓혀 다시 -
+        # 후보 밖의 세션은 모든 일치가 후보보다 뒤이므로 앞쪽 limit개 순위는 그대로 맞음
+        candidates = limit * 10
+        while True:
+            cursor.execute(f"""
+                WITH hits AS (
+                    SELECT session_id, rank AS score,
+                           COALESCE(NULLIF(snippet(history_fts, {snippet_column}, '[', ']', '…', 10), ''),
+                                    snippet(history_fts, 0, '[', ']', '…', 10)) AS snippet
+                    FROM history_fts
+                    WHERE history_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                )
+                SELECT h.session_id, MIN(h.score) AS score, COUNT(*) AS hits, h.snippet,
+                       s.start_time, s.end_time, s.target_duration, s.actual_duration,
+                       s.app_name, s.category_id, s.completed
+                FROM hits h JOIN focus_sessions s ON s.id = h.session_id
+                GROUP BY h.session_id
+                ORDER BY score
+                LIMIT ?
+            """, (' AND '.join(clauses), candidates, limit))
+            rows = [dict(row) for row in cursor.fetchall()]
+            # 세션이 충분하거나 일치하는 행을 전부 봤으면 끝
+            if len(rows) >= limit or sum(row['hits'] for row in rows) < candidates:
+                return rows
+            candidates *= 4
+
+    # === 체류 시간 집계 ===
+    @timed_write
+    def add_category_dwell(self, cells: List[tuple]):
+        """날짜/카테고리별 체류 시간 누적 - (day, category_id, seconds) 목록을 한 트랜잭션으로"""
+        if not cells:
+            return
+        self.conn.executemany("""
+            INSERT INTO category_dwell (day, category_id, seconds) VALUES (?, ?, ?)
+            ON CONFLICT (day, category_id) DO UPDATE SET seconds = seconds + excluded.seconds
+        """, cells)
+        self._commit()
+
+    def get_category_dwell(self, first_date: str, last_date: str) -> List[tuple]:
+        """first_date ~ last_date(ISO 날짜) 체류 시간 - (day, category_id, seconds) 목록"""
+        cursor = self.conn.execute("""
+            SELECT day, category_id, seconds FROM category_dwell
+            WHERE day >= ? AND day <= ?
+        """, (first_date, last_date))
+        return [tuple(row) for row in cursor.fetchall()]
 
     # === 통계 관련 메서드 ===
     def get_today_stats(self) -> dict:
@@ -237,6 +318,78 @@ class Database:
             'switches_blocked': 0
         }
 
+    def get_ended_sessions(self, since: datetime) -> List[dict]:
+        """since 이후 시작해서 끝난 세션 (시작순)"""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT id, start_time, end_time, target_duration, actual_duration, category_id,
+                   completed, switch_attempts, switches_blocked
+            FROM focus_sessions
+            WHERE start_time >= ? AND end_time IS NOT NULL
+            ORDER BY start_time
+        """, (since.isoformat(),))
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_daily_rollups(self, first_date: str, last_date: str) -> List[dict]:
+        """날짜별 집계 (first_date ~ last_date, ISO 날짜) - 앱 이름/창 제목 없이 숫자와 카테고리 id만"""
+        rollups = {}
+
+        def day(date: str) -> dict:
+            if date not in rollups:
+                rollups[date] = {
+                    'date': date, 'focus_minutes': 0, 'sessions_completed': 0,
+                    'sessions_abandoned': 0, 'switch_attempts': 0, 'switches_blocked': 0,
+                    'focus_phases_completed': 0, 'category_minutes': {},
+                }
+            return rollups[date]
+
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT date(start_time) AS day, COALESCE(category_id, 'neutral') AS category,
+                   COALESCE(SUM(actual_duration), 0) AS minutes,
+                   COUNT(CASE WHEN completed = 1 THEN 1 END) AS completed,
+                   COUNT(CASE WHEN completed = 0 THEN 1 END) AS abandoned
+            FROM focus_sessions
+            WHERE start_time >= ? AND start_time < date(?, '+1 day') AND end_time IS NOT NULL
+            GROUP BY day, category
+        """, (first_date, last_date))
+        for row in cursor.fetchall():
+            rollup = day(row['day'])
+            rollup['focus_minutes'] += row['minutes']
+            rollup['sessions_completed'] += row['completed']
+            rollup['sessions_abandoned'] += row['abandoned']
+            rollup['category_minutes'][row['category']] = row['minutes']
+
+        # switch_events.timestamp는 UTC, 세션 시각은 로컬
+        start = datetime.fromisoformat(first_date)
+        end = datetime.fromisoformat(last_date) + timedelta(days=1)
+        for sql, params in self._switch_events("timestamp, blocked", start, end):
+            cursor.execute(f"""
+                SELECT date(timestamp, 'localtime') AS day, COUNT(*) AS attempts,
+                       COUNT(CASE WHEN blocked = 1 THEN 1 END) AS blocked
+                FROM ({sql})
+                GROUP BY day
+            """, params)
+            # 하루가 두 묶음에 걸칠 수 있으므로 합산
+            for row in cursor.fetchall():
+                rollup = day(row['day'])
+                rollup['switch_attempts'] += row['attempts']
+                rollup['switches_blocked'] += row['blocked']
+
+        cursor.execute("""
+            SELECT date(start_time) AS day, COUNT(*) AS phases
+            FROM phase_history
+            WHERE phase = 'focus' AND completed = 1
+              AND start_time >= ? AND start_time < date(?, '+1 day')
+            GROUP BY day
+        """, (first_date, last_date))
+        for row in cursor.fetchall():
+            day(row['day'])['focus_phases_completed'] = row['phases']
+
+        return [rollups[date] for date in sorted(rollups)]
+
     def close(self):
         """데이터베이스 연결 종료"""
+        if self.partitions:
+            self.partitions.close()
         self.conn.close()
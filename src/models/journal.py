@@ -0,0 +1,122 @@
+"""세션 저널 - 진행 중인 세션 상태를 추가 전용 파일에 기록해서 비정상 종료 후 복구
+
+한 줄에 레코드 하나: "<crc32 8자리> <json>". 마지막 줄이 쓰다 만 상태면 CRC가 맞지 않아
+무시된다. 저널에는 현재 세션만 담기며 세션이 끝나면 비운다.
+
+레코드:
+    {"op": "state", "t": ..., "session": FocusSession.to_dict()}   시작/일시정지/재개/연장
+    {"op": "beat", "t": ...}                                       하트비트
+"""
+import os
+import json
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, NamedTuple
+
+
+JOURNAL_PATH = Path.home() / ".config" / "focus-guardian" / "session.journal"
+
+# 상태 레코드 JSON의 시작 (encode_record는 op를 첫 키로 씀)
+_STATE_PREFIX = b'{"op":"state"'
+
+
+class RecoveredSession(NamedTuple):
+    """저널에서 읽은 마지막 세션 상태"""
+    session: dict        # FocusSession.to_dict() 형식
+    last_seen: datetime  # 마지막 상태 기록 또는 하트비트 시각
+
+
+def encode_record(record: dict) -> bytes:
+    payload = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+
+def decode_record(line: bytes) -> Optional[dict]:
+    """손상되었거나 잘린 줄은 None"""
+    if len(line) < 10 or line[8:9] != b" " or not line.endswith(b"\n"):
+        return None
+    payload = line[9:-1]
+    try:
+        if int(line[:8], 16) != zlib.crc32(payload):
+            return None
+        return json.loads(payload)
+    except ValueError:
+        return None
+
+
+class SessionJournal:
+    """세션 상태 전이는 즉시 fsync, 하트비트는 모아서 fsync"""
+
+    # 하트비트 fsync 간격 (초) - 그 사이 전원이 나가면 마지막 하트비트 몇 개만 잃음
+    FSYNC_INTERVAL = 60.0
+
+    def __init__(self, path: Path = JOURNAL_PATH, clock=time.time):
+        self.path = Path(path)
+        self._clock = clock
+        self._file = None
+        self._last_sync = 0.0
+
+    def _open(self):
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'ab', buffering=0)
+        return self._file
+
+    def _append(self, record: dict, sync: bool):
+        f = self._open()
+        f.write(encode_record(record))
+        now = record["t"]
+        if sync or now - self._last_sync >= self.FSYNC_INTERVAL:
+            os.fsync(f.fileno())
+            self._last_sync = now
+
+    def begin(self, session: dict):
+        """새 세션 - 이전 내용을 버리고 시작 상태 기록"""
+        self._open().truncate(0)
+        self.record_state(session)
+
+    def record_state(self, session: dict):
+        """세션 상태 전이 (즉시 fsync)"""
+        self._append({"op": "state", "t": self._clock(), "session": session}, sync=True)
+
+    def heartbeat(self):
+        """살아 있음 표시 (fsync는 FSYNC_INTERVAL마다)"""
+        self._append({"op": "beat", "t": self._clock()}, sync=False)
+
+    def end(self):
+        """정상 종료 - 저널 비우기"""
+        f = self._open()
+        f.truncate(0)
+        os.fsync(f.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def recover(self) -> Optional[RecoveredSession]:
+        """정상 종료되지 않은 세션 (없으면 None)"""
+        try:
+            data = self.path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        # 뒤에서부터: 마지막 정상 레코드의 시각과 마지막 상태 레코드만 디코드
+        # (하트비트가 수천 줄이어도 나머지는 건너뜀)
+        last_seen = None
+        for line in reversed(data.splitlines(keepends=True)):
+            if last_seen is None:
+                record = decode_record(line)
+                if record is None:
+                    # 추가 전용이므로 손상은 마지막 쓰기에서만 생김
+                    continue
+                last_seen = record["t"]
+            elif line[9:9 + len(_STATE_PREFIX)] == _STATE_PREFIX:
+                record = decode_record(line)
+            else:
+                continue
+            if record and record.get("op") == "state":
+                return RecoveredSession(record["session"], datetime.fromtimestamp(last_seen))
+        return None
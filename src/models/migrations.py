@@ -0,0 +1,186 @@
+"""스키마 마이그레이션 (PRAGMA user_version 기반)"""
+import sqlite3
+from typing import List, Tuple
+
+
+# (버전, 설명, SQL 문 목록) - 버전 순서대로 적용
+MIGRATIONS: List[Tuple[int, str, List[str]]] = [
+    (1, "기본 스키마", [
+        # 사용자 설정
+        """
+            CREATE TABLE IF NOT EXISTS settings (
+                id INTEGER PRIMARY KEY,
+                default_duration INTEGER DEFAULT 45,
+                break_interval INTEGER DEFAULT 15,
+                pomodoro_mode BOOLEAN DEFAULT 0,
+                strict_mode BOOLEAN DEFAULT 0,
+                notification_enabled BOOLEAN DEFAULT 1,
+                notification_position TEXT DEFAULT 'top-right',
+                notification_duration INTEGER DEFAULT 5,
+                notification_sound BOOLEAN DEFAULT 1,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+        # 앱 카테고리
+        """
+            CREATE TABLE IF NOT EXISTS app_categories (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                type TEXT CHECK(type IN ('work', 'entertainment', 'neutral')),
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+        # 앱 정의
+        """
+            CREATE TABLE IF NOT EXISTS apps (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                category_id TEXT,
+                app_name TEXT NOT NULL,
+                process_name TEXT,
+                title_pattern TEXT,
+                FOREIGN KEY (category_id) REFERENCES app_categories(id)
+            )
+        """,
+        # 집중 세션
+        """
+            CREATE TABLE IF NOT EXISTS focus_sessions (
+                id TEXT PRIMARY KEY,
+                start_time TIMESTAMP NOT NULL,
+                end_time TIMESTAMP,
+                target_duration INTEGER NOT NULL,
+                actual_duration INTEGER,
+                app_name TEXT,
+                category_id TEXT,
+                switch_attempts INTEGER DEFAULT 0,
+                switches_blocked INTEGER DEFAULT 0,
+                switches_allowed INTEGER DEFAULT 0,
+                completed BOOLEAN DEFAULT 0,
+                FOREIGN KEY (category_id) REFERENCES app_categories(id)
+            )
+        """,
+        # 창 전환 이벤트
+        """
+            CREATE TABLE IF NOT EXISTS switch_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT,
+                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                from_app TEXT,
+                to_app TEXT,
+                blocked BOOLEAN,
+                user_choice TEXT CHECK(user_choice IN ('continue', 'extend', 'switch', NULL)),
+                FOREIGN KEY (session_id) REFERENCES focus_sessions(id)
+            )
+        """,
+        # 일일 통계
+        """
+            CREATE TABLE IF NOT EXISTS daily_stats (
+                date DATE PRIMARY KEY,
+                total_focus_time INTEGER,
+                sessions_completed INTEGER,
+                sessions_abandoned INTEGER,
+                distraction_score REAL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+        # 인덱스
+        "CREATE INDEX IF NOT EXISTS idx_sessions_start_time ON focus_sessions(start_time)",
+        "CREATE INDEX IF NOT EXISTS idx_switch_events_session ON switch_events(session_id)",
+        "CREATE INDEX IF NOT EXISTS idx_switch_events_timestamp ON switch_events(timestamp)",
+        # 기본 설정 행
+        "INSERT OR IGNORE INTO settings (id) VALUES (1)",
+    ]),
+    (2, "활성 세션 부분 인덱스", [
+        "CREATE INDEX IF NOT EXISTS idx_sessions_active ON focus_sessions(start_time) WHERE end_time IS NULL",
+    ]),
+    (3, "전환 기록의 창 제목 (정규화/해시된 값)", [
+        "ALTER TABLE switch_events ADD COLUMN from_title TEXT",
+        "ALTER TABLE switch_events ADD COLUMN to_title TEXT",
+    ]),
+    (4, "뽀모도로 단계 기록", [
+        """
+            CREATE TABLE IF NOT EXISTS phase_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT,
+                phase TEXT CHECK(phase IN ('focus', 'short_break', 'long_break')),
+                cycle INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                start_time TIMESTAMP NOT NULL,
+                end_time TIMESTAMP NOT NULL,
+                planned_seconds INTEGER NOT NULL,
+                completed BOOLEAN DEFAULT 0,
+                FOREIGN KEY (session_id) REFERENCES focus_sessions(id)
+            )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_phase_history_session ON phase_history(session_id)",
+    ]),
+    (5, "세션/창 이력 전문 검색 색인 (FTS5)", [
+        # 세션마다 처음 본 창 하나당 한 행, 제목은 TitleProcessor.index_terms를 거친 값
+        """
+            CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(
+                app, title, category,
+                session_id UNINDEXED, seen_at UNINDEXED,
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            )
+        """,
+        # 앱 이름 일치를 제목보다 높게
+        "INSERT INTO history_fts(history_fts, rank) VALUES ('rank', 'bm25(2.0, 1.0, 1.5)')",
+        # 기존 세션은 앱/카테고리만 색인
+        """
+            INSERT INTO history_fts (app, title, category, session_id, seen_at)
+            SELECT app_name, NULL, category_id, id, start_time FROM focus_sessions
+        """,
+    ]),
+    (6, "날짜/카테고리별 창 체류 시간 집계", [
+        # 창 전환 스트림에서 증분으로 더함 (services.dwell_rollup), 하루에 카테고리 수만큼의 행
+        """
+            CREATE TABLE IF NOT EXISTS category_dwell (
+                day TEXT NOT NULL,
+                category_id TEXT NOT NULL,
+                seconds REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, category_id)
+            ) WITHOUT ROWID
+        """,
+    ]),
+]
+
+# 최신 스키마 버전
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """저장된 스키마 버전"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    미적용 마이그레이션을 순서대로 적용
+
+    최신 버전이면 PRAGMA 한 번만 읽고 반환한다.
+    각 마이그레이션은 user_version 갱신과 함께 하나의 트랜잭션으로 적용된다.
+
+    Returns:
+        적용 후 스키마 버전
+    """
+    version = get_schema_version(conn)
+    if version >= SCHEMA_VERSION:
+        # 최신이거나 더 새로운 버전에서 만든 DB - DDL 생략
+        return version
+
+    for target, _description, statements in MIGRATIONS:
+        if target <= version:
+            continue
+        conn.execute("BEGIN")
+        try:
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {target}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        version = target
+
+    return version
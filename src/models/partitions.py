@@ -0,0 +1,210 @@
+"""월별 파티션 - switch_events를 달마다 별도 SQLite 파일에 저장
+
+data.db 옆 partitions/ 디렉터리에 switch_events-YYYY-MM.db 파일을 두고 필요할 때 ATTACH한다.
+쓰기는 이번 달 파티션으로만 가고, 기간 조회는 그 기간에 걸친 파티션만 UNION ALL로 묶는다.
+지난 달 파티션은 VACUUM 후 읽기 전용으로 만들거나 gzip으로 압축해 둘 수 있다.
+
+월 구분은 timestamp 컬럼과 같은 UTC 기준이다.
+"""
+import os
+import gzip
+import shutil
+import sqlite3
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+# 파티션 테이블 (data.db의 switch_events와 같은 컬럼)
+PARTITION_SCHEMA = [
+    """
+        CREATE TABLE IF NOT EXISTS {schema}.switch_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            from_app TEXT,
+            to_app TEXT,
+            blocked BOOLEAN,
+            user_choice TEXT CHECK(user_choice IN ('continue', 'extend', 'switch', NULL)),
+            from_title TEXT,
+            to_title TEXT
+        )
+    """,
+    "CREATE INDEX IF NOT EXISTS {schema}.idx_switch_events_session ON switch_events(session_id)",
+    "CREATE INDEX IF NOT EXISTS {schema}.idx_switch_events_timestamp ON switch_events(timestamp)",
+]
+
+SWITCH_COLUMNS = ('session_id', 'timestamp', 'from_app', 'to_app', 'blocked', 'user_choice',
+                  'from_title', 'to_title')
+
+PREFIX = "switch_events-"
+
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def month_key(moment: datetime) -> str:
+    """UTC 시각 → 'YYYY-MM'"""
+    return f"{moment.year:04d}-{moment.month:02d}"
+
+
+def months_between(first: str, last: str) -> List[str]:
+    """'YYYY-MM' 두 값 사이의 모든 달 (양끝 포함)"""
+    year, month = map(int, first.split('-'))
+    end = tuple(map(int, last.split('-')))
+    months = []
+    while (year, month) <= end:
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+class SwitchPartitions:
+    """파티션 파일 생성/ATTACH/정리 (Database와 같은 연결 사용)"""
+
+    # SQLite 기본 ATTACH 한도(10)보다 작게 유지, 넘으면 오래 안 쓴 것부터 DETACH
+    MAX_ATTACHED = 8
+
+    def __init__(self, conn: sqlite3.Connection, directory: Path):
+        self.conn = conn
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._cache_dir = self.directory / ".cache"
+        self._attached: "OrderedDict[str, str]" = OrderedDict()  # month → schema
+        self._months = {p.name[len(PREFIX):len(PREFIX) + 7] for p in self.directory.glob(PREFIX + "*")}
+
+    @staticmethod
+    def schema_name(month: str) -> str:
+        return "p_" + month.replace('-', '_')
+
+    def path(self, month: str) -> Path:
+        return self.directory / f"{PREFIX}{month}.db"
+
+    def months(self) -> List[str]:
+        """파티션 파일이 있는 달 (오름차순)"""
+        return sorted(self._months)
+
+    def _attach(self, month: str, create: bool) -> Optional[str]:
+        """해당 달 파티션의 스키마 이름 (없고 create=False면 None)"""
+        schema = self._attached.get(month)
+        if schema:
+            self._attached.move_to_end(month)
+            return schema
+        path = self.path(month)
+        archived = path.with_suffix('.db.gz')
+        if not path.exists():
+            if archived.exists():
+                path = self._extract(archived)
+            elif not create:
+                return None
+
+        if self.conn.in_transaction:
+            # ATTACH/DETACH는 트랜잭션 밖에서만 가능
+            self.conn.commit()
+        while len(self._attached) >= self.MAX_ATTACHED:
+            _old_month, old_schema = self._attached.popitem(last=False)
+            self.conn.execute(f"DETACH DATABASE {old_schema}")
+
+        schema = self.schema_name(month)
+        self.conn.execute("ATTACH DATABASE ? AS " + schema, (str(path),))
+        if create:
+            # WAL이면 data.db와 함께 커밋할 때 슈퍼 저널(파일 여러 개 fsync)을 쓰지 않음
+            self.conn.execute(f"PRAGMA {schema}.journal_mode=WAL")
+            for statement in PARTITION_SCHEMA:
+                self.conn.execute(statement.format(schema=schema))
+            self.conn.commit()
+            self._months.add(month)
+        self._attached[month] = schema
+        return schema
+
+    def _extract(self, archived: Path) -> Path:
+        """압축된 파티션을 캐시에 풀어서 (읽기 전용) 경로 반환"""
+        self._cache_dir.mkdir(exist_ok=True)
+        target = self._cache_dir / archived.name[:-len('.gz')]
+        if not target.exists() or target.stat().st_mtime < archived.stat().st_mtime:
+            with gzip.open(archived, 'rb') as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.chmod(target, 0o444)
+        return target
+
+    def current(self, now: datetime = None) -> str:
+        """쓰기용 이번 달 파티션 스키마 (없으면 생성)"""
+        return self._attach(month_key(now or utc_now()), create=True)
+
+    def select(self, columns: str, where: str, first: datetime, last: datetime,
+               params: Iterable = ()) -> Iterator[Tuple[str, list]]:
+        """first ~ last(UTC, last 미포함) 구간에 걸친 파티션만 UNION ALL로 묶은 쿼리들
+
+        ATTACH 한도 때문에 MAX_ATTACHED개 달씩 나눠서 (SQL, 파라미터)를 하나씩 내보낸다.
+        다음 쿼리를 받기 전에 앞 쿼리의 결과를 다 읽어야 한다 (DETACH될 수 있음).
+        결과 컬럼은 columns, 조건은 where (timestamp 범위는 자동 추가).
+        """
+        params = tuple(params)
+        bounds = (first.strftime('%Y-%m-%d %H:%M:%S'), last.strftime('%Y-%m-%d %H:%M:%S'))
+        condition = "timestamp >= ? AND timestamp < ?" + (f" AND ({where})" if where else "")
+        months = [m for m in months_between(month_key(first), month_key(last)) if m in self._months]
+        for i in range(0, len(months), self.MAX_ATTACHED):
+            parts = [f"SELECT {columns} FROM {self._attach(month, create=False)}.switch_events "
+                     f"WHERE {condition}" for month in months[i:i + self.MAX_ATTACHED]]
+            yield " UNION ALL ".join(parts), list((*bounds, *params) * len(parts))
+
+    def adopt_legacy(self):
+        """data.db의 switch_events에 남은 행을 월별 파티션으로 이동 (최초 한 번)"""
+        row = self.conn.execute(
+            "SELECT MIN(timestamp), MAX(timestamp) FROM main.switch_events").fetchone()
+        if row[0] is None:
+            return
+        columns = ', '.join(SWITCH_COLUMNS)
+        for month in months_between(row[0][:7], row[1][:7]):
+            schema = self.current(datetime.strptime(month, '%Y-%m'))
+            year, mon = map(int, month.split('-'))
+            next_month = f"{year + mon // 12:04d}-{mon % 12 + 1:02d}"
+            bounds = (f"{month}-01", f"{next_month}-01")
+            self.conn.execute(f"""
+                INSERT INTO {schema}.switch_events ({columns})
+                SELECT {columns} FROM main.switch_events
+                WHERE timestamp >= ? AND timestamp < ? ORDER BY id
+            """, bounds)
+            self.conn.execute(
+                "DELETE FROM main.switch_events WHERE timestamp >= ? AND timestamp < ?", bounds)
+            self.conn.commit()
+
+    def archive(self, before: str = None, compress: bool = False) -> List[str]:
+        """before('YYYY-MM', 기본: 이번 달)보다 이전 파티션을 VACUUM 후 읽기 전용으로
+
+        compress=True면 gzip으로 압축하고 원본을 지운다 (조회 시 캐시에 풀어서 사용).
+
+        Returns:
+            정리한 달 목록
+        """
+        before = before or month_key(utc_now())
+        done = []
+        for month in self.months():
+            path = self.path(month)
+            if month >= before or not path.exists():
+                continue
+            if month in self._attached:
+                if self.conn.in_transaction:
+                    self.conn.commit()
+                self.conn.execute(f"DETACH DATABASE {self._attached.pop(month)}")
+            if not path.stat().st_mode & 0o200 and not compress:
+                continue
+            os.chmod(path, 0o644)
+            conn = sqlite3.connect(path)
+            # 읽기 전용 파일은 -wal/-shm 없이 열려야 하므로 롤백 저널로 되돌림
+            conn.execute("PRAGMA journal_mode=DELETE")
+            conn.execute("VACUUM")
+            conn.close()
+            if compress:
+                with open(path, 'rb') as src, gzip.open(path.with_suffix('.db.gz'), 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+                path.unlink()
+            else:
+                os.chmod(path, 0o444)
+            done.append(month)
+        return done
+
+    def close(self):
+        self._attached.clear()
@@ -0,0 +1,56 @@
+"""핫 패스 레코드 - 불변, __slots__ (인스턴스 딕셔너리 없음)
+
+폴링/분류/전환 기록마다 만들어지는 객체라 개수가 많으므로 작게 유지한다.
+앱/프로세스/카테고리 이름은 utils.symbols로 인터닝해서 넘긴다.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class WindowInfo:
+    """활성 창 정보"""
+    window_id: str
+    title: str
+    app_name: str
+    process_name: str
+    url: Optional[str] = None  # 브라우저 탭 URL (확장이 보고한 경우)
+    pid: Optional[int] = None  # 창 소유 프로세스 (_NET_WM_PID)
+
+
+@dataclass(frozen=True, slots=True)
+class Category:
+    """분류 결과 (분류기가 미리 만들어 둔 인스턴스를 공유)"""
+    id: str
+    name: str
+    type: str  # 'work' | 'entertainment' | 'neutral'
+
+
+# 어떤 규칙에도 맞지 않는 창
+NEUTRAL_CATEGORY = Category("neutral", "기타", "neutral")
+
+
+@dataclass(frozen=True, slots=True)
+class SwitchEvent:
+    """세션 중 창 전환 시도"""
+    session_id: str
+    from_app: str
+    to_app: str
+    blocked: bool
+    user_choice: str  # 'continue' | 'extend' | 'switch'
+    from_title: Optional[str] = None  # TitleProcessor를 거친 값 (해시 또는 원문)
+    to_title: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseRecord:
+    """뽀모도로 단계 하나의 기록 (한 사이클씩 모아서 저장)"""
+    session_id: str
+    phase: str  # 'focus' | 'short_break' | 'long_break'
+    cycle: int
+    position: int  # 사이클 안에서의 순서 (0부터)
+    start_time: datetime
+    end_time: datetime
+    planned_seconds: int
+    completed: bool  # 계획한 길이를 다 채웠는지 (건너뛰기/세션 종료 시 False)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""브라우저 네이티브 메시징 호스트 - 탭 활성화 이벤트를 실행 중인 Focus Guardian으로 전달
+
+브라우저 확장이 connectNative()를 호출하면 브라우저가 이 스크립트를 실행한다.
+stdin/stdout은 네이티브 메시징 프레임(4바이트 길이 + JSON)만 주고받으므로
+진단 메시지는 stderr로만 출력한다.
+
+받는 메시지:
+    {"type": "tab", "url": "https://...", "title": "...", "browser": "firefox"}
+    {"type": "ping"}
+보내는 응답 (메시지마다 하나):
+    {"ok": true} / {"ok": false, "error": "..."}
+"""
+import os
+import sys
+from pathlib import Path
+
+# 모듈 경로 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from services.ipc import IpcClient, IpcError
+from utils.native_messaging import FramingError, read_message, write_message
+
+
+class Forwarder:
+    """제어 소켓 연결 (끊기면 다음 메시지에서 다시 연결)"""
+
+    def __init__(self, socket_path: str = None):
+        self.socket_path = socket_path
+        self._client = None
+
+    def send_tab(self, message: dict):
+        url = message.get("url")
+        title = message.get("title") or ""
+        if not isinstance(url, str) or not isinstance(title, str):
+            raise ValueError("url/title은 문자열이어야 합니다")
+        params = {"url": url, "title": title, "browser": str(message.get("browser") or "")}
+        for attempt in range(2):
+            if self._client is None:
+                self._client = IpcClient(self.socket_path, timeout=2.0)
+            try:
+                return self._client.call("browser.tab", **params)
+            except (OSError, ConnectionError):
+                # 데몬이 재시작된 경우 한 번만 다시 연결
+                self.close()
+                if attempt:
+                    raise
+
+    def close(self):
+        if self._client:
+            self._client.close()
+            self._client = None
+
+
+def serve(stdin, stdout, socket_path: str = None):
+    """스트림이 닫힐 때까지 메시지 처리"""
+    forwarder = Forwarder(socket_path)
+    try:
+        while True:
+            try:
+                message = read_message(stdin)
+            except FramingError as e:
+                # 프레임이 깨지면 이후 경계를 알 수 없으므로 종료
+                print(f"native_host: {e}", file=sys.stderr)
+                return 1
+            if message is None:
+                return 0
+
+            try:
+                if message.get("type") == "ping":
+                    pass
+                elif message.get("type") == "tab":
+                    forwarder.send_tab(message)
+                else:
+                    raise ValueError(f"알 수 없는 메시지 종류: {message.get('type')}")
+                response = {"ok": True}
+            except (FileNotFoundError, ConnectionRefusedError):
+                response = {"ok": False, "error": "Focus Guardian이 실행 중이 아닙니다"}
+            except (IpcError, ValueError, OSError) as e:
+                response = {"ok": False, "error": str(e)}
+            write_message(stdout, response)
+    finally:
+        forwarder.close()
+
+
+def main():
+    # 브라우저는 확장 ID 등을 인자로 넘기므로 무시하고, 소켓 경로만 환경 변수로 받음
+    sys.exit(serve(sys.stdin.buffer, sys.stdout.buffer, os.environ.get("FOCUS_GUARDIAN_SOCKET")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""창 소스 백엔드 레지스트리 - 세션 종류에 맞는 가장 싼 활성 창 소스를 시작 시 선택
+
+    sway-ipc        sway/i3 IPC window 이벤트 (Wayland wlroots, X11 i3)
+    xlib            Xlib PropertyNotify 이벤트 (X11, EWMH 창 관리자)
+    gnome-dbus      GNOME Shell Introspect D-Bus (Wayland GNOME, 허용된 경우)
+    x11-subprocess  xdotool/xprop 폴링 (X11/XWayland, 최후의 수단)
+    scripted        push()로 창을 넣는 가짜 소스 (자동 선택 안 됨)
+
+후보는 probe()로 환경만 보고 거른 뒤 cost 순으로 open()해 보고 처음 성공한 것을 쓴다.
+"""
+import os
+from typing import Dict, List, Optional, Type
+
+from services.backends.base import WindowSource
+
+BACKENDS: Dict[str, Type[WindowSource]] = {}
+
+# 등록을 위해 가져올 모듈 (각 모듈이 @register로 등록)
+_MODULES = ('x11_subprocess', 'xlib_events', 'sway_ipc', 'gnome_shell', 'scripted')
+
+
+def register(cls: Type[WindowSource]) -> Type[WindowSource]:
+    """백엔드 클래스 등록 (데코레이터)"""
+    BACKENDS[cls.name] = cls
+    return cls
+
+
+def _load():
+    import importlib
+    for module in _MODULES:
+        importlib.import_module(f"services.backends.{module}")
+
+
+def backend_names() -> List[str]:
+    _load()
+    return sorted(BACKENDS)
+
+
+def candidates(env: dict = None) -> List[Type[WindowSource]]:
+    """이 세션에서 쓸 수 있어 보이는 백엔드 (싼 것부터)"""
+    _load()
+    env = os.environ if env is None else env
+    return sorted((cls for cls in BACKENDS.values() if cls.probe(env)), key=lambda cls: cls.cost)
+
+
+def select_source(name: Optional[str] = None, env: dict = None) -> WindowSource:
+    """
+    활성 창 소스 선택
+
+    Args:
+        name: 백엔드 이름 (None이나 'auto'면 자동 선택, 열리지 않으면 자동 선택으로 넘어감)
+    """
+    _load()
+    if name and name != 'auto':
+        if name not in BACKENDS:
+            raise ValueError(f"알 수 없는 모니터 백엔드: {name} (가능: auto, {', '.join(sorted(BACKENDS))})")
+        source = BACKENDS[name]()
+        if source.open():
+            return source
+        print(f"모니터 백엔드 {name}을(를) 사용할 수 없어 자동으로 선택합니다")
+
+    for cls in candidates(env):
+        source = cls()
+        if source.open():
+            return source
+    # 아무것도 없으면 기존처럼 xdotool (설치 안내를 출력함)
+    source = BACKENDS['x11-subprocess']()
+    source.open()
+    return source
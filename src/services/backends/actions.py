@@ -0,0 +1,158 @@
+"""창 조작 - 최소화/닫기/활성화를 프로세스 실행 없이 창 관리자에 직접 요청
+
+    XlibWindowActions   루트 창에 ClientMessage 전송 (ICCCM WM_CHANGE_STATE, EWMH _NET_CLOSE_WINDOW,
+                        _NET_ACTIVE_WINDOW) - X11과 XWayland 창
+    SwayWindowActions   sway/i3 IPC RUN_COMMAND ([con_id=N] move scratchpad / kill / focus)
+    RecordingWindowActions  요청만 기록 (스크립트 백엔드, 벤치마크)
+
+각 소스의 open_actions()가 자기 창 ID 체계에 맞는 것을 연다. 요청은 보내기만 하고 응답
+(창이 실제로 사라졌는지)은 기다리지 않는다 - 결과는 다음 활성 창 변경으로 드러난다.
+한 인스턴스는 한 번에 한 스레드에서만 쓴다 (엄격 모드에서는 모니터 작업 스레드).
+"""
+import socket
+from collections import deque
+from typing import Optional
+
+try:
+    from Xlib import X, display as xdisplay
+    from Xlib.error import DisplayError, XError
+    from Xlib.protocol import event as xevent
+except ImportError:  # python-xlib 미설치
+    xdisplay = None
+
+
+class WindowActions:
+    """창 조작 인터페이스 (성공하면 True - 요청을 보냈다는 뜻)"""
+
+    def minimize(self, window_id: str) -> bool:
+        return False
+
+    def close(self, window_id: str) -> bool:
+        return False
+
+    def activate(self, window_id: str) -> bool:
+        return False
+
+    def disconnect(self):
+        pass
+
+
+class XlibWindowActions(WindowActions):
+    """EWMH 창 관리자에 ClientMessage로 요청 (창 ID는 xdotool과 같은 10진수 문자열)"""
+
+    # ClientMessage 출처 표시 - 2: 페이저/사용자 도구 (포커스 훔치기 방지를 우회)
+    SOURCE_PAGER = 2
+    ICONIC_STATE = 3
+
+    def __init__(self, connection):
+        self._display = connection
+        self._root = connection.screen().root
+        self._atoms = {name: connection.intern_atom(name) for name in (
+            'WM_CHANGE_STATE', '_NET_CLOSE_WINDOW', '_NET_ACTIVE_WINDOW')}
+
+    @classmethod
+    def open(cls) -> Optional["XlibWindowActions"]:
+        """X 서버 연결 (python-xlib이 없거나 연결할 수 없으면 None)"""
+        if xdisplay is None:
+            return None
+        try:
+            return cls(xdisplay.Display())
+        except (DisplayError, OSError, XError):
+            return None
+
+    def _send(self, window_id: str, atom: str, *data: int) -> bool:
+        try:
+            window = self._display.create_resource_object('window', int(window_id))
+            message = xevent.ClientMessage(
+                window=window, client_type=self._atoms[atom],
+                data=(32, (list(data) + [0] * 5)[:5])
+            )
+            self._root.send_event(
+                message, event_mask=X.SubstructureRedirectMask | X.SubstructureNotifyMask)
+            self._display.flush()
+            return True
+        except (ValueError, XError, OSError):
+            return False
+
+    def minimize(self, window_id: str) -> bool:
+        return self._send(window_id, 'WM_CHANGE_STATE', self.ICONIC_STATE)
+
+    def close(self, window_id: str) -> bool:
+        # 창 관리자가 WM_DELETE_WINDOW로 정상 종료를 요청 (앱이 저장 확인 등을 띄울 수 있음)
+        return self._send(window_id, '_NET_CLOSE_WINDOW', X.CurrentTime, self.SOURCE_PAGER)
+
+    def activate(self, window_id: str) -> bool:
+        return self._send(window_id, '_NET_ACTIVE_WINDOW', self.SOURCE_PAGER, X.CurrentTime)
+
+    def disconnect(self):
+        try:
+            self._display.close()
+        except (XError, OSError):
+            pass
+
+
+class SwayWindowActions(WindowActions):
+    """sway/i3 IPC 명령 (창 ID는 컨테이너 id) - 최소화가 없으므로 스크래치패드로 보냄"""
+
+    RUN_COMMAND = 0
+
+    def __init__(self, path: str):
+        self.path = path
+        self._socket: Optional[socket.socket] = None
+
+    def _command(self, command: str) -> bool:
+        from services.backends.sway_ipc import SwayIpcSource
+        for _attempt in range(2):
+            try:
+                if self._socket is None:
+                    self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    self._socket.settimeout(0.5)
+                    self._socket.connect(self.path)
+                SwayIpcSource._send(self._socket, self.RUN_COMMAND, command.encode())
+                _kind, reply = SwayIpcSource._recv(self._socket)
+                return bool(reply) and all(result.get('success') for result in reply)
+            except (OSError, ValueError, ConnectionError):
+                # 컴포지터 재시작 등 - 한 번 다시 연결
+                self.disconnect()
+        return False
+
+    def _con(self, window_id: str) -> Optional[str]:
+        return window_id if window_id.isdigit() else None
+
+    def minimize(self, window_id: str) -> bool:
+        con = self._con(window_id)
+        return con is not None and self._command(f'[con_id={con}] move scratchpad')
+
+    def close(self, window_id: str) -> bool:
+        con = self._con(window_id)
+        return con is not None and self._command(f'[con_id={con}] kill')
+
+    def activate(self, window_id: str) -> bool:
+        con = self._con(window_id)
+        return con is not None and self._command(f'[con_id={con}] focus')
+
+    def disconnect(self):
+        if self._socket is not None:
+            self._socket.close()
+        self._socket = None
+
+
+class RecordingWindowActions(WindowActions):
+    """요청을 (동작, 창 ID)로 기록만 함"""
+
+    def __init__(self):
+        self.log: deque = deque(maxlen=1000)
+
+    def _record(self, action: str, window_id: str) -> bool:
+        self.log.append((action, window_id))
+        return True
+
+    def minimize(self, window_id: str) -> bool:
+        return self._record('minimize', window_id)
+
+    def close(self, window_id: str) -> bool:
+        return self._record('close', window_id)
+
+    def activate(self, window_id: str) -> bool:
+        return self._record('activate', window_id)
+
@@ -0,0 +1,138 @@
+"""창 소스 공통 인터페이스 - 활성 창 조회와 변경 알림
+
+소스는 read_window()로 현재 활성 창을 돌려주고, 변경을 알릴 수 있으면 fileno()로
+읽을 수 있게 되는 파일 디스크립터를 내준다. Qt 모니터는 그 fd에 QSocketNotifier를,
+asyncio 파이프라인은 loop.add_reader를 걸어서 폴링 대신 이벤트가 올 때만 조회한다.
+이 모듈은 Qt를 가져오지 않는다.
+"""
+import asyncio
+from concurrent.futures import Executor
+from typing import AsyncIterator, Callable, Optional
+
+from models.records import WindowInfo
+from services.backends.actions import WindowActions
+from utils.metrics import metrics
+from utils.process_tree import ProcessTree
+from utils.symbols import symbols
+
+
+class WindowSource:
+    """활성 창 소스 (하위 클래스는 services.backends.register로 등록)"""
+
+    # 레지스트리 이름 (--monitor-backend 값)
+    name = ""
+    # 선택 순서 - 작을수록 싸고 먼저 시도 (이벤트 기반 < D-Bus 호출 < 프로세스 실행)
+    cost = 100
+    # 이벤트가 와도 놓친 변경(제목 등)을 잡기 위한 안전 폴링 간격 (초, None이면 순수 폴링)
+    fallback_interval: Optional[float] = None
+
+    def __init__(self):
+        # 터미널/포장 프로세스 안의 실제 프로세스 찾기
+        self.process_tree = ProcessTree()
+
+    @classmethod
+    def probe(cls, env: dict) -> bool:
+        """이 세션에서 쓸 수 있어 보이는지 (환경 변수/실행 파일만 보는 가벼운 검사)"""
+        return False
+
+    def open(self) -> bool:
+        """연결 (실제로 쓸 수 없으면 False - 레지스트리가 다음 후보로 넘어감)"""
+        return True
+
+    def close(self):
+        pass
+
+    @property
+    def event_driven(self) -> bool:
+        return self.fileno() is not None
+
+    def fileno(self) -> Optional[int]:
+        """활성 창이 바뀔 수 있을 때 읽을 수 있게 되는 fd (없으면 폴링)"""
+        return None
+
+    def drain(self) -> bool:
+        """fd에 쌓인 이벤트 소비 (블로킹 없이), 활성 창이 바뀌었을 수 있으면 True"""
+        return True
+
+    def read_window(self) -> Optional[WindowInfo]:
+        """현재 활성 창 (블로킹 가능 - 파이프라인에서는 실행기에서 호출)"""
+        raise NotImplementedError
+
+    def open_actions(self) -> Optional["WindowActions"]:
+        """이 소스의 창 ID로 창을 조작할 수단 (services.backends.actions, 없으면 None)"""
+        return None
+
+    def make_window(self, window_id: str, title: str, app_name: str,
+                    pid: Optional[int] = None, process_name: str = "") -> WindowInfo:
+        """
+        백엔드가 읽은 값으로 WindowInfo 생성
+
+        PID가 있으면 /proc에서 프로세스 이름을 읽고, 터미널/포장 프로세스면
+        전경 작업이나 실제 앱 이름으로 바꾼다. 반복되는 문자열은 인터닝한다.
+        """
+        comm = process_name
+        if pid:
+            chain = self.process_tree.ancestry(pid)
+            if chain:
+                process_name = comm = chain[0].comm
+                with metrics.timer("monitor.process_tree_seconds"):
+                    resolved = self.process_tree.resolve(pid, title)
+                if resolved:
+                    process_name = resolved
+        # 앱 이름(WM_CLASS/app_id)이 없으면 창 소유 프로세스 이름
+        return WindowInfo(
+            window_id=symbols.intern(window_id),
+            title=title,
+            app_name=symbols.intern(app_name or comm),
+            process_name=symbols.intern(process_name),
+            pid=pid
+        )
+
+    async def windows(
+        self,
+        interval: float,
+        read: Callable[[], Optional[WindowInfo]] = None,
+        executor: Optional[Executor] = None
+    ) -> AsyncIterator[Optional[WindowInfo]]:
+        """
+        활성 창 스트림 (AsyncPipeline.run의 windows로 사용)
+
+        이벤트 fd가 없으면 interval초 폴링, 있으면 이벤트가 오거나 fallback_interval이
+        지날 때만 조회한다. read를 주면 read_window 대신 사용 (탭 URL 붙이기 등).
+        """
+        from services.pipeline import probe, _offload
+
+        read = read or self.read_window
+        fd = self.fileno()
+        if fd is None:
+            async for window in probe(read, interval, executor):
+                yield window
+            return
+
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+        watching = True
+
+        def on_readable():
+            nonlocal watching
+            if self.drain():
+                changed.set()
+            if self.fileno() != fd:
+                # 이벤트 연결이 끊김 - 폴링으로 전환
+                loop.remove_reader(fd)
+                watching = False
+
+        loop.add_reader(fd, on_readable)
+        try:
+            yield await _offload(executor, read)
+            while True:
+                try:
+                    await asyncio.wait_for(changed.wait(),
+                                           (self.fallback_interval or interval) if watching else interval)
+                except asyncio.TimeoutError:
+                    pass
+                changed.clear()
+                yield await _offload(executor, read)
+        finally:
+            if watching:
+                loop.remove_reader(fd)
@@ -0,0 +1,215 @@
+"""GNOME Shell D-Bus 백엔드 - org.gnome.Shell.Introspect (Wayland GNOME)
+
+GetWindows 한 번으로 모든 창과 포커스 여부를 받는다 (gdbus 프로세스 하나).
+포커스/창 목록이 바뀌면 Introspect가 보내는 시그널을 gdbus monitor로 받아서 그때만
+조회하고, 시그널이 없는 제목 변경은 안전 폴링으로 잡는다. GNOME 41부터 Introspect는
+허용된 호출자만 쓸 수 있어서 open()에서 실제로 호출해 보고 거부되면 다음 후보로 넘어간다.
+Introspect에는 창 조작이 없으므로 open_actions()는 None이다 (엄격 모드는 리마인더로 대신함).
+"""
+import os
+import shutil
+import subprocess
+from typing import Any, Optional
+
+from models.records import WindowInfo
+from services.backends import register
+from services.backends.base import WindowSource
+
+GDBUS_TARGET = ['--session', '--dest', 'org.gnome.Shell', '--object-path', '/org/gnome/Shell/Introspect']
+# GVariant 텍스트의 숫자 타입 접두사
+_NUMBER_TYPES = frozenset(('byte', 'int16', 'uint16', 'int32', 'uint32', 'int64', 'uint64',
+                           'double', 'handle'))
+
+
+class GVariantText:
+    """gdbus 출력(GVariant 텍스트 형식) 파서 - 문자열/숫자/불리언/튜플/배열/사전/variant만"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    @classmethod
+    def parse(cls, text: str) -> Any:
+        return cls(text.strip()).value()
+
+    def _skip(self):
+        text = self.text
+        while self.pos < len(text) and text[self.pos] in ' \t\n,':
+            self.pos += 1
+
+    def _word(self) -> str:
+        start = self.pos
+        while self.pos < len(self.text) and (self.text[self.pos].isalnum() or self.text[self.pos] in '_.-+'):
+            self.pos += 1
+        return self.text[start:self.pos]
+
+    def _string(self) -> str:
+        quote = self.text[self.pos]
+        self.pos += 1
+        out = []
+        while self.text[self.pos] != quote:
+            char = self.text[self.pos]
+            if char == '\\':
+                self.pos += 1
+                char = self.text[self.pos]
+                if char == 'u':
+                    char = chr(int(self.text[self.pos + 1:self.pos + 5], 16))
+                    self.pos += 4
+                else:
+                    char = {'n': '\n', 't': '\t', 'r': '\r'}.get(char, char)
+            out.append(char)
+            self.pos += 1
+        self.pos += 1
+        return ''.join(out)
+
+    def _sequence(self, close: str) -> list:
+        items = []
+        self.pos += 1
+        self._skip()
+        while self.text[self.pos] != close:
+            items.append(self.value())
+            self._skip()
+        self.pos += 1
+        return items
+
+    def value(self) -> Any:
+        self._skip()
+        char = self.text[self.pos]
+        if char == '@':
+            # 타입 주석 (@a{sv} {}) - 타입 문자열은 건너뜀
+            while self.text[self.pos] not in ' \t':
+                self.pos += 1
+            return self.value()
+        if char in '\'"':
+            return self._string()
+        if char == '(':
+            return tuple(self._sequence(')'))
+        if char == '[':
+            return self._sequence(']')
+        if char == '<':
+            self.pos += 1
+            result = self.value()
+            self._skip()
+            self.pos += 1  # '>'
+            return result
+        if char == '{':
+            result = {}
+            self.pos += 1
+            self._skip()
+            while self.text[self.pos] != '}':
+                key = self.value()
+                self._skip()
+                self.pos += 1  # ':'
+                result[key] = self.value()
+                self._skip()
+            self.pos += 1
+            return result
+        word = self._word()
+        if word in _NUMBER_TYPES or word in ('objectpath', 'signature'):
+            return self.value()
+        if word == 'true':
+            return True
+        if word == 'false':
+            return False
+        if word == 'nothing':
+            return None
+        try:
+            return int(word, 0)
+        except ValueError:
+            return float(word)
+
+
+@register
+class GnomeShellSource(WindowSource):
+    """GNOME Shell Introspect D-Bus로 포커스된 창 조회"""
+
+    name = "gnome-dbus"
+    cost = 20
+    # 제목 변경은 시그널이 없으므로 자주 확인
+    fallback_interval = 1.0
+
+    def __init__(self):
+        super().__init__()
+        self._monitor: Optional[subprocess.Popen] = None
+        # gdbus monitor가 끝나면 fd를 내놓지 않음 (닫는 것은 close에서)
+        self._eof = False
+
+    @classmethod
+    def probe(cls, env: dict) -> bool:
+        wayland = env.get("XDG_SESSION_TYPE") == "wayland" or bool(env.get("WAYLAND_DISPLAY"))
+        return (wayland and "GNOME" in env.get("XDG_CURRENT_DESKTOP", "").upper()
+                and shutil.which("gdbus") is not None)
+
+    def _get_windows(self) -> Optional[dict]:
+        result = subprocess.run(
+            ['gdbus', 'call', *GDBUS_TARGET, '--method', 'org.gnome.Shell.Introspect.GetWindows'],
+            capture_output=True, text=True, timeout=1
+        )
+        if result.returncode != 0:
+            return None
+        try:
+            reply = GVariantText.parse(result.stdout)
+        except (IndexError, ValueError):
+            return None
+        return reply[0] if isinstance(reply, tuple) and reply and isinstance(reply[0], dict) else None
+
+    def open(self) -> bool:
+        try:
+            if self._get_windows() is None:
+                # 접근 거부 (허용되지 않은 호출자) 또는 GNOME Shell 아님
+                return False
+            self._monitor = subprocess.Popen(
+                ['gdbus', 'monitor', *GDBUS_TARGET],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        os.set_blocking(self._monitor.stdout.fileno(), False)
+        return True
+
+    def close(self):
+        if self._monitor is not None:
+            self._monitor.terminate()
+            try:
+                self._monitor.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self._monitor.kill()
+            self._monitor.stdout.close()
+        self._monitor = None
+        self._eof = False
+
+    def fileno(self) -> Optional[int]:
+        return self._monitor.stdout.fileno() if self._monitor is not None and not self._eof else None
+
+    def drain(self) -> bool:
+        if self._monitor is None or self._eof:
+            return False
+        data = b""
+        try:
+            while True:
+                chunk = os.read(self._monitor.stdout.fileno(), 65536)
+                if not chunk:
+                    # gdbus monitor 종료 - fd를 내놓지 않으면 모니터가 폴링으로 돌아감
+                    self._eof = True
+                    return True
+                data += chunk
+        except BlockingIOError:
+            pass
+        # WindowsChanged / RunningApplicationsChanged (포커스 앱 변경 포함)
+        return b'Changed' in data
+
+    def read_window(self) -> Optional[WindowInfo]:
+        try:
+            windows = self._get_windows()
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if not windows:
+            return None
+        for window_id, props in windows.items():
+            if props.get('has-focus'):
+                app_id = props.get('app-id') or ''
+                if app_id.endswith('.desktop'):
+                    app_id = app_id[:-len('.desktop')]
+                return self.make_window(str(window_id), props.get('title') or '',
+                                        props.get('wm-class') or app_id, props.get('pid'))
+        return None
@@ -0,0 +1,73 @@
+"""스크립트 백엔드 - 외부에서 창을 밀어 넣는 가짜 소스 (테스트/벤치마크용)
+
+push()하면 파이프에 한 바이트를 써서 실제 이벤트 백엔드처럼 fd가 읽을 수 있게 된다.
+자동 선택 대상이 아니며 --monitor-backend scripted나 직접 생성으로만 쓴다.
+"""
+import os
+from typing import Optional
+
+from models.records import WindowInfo
+from services.backends import register
+from services.backends.actions import RecordingWindowActions
+from services.backends.base import WindowSource
+
+
+@register
+class ScriptedWindowSource(WindowSource):
+    """push()로 지정한 창을 활성 창으로 보고"""
+
+    name = "scripted"
+    cost = 0
+    fallback_interval = 60.0
+
+    def __init__(self, window: Optional[WindowInfo] = None):
+        super().__init__()
+        self._window = window
+        self._read_fd: Optional[int] = None
+        self._write_fd: Optional[int] = None
+        self._signaled = False
+        self.reads = 0
+        # 창 조작 요청 기록 (엄격 모드)
+        self.actions = RecordingWindowActions()
+
+    def open(self) -> bool:
+        if self._read_fd is None:
+            self._read_fd, self._write_fd = os.pipe()
+            os.set_blocking(self._read_fd, False)
+            os.set_blocking(self._write_fd, False)
+        return True
+
+    def close(self):
+        for fd in (self._read_fd, self._write_fd):
+            if fd is not None:
+                os.close(fd)
+        self._read_fd = self._write_fd = None
+
+    def fileno(self) -> Optional[int]:
+        return self._read_fd
+
+    def push(self, window: WindowInfo):
+        """다음 활성 창 지정 (열려 있으면 변경 알림)"""
+        self._window = window
+        if self._write_fd is not None and not self._signaled:
+            self._signaled = True
+            try:
+                os.write(self._write_fd, b'.')
+            except BlockingIOError:
+                pass
+
+    def drain(self) -> bool:
+        self._signaled = False
+        try:
+            while os.read(self._read_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def read_window(self) -> Optional[WindowInfo]:
+        self.reads += 1
+        return self._window
+
+    def open_actions(self) -> RecordingWindowActions:
+        return self.actions
@@ -0,0 +1,178 @@
+"""sway/i3 IPC 백엔드 - window 이벤트 구독 (Wayland wlroots 컴포지터와 X11 i3)
+
+이벤트에 포커스된 컨테이너(제목, app_id/WM_CLASS, PID)가 통째로 들어 있으므로
+조회할 때 추가 왕복이 없다. 시작할 때만 GET_TREE로 현재 포커스를 찾는다.
+"""
+import os
+import json
+import socket
+import struct
+from typing import Optional
+
+from models.records import WindowInfo
+from services.backends import register
+from services.backends.actions import WindowActions, SwayWindowActions
+from services.backends.base import WindowSource
+
+MAGIC = b"i3-ipc"
+HEADER = struct.Struct("<II")
+SUBSCRIBE = 2
+GET_TREE = 4
+# 이벤트 메시지는 최상위 비트가 켜져 있음
+EVENT_WINDOW = 0x80000003
+
+
+def _focused(node: dict) -> Optional[dict]:
+    """트리에서 포커스된 창 컨테이너"""
+    if node.get("focused") and node.get("type") in ("con", "floating_con"):
+        return node
+    for child in node.get("nodes", []) + node.get("floating_nodes", []):
+        found = _focused(child)
+        if found:
+            return found
+    return None
+
+
+@register
+class SwayIpcSource(WindowSource):
+    """sway/i3 IPC 소켓의 window 이벤트로 활성 창 감시"""
+
+    name = "sway-ipc"
+    cost = 5
+    # 이벤트를 놓쳐도 (터미널 전경 작업 변경 등) 이 간격으로는 다시 확인
+    fallback_interval = 5.0
+
+    def __init__(self):
+        super().__init__()
+        self._socket: Optional[socket.socket] = None
+        self._buffer = b""
+        self._container: Optional[dict] = None
+        # 연결이 끊기면 fd를 내놓지 않음 (닫는 것은 close에서 - 감시 중인 fd 번호 재사용 방지)
+        self._eof = False
+
+    @staticmethod
+    def socket_path(env: dict) -> Optional[str]:
+        return env.get("SWAYSOCK") or env.get("I3SOCK")
+
+    @classmethod
+    def probe(cls, env: dict) -> bool:
+        path = cls.socket_path(env)
+        return bool(path) and os.path.exists(path)
+
+    @staticmethod
+    def _send(sock: socket.socket, kind: int, payload: bytes = b""):
+        sock.sendall(MAGIC + HEADER.pack(len(payload), kind) + payload)
+
+    @staticmethod
+    def _recv(sock: socket.socket):
+        """메시지 하나 (블로킹)"""
+        data = b""
+        while len(data) < len(MAGIC) + HEADER.size:
+            chunk = sock.recv(len(MAGIC) + HEADER.size - len(data))
+            if not chunk:
+                raise ConnectionError("IPC 연결 끊김")
+            data += chunk
+        length, kind = HEADER.unpack(data[len(MAGIC):])
+        payload = b""
+        while len(payload) < length:
+            chunk = sock.recv(length - len(payload))
+            if not chunk:
+                raise ConnectionError("IPC 연결 끊김")
+            payload += chunk
+        return kind, json.loads(payload)
+
+    def open(self) -> bool:
+        path = self.socket_path(os.environ)
+        if not path:
+            return False
+        try:
+            # 현재 포커스는 별도 연결로 한 번만 조회
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as query:
+                query.settimeout(1)
+                query.connect(path)
+                self._send(query, GET_TREE)
+                _kind, tree = self._recv(query)
+            self._container = _focused(tree)
+
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(1)
+            self._socket.connect(path)
+            self._send(self._socket, SUBSCRIBE, b'["window"]')
+            _kind, reply = self._recv(self._socket)
+            if not reply.get("success"):
+                self.close()
+                return False
+            self._socket.setblocking(False)
+        except (OSError, ValueError, ConnectionError):
+            self.close()
+            return False
+        return True
+
+    def close(self):
+        if self._socket is not None:
+            self._socket.close()
+        self._socket = None
+        self._buffer = b""
+        self._eof = False
+
+    def fileno(self) -> Optional[int]:
+        return self._socket.fileno() if self._socket is not None and not self._eof else None
+
+    def drain(self) -> bool:
+        if self._socket is None or self._eof:
+            return False
+        try:
+            while True:
+                chunk = self._socket.recv(65536)
+                if not chunk:
+                    # 컴포지터 종료 - fd를 내놓지 않으면 모니터가 폴링으로 돌아감
+                    self._eof = True
+                    return True
+                self._buffer += chunk
+        except BlockingIOError:
+            pass
+        except OSError:
+            self._eof = True
+            return True
+
+        changed = False
+        header = len(MAGIC) + HEADER.size
+        while len(self._buffer) >= header:
+            length, kind = HEADER.unpack(self._buffer[len(MAGIC):header])
+            if len(self._buffer) < header + length:
+                break
+            payload, self._buffer = self._buffer[header:header + length], self._buffer[header + length:]
+            if kind != EVENT_WINDOW:
+                continue
+            try:
+                event = json.loads(payload)
+            except ValueError:
+                continue
+            container = event.get("container") or {}
+            change = event.get("change")
+            if change == "focus":
+                self._container = container
+                changed = True
+            elif change in ("title", "urgent", "mark") and self._container \
+                    and container.get("id") == self._container.get("id"):
+                self._container = container
+                changed = True
+            elif change == "close" and self._container \
+                    and container.get("id") == self._container.get("id"):
+                self._container = None
+                changed = True
+        return changed
+
+    def read_window(self) -> Optional[WindowInfo]:
+        container = self._container
+        if not container:
+            return None
+        # Wayland 창은 app_id, XWayland/i3 창은 WM_CLASS
+        properties = container.get("window_properties") or {}
+        app_name = container.get("app_id") or properties.get("class") or ""
+        return self.make_window(str(container.get("id")), container.get("name") or "",
+                                app_name, container.get("pid"))
+
+    def open_actions(self) -> Optional[WindowActions]:
+        path = self.socket_path(os.environ)
+        return SwayWindowActions(path) if path else None
@@ -0,0 +1,79 @@
+"""X11 xdotool/xprop 백엔드 - 조회마다 프로세스 실행 (폴링, 최후의 수단)"""
+import re
+import shutil
+import subprocess
+from typing import Optional
+
+from models.records import WindowInfo
+from services.backends import register
+from services.backends.actions import WindowActions, XlibWindowActions
+from services.backends.base import WindowSource
+
+
+@register
+class X11SubprocessSource(WindowSource):
+    """xdotool로 활성 창 ID/제목/PID, xprop으로 WM_CLASS 조회 (XWayland 창도 가능)"""
+
+    name = "x11-subprocess"
+    cost = 100
+
+    @classmethod
+    def probe(cls, env: dict) -> bool:
+        return bool(env.get("DISPLAY")) and shutil.which("xdotool") is not None
+
+    def read_window(self) -> Optional[WindowInfo]:
+        """현재 활성 창 정보 가져오기 (xdotool 사용)"""
+        try:
+            # 활성 창 ID 가져오기
+            window_id = subprocess.run(
+                ['xdotool', 'getactivewindow'],
+                capture_output=True, text=True, timeout=1
+            ).stdout.strip()
+
+            if not window_id:
+                return None
+
+            # 창 제목 가져오기
+            title = subprocess.run(
+                ['xdotool', 'getwindowname', window_id],
+                capture_output=True, text=True, timeout=1
+            ).stdout.strip()
+
+            # 창의 PID 가져오기
+            pid_result = subprocess.run(
+                ['xdotool', 'getwindowpid', window_id],
+                capture_output=True, text=True, timeout=1
+            )
+            pid = pid_result.stdout.strip() if pid_result.returncode == 0 else ""
+            pid = int(pid) if pid.isdigit() else None
+
+            # WM_CLASS에서 앱 이름 가져오기 (없으면 프로세스 이름)
+            app_name = ""
+            try:
+                xprop_result = subprocess.run(
+                    ['xprop', '-id', window_id, 'WM_CLASS'],
+                    capture_output=True, text=True, timeout=1
+                )
+                if xprop_result.returncode == 0:
+                    # WM_CLASS(STRING) = "instance", "class"
+                    match = re.search(r'"([^"]+)",\s*"([^"]+)"', xprop_result.stdout)
+                    if match:
+                        app_name = match.group(2)  # class name 사용
+            except:
+                pass
+
+            return self.make_window(window_id, title, app_name, pid)
+
+        except subprocess.TimeoutExpired:
+            return None
+        except FileNotFoundError:
+            # xdotool이 설치되지 않은 경우
+            print("Error: xdotool이 설치되어 있지 않습니다.")
+            print("설치 명령어: sudo apt install xdotool")
+            return None
+        except Exception as e:
+            print(f"창 정보 가져오기 실패: {e}")
+            return None
+
+    def open_actions(self) -> Optional[WindowActions]:
+        return XlibWindowActions.open()
@@ -0,0 +1,144 @@
+"""X11 Xlib 이벤트 백엔드 - 루트 창 _NET_ACTIVE_WINDOW와 활성 창 제목 PropertyNotify 구독
+
+프로세스를 띄우지 않고 X 서버 왕복 몇 번으로 조회하며, 활성 창이나 제목이 바뀔 때만
+연결 fd가 읽을 수 있게 된다. 이벤트용/조회용 연결을 따로 열어서 조회가 실행기 스레드에서
+돌아도 이벤트 연결과 섞이지 않는다. EWMH를 지원하는 창 관리자가 필요하다.
+"""
+from typing import Optional
+
+from models.records import WindowInfo
+from services.backends import register
+from services.backends.actions import WindowActions, XlibWindowActions
+from services.backends.base import WindowSource
+
+try:
+    from Xlib import X, display as xdisplay
+    from Xlib.error import DisplayError, XError
+except ImportError:  # python-xlib 미설치
+    xdisplay = None
+
+
+@register
+class XlibEventSource(WindowSource):
+    """EWMH 속성 변경 이벤트로 활성 창 감시"""
+
+    name = "xlib"
+    cost = 10
+    # 이벤트를 놓쳐도 (창 관리자 재시작 등) 이 간격으로는 다시 확인
+    fallback_interval = 5.0
+
+    def __init__(self):
+        super().__init__()
+        self._events = None   # 이벤트 구독 연결
+        self._query = None    # 조회 연결
+        self._atoms = {}
+        self._watched = None  # 제목 변경을 구독 중인 창 (이벤트 연결의 리소스)
+
+    @classmethod
+    def probe(cls, env: dict) -> bool:
+        # Wayland 세션의 XWayland는 X 클라이언트 창만 보이므로 제외
+        return (xdisplay is not None and bool(env.get("DISPLAY"))
+                and env.get("XDG_SESSION_TYPE") != "wayland" and not env.get("WAYLAND_DISPLAY"))
+
+    def open(self) -> bool:
+        if xdisplay is None:
+            return False
+        try:
+            self._events = xdisplay.Display()
+            self._query = xdisplay.Display()
+        except (DisplayError, OSError, XError):
+            self.close()
+            return False
+        for name in ('_NET_ACTIVE_WINDOW', '_NET_SUPPORTED', '_NET_WM_NAME', '_NET_WM_PID',
+                     'UTF8_STRING', 'WM_NAME'):
+            self._atoms[name] = self._query.intern_atom(name)
+        root = self._query.screen().root
+        supported = root.get_full_property(self._atoms['_NET_SUPPORTED'], X.AnyPropertyType)
+        if not supported or self._atoms['_NET_ACTIVE_WINDOW'] not in supported.value:
+            # EWMH 창 관리자가 아니면 활성 창을 알 수 없음
+            self.close()
+            return False
+        self._events.screen().root.change_attributes(event_mask=X.PropertyChangeMask)
+        self._watch(self._active_id(self._events))
+        self._events.flush()
+        return True
+
+    def close(self):
+        for connection in (self._events, self._query):
+            if connection is not None:
+                try:
+                    connection.close()
+                except (XError, OSError):
+                    pass
+        self._events = self._query = self._watched = None
+
+    def fileno(self) -> Optional[int]:
+        return self._events.fileno() if self._events is not None else None
+
+    def _active_id(self, connection) -> Optional[int]:
+        prop = connection.screen().root.get_full_property(
+            self._atoms['_NET_ACTIVE_WINDOW'], X.AnyPropertyType)
+        if prop is None or not len(prop.value) or not prop.value[0]:
+            return None
+        return int(prop.value[0])
+
+    def _watch(self, window_id: Optional[int]):
+        """활성 창의 제목 변경만 구독 (이전 창 구독은 해제)"""
+        if self._watched is not None:
+            try:
+                self._watched.change_attributes(event_mask=X.NoEventMask)
+            except XError:
+                pass
+            self._watched = None
+        if window_id:
+            window = self._events.create_resource_object('window', window_id)
+            try:
+                window.change_attributes(event_mask=X.PropertyChangeMask)
+                self._watched = window
+            except XError:
+                pass
+
+    def drain(self) -> bool:
+        changed = False
+        try:
+            while self._events.pending_events():
+                event = self._events.next_event()
+                if event.type != X.PropertyNotify:
+                    continue
+                if event.atom == self._atoms['_NET_ACTIVE_WINDOW']:
+                    self._watch(self._active_id(self._events))
+                    changed = True
+                elif event.atom in (self._atoms['_NET_WM_NAME'], self._atoms['WM_NAME']):
+                    changed = True
+            self._events.flush()
+        except (XError, OSError):
+            changed = True
+        return changed
+
+    def read_window(self) -> Optional[WindowInfo]:
+        if self._query is None:
+            return None
+        try:
+            window_id = self._active_id(self._query)
+            if window_id is None:
+                return None
+            window = self._query.create_resource_object('window', window_id)
+            prop = window.get_full_property(self._atoms['_NET_WM_NAME'], self._atoms['UTF8_STRING'])
+            if prop is not None:
+                title = prop.value.decode('utf-8', 'replace') if isinstance(prop.value, bytes) \
+                    else str(prop.value)
+            else:
+                title = window.get_wm_name() or ""
+                if isinstance(title, bytes):
+                    title = title.decode('latin-1')
+            wm_class = window.get_wm_class()
+            prop = window.get_full_property(self._atoms['_NET_WM_PID'], X.AnyPropertyType)
+            pid = int(prop.value[0]) if prop is not None and len(prop.value) else None
+        except (XError, OSError):
+            # 조회 중에 창이 닫힌 경우 등
+            return None
+        # xdotool과 같은 10진수 창 ID (activate_window에 그대로 사용)
+        return self.make_window(str(window_id), title, wm_class[1] if wm_class else "", pid)
+
+    def open_actions(self) -> Optional[WindowActions]:
+        return XlibWindowActions.open()
@@ -0,0 +1,71 @@
+"""브라우저 활성 탭 - 네이티브 메시징 호스트가 보고한 URL을 창과 연결"""
+import time
+from typing import Dict, NamedTuple, Optional
+from PySide6.QtCore import QObject, Signal
+
+from models.records import WindowInfo
+
+
+# 브라우저 창 제목 뒤에 붙는 접미사 구분자 ("탭 제목 — Mozilla Firefox")
+TITLE_SEPARATORS = (" — ", " - ")
+
+BROWSER_NAMES = ("firefox", "chrome", "chromium", "brave", "vivaldi", "opera", "edge")
+
+
+class BrowserTab(NamedTuple):
+    """확장이 보고한 탭"""
+    url: str
+    title: str
+    browser: str
+    received: float  # time.monotonic()
+
+
+def is_browser(window: WindowInfo) -> bool:
+    """브라우저 창인지 (앱/프로세스 이름 기준)"""
+    names = (window.app_name + " " + window.process_name).lower()
+    return any(name in names for name in BROWSER_NAMES)
+
+
+class BrowserTabs(QObject):
+    """최근 탭 제목 → URL 매핑"""
+
+    # 시그널: 탭이 활성화되었을 때 (URL)
+    tab_activated = Signal(str)
+
+    # 기억할 최근 탭 수 (넘으면 오래된 것부터 제거)
+    MAX_TABS = 256
+
+    def __init__(self):
+        super().__init__()
+        self._by_title: Dict[str, BrowserTab] = {}
+        self._last: Optional[BrowserTab] = None
+
+    @property
+    def last_tab(self) -> Optional[BrowserTab]:
+        return self._last
+
+    def update(self, url: str, title: str, browser: str = "") -> BrowserTab:
+        """탭 활성화/변경 보고"""
+        tab = BrowserTab(url, title, browser, time.monotonic())
+        # 다시 넣어서 최근 순서 유지 (dict는 삽입 순서)
+        self._by_title.pop(title, None)
+        self._by_title[title] = tab
+        if len(self._by_title) > self.MAX_TABS:
+            del self._by_title[next(iter(self._by_title))]
+        self._last = tab
+        self.tab_activated.emit(url)
+        return tab
+
+    def url_for(self, window: WindowInfo) -> Optional[str]:
+        """브라우저 창의 현재 탭 URL (모르면 None)"""
+        if not is_browser(window):
+            return None
+        title = window.title
+        tab = self._by_title.get(title)
+        if tab is None:
+            for separator in TITLE_SEPARATORS:
+                if separator in title:
+                    tab = self._by_title.get(title.rsplit(separator, 1)[0])
+                    if tab is not None:
+                        break
+        return tab.url if tab else None
@@ -0,0 +1,316 @@
+"""설정 서비스 - 병합, 검증, 컴파일된 스냅샷, 핫 리로드"""
+import re
+import json
+import pickle
+from copy import deepcopy
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional, Tuple
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+
+from services.window_monitor import ClassifierRules, compile_rules
+from services.enforcement import STRICT_ACTIONS
+from utils.title_privacy import TITLE_MODES
+
+
+# 기본 경로
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "default_settings.json"
+USER_CONFIG_PATH = Path.home() / ".config" / "focus-guardian" / "settings.json"
+CACHE_PATH = Path.home() / ".cache" / "focus-guardian" / "config.cache"
+
+# 캐시 포맷이 바뀌면 올려서 기존 캐시 무효화
+CACHE_FORMAT = 6
+
+CATEGORY_TYPES = ('work', 'entertainment', 'neutral')
+NOTIFICATION_POSITIONS = ('top-right', 'top-left', 'bottom-right', 'bottom-left')
+# 도메인 패턴: example.com 또는 *.example.com
+DOMAIN_PATTERN = re.compile(r'^(\*\.)?([A-Za-z0-9-]+\.)*[A-Za-z0-9-]+$')
+
+
+def deep_merge(base: dict, override: dict) -> dict:
+    """딕셔너리 재귀 병합 (리스트와 값은 override가 대체)"""
+    merged = deepcopy(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = deepcopy(value)
+    return merged
+
+
+def validate_config(config: dict) -> List[str]:
+    """설정 검증 (오류 메시지 목록 반환, 비어 있으면 유효)"""
+    errors = []
+
+    focus = config.get('focus', {})
+    if not isinstance(focus, dict):
+        errors.append("focus: 객체여야 합니다")
+        focus = {}
+    for key in ('default_duration', 'break_interval', 'idle_threshold', 'long_break',
+                'long_break_every'):
+        if key in focus and (not isinstance(focus[key], int) or isinstance(focus[key], bool)
+                             or focus[key] <= 0):
+            errors.append(f"focus.{key}: 양의 정수여야 합니다")
+    for key in ('pomodoro_mode', 'strict_mode', 'pause_when_idle'):
+        if key in focus and not isinstance(focus[key], bool):
+            errors.append(f"focus.{key}: true/false여야 합니다")
+    strict_policy = focus.get('strict_policy', {})
+    if not isinstance(strict_policy, dict):
+        errors.append("focus.strict_policy: 객체여야 합니다")
+        strict_policy = {}
+    if 'default' in strict_policy and strict_policy['default'] not in STRICT_ACTIONS:
+        errors.append(f"focus.strict_policy.default: {', '.join(STRICT_ACTIONS)} 중 하나여야 합니다")
+    strict_apps = strict_policy.get('apps', {})
+    if not isinstance(strict_apps, dict):
+        errors.append("focus.strict_policy.apps: 앱 이름 → 동작 객체여야 합니다")
+        strict_apps = {}
+    for app, action in strict_apps.items():
+        if action not in STRICT_ACTIONS:
+            errors.append(f"focus.strict_policy.apps.{app}: {', '.join(STRICT_ACTIONS)} 중 하나여야 합니다")
+
+    notification = config.get('notification', {})
+    if not isinstance(notification, dict):
+        errors.append("notification: 객체여야 합니다")
+        notification = {}
+    if 'position' in notification and notification['position'] not in NOTIFICATION_POSITIONS:
+        errors.append(f"notification.position: {', '.join(NOTIFICATION_POSITIONS)} 중 하나여야 합니다")
+    messages = notification.get('messages', [])
+    if not isinstance(messages, list) or not all(isinstance(m, str) for m in messages):
+        errors.append("notification.messages: 문자열 목록이어야 합니다")
+
+    privacy = config.get('privacy', {})
+    if not isinstance(privacy, dict):
+        errors.append("privacy: 객체여야 합니다")
+        privacy = {}
+    if 'store_titles' in privacy and privacy['store_titles'] not in TITLE_MODES:
+        errors.append(f"privacy.store_titles: {', '.join(TITLE_MODES)} 중 하나여야 합니다")
+    if 'normalize_titles' in privacy and not isinstance(privacy['normalize_titles'], bool):
+        errors.append("privacy.normalize_titles: true/false여야 합니다")
+
+    fleet = config.get('fleet', {})
+    if not isinstance(fleet, dict):
+        errors.append("fleet: 객체여야 합니다")
+        fleet = {}
+    if 'enabled' in fleet and not isinstance(fleet['enabled'], bool):
+        errors.append("fleet.enabled: true/false여야 합니다")
+    for key in ('endpoint', 'team', 'token'):
+        if key in fleet and not isinstance(fleet[key], str):
+            errors.append(f"fleet.{key}: 문자열이어야 합니다")
+    if fleet.get('enabled') and not str(fleet.get('endpoint', '')).startswith(('http://', 'https://')):
+        errors.append("fleet.endpoint: 사용하려면 http(s):// 주소가 필요합니다")
+
+    categories = config.get('categories', [])
+    if not isinstance(categories, list):
+        errors.append("categories: 목록이어야 합니다")
+        categories = []
+    seen_ids = set()
+    for i, category in enumerate(categories):
+        where = f"categories[{i}]"
+        if not isinstance(category, dict):
+            errors.append(f"{where}: 객체여야 합니다")
+            continue
+        for key in ('id', 'name'):
+            if not isinstance(category.get(key), str) or not category.get(key):
+                errors.append(f"{where}.{key}: 비어 있지 않은 문자열이어야 합니다")
+        if category.get('id') in seen_ids:
+            errors.append(f"{where}.id: 중복된 id '{category['id']}'")
+        seen_ids.add(category.get('id'))
+        if category.get('type') not in CATEGORY_TYPES:
+            errors.append(f"{where}.type: {', '.join(CATEGORY_TYPES)} 중 하나여야 합니다")
+        for key in ('apps', 'title_patterns', 'domains'):
+            values = category.get(key, [])
+            if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+                errors.append(f"{where}.{key}: 문자열 목록이어야 합니다")
+                continue
+            if key == 'title_patterns':
+                for pattern in values:
+                    try:
+                        re.compile(pattern)
+                    except re.error as e:
+                        errors.append(f"{where}.title_patterns: 잘못된 정규식 '{pattern}' ({e})")
+            if key == 'domains':
+                for domain in values:
+                    if not DOMAIN_PATTERN.match(domain):
+                        errors.append(f"{where}.domains: 잘못된 도메인 '{domain}' "
+                                      f"(예: youtube.com, *.netflix.com)")
+
+    return errors
+
+
+def _freeze(value: Any) -> Any:
+    """딕셔너리/리스트를 읽기 전용 구조로 변환"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """검증 및 컴파일이 끝난 불변 설정 스냅샷"""
+    focus: Mapping[str, Any]
+    notification: Mapping[str, Any]
+    categories: Tuple[Mapping[str, Any], ...]
+    privacy: Mapping[str, Any]
+    fleet: Mapping[str, Any]
+    rules: ClassifierRules
+    raw: Mapping[str, Any]
+
+    @classmethod
+    def build(cls, config: dict, rules: ClassifierRules = None) -> "ConfigSnapshot":
+        """병합된 설정 딕셔너리로부터 스냅샷 생성"""
+        if rules is None:
+            rules = compile_rules(config.get('categories', []))
+        frozen = _freeze(config)
+        return cls(
+            focus=frozen.get('focus', MappingProxyType({})),
+            notification=frozen.get('notification', MappingProxyType({})),
+            categories=frozen.get('categories', ()),
+            privacy=frozen.get('privacy', MappingProxyType({})),
+            fleet=frozen.get('fleet', MappingProxyType({})),
+            rules=rules,
+            raw=frozen
+        )
+
+
+class ConfigService(QObject):
+    """설정 서비스"""
+
+    # 시그널: 새 스냅샷이 적용되었을 때 발생
+    config_changed = Signal(object)  # ConfigSnapshot
+
+    def __init__(
+        self,
+        default_path: Path = DEFAULT_CONFIG_PATH,
+        user_path: Path = USER_CONFIG_PATH,
+        cache_path: Optional[Path] = CACHE_PATH
+    ):
+        super().__init__()
+        self.default_path = Path(default_path)
+        self.user_path = Path(user_path)
+        self.cache_path = Path(cache_path) if cache_path else None
+
+        # 사용자 설정이 잘못되었으면 기본 설정만으로 시작
+        self._snapshot = (
+            self._load() or self._load(include_user=False) or ConfigSnapshot.build({})
+        )
+
+        self._watcher: Optional[QFileSystemWatcher] = None
+        # 편집기가 여러 번 나눠 쓰는 경우를 위한 지연
+        self._reload_timer = QTimer()
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(200)
+        self._reload_timer.timeout.connect(self.reload)
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """현재 설정 스냅샷"""
+        return self._snapshot
+
+    def watch(self):
+        """설정 파일 감시 시작 (Linux에서는 inotify 사용)"""
+        if self._watcher:
+            return
+        self._watcher = QFileSystemWatcher()
+        self._watcher.fileChanged.connect(self._on_path_changed)
+        self._watcher.directoryChanged.connect(self._on_path_changed)
+        self._refresh_watch_paths()
+
+    def reload(self) -> bool:
+        """설정 다시 읽기 - 유효하면 스냅샷을 교체하고 True 반환"""
+        self._refresh_watch_paths()
+        snapshot = self._load()
+        if snapshot is None or snapshot == self._snapshot:
+            return False
+        self._snapshot = snapshot
+        self.config_changed.emit(snapshot)
+        return True
+
+    def _on_path_changed(self, _path: str):
+        """파일/디렉터리 변경 감지"""
+        self._reload_timer.start()
+
+    def _refresh_watch_paths(self):
+        """감시 경로 갱신 (파일이 교체되면 감시가 풀리므로 디렉터리도 감시)"""
+        if not self._watcher:
+            return
+        paths = []
+        for path in (self.default_path, self.user_path):
+            if path.exists():
+                paths.append(str(path))
+            if path.parent.exists():
+                paths.append(str(path.parent))
+        watched = set(self._watcher.files()) | set(self._watcher.directories())
+        missing = [p for p in paths if p not in watched]
+        if missing:
+            self._watcher.addPaths(missing)
+
+    def _cache_key(self) -> tuple:
+        """캐시 키 - 파일별 (경로, mtime, 크기)"""
+        key = [CACHE_FORMAT]
+        for path in (self.default_path, self.user_path):
+            try:
+                stat = path.stat()
+                key.append((str(path), stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                key.append((str(path), None, None))
+        return tuple(key)
+
+    def _load(self, include_user: bool = True) -> Optional[ConfigSnapshot]:
+        """스냅샷 로드 (캐시 우선) - 실패 시 None"""
+        key = self._cache_key() if include_user else None
+
+        cached = self._read_cache(key)
+        if cached is not None:
+            return cached
+
+        try:
+            config = {}
+            if self.default_path.exists():
+                with open(self.default_path, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+            if include_user and self.user_path.exists():
+                with open(self.user_path, 'r', encoding='utf-8') as f:
+                    config = deep_merge(config, json.load(f))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"설정 파일 읽기 실패: {e}")
+            return None
+
+        errors = validate_config(config)
+        if errors:
+            print("설정 검증 실패:")
+            for error in errors:
+                print(f"  - {error}")
+            return None
+
+        rules = compile_rules(config.get('categories', []))
+        self._write_cache(key, config, rules)
+        return ConfigSnapshot.build(config, rules)
+
+    def _read_cache(self, key: tuple) -> Optional[ConfigSnapshot]:
+        """디스크 캐시 읽기 (키가 다르면 None)"""
+        if key is None or not self.cache_path or not self.cache_path.exists():
+            return None
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cached_key, config, rules = pickle.load(f)
+        except Exception:
+            return None
+        if cached_key != key:
+            return None
+        return ConfigSnapshot.build(config, rules)
+
+    def _write_cache(self, key: tuple, config: dict, rules: ClassifierRules):
+        """디스크 캐시 쓰기 (임시 파일 후 교체)"""
+        if key is None or not self.cache_path:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((key, config, rules), f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(self.cache_path)
+        except OSError as e:
+            print(f"설정 캐시 저장 실패: {e}")
@@ -0,0 +1,199 @@
+"""세션 제어 API - IPC 메서드와 이벤트를 세션 엔진에 연결"""
+from typing import Callable, List, Optional
+from PySide6.QtCore import QObject
+
+from services.ipc import IpcServer, IpcError, INVALID_PARAMS
+from services.browser_tabs import BrowserTabs
+from services.search_index import SearchIndexer
+from services.session_manager import SessionManager, FocusSession
+from services.today_stats import TodayStats
+from services.window_monitor import WindowInfo
+
+
+# 애플리케이션 수준 오류 코드
+NO_ACTIVE_SESSION = 1
+NO_PENDING_REMINDER = 2
+
+
+def window_to_dict(window: Optional[WindowInfo]) -> Optional[dict]:
+    if window is None:
+        return None
+    return {
+        "window_id": window.window_id,
+        "title": window.title,
+        "app_name": window.app_name,
+        "process_name": window.process_name,
+        "url": window.url,
+        "pid": window.pid,
+    }
+
+
+def _positive_int(value) -> bool:
+    # bool은 int의 하위 클래스라 따로 제외 (true가 1분으로 통과하지 않도록)
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+class RemoteNotificationService:
+    """
+    헤드리스용 알림 서비스 - 토스트 대신 IPC 이벤트로 리마인더 전달
+
+    구독 중인 클라이언트가 session.choice로 응답하면 선택이 적용된다.
+    """
+
+    def __init__(self):
+        self.server: Optional[IpcServer] = None
+        self._pending: Optional[Callable[[str], None]] = None
+
+    @property
+    def has_pending(self) -> bool:
+        return self._pending is not None
+
+    def show_focus_reminder(self, remaining_minutes: int,
+                            on_choice: Callable[[str], None] = None):
+        self._pending = on_choice
+        if self.server:
+            self.server.broadcast("focus.reminder", remaining_minutes=remaining_minutes)
+
+    def answer(self, choice: str):
+        """대기 중인 리마인더에 응답"""
+        callback, self._pending = self._pending, None
+        if callback:
+            callback(choice)
+
+    def close_current(self):
+        self._pending = None
+        if self.server:
+            self.server.broadcast("focus.reminder_closed")
+
+
+class ControlApi(QObject):
+    """세션 엔진을 IPC 서버에 노출"""
+
+    def __init__(
+        self,
+        server: IpcServer,
+        session_manager: SessionManager,
+        today_stats: TodayStats,
+        remote_notifications: RemoteNotificationService = None,
+        browser_tabs: BrowserTabs = None,
+        search_indexer: SearchIndexer = None
+    ):
+        super().__init__()
+        self.server = server
+        self.session_manager = session_manager
+        self.today_stats = today_stats
+        self.remote_notifications = remote_notifications
+        self.browser_tabs = browser_tabs
+        self.search_indexer = search_indexer
+        if remote_notifications:
+            remote_notifications.server = server
+
+        for name, handler in {
+            "ping": lambda: "pong",
+            "session.start": self.start_session,
+            "session.pause": self.pause_session,
+            "session.resume": self.resume_session,
+            "session.stop": self.stop_session,
+            "session.extend": self.extend_session,
+            "session.status": self.session_status,
+            "session.choice": self.answer_reminder,
+            "stats.today": lambda: self.today_stats.stats,
+            "stats.refresh": self.refresh_stats,
+            "window.current": self.current_window,
+            "browser.tab": self.browser_tab,
+            "history.search": self.search_history,
+        }.items():
+            server.register(name, handler)
+
+        session_manager.session_started.connect(
+            lambda s: server.broadcast("session.started", session=s.to_dict()))
+        session_manager.session_ended.connect(
+            lambda s, completed: server.broadcast("session.ended", session=s.to_dict(),
+                                                  completed=completed))
+        session_manager.session_updated.connect(
+            lambda s: server.broadcast("session.updated", session=s.to_dict()))
+        today_stats.stats_changed.connect(
+            lambda stats: server.broadcast("stats.changed", stats=stats))
+
+    def stop(self):
+        """제어 소켓 닫기"""
+        self.server.stop()
+
+    def _broadcast_updated(self) -> dict:
+        """일시정지/재개는 시그널이 없으므로 직접 알림"""
+        session = self.session_manager.current_session.to_dict()
+        self.server.broadcast("session.updated", session=session)
+        return session
+
+    def _require_session(self) -> FocusSession:
+        session = self.session_manager.current_session
+        if not session:
+            raise IpcError(NO_ACTIVE_SESSION, "진행 중인 세션이 없습니다")
+        return session
+
+    def start_session(self, duration: int = None) -> dict:
+        if duration is not None and not _positive_int(duration):
+            raise IpcError(INVALID_PARAMS, "duration은 양의 정수(분)여야 합니다")
+        return self.session_manager.start_session(duration=duration).to_dict()
+
+    def pause_session(self) -> dict:
+        self._require_session()
+        self.session_manager.pause_session()
+        return self._broadcast_updated()
+
+    def resume_session(self) -> dict:
+        self._require_session()
+        self.session_manager.resume_session()
+        return self._broadcast_updated()
+
+    def stop_session(self, completed: bool = False) -> dict:
+        if not isinstance(completed, bool):
+            raise IpcError(INVALID_PARAMS, "completed는 true/false여야 합니다")
+        session = self._require_session()
+        self.session_manager.end_session(completed=completed)
+        return session.to_dict()
+
+    def extend_session(self, minutes: int = 5) -> dict:
+        if not _positive_int(minutes):
+            raise IpcError(INVALID_PARAMS, "minutes는 양의 정수(분)여야 합니다")
+        self._require_session()
+        self.session_manager.extend_session(minutes)
+        return self.session_manager.current_session.to_dict()
+
+    def session_status(self) -> Optional[dict]:
+        session = self.session_manager.current_session
+        return session.to_dict() if session else None
+
+    def answer_reminder(self, choice: str) -> bool:
+        if choice not in ('continue', 'extend', 'switch'):
+            raise IpcError(INVALID_PARAMS, "choice는 continue, extend, switch 중 하나여야 합니다")
+        if not self.remote_notifications or not self.remote_notifications.has_pending:
+            raise IpcError(NO_PENDING_REMINDER, "응답을 기다리는 리마인더가 없습니다")
+        self.remote_notifications.answer(choice)
+        return True
+
+    def refresh_stats(self) -> dict:
+        self.today_stats.refresh()
+        return self.today_stats.stats
+
+    def current_window(self) -> Optional[dict]:
+        return window_to_dict(self.session_manager.window_monitor.get_current_window())
+
+    def browser_tab(self, url: str, title: str = "", browser: str = "") -> bool:
+        """브라우저 확장의 탭 활성화 보고 (native_host.py 경유)"""
+        if not isinstance(url, str) or not url:
+            raise IpcError(INVALID_PARAMS, "url은 비어 있지 않은 문자열이어야 합니다")
+        if not self.browser_tabs:
+            return False
+        self.browser_tabs.update(url, title, browser)
+        return True
+
+    def search_history(self, query: str, limit: int = 20) -> List[dict]:
+        """세션/창 이력 검색"""
+        if not isinstance(query, str) or not query.strip():
+            raise IpcError(INVALID_PARAMS, "query는 비어 있지 않은 문자열이어야 합니다")
+        if not _positive_int(limit) or limit > 200:
+            raise IpcError(INVALID_PARAMS, "limit은 1~200 사이의 정수여야 합니다")
+        if not self.search_indexer:
+            return []
+        return self.search_indexer.search(query, limit)
@@ -0,0 +1,163 @@
+"""방해 예측 - 앱 전환 마르코프 모델로 다음 창을 미리 분류하고 토스트를 미리 준비
+
+상태는 (앱, 분류 종류)다. 같은 브라우저라도 작업 탭과 영상 탭은 다른 상태라서
+탭 전환으로 생기는 방해도 예측할 수 있다. 전환 시점에는 창 쌍만 적어 두고, 이벤트 루프가
+한가할 때 모델을 갱신한 뒤 다음에 올 확률이 높은 상태의 마지막 창을 미리 분류한다.
+그중 방해 요소로 갈 확률이 높으면 세션 중일 때 NotificationService.prewarm()으로 토스트를
+만들어 두어, 실제 전환 때는 내용만 바꿔 바로 띄운다. 시작할 때 최근 전환 기록으로 모델을 채운다.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+from PySide6.QtCore import QObject, QTimer
+
+from models.database import Database
+from models.records import WindowInfo
+from services.window_monitor import AppClassifier
+
+
+def state_key(app_name: str, category_type: str) -> str:
+    """마르코프 상태 (앱 + 분류 종류)"""
+    return f"{app_name}\x1f{category_type}"
+
+
+def state_type(state: str) -> str:
+    return state.rpartition("\x1f")[2]
+
+
+class TransitionModel:
+    """1차 마르코프 전환 모델 (행마다 상위 후보만 유지, 오래된 횟수는 반감)"""
+
+    # 기억할 출발 상태 수 / 출발 상태당 후보 수
+    MAX_APPS = 256
+    MAX_SUCCESSORS = 16
+    # 한 행의 합이 이만큼 쌓이면 절반으로 줄여 최근 습관을 따라감
+    ROW_LIMIT = 200.0
+
+    def __init__(self):
+        self._rows: Dict[str, Dict[str, float]] = {}
+        self._totals: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def observe(self, source: str, target: str):
+        """전환 한 번 반영 (O(후보 수))"""
+        if not source or not target or source == target:
+            return
+        row = self._rows.get(source)
+        if row is None:
+            if len(self._rows) >= self.MAX_APPS:
+                # 가장 적게 쓰인 출발 상태를 버림
+                victim = min(self._totals, key=self._totals.get)
+                del self._rows[victim], self._totals[victim]
+            row = self._rows[source] = {}
+            self._totals[source] = 0.0
+        if target not in row and len(row) >= self.MAX_SUCCESSORS:
+            victim = min(row, key=row.get)
+            self._totals[source] -= row.pop(victim)
+        row[target] = row.get(target, 0.0) + 1.0
+        self._totals[source] += 1.0
+        if self._totals[source] >= self.ROW_LIMIT:
+            for state in row:
+                row[state] *= 0.5
+            self._totals[source] *= 0.5
+
+    def predict(self, source: str, k: int = 3) -> List[Tuple[str, float]]:
+        """source 다음에 올 상태 상위 k개와 확률"""
+        row = self._rows.get(source)
+        if not row:
+            return []
+        total = self._totals[source]
+        best = sorted(row.items(), key=lambda item: item[1], reverse=True)[:k]
+        return [(state, count / total) for state, count in best]
+
+
+class DistractionPredictor(QObject):
+    """창 전환 스트림으로 모델 갱신, 다음 창 미리 분류, 방해 가능성이 높으면 토스트 준비"""
+
+    # 미리 분류할 후보 수
+    TOP_K = 3
+    # 방해 요소로 넘어갈 확률이 이 이상이면 토스트 준비
+    PREWARM_PROBABILITY = 0.25
+    # 시작 시 모델을 채울 전환 기록 기간
+    HISTORY_DAYS = 30
+
+    def __init__(self, session_manager, classifier: AppClassifier = None):
+        super().__init__()
+        self.session_manager = session_manager
+        self.classifier = classifier or session_manager.app_classifier
+        self.model = TransitionModel()
+        # 상태별 마지막으로 본 창 (미리 분류할 대상)
+        self._last_window: Dict[str, WindowInfo] = {}
+        self._current_state = None
+        # 아직 모델에 반영하지 않은 (이전 창, 새 창)
+        self._pending: List[Tuple[WindowInfo, WindowInfo]] = []
+        self.prewarms = 0
+
+        # 전환 처리가 끝난 뒤 유휴 시간에 갱신/예측
+        self._predict_timer = QTimer()
+        self._predict_timer.setSingleShot(True)
+        self._predict_timer.timeout.connect(self.predict_next)
+
+        session_manager.window_monitor.window_changed.connect(self._on_window_changed)
+        session_manager.session_started.connect(lambda _session: self._predict_timer.start(0))
+
+    def _state(self, window: WindowInfo) -> str:
+        return state_key(window.app_name, self.classifier.classify(window).type)
+
+    def bootstrap(self, db: Database, now: datetime = None):
+        """
+        최근 전환 기록으로 모델 채우기 (월별 파티션 중 해당 기간만 읽음)
+
+        기록된 전환은 모두 방해 요소로 가는 전환이므로 도착 쪽은 entertainment,
+        출발 쪽은 제목 없이 앱 이름만으로 분류한 종류를 쓴다 (대략적인 사전 분포).
+        """
+        now = now or datetime.now()
+        types: Dict[str, str] = {}
+        for event in db.get_switch_events(now - timedelta(days=self.HISTORY_DAYS), now):
+            from_app = event['from_app'] or ''
+            if from_app not in types:
+                types[from_app] = self.classifier.classify(
+                    WindowInfo('', '', from_app, from_app)).type
+            self.model.observe(state_key(from_app, types[from_app]),
+                               state_key(event['to_app'], 'entertainment'))
+
+    def _on_window_changed(self, old_window: WindowInfo, new_window: WindowInfo):
+        """전환 시점에는 기록만 (분류/모델 갱신은 predict_next에서)"""
+        if new_window and len(self._pending) < 64:
+            self._pending.append((old_window, new_window))
+            self._predict_timer.start(0)
+
+    def _apply_pending(self):
+        pending, self._pending = self._pending, []
+        for old_window, new_window in pending:
+            state = self._state(new_window)
+            if old_window:
+                self.model.observe(self._current_state or self._state(old_window), state)
+            if len(self._last_window) >= TransitionModel.MAX_APPS and state not in self._last_window:
+                self._last_window.clear()
+            self._last_window[state] = new_window
+            self._current_state = state
+
+    def predict_next(self) -> float:
+        """
+        모델 갱신 후 다음 후보를 미리 분류하고, 방해 요소로 갈 확률이 높으면 토스트 준비
+
+        Returns:
+            방해 요소(entertainment)로 넘어갈 확률 (후보 상위 TOP_K 기준)
+        """
+        self._apply_pending()
+        probability = 0.0
+        for state, p in self.model.predict(self._current_state, self.TOP_K):
+            window = self._last_window.get(state)
+            if window:
+                # 분류 캐시를 채워 둠 (규칙이 바뀌어 캐시가 비었을 때 효과)
+                self.classifier.classify(window)
+            if state_type(state) == 'entertainment':
+                probability += p
+        if probability >= self.PREWARM_PROBABILITY and self.session_manager.is_active:
+            prewarm = getattr(self.session_manager.notification_service, 'prewarm', None)
+            if prewarm:
+                prewarm()
+                self.prewarms += 1
+        return probability
@@ -0,0 +1,219 @@
+"""카테고리별 체류 시간 집계 - 날짜 × 카테고리 셀과 30분 단위 스파크라인
+
+창이 바뀔 때마다 이전 창이 머문 구간을 (날짜, 카테고리) 셀 하나(자정에 걸치면 둘)에 더한다.
+대시보드 차트는 최근 HISTORY_DAYS일의 셀(하루에 카테고리 수만큼)만 읽으므로 이력이 길어져도
+렌더링 비용이 같다. 셀 증분은 모아 두었다가 주기적으로 category_dwell 테이블에 더하고,
+시작할 때 최근 기간만 한 번 읽어 온다. 자리 비움 동안은 집계하지 않는다.
+"""
+from datetime import datetime, date, timedelta
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from models.database import Database
+from models.records import WindowInfo, Category, NEUTRAL_CATEGORY
+from services.session_manager import SessionManager
+from services.window_monitor import make_category
+from utils.metrics import metrics
+
+
+def _split_days(start: datetime, end: datetime):
+    """start ~ end를 날짜별 (날짜, 초)로 나눔"""
+    while start.date() < end.date():
+        midnight = datetime.combine(start.date() + timedelta(days=1), datetime.min.time())
+        yield start.date(), (midnight - start).total_seconds()
+        start = midnight
+    if end > start:
+        yield start.date(), (end - start).total_seconds()
+
+
+class Sparkline:
+    """최근 SLOTS개 구간(SLOT_MINUTES분 단위)의 분류 종류별 체류 시간"""
+
+    SLOT_MINUTES = 30
+    SLOTS = 24
+    TYPES = ('work', 'entertainment', 'neutral')
+
+    def __init__(self):
+        # 구간 번호(에포크 기준) -> 종류별 초
+        self._slots: Dict[int, List[float]] = {}
+
+    def _slot(self, at: datetime) -> int:
+        return int(at.timestamp()) // (self.SLOT_MINUTES * 60)
+
+    def add(self, start: datetime, end: datetime, category_type: str):
+        """구간을 슬롯 경계에서 나눠서 더함"""
+        index = self.TYPES.index(category_type) if category_type in self.TYPES else 2
+        width = self.SLOT_MINUTES * 60
+        first, last = start.timestamp(), end.timestamp()
+        while first < last:
+            slot = int(first) // width
+            upto = min(last, (slot + 1) * width)
+            self._slots.setdefault(slot, [0.0] * len(self.TYPES))[index] += upto - first
+            first = upto
+        if len(self._slots) > self.SLOTS * 2:
+            newest = max(self._slots)
+            for slot in [s for s in self._slots if s <= newest - self.SLOTS]:
+                del self._slots[slot]
+
+    def values(self, category_type: str = 'work', now: datetime = None) -> List[float]:
+        """오래된 순 SLOTS개 값 (분, 지금 구간이 마지막)"""
+        index = self.TYPES.index(category_type)
+        current = self._slot(now or datetime.now())
+        return [self._slots.get(slot, (0.0,) * len(self.TYPES))[index] / 60
+                for slot in range(current - self.SLOTS + 1, current + 1)]
+
+
+class DwellRollup(QObject):
+    """창 전환 스트림 → 날짜 × 카테고리 체류 시간 셀 (메모리) + 배치 저장"""
+
+    # 셀 값이 바뀌었을 때 (창 전환, 주기 저장)
+    rollup_changed = Signal()
+
+    # 메모리에 두는 기간 (주간 차트 + 여유)
+    HISTORY_DAYS = 28
+    # 저장 간격 (밀리초) - 한 창에 오래 머물러도 이 간격으로 열린 구간을 나눠 더함
+    FLUSH_INTERVAL = 60_000
+
+    def __init__(self, db: Database, session_manager: SessionManager,
+                 clock: Callable[[], datetime] = datetime.now):
+        super().__init__()
+        self.db = db
+        self.session_manager = session_manager
+        self._clock = clock
+        # 날짜 -> 카테고리 id -> 초
+        self._cells: Dict[date, Dict[str, float]] = {}
+        # 아직 저장하지 않은 증분 (날짜, 카테고리 id) -> 초
+        self._pending: Dict[Tuple[date, str], float] = {}
+        # 카테고리 id -> 레코드 (이름/종류 표시용, 분류 결과와 설정에서 채움)
+        self._categories: Dict[str, Category] = {NEUTRAL_CATEGORY.id: NEUTRAL_CATEGORY}
+        self.set_categories(session_manager.app_classifier.categories)
+        self.sparkline = Sparkline()
+        # 열린 구간 (현재 창의 카테고리와 시작 시각, 자리 비움/중지 중이면 None)
+        self._category: Optional[Category] = None
+        self._since: Optional[datetime] = None
+        self._running = False
+
+        self._flush_timer = QTimer()
+        self._flush_timer.timeout.connect(self.flush)
+
+        session_manager.window_monitor.window_changed.connect(self._on_window_changed)
+        self.load()
+
+    def load(self):
+        """최근 HISTORY_DAYS일 셀을 DB에서 읽기 (시작 시 한 번)"""
+        today = self._clock().date()
+        first = today - timedelta(days=self.HISTORY_DAYS - 1)
+        self._cells = {}
+        for day, category_id, seconds in self.db.get_category_dwell(first.isoformat(), today.isoformat()):
+            self._cells.setdefault(date.fromisoformat(day), {})[category_id] = seconds
+
+    def start(self):
+        """현재 창부터 집계 시작"""
+        self._running = True
+        self._flush_timer.start(self.FLUSH_INTERVAL)
+        self._resume()
+
+    def stop(self):
+        self._running = False
+        self._flush_timer.stop()
+        self.observe(None)
+        self.flush()
+
+    def attach_idle_detector(self, detector):
+        """자리 비움 동안은 집계하지 않음 (services.idle_detector.IdleDetector)"""
+        detector.idle_started.connect(lambda since: self.observe(None, since))
+        detector.idle_ended.connect(self._resume)
+
+    def _resume(self):
+        if not self._running:
+            return
+        window = self.session_manager.window_monitor.get_current_window()
+        self.observe(self._classify(window) if window else None)
+
+    def _classify(self, window: WindowInfo) -> Category:
+        return self.session_manager.app_classifier.classify(window)
+
+    def _on_window_changed(self, _old_window: WindowInfo, new_window: WindowInfo):
+        if not self._running:
+            # 시작 전 (start()에서 현재 창부터 집계)
+            return
+        self.observe(self._classify(new_window) if new_window else None)
+        self.rollup_changed.emit()
+
+    def observe(self, category: Optional[Category], at: datetime = None):
+        """
+        열린 구간을 at에서 닫아 셀에 더하고 category로 새 구간 시작 (None이면 집계 중지)
+
+        Args:
+            at: 전환 시각 (자리 비움은 마지막 입력 시각, 기본은 지금)
+        """
+        now = self._clock()
+        at = min(at or now, now)
+        if self._category is not None and self._since is not None and at > self._since:
+            with metrics.timer("dwell.observe_seconds"):
+                self._add(self._category, self._since, at)
+        self._category = category
+        self._since = at if category is not None else None
+        if category is not None and category.id not in self._categories:
+            self._categories[category.id] = category
+
+    def _add(self, category: Category, start: datetime, end: datetime):
+        for day, seconds in _split_days(start, end):
+            row = self._cells.setdefault(day, {})
+            row[category.id] = row.get(category.id, 0.0) + seconds
+            key = (day, category.id)
+            self._pending[key] = self._pending.get(key, 0.0) + seconds
+        self.sparkline.add(start, end, category.type)
+
+    def flush(self):
+        """열린 구간을 지금까지 더하고 증분을 한 트랜잭션으로 저장, 지난 날짜는 메모리에서 정리"""
+        if self._category is not None:
+            self.observe(self._category)
+            self.rollup_changed.emit()
+        if self._pending:
+            pending, self._pending = self._pending, {}
+            self.db.add_category_dwell([(day.isoformat(), category_id, seconds)
+                                        for (day, category_id), seconds in pending.items()])
+        oldest = self._clock().date() - timedelta(days=self.HISTORY_DAYS - 1)
+        for day in [day for day in self._cells if day < oldest]:
+            del self._cells[day]
+
+    def set_categories(self, categories: Iterable[Mapping]):
+        """카테고리 설정 (이름/종류 표시용 - 이력에만 있고 아직 분류된 적 없는 카테고리)"""
+        for config in categories:
+            self._categories[config['id']] = make_category(config)
+
+    # === 조회 (셀만 읽음, 열린 구간은 마지막 전환/저장 시점까지 반영) ===
+    def category(self, category_id: str) -> Category:
+        """카테고리 레코드 (설정에서 지워진 카테고리는 id를 이름으로)"""
+        category = self._categories.get(category_id)
+        if category is None:
+            category = self._categories[category_id] = Category(category_id, category_id, 'neutral')
+        return category
+
+    def days(self, count: int = 7) -> List[date]:
+        """오늘까지 count일 (오래된 순)"""
+        today = self._clock().date()
+        return [today - timedelta(days=offset) for offset in range(count - 1, -1, -1)]
+
+    def daily_totals(self, count: int = 7, category_type: str = 'work') -> List[Tuple[date, float]]:
+        """날짜별 해당 종류 카테고리 체류 시간 (초, 오래된 순) - 주간 막대 차트"""
+        totals = []
+        for day in self.days(count):
+            row = self._cells.get(day, {})
+            totals.append((day, sum(seconds for category_id, seconds in row.items()
+                                    if self.category(category_id).type == category_type)))
+        return totals
+
+    def distribution(self, count: int = 7) -> List[Tuple[Category, float]]:
+        """최근 count일 카테고리별 체류 시간 (초, 많은 순) - 카테고리별 분포"""
+        totals: Dict[str, float] = {}
+        for day in self.days(count):
+            for category_id, seconds in self._cells.get(day, {}).items():
+                totals[category_id] = totals.get(category_id, 0.0) + seconds
+        return sorted(((self.category(category_id), seconds) for category_id, seconds in totals.items()),
+                      key=lambda item: item[1], reverse=True)
+
+    @property
+    def cell_count(self) -> int:
+        return sum(len(row) for row in self._cells.values())
@@ -0,0 +1,111 @@
+"""엄격 모드 - 세션 중 엔터테인먼트 창을 리마인더 없이 바로 최소화하거나 닫음
+
+결정과 실행은 창 변경을 감지한 스레드에서 바로 한다 (asyncio 파이프라인이면 파이프라인
+스레드의 정책 단계, QTimer 모니터면 모니터 타이머 콜백). 창 조작은 활성 창 소스가 연
+services.backends.actions로 창 관리자에 직접 요청하므로 프로세스 실행도, GUI 스레드를
+거치는 토스트 왕복도 없다. GUI 스레드에는 결과(Enforcement)만 전달되어 기록된다.
+
+이 모듈은 Qt를 가져오지 않는다.
+"""
+from typing import Callable, Mapping, NamedTuple, Optional, Tuple
+
+from models.records import WindowInfo
+from services.backends.actions import WindowActions
+from utils.metrics import metrics
+
+# 앱별 동작: 최소화 | 닫기 (창 관리자가 정상 종료 요청) | 리마인더만 (엄격 모드 제외)
+STRICT_ACTIONS = ('minimize', 'close', 'remind')
+
+
+class StrictPolicy(NamedTuple):
+    """앱별 엄격 모드 동작 (설정 focus.strict_policy)"""
+    default: str = 'minimize'
+    # (소문자 앱/프로세스 이름 일부, 동작) - 분류기 앱 규칙처럼 포함 여부로 비교, 먼저 맞는 것
+    apps: Tuple[Tuple[str, str], ...] = ()
+
+    @classmethod
+    def from_config(cls, config: Optional[Mapping]) -> "StrictPolicy":
+        config = config or {}
+        return cls(
+            default=config.get('default', 'minimize'),
+            apps=tuple((app.lower(), action) for app, action in (config.get('apps') or {}).items())
+        )
+
+    def action_for(self, window: WindowInfo) -> str:
+        app_name = window.app_name.lower()
+        process_name = window.process_name.lower()
+        for app, action in self.apps:
+            if app in app_name or app in process_name:
+                return action
+        return self.default
+
+
+class Enforcement(NamedTuple):
+    """엄격 모드로 처리한 전환"""
+    action: str  # 'minimize' | 'close'
+    window: WindowInfo
+    returned: bool  # 작업 창으로 되돌렸는지
+
+
+class StrictEnforcer:
+    """엄격 모드 결정/실행 (한 번에 한 스레드에서 호출)"""
+
+    def __init__(self, open_actions: Callable[[], Optional[WindowActions]]):
+        """
+        Args:
+            open_actions: 창 조작 수단을 여는 함수 (처음 실행할 때 실행 스레드에서 호출)
+        """
+        self.enabled = False
+        self.policy = StrictPolicy()
+        self._open_actions = open_actions
+        self._actions: Optional[WindowActions] = None
+        self._opened = False
+
+    def configure(self, enabled: bool, policy: Optional[Mapping] = None):
+        """설정 적용 (참조만 바꾸므로 다른 스레드에서 호출해도 됨)"""
+        self.policy = StrictPolicy.from_config(policy)
+        self.enabled = bool(enabled)
+
+    def reset(self):
+        """창 조작 연결 닫기 (모니터 소스가 바뀌었거나 종료 시)"""
+        if self._actions is not None:
+            self._actions.disconnect()
+        self._actions = None
+        self._opened = False
+
+    def _get_actions(self) -> Optional[WindowActions]:
+        if not self._opened:
+            self._opened = True
+            self._actions = self._open_actions()
+            if self._actions is None:
+                print("엄격 모드: 이 세션에서는 창을 조작할 수 없어 리마인더로 대신합니다")
+        return self._actions
+
+    def enforce(self, window: WindowInfo,
+                return_window: Optional[WindowInfo] = None) -> Optional[Enforcement]:
+        """
+        방해 창에 엄격 모드 적용
+
+        Returns:
+            처리했으면 Enforcement, 꺼져 있거나 'remind' 앱이거나 조작할 수 없으면 None
+            (None이면 평소처럼 리마인더를 띄움)
+        """
+        if not self.enabled:
+            return None
+        policy = self.policy
+        action = policy.action_for(window)
+        if action not in ('minimize', 'close'):
+            return None
+        actions = self._get_actions()
+        if actions is None:
+            return None
+
+        with metrics.timer("strict.enforce_seconds"):
+            done = actions.minimize(window.window_id) if action == 'minimize' \
+                else actions.close(window.window_id)
+            if not done:
+                return None
+            returned = bool(return_window) and return_window.window_id != window.window_id \
+                and actions.activate(return_window.window_id)
+        metrics.inc(f"strict.{action}")
+        return Enforcement(action, window, returned)
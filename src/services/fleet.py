@@ -0,0 +1,197 @@
+"""팀 집계 업로드 (옵트인) - 일별 집계를 압축해서 수집 서버로 전송
+
+집계에는 숫자와 카테고리 id만 들어가며 앱 이름/창 제목은 보내지 않는다.
+배치는 먼저 디스크 아웃박스(gzip JSON 파일)에 쓰고, 전송에 성공해야 지운다.
+실패하면 지터를 섞은 지수 백오프로 다시 시도하므로 수백 대가 동시에 몰리지 않는다.
+"""
+import os
+import gzip
+import json
+import uuid
+import random
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+from PySide6.QtCore import QObject, QTimer, QUrl, Signal
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
+
+from models.database import Database
+
+
+OUTBOX_DIR = Path.home() / ".config" / "focus-guardian" / "outbox"
+PAYLOAD_VERSION = 1
+
+
+class Outbox:
+    """전송 대기 배치 디렉터리 (파일 하나 = 배치 하나, 이름순 = 생성순)"""
+
+    # 수집 서버가 오래 죽어 있어도 디스크를 무한히 쓰지 않음 (오래된 것부터 버림)
+    MAX_BATCHES = 1000
+
+    def __init__(self, path: Path = OUTBOX_DIR):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._state_path = self.path / "state.json"
+
+    def put(self, payload: dict) -> Path:
+        """배치 저장 (임시 파일에 쓴 뒤 rename - 반쯤 쓴 배치는 보이지 않음)"""
+        name = f"{datetime.now():%Y%m%d%H%M%S%f}-{payload['batch_id'][:8]}.json.gz"
+        target = self.path / name
+        tmp = target.with_suffix('.tmp')
+        tmp.write_bytes(gzip.compress(json.dumps(payload, separators=(',', ':')).encode('utf-8')))
+        os.replace(tmp, target)
+        for old in self.pending()[:-self.MAX_BATCHES]:
+            old.unlink(missing_ok=True)
+        return target
+
+    def pending(self) -> List[Path]:
+        return sorted(self.path.glob("*.json.gz"))
+
+    def remove(self, path: Path):
+        path.unlink(missing_ok=True)
+
+    def load_state(self) -> dict:
+        try:
+            return json.loads(self._state_path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save_state(self, state: dict):
+        tmp = self._state_path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(state), encoding='utf-8')
+        os.replace(tmp, self._state_path)
+
+
+def backoff_delay(attempt: int, base: float = 30.0, cap: float = 3600.0) -> float:
+    """attempt번째 재시도까지 기다릴 시간 (초) - 지수 증가, 상한, 50~100% 지터"""
+    return min(cap, base * (2 ** attempt)) * random.uniform(0.5, 1.0)
+
+
+class FleetUploader(QObject):
+    """지난 날짜의 일별 집계를 아웃박스에 쌓고 순서대로 전송"""
+
+    uploaded = Signal(str)       # 전송 완료된 배치 파일 이름
+    upload_failed = Signal(str)  # 오류 메시지 (재시도 예정)
+
+    # 새 집계 확인 간격 (밀리초)
+    CHECK_INTERVAL = 3600_000
+    # 한 번에 보낼 최대 일 수 (오래 꺼져 있다 켜진 경우)
+    MAX_DAYS_PER_BATCH = 31
+    REQUEST_TIMEOUT = 30_000
+
+    def __init__(self, db: Database, endpoint: str, team: str = "", token: str = "",
+                 outbox: Outbox = None):
+        super().__init__()
+        self.db = db
+        self.endpoint = endpoint
+        self.team = team
+        self.token = token
+        self.outbox = outbox or Outbox()
+        self._network = QNetworkAccessManager()
+        self._network.setTransferTimeout(self.REQUEST_TIMEOUT)
+        self._reply: Optional[QNetworkReply] = None
+        self._attempt = 0
+        self._check_timer = QTimer()
+        self._check_timer.timeout.connect(self.sync)
+        self._retry_timer = QTimer()
+        self._retry_timer.setSingleShot(True)
+        self._retry_timer.timeout.connect(self.flush)
+
+        state = self.outbox.load_state()
+        # 사용자/호스트와 무관한 무작위 좌석 id
+        self.seat_id = state.get('seat_id') or str(uuid.uuid4())
+        self.last_rollup: Optional[str] = state.get('last_rollup')
+        if not state.get('seat_id'):
+            self._save_state()
+
+    def start(self, initial_delay: float = None):
+        """주기적 집계/전송 시작 (첫 전송은 좌석마다 흩어지도록 지연)"""
+        if initial_delay is None:
+            initial_delay = random.uniform(0, 300)
+        self._check_timer.start(self.CHECK_INTERVAL)
+        QTimer.singleShot(int(initial_delay * 1000), self.sync)
+
+    def stop(self):
+        self._check_timer.stop()
+        self._retry_timer.stop()
+        if self._reply:
+            self._reply.abort()
+
+    def configure(self, endpoint: str, team: str = "", token: str = ""):
+        self.endpoint = endpoint
+        self.team = team
+        self.token = token
+
+    def _save_state(self):
+        self.outbox.save_state({'seat_id': self.seat_id, 'last_rollup': self.last_rollup})
+
+    def sync(self):
+        """끝난 날짜의 집계를 아웃박스에 넣고 전송"""
+        self.enqueue_rollups()
+        self.flush()
+
+    def enqueue_rollups(self, today: date = None) -> Optional[Path]:
+        """마지막으로 집계한 다음 날부터 어제까지 배치 하나로 (오늘은 아직 안 끝남)"""
+        today = today or date.today()
+        last_day = today - timedelta(days=1)
+        if self.last_rollup:
+            first_day = date.fromisoformat(self.last_rollup) + timedelta(days=1)
+        else:
+            first_day = last_day
+        first_day = max(first_day, last_day - timedelta(days=self.MAX_DAYS_PER_BATCH - 1))
+        if first_day > last_day:
+            return None
+
+        rollups = self.db.get_daily_rollups(first_day.isoformat(), last_day.isoformat())
+        path = None
+        if rollups:
+            path = self.outbox.put({
+                'version': PAYLOAD_VERSION,
+                'batch_id': str(uuid.uuid4()),
+                'seat': self.seat_id,
+                'team': self.team,
+                'created': datetime.now().isoformat(timespec='seconds'),
+                'rollups': rollups,
+            })
+        self.last_rollup = last_day.isoformat()
+        self._save_state()
+        return path
+
+    def flush(self):
+        """아웃박스의 가장 오래된 배치부터 하나씩 전송"""
+        if self._reply is not None or self._retry_timer.isActive():
+            return
+        pending = self.outbox.pending()
+        if not pending:
+            return
+        path = pending[0]
+        request = QNetworkRequest(QUrl(self.endpoint))
+        request.setHeader(QNetworkRequest.KnownHeaders.ContentTypeHeader, "application/json")
+        request.setRawHeader(b"Content-Encoding", b"gzip")
+        if self.token:
+            request.setRawHeader(b"Authorization", f"Bearer {self.token}".encode())
+        self._reply = self._network.post(request, path.read_bytes())
+        self._reply.finished.connect(lambda reply=self._reply: self._on_finished(reply, path))
+
+    def _on_finished(self, reply: QNetworkReply, path: Path):
+        self._reply = None
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute) or 0
+        error = reply.errorString()
+        reply.deleteLater()
+
+        if 200 <= status < 300:
+            self._attempt = 0
+            self.outbox.remove(path)
+            self.uploaded.emit(path.name)
+            self.flush()
+        elif status in (400, 413, 422):
+            # 배치 자체가 잘못됨 - 다시 보내도 같은 결과이므로 버리고 다음 배치
+            # (401/403 같은 설정 문제, 5xx, 네트워크 오류는 재시도)
+            self.outbox.remove(path)
+            self.upload_failed.emit(f"{path.name} 거부됨 (HTTP {status})")
+            self.flush()
+        else:
+            delay = backoff_delay(self._attempt)
+            self._attempt += 1
+            self.upload_failed.emit(f"전송 실패 (HTTP {status or '-'}: {error}), {delay:.0f}초 후 재시도")
+            self._retry_timer.start(int(delay * 1000))
@@ -0,0 +1,258 @@
+"""집중 패턴 모델 - 시간대/요일/카테고리별 지수 감쇠 통계와 집중 시간 추천
+
+세션이 끝날 때와 전환이 기록될 때마다 해당 버킷 몇 개만 O(1)로 갱신한다.
+버킷은 마지막 갱신 시각을 들고 있다가 다음 갱신 때 지난 시간만큼 한꺼번에 감쇠하므로
+(반감기 half_life_days) 오래된 습관은 서서히 잊힌다. 통계는 작은 JSON 스냅샷으로 저장하고,
+스냅샷이 없을 때만 DB 이력으로 한 번 채운다.
+"""
+import os
+import json
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+from PySide6.QtCore import QObject
+
+from models.database import Database
+
+
+PATTERNS_PATH = Path.home() / ".config" / "focus-guardian" / "patterns.json"
+SNAPSHOT_VERSION = 1
+
+# 집중 시간 히스토그램: 5분 단위 0~120분 + 120분 이상
+BIN_MINUTES = 5
+BINS = 120 // BIN_MINUTES + 1
+
+
+class _Bucket:
+    """감쇠 합계 (세션 수, 완료 수, 집중 분, 전환 시도/차단, 집중 시간 히스토그램)"""
+    __slots__ = ('updated', 'sessions', 'completed', 'minutes', 'switches', 'blocked', 'hist')
+
+    def __init__(self, updated: float = 0.0):
+        self.updated = updated
+        self.sessions = 0.0
+        self.completed = 0.0
+        self.minutes = 0.0
+        self.switches = 0.0
+        self.blocked = 0.0
+        self.hist = [0.0] * BINS
+
+    def decay(self, now: float, half_life: float):
+        """now까지 감쇠 (마지막 갱신 이후 흐른 시간만큼)"""
+        if now > self.updated:
+            factor = 0.5 ** ((now - self.updated) / half_life)
+            self.sessions *= factor
+            self.completed *= factor
+            self.minutes *= factor
+            self.switches *= factor
+            self.blocked *= factor
+            self.hist = [count * factor for count in self.hist]
+            self.updated = now
+
+    def weight(self, now: float, half_life: float) -> float:
+        """now 기준 감쇠된 세션 수 (버킷은 바꾸지 않음)"""
+        return self.sessions * 0.5 ** (max(now - self.updated, 0.0) / half_life)
+
+    def to_list(self) -> list:
+        return [round(self.updated), *(round(v, 4) for v in (
+            self.sessions, self.completed, self.minutes, self.switches, self.blocked)),
+            [round(count, 4) for count in self.hist]]
+
+    @classmethod
+    def from_list(cls, values: list) -> "_Bucket":
+        bucket = cls(values[0])
+        (bucket.sessions, bucket.completed, bucket.minutes,
+         bucket.switches, bucket.blocked) = values[1:6]
+        if len(values[6]) == BINS:
+            bucket.hist = list(values[6])
+        return bucket
+
+
+class Suggestion(NamedTuple):
+    """집중 시간 추천"""
+    minutes: int
+    completion_rate: Optional[float]    # 이 시간대 완료율 (0~1)
+    distraction_rate: Optional[float]   # 집중 1시간당 전환 시도
+    confidence: float                   # 시간대 버킷 데이터량 기준 (0~1)
+
+
+class FocusPatterns(QObject):
+    """온라인 집중 패턴 통계 (SessionManager 시그널로 갱신)"""
+
+    # 추천이 지켜지길 바라는 비율 - 과거 세션의 이만큼이 추천 시간 이상 집중했음
+    TARGET_SURVIVAL = 0.75
+    # 버킷 데이터가 이 세션 수만큼 쌓이면 전체 통계와 같은 비중
+    PRIOR_SESSIONS = 5.0
+    MIN_SUGGESTION = 10
+    MAX_SUGGESTION = 120
+
+    def __init__(self, path: Path = PATTERNS_PATH, half_life_days: float = 21.0,
+                 clock: Callable[[], float] = time.time):
+        super().__init__()
+        self.path = Path(path)
+        self.half_life = half_life_days * 86400
+        self._clock = clock
+        self._buckets: Dict[str, _Bucket] = {}
+        self._dirty = False
+
+    # === 갱신 ===
+    def _touch(self, key: str, now: float) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(now)
+        bucket.decay(now, self.half_life)
+        return bucket
+
+    @staticmethod
+    def _keys(start: datetime, category: Optional[str]) -> List[str]:
+        """세션이 속하는 버킷 (전체, 시간대, 요일, 카테고리)"""
+        keys = ['all', f'hour:{start.hour}', f'weekday:{start.weekday()}']
+        if category:
+            keys.append(f'category:{category}')
+        return keys
+
+    def observe_session(self, start: datetime, minutes: int, completed: bool,
+                        category: str = None, switches: int = 0, blocked: int = 0,
+                        now: float = None):
+        """끝난 세션 반영 (switches/blocked는 observe_switch로 따로 받지 않은 경우만)"""
+        now = self._clock() if now is None else now
+        index = min(max(minutes, 0) // BIN_MINUTES, BINS - 1)
+        for key in self._keys(start, category):
+            bucket = self._touch(key, now)
+            bucket.sessions += 1
+            bucket.completed += bool(completed)
+            bucket.minutes += max(minutes, 0)
+            bucket.switches += switches
+            bucket.blocked += blocked
+            bucket.hist[index] += 1
+        self._dirty = True
+
+    def observe_switch(self, start: datetime, category: str = None, blocked: bool = False,
+                       now: float = None):
+        """세션 중 전환 시도 반영 (세션 시작 시간대 버킷에 누적)"""
+        now = self._clock() if now is None else now
+        for key in self._keys(start, category):
+            bucket = self._touch(key, now)
+            bucket.switches += 1
+            bucket.blocked += bool(blocked)
+        self._dirty = True
+
+    def attach(self, session_manager):
+        """SessionManager 시그널 연결"""
+        session_manager.session_ended.connect(self._on_session_ended)
+        session_manager.switch_recorded.connect(self._on_switch_recorded)
+
+    def _on_session_ended(self, session, completed: bool):
+        if session.actual_duration is None:
+            return
+        self.observe_session(session.start_time, session.actual_duration, completed,
+                             session.category_id)
+        self.save()
+
+    def _on_switch_recorded(self, session, blocked: bool):
+        self.observe_switch(session.start_time, session.category_id, blocked)
+
+    # === 조회 ===
+    def rates(self, key: str) -> Optional[dict]:
+        """버킷 하나의 요약 (데이터 없으면 None)"""
+        bucket = self._buckets.get(key)
+        if not bucket or bucket.sessions <= 0:
+            return None
+        return {
+            'sessions': bucket.weight(self._clock(), self.half_life),
+            'completion_rate': bucket.completed / bucket.sessions,
+            'distraction_rate': bucket.switches / max(bucket.minutes / 60, 1 / 60),
+            'average_minutes': bucket.minutes / bucket.sessions,
+        }
+
+    def profile(self, dimension: str) -> Dict[str, dict]:
+        """'hour' | 'weekday' | 'category'별 요약"""
+        prefix = dimension + ':'
+        return {key[len(prefix):]: self.rates(key) for key in self._buckets
+                if key.startswith(prefix) and self.rates(key)}
+
+    def suggest_duration(self, when: datetime = None, default: int = 45) -> Suggestion:
+        """
+        when 시각에 시작할 세션의 집중 시간 추천
+
+        그 시간대의 히스토그램을 데이터량에 따라 전체 히스토그램 쪽으로 당긴 뒤(PRIOR_SESSIONS),
+        과거 세션의 TARGET_SURVIVAL 비율이 채운 가장 긴 시간(5분 단위)을 고른다.
+        요일/카테고리는 시간대와 섞이면 습관이 흐려지므로 요약(profile)에만 쓴다.
+        """
+        when = when or datetime.now()
+        now = self._clock()
+        total = self._buckets.get('all')
+        if not total or total.weight(now, self.half_life) < 3:
+            return Suggestion(default, None, None, 0.0)
+
+        hour_key = f'hour:{when.hour}'
+        combined = [self.PRIOR_SESSIONS * count / total.sessions for count in total.hist]
+        bucket = self._buckets.get(hour_key)
+        confidence = 0.0
+        if bucket and bucket.sessions > 0:
+            weight = bucket.weight(now, self.half_life)
+            confidence = weight / (weight + self.PRIOR_SESSIONS)
+            for i, count in enumerate(bucket.hist):
+                combined[i] += weight * count / bucket.sessions
+
+        # 누적 비율이 (1 - TARGET_SURVIVAL)를 넘기 전까지의 가장 긴 구간 경계
+        limit = (1 - self.TARGET_SURVIVAL) * sum(combined)
+        minutes, below = 0, 0.0
+        for i, count in enumerate(combined):
+            if below > limit:
+                break
+            minutes = i * BIN_MINUTES
+            below += count
+        minutes = min(max(minutes, self.MIN_SUGGESTION), self.MAX_SUGGESTION)
+
+        rates = self.rates(hour_key) or self.rates('all')
+        return Suggestion(minutes, rates['completion_rate'], rates['distraction_rate'],
+                          round(confidence, 2))
+
+    # === 저장 ===
+    def snapshot(self) -> dict:
+        return {
+            'version': SNAPSHOT_VERSION,
+            'half_life': self.half_life,
+            'buckets': {key: bucket.to_list() for key, bucket in self._buckets.items()},
+        }
+
+    def restore(self, snapshot: dict) -> bool:
+        """스냅샷 복원 (버전이 다르거나 깨졌으면 False)"""
+        if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+            return False
+        try:
+            self._buckets = {key: _Bucket.from_list(values)
+                             for key, values in snapshot['buckets'].items()}
+        except (KeyError, TypeError, ValueError, IndexError):
+            self._buckets = {}
+            return False
+        self._dirty = False
+        return True
+
+    def load(self) -> bool:
+        try:
+            return self.restore(json.loads(self.path.read_text(encoding='utf-8')))
+        except (FileNotFoundError, ValueError):
+            return False
+
+    def save(self):
+        """변경이 있으면 스냅샷 저장 (임시 파일에 쓴 뒤 rename)"""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self.snapshot(), separators=(',', ':')), encoding='utf-8')
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+    def bootstrap(self, db: Database, days: int = 180):
+        """DB 이력으로 채우기 (스냅샷이 없을 때 한 번)"""
+        since = datetime.now() - timedelta(days=days)
+        for row in db.get_ended_sessions(since):
+            start = datetime.fromisoformat(row['start_time'])
+            end = datetime.fromisoformat(row['end_time'])
+            self.observe_session(start, row['actual_duration'] or 0, bool(row['completed']),
+                                 row['category_id'], row['switch_attempts'] or 0,
+                                 row['switches_blocked'] or 0, now=end.timestamp())
+        self.save()
@@ -0,0 +1,253 @@
+"""자리 비움/화면 잠금 감지 - 유휴 상태에서는 세션 시간과 창 폴링을 멈춤
+
+유휴 시간은 X 스크린세이버 확장(MIT-SCREEN-SAVER)에서 읽고, 화면 잠금은 logind의
+Lock/Unlock과 스크린세이버 ActiveChanged D-Bus 시그널로 받는다.
+"""
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+from PySide6.QtCore import QObject, QTimer, Signal, Slot, SLOT
+
+try:
+    from Xlib import display as xdisplay
+    from Xlib.error import DisplayError, XError
+except ImportError:  # python-xlib 미설치
+    xdisplay = None
+
+
+class XScreenSaverIdleSource:
+    """마지막 키보드/마우스 입력 이후 경과 시간 (X 서버 한 번 왕복)"""
+
+    def __init__(self):
+        self._display = None
+        self._root = None
+
+    def open(self) -> bool:
+        """디스플레이 연결 (X 서버나 확장이 없으면 False)"""
+        if xdisplay is None:
+            return False
+        try:
+            self._display = xdisplay.Display()
+        except (DisplayError, OSError, XError):
+            return False
+        if not self._display.has_extension('MIT-SCREEN-SAVER'):
+            self.close()
+            return False
+        self._root = self._display.screen().root
+        return True
+
+    def close(self):
+        if self._display is not None:
+            self._display.close()
+        self._display = None
+        self._root = None
+
+    def idle_ms(self) -> Optional[int]:
+        """유휴 시간 (밀리초, 읽을 수 없으면 None)"""
+        if self._root is None:
+            return None
+        try:
+            return int(self._root.screensaver_query_info().idle)
+        except (XError, OSError):
+            return None
+
+
+class ScriptedIdleSource:
+    """X 서버 대신 쓰는 유휴 시간 소스 (테스트/벤치마크용)"""
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._last_input = clock()
+
+    def open(self) -> bool:
+        return True
+
+    def close(self):
+        pass
+
+    def touch(self):
+        """입력이 있었던 것으로 처리"""
+        self._last_input = self._clock()
+
+    def set_idle(self, seconds: float):
+        """마지막 입력이 seconds초 전이었던 것으로 처리"""
+        self._last_input = self._clock() - seconds
+
+    def idle_ms(self) -> Optional[int]:
+        return int((self._clock() - self._last_input) * 1000)
+
+
+class LockWatcher(QObject):
+    """logind 세션 Lock/Unlock, 스크린세이버 ActiveChanged → locked_changed"""
+
+    locked_changed = Signal(bool)
+
+    # 세션 버스 스크린세이버 (freedesktop 표준, GNOME)
+    SCREENSAVERS = (
+        ('org.freedesktop.ScreenSaver', '/org/freedesktop/ScreenSaver', 'org.freedesktop.ScreenSaver'),
+        ('org.gnome.ScreenSaver', '/org/gnome/ScreenSaver', 'org.gnome.ScreenSaver'),
+    )
+
+    def __init__(self):
+        super().__init__()
+        self._connected = []
+
+    def start(self) -> bool:
+        """시그널 구독 (하나라도 연결되면 True)"""
+        try:
+            from PySide6.QtDBus import QDBusConnection
+        except ImportError:
+            return False
+
+        system = QDBusConnection.systemBus()
+        if system.isConnected():
+            path = self._logind_session_path(system)
+            if path:
+                for name, slot in (('Lock', '_on_lock()'), ('Unlock', '_on_unlock()')):
+                    if system.connect('org.freedesktop.login1', path,
+                                      'org.freedesktop.login1.Session', name,
+                                      self, SLOT(slot)):
+                        self._connected.append(('system', path, name))
+
+        session = QDBusConnection.sessionBus()
+        if session.isConnected():
+            for service, path, interface in self.SCREENSAVERS:
+                if session.connect(service, path, interface, 'ActiveChanged',
+                                   self, SLOT('_on_active_changed(bool)')):
+                    self._connected.append(('session', path, 'ActiveChanged'))
+        return bool(self._connected)
+
+    @staticmethod
+    def _logind_session_path(bus) -> Optional[str]:
+        """현재 프로세스가 속한 logind 세션 객체 경로"""
+        from PySide6.QtDBus import QDBusInterface
+        manager = QDBusInterface('org.freedesktop.login1', '/org/freedesktop/login1',
+                                 'org.freedesktop.login1.Manager', bus)
+        if not manager.isValid():
+            return None
+        calls = [('GetSessionByPID', os.getpid())]
+        if os.environ.get('XDG_SESSION_ID'):
+            calls.append(('GetSession', os.environ['XDG_SESSION_ID']))
+        for method, arg in calls:
+            reply = manager.call(method, arg)
+            arguments = reply.arguments()
+            if arguments:
+                value = arguments[0]
+                return value.path() if hasattr(value, 'path') else str(value)
+        return None
+
+    @Slot()
+    def _on_lock(self):
+        self.locked_changed.emit(True)
+
+    @Slot()
+    def _on_unlock(self):
+        self.locked_changed.emit(False)
+
+    @Slot(bool)
+    def _on_active_changed(self, active: bool):
+        self.locked_changed.emit(active)
+
+
+class IdleDetector(QObject):
+    """유휴 시간이 임계값을 넘거나 화면이 잠기면 idle_started, 돌아오면 idle_ended"""
+
+    idle_started = Signal(object)  # 자리를 비운 시각 (datetime)
+    idle_ended = Signal()
+
+    # 유휴 상태에서 복귀를 확인하는 간격 (밀리초)
+    IDLE_CHECK_INTERVAL = 1000
+    # 활성 상태 확인 간격 상한 (임계값 변경 반영용)
+    MAX_CHECK_INTERVAL = 60_000
+
+    def __init__(self, source=None, threshold: int = 300, lock_watcher: LockWatcher = None):
+        """
+        Args:
+            source: 유휴 시간 소스 (기본: XScreenSaverIdleSource)
+            threshold: 자리 비움으로 볼 유휴 시간 (초)
+            lock_watcher: 화면 잠금 시그널 (None이면 잠금은 set_locked로만 전달)
+        """
+        super().__init__()
+        self.source = source or XScreenSaverIdleSource()
+        self.threshold = threshold
+        self.lock_watcher = lock_watcher
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.check)
+        self._running = False
+        self._has_source = False
+        self._inactive = False
+        self._locked = False
+        self.idle_since: Optional[datetime] = None
+        if lock_watcher:
+            lock_watcher.locked_changed.connect(self.set_locked)
+
+    @property
+    def is_idle(self) -> bool:
+        return self.idle_since is not None
+
+    def start(self) -> bool:
+        """감지 시작 (유휴 시간도 잠금 시그널도 없으면 False)"""
+        if self._running:
+            return True
+        self._has_source = self.source.open()
+        watching_lock = self.lock_watcher.start() if self.lock_watcher else False
+        if not (self._has_source or watching_lock):
+            return False
+        self._running = True
+        if self._has_source:
+            self.check()
+        return True
+
+    def stop(self):
+        self._running = False
+        self._timer.stop()
+        if self._has_source:
+            self.source.close()
+            self._has_source = False
+
+    def set_threshold(self, seconds: int):
+        """임계값 변경 (다음 확인부터 적용)"""
+        self.threshold = seconds
+        if self._running and self._has_source:
+            self.check()
+
+    @Slot(bool)
+    def set_locked(self, locked: bool):
+        """화면 잠금 상태 변경"""
+        self._locked = locked
+        self._update(datetime.now())
+        if self._running and self._has_source and not locked:
+            self.check()
+
+    def check(self):
+        """지금 유휴 시간 확인 후 다음 확인 시점 예약"""
+        if not self._running:
+            return
+        idle_ms = self.source.idle_ms()
+        if idle_ms is None:
+            # 일시적인 읽기 실패 (X 오류 등) - 확인을 멈추면 복귀를 영영 놓치므로 다시 예약
+            self._timer.start(self.IDLE_CHECK_INTERVAL)
+            return
+        threshold_ms = self.threshold * 1000
+        self._inactive = idle_ms >= threshold_ms
+        self._update(datetime.now() - timedelta(milliseconds=idle_ms))
+
+        if self._inactive or self._locked:
+            # 복귀는 빨리 알아채야 하므로 짧게
+            interval = self.IDLE_CHECK_INTERVAL
+        else:
+            # 지금부터 입력이 없어도 임계값에 닿기 전까지는 확인할 필요 없음
+            interval = min(threshold_ms - idle_ms, self.MAX_CHECK_INTERVAL)
+        self._timer.start(max(interval, self.IDLE_CHECK_INTERVAL))
+
+    def _update(self, since: datetime):
+        """상태가 바뀌었을 때만 시그널 발생"""
+        idle = self._inactive or self._locked
+        if idle and self.idle_since is None:
+            self.idle_since = since
+            self.idle_started.emit(since)
+        elif not idle and self.idle_since is not None:
+            self.idle_since = None
+            self.idle_ended.emit()
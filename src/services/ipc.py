@@ -0,0 +1,259 @@
+"""로컬 IPC - UNIX 소켓 위의 줄 단위 JSON-RPC 2.0
+
+요청:   {"jsonrpc": "2.0", "id": 1, "method": "session.start", "params": {"duration": 45}}
+응답:   {"jsonrpc": "2.0", "id": 1, "result": ...} 또는 {"jsonrpc": "2.0", "id": 1, "error": {...}}
+이벤트: {"jsonrpc": "2.0", "method": "event", "params": {"type": "session.started", ...}}
+        ("subscribe" 를 호출한 연결에만 전달)
+
+서버와 Qt 클라이언트는 QtNetwork(QLocalServer/QLocalSocket)만 쓰므로 QtWidgets 없이 동작하고,
+IpcClient는 표준 라이브러리 소켓만 사용해 스크립트/도구에서 쓸 수 있다.
+"""
+import os
+import json
+import inspect
+import socket
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+
+# JSON-RPC 오류 코드
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+def default_socket_path() -> str:
+    """기본 제어 소켓 경로 ($XDG_RUNTIME_DIR 우선)"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return str(Path(runtime_dir) / f"focus-guardian-{os.getuid()}.sock")
+
+
+class IpcError(Exception):
+    """RPC 오류 (서버 핸들러에서 발생시키면 그대로 클라이언트에 전달)"""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _encode(message: dict) -> bytes:
+    return json.dumps(message, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b"\n"
+
+
+class IpcServer(QObject):
+    """JSON-RPC 서버"""
+
+    def __init__(self, socket_path: str = None):
+        super().__init__()
+        self.socket_path = socket_path or default_socket_path()
+        self._methods: Dict[str, Callable[..., Any]] = {}
+        self._signatures: Dict[str, inspect.Signature] = {}
+        self._buffers: Dict[QLocalSocket, bytes] = {}
+        self._subscribers: set = set()
+        self._server = QLocalServer()
+        self._server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self._server.newConnection.connect(self._on_new_connection)
+        self.register("subscribe", self._subscribe_placeholder)
+
+    def register(self, name: str, handler: Callable[..., Any]):
+        """메서드 등록 (params는 키워드 인자로 전달)"""
+        self._methods[name] = handler
+        self._signatures[name] = inspect.signature(handler)
+
+    def start(self) -> bool:
+        """소켓 열기 (다른 인스턴스가 사용 중이면 실패)"""
+        probe = QLocalSocket()
+        probe.connectToServer(self.socket_path)
+        if probe.waitForConnected(100):
+            probe.disconnectFromServer()
+            print(f"제어 소켓이 이미 사용 중입니다: {self.socket_path}")
+            return False
+        # 이전 실행에서 남은 소켓 파일 제거
+        QLocalServer.removeServer(self.socket_path)
+        if not self._server.listen(self.socket_path):
+            print(f"제어 소켓 열기 실패: {self._server.errorString()}")
+            return False
+        return True
+
+    def stop(self):
+        self._server.close()
+        for conn in list(self._buffers):
+            conn.disconnectFromServer()
+
+    def broadcast(self, event_type: str, **payload):
+        """구독 중인 연결에 이벤트 전송"""
+        if not self._subscribers:
+            return
+        data = _encode({"jsonrpc": "2.0", "method": "event",
+                        "params": {"type": event_type, **payload}})
+        for conn in list(self._subscribers):
+            conn.write(data)
+
+    @staticmethod
+    def _subscribe_placeholder():
+        # 실제 처리는 연결 정보가 필요하므로 _dispatch에서 수행
+        return True
+
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            conn = self._server.nextPendingConnection()
+            self._buffers[conn] = b""
+            conn.readyRead.connect(lambda c=conn: self._on_ready_read(c))
+            conn.disconnected.connect(lambda c=conn: self._on_disconnected(c))
+
+    def _on_disconnected(self, conn: QLocalSocket):
+        self._buffers.pop(conn, None)
+        self._subscribers.discard(conn)
+        conn.deleteLater()
+
+    def _on_ready_read(self, conn: QLocalSocket):
+        buffer = self._buffers.get(conn, b"") + bytes(conn.readAll())
+        *lines, rest = buffer.split(b"\n")
+        self._buffers[conn] = rest
+        for line in lines:
+            if line.strip():
+                response = self._dispatch(conn, line)
+                if response is not None:
+                    conn.write(_encode(response))
+
+    def _dispatch(self, conn: QLocalSocket, line: bytes) -> Optional[dict]:
+        """요청 한 줄 처리 (알림 요청이면 None)"""
+        try:
+            request = json.loads(line)
+        except (ValueError, UnicodeDecodeError):
+            return self._error(None, PARSE_ERROR, "잘못된 JSON")
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return self._error(None, INVALID_REQUEST, "잘못된 요청")
+
+        request_id = request.get("id")
+        method = request["method"]
+        params = request.get("params") or {}
+        handler = self._methods.get(method)
+        if handler is None:
+            return self._error(request_id, METHOD_NOT_FOUND, f"알 수 없는 메서드: {method}")
+        if not isinstance(params, dict):
+            return self._error(request_id, INVALID_PARAMS, "params는 객체여야 합니다")
+        # 인자 검사는 호출 전에 - 핸들러 안의 TypeError는 INTERNAL_ERROR로
+        try:
+            self._signatures[method].bind(**params)
+        except TypeError as e:
+            return self._error(request_id, INVALID_PARAMS, str(e))
+
+        try:
+            if method == "subscribe":
+                self._subscribers.add(conn)
+            result = handler(**params)
+        except IpcError as e:
+            return self._error(request_id, e.code, e.message)
+        except Exception as e:
+            return self._error(request_id, INTERNAL_ERROR, str(e))
+
+        if request_id is None:
+            return None
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    @staticmethod
+    def _error(request_id, code: int, message: str) -> dict:
+        return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+class QtIpcClient(QObject):
+    """이벤트 루프용 비동기 클라이언트 (GUI에서 사용)"""
+
+    connected = Signal()
+    disconnected = Signal()
+    event_received = Signal(dict)
+
+    def __init__(self, socket_path: str = None):
+        super().__init__()
+        self.socket_path = socket_path or default_socket_path()
+        self._next_id = 1
+        self._callbacks: Dict[int, Callable[[Any, Optional[dict]], None]] = {}
+        self._buffer = b""
+        self._socket = QLocalSocket()
+        self._socket.connected.connect(self.connected)
+        self._socket.disconnected.connect(self.disconnected)
+        self._socket.readyRead.connect(self._on_ready_read)
+
+    def connect_to_server(self, timeout: int = 1000) -> bool:
+        """서버 연결 (성공 여부)"""
+        self._socket.connectToServer(self.socket_path)
+        return self._socket.waitForConnected(timeout)
+
+    def call(self, method: str, callback: Callable[[Any, Optional[dict]], None] = None,
+             **params):
+        """비동기 호출 - callback(result, error)"""
+        request = {"jsonrpc": "2.0", "method": method, "params": params}
+        if callback:
+            request["id"] = self._next_id
+            self._callbacks[self._next_id] = callback
+            self._next_id += 1
+        self._socket.write(_encode(request))
+
+    def _on_ready_read(self):
+        *lines, self._buffer = (self._buffer + bytes(self._socket.readAll())).split(b"\n")
+        for line in lines:
+            if not line.strip():
+                continue
+            message = json.loads(line)
+            if message.get("method") == "event":
+                self.event_received.emit(message.get("params", {}))
+                continue
+            callback = self._callbacks.pop(message.get("id"), None)
+            if callback:
+                callback(message.get("result"), message.get("error"))
+
+
+class IpcClient:
+    """블로킹 클라이언트 (표준 라이브러리만 사용)"""
+
+    def __init__(self, socket_path: str = None, timeout: float = 5.0):
+        self.socket_path = socket_path or default_socket_path()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        self._sock.connect(self.socket_path)
+        self._file = self._sock.makefile('rb')
+        self._next_id = 1
+
+    def call(self, method: str, **params) -> Any:
+        """동기 호출 (오류 응답이면 IpcError)"""
+        request_id = self._next_id
+        self._next_id += 1
+        self._sock.sendall(_encode({"jsonrpc": "2.0", "id": request_id,
+                                    "method": method, "params": params}))
+        for message in self._messages():
+            if message.get("id") != request_id:
+                continue
+            if "error" in message:
+                raise IpcError(message["error"]["code"], message["error"]["message"])
+            return message.get("result")
+        raise ConnectionError("서버 연결이 끊어졌습니다")
+
+    def events(self) -> Iterator[dict]:
+        """이벤트 구독 후 수신 (블로킹 반복자)"""
+        self.call("subscribe")
+        self._sock.settimeout(None)
+        for message in self._messages():
+            if message.get("method") == "event":
+                yield message.get("params", {})
+
+    def _messages(self) -> Iterator[dict]:
+        for line in self._file:
+            if line.strip():
+                yield json.loads(line)
+
+    def close(self):
+        self._file.close()
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -0,0 +1,107 @@
+"""메트릭 노출 서비스 - 파일 덤프, 로컬 UNIX 소켓, 이벤트 루프 지연 감지"""
+import os
+import json
+import time
+from pathlib import Path
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+from utils.metrics import MetricsRegistry, metrics as default_registry
+
+
+def default_socket_path() -> str:
+    """기본 메트릭 소켓 경로 ($XDG_RUNTIME_DIR 우선)"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return str(Path(runtime_dir) / f"focus-guardian-{os.getuid()}-metrics.sock")
+
+
+class StallDetector(QObject):
+    """이벤트 루프 지연 감지 (하트비트 타이머가 늦게 깨어난 만큼 기록)"""
+
+    def __init__(self, interval: int = 100, threshold: int = 50,
+                 registry: MetricsRegistry = None):
+        """
+        Args:
+            interval: 하트비트 간격 (밀리초)
+            threshold: 지연으로 간주할 최소 초과 시간 (밀리초)
+        """
+        super().__init__()
+        self.registry = registry or default_registry
+        self.interval = interval
+        self.threshold = threshold / 1000
+        self._last = 0.0
+        self._timer = QTimer()
+        self._timer.timeout.connect(self._on_heartbeat)
+
+    def start(self):
+        self._last = time.perf_counter()
+        self._timer.start(self.interval)
+
+    def stop(self):
+        self._timer.stop()
+
+    def _on_heartbeat(self):
+        now = time.perf_counter()
+        lag = now - self._last - self.interval / 1000
+        self._last = now
+        if lag >= self.threshold:
+            self.registry.inc("gui.stalls")
+            self.registry.observe("gui.stall_seconds", lag)
+
+
+class MetricsServer(QObject):
+    """로컬 UNIX 소켓으로 메트릭 제공 (연결하면 JSON 한 번 쓰고 닫음)"""
+
+    def __init__(self, socket_path: str = None, registry: MetricsRegistry = None):
+        super().__init__()
+        self.registry = registry or default_registry
+        self.socket_path = socket_path or default_socket_path()
+        self._server = QLocalServer()
+        self._server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self._server.newConnection.connect(self._on_new_connection)
+
+    def start(self) -> bool:
+        """소켓 열기"""
+        # 이전 실행에서 남은 소켓 파일 제거
+        QLocalServer.removeServer(self.socket_path)
+        if not self._server.listen(self.socket_path):
+            print(f"메트릭 소켓 열기 실패: {self._server.errorString()}")
+            return False
+        return True
+
+    def stop(self):
+        self._server.close()
+
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            conn: QLocalSocket = self._server.nextPendingConnection()
+            payload = json.dumps(self.registry.snapshot()).encode('utf-8') + b"\n"
+            conn.write(payload)
+            conn.disconnectFromServer()
+            conn.disconnected.connect(conn.deleteLater)
+
+
+class MetricsFileWriter(QObject):
+    """메트릭을 주기적으로 파일에 덤프"""
+
+    def __init__(self, path: str, interval: int = 60000, registry: MetricsRegistry = None):
+        super().__init__()
+        self.registry = registry or default_registry
+        self.path = path
+        self._timer = QTimer()
+        self._timer.timeout.connect(self.dump)
+        self._interval = interval
+
+    def start(self):
+        self.dump()
+        self._timer.start(self._interval)
+
+    def stop(self):
+        self._timer.stop()
+        self.dump()
+
+    def dump(self):
+        try:
+            self.registry.dump(self.path)
+        except OSError as e:
+            print(f"메트릭 저장 실패: {e}")
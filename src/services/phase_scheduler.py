@@ -0,0 +1,211 @@
+"""뽀모도로 단계 스케줄러 - 집중/짧은 휴식/긴 휴식 반복
+
+모든 단계 경계는 시작 시 잡은 단조 시계 기준점(anchor)으로부터의 오프셋으로 계산한다.
+타이머는 다음 전환 시점에 한 번만 울리도록 잡으므로 틱마다 깨어나지 않고, 늦게 울려도
+다음 경계가 밀리지 않는다. 일시정지한 시간만큼 기준점을 뒤로 옮긴다.
+"""
+import math
+import time
+from datetime import datetime
+from typing import Callable, List, Mapping, NamedTuple, Optional
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from models.records import PhaseRecord
+
+
+PHASE_FOCUS = 'focus'
+PHASE_SHORT_BREAK = 'short_break'
+PHASE_LONG_BREAK = 'long_break'
+
+
+class Phase(NamedTuple):
+    """기준점으로부터의 단계 위치"""
+    kind: str
+    cycle: int      # 몇 번째 사이클인지 (0부터)
+    position: int   # 사이클 안에서의 순서 (0부터)
+    start: float    # 기준점으로부터 시작 오프셋 (초)
+    end: float      # 기준점으로부터 끝 오프셋 (초)
+
+    @property
+    def is_break(self) -> bool:
+        return self.kind != PHASE_FOCUS
+
+
+class PhasePlan(NamedTuple):
+    """한 사이클 = (집중 + 짧은 휴식) × (long_break_every - 1) + 집중 + 긴 휴식"""
+    focus: int             # 초
+    short_break: int       # 초
+    long_break: int        # 초
+    long_break_every: int  # 긴 휴식 전 집중 횟수
+
+    @classmethod
+    def from_settings(cls, focus_minutes: int, settings: Mapping) -> "PhasePlan":
+        """집중 시간(분)과 focus 설정 블록으로 생성"""
+        return cls(
+            focus=focus_minutes * 60,
+            short_break=settings.get('break_interval', 15) * 60,
+            long_break=settings.get('long_break', 30) * 60,
+            long_break_every=settings.get('long_break_every', 4)
+        )
+
+    def cycle_phases(self) -> List[tuple]:
+        """한 사이클의 (종류, 길이) 목록"""
+        phases = []
+        for i in range(self.long_break_every):
+            phases.append((PHASE_FOCUS, self.focus))
+            if i < self.long_break_every - 1:
+                phases.append((PHASE_SHORT_BREAK, self.short_break))
+        phases.append((PHASE_LONG_BREAK, self.long_break))
+        return phases
+
+    @property
+    def cycle_length(self) -> int:
+        return sum(length for _kind, length in self.cycle_phases())
+
+    def phase_at(self, offset: float) -> Phase:
+        """기준점으로부터 offset초 시점의 단계"""
+        cycle, rest = divmod(max(offset, 0.0), self.cycle_length)
+        cycle = int(cycle)
+        start = cycle * self.cycle_length
+        for position, (kind, length) in enumerate(self.cycle_phases()):
+            if rest < length:
+                return Phase(kind, cycle, position, start, start + length)
+            rest -= length
+            start += length
+        # 부동소수점 경계 - 다음 사이클의 첫 단계
+        return Phase(PHASE_FOCUS, cycle + 1, 0, start, start + self.focus)
+
+
+class PhaseScheduler(QObject):
+    """PhasePlan에 따라 단계 전환 시그널 발생, 단계 기록은 사이클마다 한 번에 저장"""
+
+    phase_started = Signal(object)  # Phase
+    cycle_completed = Signal(int)   # 끝난 사이클 번호
+
+    def __init__(self, record_phases: Callable[[List[PhaseRecord]], None] = None,
+                 clock=time.monotonic):
+        """
+        Args:
+            record_phases: 단계 기록 저장 함수 (Database.record_phases)
+            clock: 단조 시계 (초)
+        """
+        super().__init__()
+        self.record_phases = record_phases
+        self._clock = clock
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+
+        self.plan: Optional[PhasePlan] = None
+        self.session_id: Optional[str] = None
+        self.current: Optional[Phase] = None
+        self.focus_completed = 0
+        self._anchor = 0.0
+        self._paused_at: Optional[float] = None
+        self._phase_started_at: Optional[datetime] = None
+        self._pending: List[PhaseRecord] = []
+
+    @property
+    def running(self) -> bool:
+        return self.plan is not None
+
+    @property
+    def paused(self) -> bool:
+        return self._paused_at is not None
+
+    def offset(self) -> float:
+        """기준점으로부터 흐른 시간 (일시정지 중에는 멈춤)"""
+        now = self._paused_at if self._paused_at is not None else self._clock()
+        return now - self._anchor
+
+    def remaining(self) -> float:
+        """현재 단계 남은 시간 (초)"""
+        if not self.current:
+            return 0.0
+        return max(self.current.end - self.offset(), 0.0)
+
+    def start(self, plan: PhasePlan, session_id: str = None):
+        """첫 집중 단계부터 시작"""
+        self.stop()
+        self.plan = plan
+        self.session_id = session_id
+        self.focus_completed = 0
+        self._anchor = self._clock()
+        self._paused_at = None
+        self._advance(completed=True)
+
+    def stop(self):
+        """중지 - 진행 중이던 단계까지 기록하고 저장"""
+        if not self.running:
+            return
+        self._timer.stop()
+        self._close_current(completed=False)
+        self._flush()
+        self.plan = None
+        self.current = None
+        self._paused_at = None
+
+    def pause(self):
+        if self.running and self._paused_at is None:
+            self._paused_at = self._clock()
+            self._timer.stop()
+
+    def resume(self):
+        if self.running and self._paused_at is not None:
+            self._anchor += self._clock() - self._paused_at
+            self._paused_at = None
+            self._arm()
+
+    def skip(self):
+        """현재 단계를 지금 끝냄 (기준점을 당겨서 이후 경계도 함께 이동)"""
+        if not self.running:
+            return
+        self.resume()
+        self._anchor -= self.current.end - self.offset()
+        self._advance(completed=False)
+
+    def _on_timeout(self):
+        self._advance(completed=True)
+
+    def _advance(self, completed: bool):
+        """현재 오프셋의 단계로 전환하고 다음 경계에 타이머 예약"""
+        phase = self.plan.phase_at(self.offset())
+        if self.current is None or phase[:3] != self.current[:3]:
+            self._close_current(completed)
+            if self.current and self.current.cycle != phase.cycle:
+                self._flush()
+                self.cycle_completed.emit(self.current.cycle)
+            self.current = phase
+            self._phase_started_at = datetime.now()
+            self.phase_started.emit(phase)
+        self._arm()
+
+    def _arm(self):
+        """현재 단계가 끝나는 시점에 한 번 울리는 타이머"""
+        if self.current and self._paused_at is None:
+            delay = self.current.end - self.offset()
+            self._timer.start(max(0, math.ceil(delay * 1000)))
+
+    def _close_current(self, completed: bool):
+        """끝난 단계를 저장 대기 목록에 추가"""
+        phase = self.current
+        if phase is None:
+            return
+        if phase.kind == PHASE_FOCUS and completed:
+            self.focus_completed += 1
+        self._pending.append(PhaseRecord(
+            session_id=self.session_id,
+            phase=phase.kind,
+            cycle=phase.cycle,
+            position=phase.position,
+            start_time=self._phase_started_at,
+            end_time=datetime.now(),
+            planned_seconds=int(phase.end - phase.start),
+            completed=completed
+        ))
+
+    def _flush(self):
+        """모아 둔 단계 기록을 한 번에 저장"""
+        if self._pending and self.record_phases:
+            self.record_phases(self._pending)
+        self._pending = []
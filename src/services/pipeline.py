@@ -0,0 +1,295 @@
+"""asyncio 모니터링 파이프라인 - probe → debounce → classify → policy → action/record
+
+각 단계는 비동기 제너레이터이고, 단계 사이는 크기 제한이 있는 asyncio.Queue로
+연결되어 뒤 단계가 밀리면 앞 단계가 기다린다 (배압). 블로킹 작업(X 프로브,
+SQLite 기록)은 실행기 스레드에서 돌린다.
+
+이 모듈은 Qt를 가져오지 않으므로 이벤트 루프만으로 테스트/확장할 수 있다.
+GUI에 붙일 때는 services.pipeline_bridge.PipelineBridge를 사용한다.
+"""
+import time
+import asyncio
+from concurrent.futures import Executor
+from typing import (TYPE_CHECKING, AsyncIterator, Awaitable, Callable, List, NamedTuple,
+                    Optional, Tuple)
+
+from utils.metrics import metrics
+
+if TYPE_CHECKING:
+    from models.records import WindowInfo, Category
+    from services.enforcement import Enforcement, StrictEnforcer
+    from services.window_monitor import AppClassifier
+
+
+class Transition(NamedTuple):
+    """분류된 창 전환"""
+    old: "WindowInfo"
+    new: "WindowInfo"
+    old_category: "Category"
+    new_category: "Category"
+
+
+class Decision(NamedTuple):
+    """정책 결정"""
+    transition: Transition
+    distraction: bool  # 리마인더를 띄워야 하는지
+    return_window: Optional["WindowInfo"]  # 복귀할 작업 창
+    enforced: Optional["Enforcement"] = None  # 엄격 모드로 이미 처리함 (리마인더 없음)
+
+
+class FocusPolicy:
+    """창 전환 정책 (Qt 없음, SessionManager와 파이프라인이 공유)"""
+
+    def __init__(self, enforcer: "StrictEnforcer" = None):
+        # 마지막 작업 창 (복귀용)
+        self.last_work_window: Optional["WindowInfo"] = None
+        # 엄격 모드 (방해 창을 결정한 스레드에서 바로 최소화/닫기)
+        self.enforcer = enforcer
+
+    @staticmethod
+    def is_own_window(window: "WindowInfo") -> bool:
+        """Focus Guardian 자신의 창인지"""
+        return ('focus' in window.app_name.lower() or
+                'python' in window.process_name.lower() or
+                'Focus Guardian' in window.title)
+
+    def decide(self, transition: Transition) -> Optional[Decision]:
+        """세션 진행 중인 전환에 대한 결정 (무시할 전환이면 None)"""
+        if self.is_own_window(transition.new):
+            return None
+
+        # 작업 창이면 마지막 작업 창으로 저장
+        if transition.old_category.type == 'work':
+            self.last_work_window = transition.old
+
+        # 오직 엔터테인먼트 앱으로 전환할 때만 알림
+        # (작업 앱 간 전환, neutral 앱 전환은 허용)
+        distraction = transition.new_category.type == 'entertainment'
+        return_window = self.last_work_window or transition.old
+        enforced = None
+        if distraction and self.enforcer is not None:
+            enforced = self.enforcer.enforce(transition.new, return_window)
+        return Decision(
+            transition=transition,
+            distraction=distraction,
+            return_window=return_window,
+            enforced=enforced
+        )
+
+
+# 큐 종료 표시
+_DONE = object()
+
+
+async def _offload(executor: Optional[Executor], func: Callable, *args):
+    """블로킹 함수를 실행기에서 실행"""
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+
+async def probe(
+    read_window: Callable[[], Optional["WindowInfo"]],
+    interval: float,
+    executor: Optional[Executor] = None
+) -> AsyncIterator[Optional["WindowInfo"]]:
+    """interval초마다 활성 창 조회 (조회는 실행기에서)"""
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        with metrics.timer("pipeline.probe_seconds"):
+            window = await _offload(executor, read_window)
+        yield window
+        # 조회가 오래 걸리면 그만큼 다음 조회를 앞당김 (고정 주기)
+        await asyncio.sleep(max(0.0, interval - (loop.time() - started)))
+
+
+async def debounce(
+    windows: AsyncIterator[Optional["WindowInfo"]],
+    settle: float = 0.0,
+    clock: Callable[[], float] = time.monotonic,
+    on_current: Callable[["WindowInfo"], None] = None
+) -> AsyncIterator[Tuple["WindowInfo", "WindowInfo"]]:
+    """
+    창 변경 감지 - (이전 창, 새 창) 방출
+
+    settle > 0이면 새 창이 settle초 이상 유지된 것이 확인될 때만 방출해서
+    alt-tab으로 스쳐 지나간 창은 무시한다.
+    """
+    current: Optional["WindowInfo"] = None
+    candidate: Optional["WindowInfo"] = None
+    candidate_since = 0.0
+
+    def same(a, b) -> bool:
+        return (a.window_id == b.window_id and a.title == b.title and a.url == b.url
+                and a.process_name == b.process_name)
+
+    async for window in windows:
+        if window is None:
+            continue
+        if current is None:
+            current = window
+            if on_current:
+                on_current(current)
+            continue
+        if same(window, current):
+            candidate = None
+            continue
+
+        now = clock()
+        if candidate is None or not same(window, candidate):
+            candidate, candidate_since = window, now
+        if now - candidate_since < settle:
+            continue
+
+        old, current, candidate = current, candidate, None
+        if on_current:
+            on_current(current)
+        yield old, current
+
+
+async def classify(
+    changes: AsyncIterator[Tuple["WindowInfo", "WindowInfo"]],
+    classifier: "AppClassifier"
+) -> AsyncIterator[Transition]:
+    """전환의 양쪽 창 분류 (캐시 적중이 대부분이라 루프 안에서 바로 실행)"""
+    async for old, new in changes:
+        yield Transition(old, new, classifier.classify(old), classifier.classify(new))
+
+
+async def apply_policy(
+    transitions: AsyncIterator[Transition],
+    policy: FocusPolicy,
+    session_active: Callable[[], bool]
+) -> AsyncIterator[Decision]:
+    """세션 진행 중인 전환에만 정책 적용"""
+    async for transition in transitions:
+        if not session_active():
+            continue
+        decision = policy.decide(transition)
+        if decision is not None:
+            yield decision
+
+
+class AsyncPipeline:
+    """단계들을 크기 제한 큐로 연결해서 실행"""
+
+    def __init__(
+        self,
+        read_window: Callable[[], Optional["WindowInfo"]],
+        classifier: "AppClassifier",
+        session_active: Callable[[], bool],
+        on_decision: Callable[[Decision], Optional[Awaitable]],
+        record: Callable[[Decision], None] = None,
+        on_current: Callable[["WindowInfo"], None] = None,
+        policy: FocusPolicy = None,
+        interval: float = 0.5,
+        settle: float = 0.0,
+        queue_size: int = 64,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Args:
+            read_window: 활성 창 조회 (블로킹, 실행기에서 호출)
+            classifier: 창 분류기
+            session_active: 세션 진행 여부 (정책 단계에서 전환마다 호출)
+            on_decision: 결정 처리 (코루틴 함수도 가능)
+            record: 결정 기록 (블로킹, 실행기에서 호출 - 예: 별도 SQLite 연결)
+            on_current: 현재 창이 바뀔 때마다 호출
+            interval: 프로브 간격 (초)
+            settle: 디바운스 유지 시간 (초)
+            queue_size: 단계 사이 큐 크기
+            executor: 블로킹 작업용 실행기 (None이면 루프 기본 실행기)
+        """
+        self.read_window = read_window
+        self.classifier = classifier
+        self.session_active = session_active
+        self.on_decision = on_decision
+        self.record = record
+        self.on_current = on_current
+        self.policy = policy or FocusPolicy()
+        self.interval = interval
+        self.settle = settle
+        self.queue_size = queue_size
+        self.executor = executor
+        self.current_window: Optional["WindowInfo"] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def _set_current(self, window: "WindowInfo"):
+        self.current_window = window
+        if self.on_current:
+            self.on_current(window)
+
+    def _queue(self) -> asyncio.Queue:
+        return asyncio.Queue(maxsize=self.queue_size)
+
+    @staticmethod
+    async def _pump(source: AsyncIterator, *queues: asyncio.Queue):
+        """제너레이터 출력을 큐로 (큐가 차면 대기)"""
+        async for item in source:
+            for queue in queues:
+                await queue.put(item)
+        # 입력이 끝나면 다음 단계에 종료 전달 (취소 시에는 전체가 함께 취소됨)
+        for queue in queues:
+            await queue.put(_DONE)
+
+    @staticmethod
+    async def _drain(queue: asyncio.Queue) -> AsyncIterator:
+        """큐를 제너레이터로"""
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            yield item
+
+    async def _act(self, queue: asyncio.Queue):
+        async for decision in self._drain(queue):
+            result = self.on_decision(decision)
+            if asyncio.iscoroutine(result):
+                await result
+
+    async def _record(self, queue: asyncio.Queue):
+        async for decision in self._drain(queue):
+            with metrics.timer("pipeline.record_seconds"):
+                await _offload(self.executor, self.record, decision)
+
+    def stages(self, windows: AsyncIterator[Optional["WindowInfo"]] = None):
+        """단계 코루틴 목록 (windows를 주면 프로브 대신 사용)"""
+        if windows is None:
+            windows = probe(self.read_window, self.interval, self.executor)
+        changes_q, transitions_q, action_q = self._queue(), self._queue(), self._queue()
+        record_q = self._queue() if self.record else None
+
+        changes = debounce(windows, self.settle, on_current=self._set_current)
+        transitions = classify(self._drain(changes_q), self.classifier)
+        decisions = apply_policy(self._drain(transitions_q), self.policy, self.session_active)
+
+        coroutines = [
+            self._pump(changes, changes_q),
+            self._pump(transitions, transitions_q),
+            self._pump(decisions, *[q for q in (action_q, record_q) if q is not None]),
+            self._act(action_q),
+        ]
+        if record_q is not None:
+            coroutines.append(self._record(record_q))
+        return coroutines
+
+    async def run(self, windows: AsyncIterator[Optional["WindowInfo"]] = None):
+        """
+        파이프라인 실행 (stop() 또는 입력 소진까지)
+
+        한 단계에서 예외가 나면 나머지 단계를 취소하고 예외를 전파한다.
+        """
+        self._tasks = [asyncio.create_task(c) for c in self.stages(windows)]
+        try:
+            await asyncio.gather(*self._tasks)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks = []
+
+    def stop(self):
+        """실행 중인 단계 취소 (루프 스레드에서 호출)"""
+        for task in self._tasks:
+            task.cancel()
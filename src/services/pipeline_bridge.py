@@ -0,0 +1,119 @@
+"""asyncio 파이프라인 ↔ Qt 연결"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+from PySide6.QtCore import Signal
+
+from services.window_monitor import WindowMonitor, WindowInfo, AppClassifier
+from services.pipeline import AsyncPipeline, Decision, FocusPolicy
+
+
+class PipelineBridge(WindowMonitor):
+    """
+    작업 스레드의 asyncio 루프에서 AsyncPipeline을 실행하는 WindowMonitor
+
+    QTimer 폴링 대신 파이프라인이 창을 조회/분류/판정하고, 결과는 시그널로
+    GUI 스레드에 전달된다 (다른 스레드에서 emit하므로 큐 연결로 전달됨).
+    SessionManager.attach_pipeline()과 함께 사용한다.
+    """
+
+    decision_made = Signal(object)  # Decision
+
+    def __init__(
+        self,
+        app_classifier: AppClassifier,
+        poll_interval: int = 500,
+        settle: float = 0.0,
+        queue_size: int = 64,
+        source=None,
+        backend: str = None
+    ):
+        """
+        Args:
+            app_classifier: 창 분류기 (파이프라인 스레드에서 호출)
+            poll_interval: 폴링 간격 (밀리초)
+            settle: 디바운스 유지 시간 (초)
+            queue_size: 단계 사이 큐 크기
+            source: 활성 창 소스 (이벤트 백엔드면 프로브 대신 fd 알림으로 조회)
+            backend: source가 없을 때 고를 백엔드 이름 (None이면 자동 선택)
+        """
+        super().__init__(poll_interval=poll_interval, source=source, backend=backend)
+        self.app_classifier = app_classifier
+        self.settle = settle
+        self.queue_size = queue_size
+        # SessionManager.attach_pipeline()에서 설정
+        self.session_active: Callable[[], bool] = lambda: False
+        self.policy: Optional[FocusPolicy] = None
+
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pipeline: Optional[AsyncPipeline] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def start(self):
+        """파이프라인 스레드 시작"""
+        if self._running:
+            return
+        self._ensure_source()
+        self._running = True
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="fg-pipeline-io")
+        self._pipeline = AsyncPipeline(
+            read_window=self._get_active_window,
+            classifier=self.app_classifier,
+            # 속성을 나중에 바꿔도 반영되도록 람다로 감쌈
+            session_active=lambda: self.session_active(),
+            on_decision=self._on_decision,
+            on_current=self._on_current,
+            policy=self.policy,
+            interval=self.poll_interval / 1000,
+            settle=self.settle,
+            queue_size=self.queue_size,
+            executor=self._executor
+        )
+        self._thread = threading.Thread(target=self._run, name="fg-pipeline", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """파이프라인 중지 (최대 2초 대기)"""
+        self._running = False
+        if self._loop and self._pipeline:
+            self._loop.call_soon_threadsafe(self._pipeline.stop)
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _run(self):
+        asyncio.run(self._main())
+
+    async def _main(self):
+        self._loop = asyncio.get_running_loop()
+        if not self._running:
+            # 시작 직후 stop()이 먼저 호출된 경우
+            return
+        try:
+            # 탭 URL을 붙이도록 소스 대신 _get_active_window로 조회
+            await self._pipeline.run(self.source.windows(
+                self.poll_interval / 1000, read=self._get_active_window, executor=self._executor))
+        except Exception as e:
+            print(f"모니터링 파이프라인 오류: {e}")
+        finally:
+            self._loop = None
+
+    def _on_tab_activated(self, url: str):
+        # GUI 스레드에서 직접 조회하지 않음 (다음 프로브에서 URL이 반영됨)
+        pass
+
+    def _on_current(self, window: WindowInfo):
+        """현재 창 갱신 (파이프라인 스레드)"""
+        old_window = self._current_window
+        self._current_window = window
+        if old_window is not None:
+            self.window_changed.emit(old_window, window)
+
+    def _on_decision(self, decision: Decision):
+        """결정 전달 (파이프라인 스레드)"""
+        self.decision_made.emit(decision)
@@ -0,0 +1,130 @@
+"""원격 세션 프록시 - 실행 중인 데몬을 IPC로 조작 (GUI --attach 모드)
+
+SessionManager/TodayStats와 같은 시그널과 메서드를 제공하므로
+MainWindow는 로컬 엔진과 원격 엔진을 구분하지 않는다. 데몬의 리마인더(focus.reminder)는
+로컬 토스트로 띄우고 사용자의 선택을 session.choice로 돌려보낸다.
+"""
+from datetime import datetime
+from typing import Optional
+from PySide6.QtCore import QObject, Signal
+
+from services.ipc import QtIpcClient
+from services.notification import NotificationService
+from services.session_manager import FocusSession
+
+
+class RemoteSessionManager(QObject):
+    """데몬의 SessionManager 프록시"""
+
+    session_started = Signal(FocusSession)
+    session_ended = Signal(FocusSession, bool)
+    session_updated = Signal(FocusSession)
+
+    def __init__(self, client: QtIpcClient, notification_service: NotificationService = None):
+        super().__init__()
+        self.client = client
+        self.notification_service = notification_service
+        self._current_session: Optional[FocusSession] = None
+        client.event_received.connect(self._on_event)
+        client.call("subscribe")
+        client.call("session.status", self._on_session_result)
+
+    @property
+    def current_session(self) -> Optional[FocusSession]:
+        return self._current_session
+
+    @property
+    def is_active(self) -> bool:
+        return self._current_session is not None and not self._current_session.paused
+
+    def start_session(self, duration: int = None, app_name: str = None):
+        """세션 시작 요청 (결과는 session.started 이벤트로 도착)"""
+        self.client.call("session.start", duration=duration)
+
+    def end_session(self, completed: bool = None):
+        self.client.call("session.stop", completed=bool(completed))
+
+    def pause_session(self):
+        # 응답 전에도 버튼 상태가 맞도록 로컬에 먼저 반영
+        if self._current_session and not self._current_session.paused:
+            self._current_session.paused = True
+            self._current_session.pause_start = datetime.now()
+        self.client.call("session.pause", self._on_session_result)
+
+    def resume_session(self):
+        if self._current_session and self._current_session.paused:
+            self._current_session.paused = False
+            self._current_session.pause_start = None
+        self.client.call("session.resume", self._on_session_result)
+
+    def extend_session(self, minutes: int = 5):
+        self.client.call("session.extend", minutes=minutes)
+
+    def _on_session_result(self, result: Optional[dict], error: Optional[dict]):
+        if error:
+            print(f"세션 요청 실패: {error.get('message')}")
+            return
+        was_active = self._current_session is not None
+        self._current_session = FocusSession.from_dict(result) if result else None
+        if self._current_session:
+            if not was_active:
+                self.session_started.emit(self._current_session)
+            self.session_updated.emit(self._current_session)
+
+    def _on_event(self, event: dict):
+        event_type = event.get("type")
+        if event_type == "session.started":
+            self._current_session = FocusSession.from_dict(event["session"])
+            self.session_started.emit(self._current_session)
+        elif event_type == "session.updated":
+            self._current_session = FocusSession.from_dict(event["session"])
+            self.session_updated.emit(self._current_session)
+        elif event_type == "session.ended":
+            self._current_session = None
+            self.session_ended.emit(FocusSession.from_dict(event["session"]),
+                                    bool(event.get("completed")))
+        elif event_type == "focus.reminder" and self.notification_service:
+            self.notification_service.show_focus_reminder(
+                event.get("remaining_minutes", 0), on_choice=self._answer_reminder)
+        elif event_type == "focus.reminder_closed" and self.notification_service:
+            # 다른 클라이언트가 응답했거나 데몬이 리마인더를 거둠
+            self.notification_service.close_current()
+
+    def _answer_reminder(self, choice: str):
+        self.client.call("session.choice", choice=choice)
+
+
+class RemoteTodayStats(QObject):
+    """데몬의 TodayStats 프록시"""
+
+    stats_changed = Signal(dict)
+
+    def __init__(self, client: QtIpcClient):
+        super().__init__()
+        self.client = client
+        self._stats = {
+            'total_focus_time': 0,
+            'sessions_completed': 0,
+            'sessions_abandoned': 0,
+            'total_switch_attempts': 0,
+            'switches_blocked': 0
+        }
+        client.event_received.connect(self._on_event)
+        client.call("stats.today", self._on_stats)
+
+    @property
+    def stats(self) -> dict:
+        return dict(self._stats)
+
+    def refresh(self):
+        self.client.call("stats.refresh", self._on_stats)
+
+    def _on_stats(self, result: Optional[dict], error: Optional[dict]):
+        if result:
+            self._stats = result
+            self.stats_changed.emit(self.stats)
+
+    def _on_event(self, event: dict):
+        if event.get("type") == "stats.changed":
+            self._stats = event["stats"]
+            self.stats_changed.emit(self.stats)
@@ -0,0 +1,189 @@
+"""트레이스 기록/재생 - X 서버 없이 전체 파이프라인 측정"""
+import time
+from collections import deque
+from typing import Callable, Iterable, List, Optional
+from PySide6.QtCore import QObject, QTimer, QEventLoop, Signal
+
+from services.backends.scripted import ScriptedWindowSource
+from services.window_monitor import WindowMonitor, WindowInfo
+from utils.traces import TraceEvent, TraceWriter
+
+
+def event_to_window(event: TraceEvent) -> WindowInfo:
+    """트레이스 이벤트를 WindowInfo로"""
+    return WindowInfo(
+        window_id=event.window_id,
+        title=event.title,
+        app_name=event.app_name,
+        process_name=event.process_name
+    )
+
+
+class ScriptedWindowMonitor(WindowMonitor):
+    """외부에서 창을 밀어 넣는 가짜 모니터 (스크립트 백엔드, xdotool/X 서버 미사용)"""
+
+    def __init__(self, poll_interval: int = 500):
+        super().__init__(poll_interval=poll_interval, source=ScriptedWindowSource())
+        # 최근 기록만 유지 (장시간 재생 시 메모리 측정 왜곡 방지)
+        self.activated: deque = deque(maxlen=1000)
+        self.closed: deque = deque(maxlen=1000)
+
+    def start(self):
+        """타이머 없이 실행 상태로만 전환"""
+        self._running = True
+
+    def push(self, window: WindowInfo):
+        """다음 활성 창을 지정하고 폴링 한 번 수행"""
+        self.source.push(window)
+        self._check_active_window()
+
+    def activate_window(self, window_id: str) -> bool:
+        self.activated.append(window_id)
+        return True
+
+    def close_tab(self, window_id: str) -> bool:
+        self.closed.append(window_id)
+        return True
+
+
+class NotificationSink:
+    """토스트 대신 리마인더를 기록하는 알림 싱크"""
+
+    def __init__(self, choice: Optional[Callable[[int], Optional[str]]] = None):
+        """
+        Args:
+            choice: 리마인더마다 호출되어 사용자 선택을 돌려주는 함수
+                    (인자: 리마인더 순번, None이면 응답하지 않음)
+        """
+        self.choice = choice
+        self.reminder_count = 0
+        self.reminders: deque = deque(maxlen=1000)  # 최근 리마인더의 time.perf_counter() 시각
+
+    def show_focus_reminder(self, remaining_minutes: int,
+                            on_choice: Callable[[str], None] = None):
+        self.reminders.append(time.perf_counter())
+        self.reminder_count += 1
+        if on_choice and self.choice:
+            choice = self.choice(self.reminder_count - 1)
+            if choice:
+                on_choice(choice)
+
+    def close_current(self):
+        pass
+
+
+class TraceRecorder(QObject):
+    """실제 WindowMonitor의 창 전환을 트레이스 파일로 기록"""
+
+    def __init__(self, window_monitor: WindowMonitor, path: str):
+        super().__init__()
+        self.window_monitor = window_monitor
+        self.path = path
+        self._writer: Optional[TraceWriter] = None
+        self._origin = 0.0
+
+    def start(self):
+        self._writer = TraceWriter(self.path, meta={"source": "recorded"})
+        self._origin = time.monotonic()
+        current = self.window_monitor.get_current_window()
+        if current:
+            self._write(current)
+        self.window_monitor.window_changed.connect(self._on_window_changed)
+
+    def stop(self):
+        if not self._writer:
+            return
+        self.window_monitor.window_changed.disconnect(self._on_window_changed)
+        self._writer.close()
+        self._writer = None
+
+    def _write(self, window: WindowInfo):
+        self._writer.write(TraceEvent(
+            time.monotonic() - self._origin,
+            window.window_id, window.title, window.app_name, window.process_name
+        ))
+
+    def _on_window_changed(self, old_window: WindowInfo, new_window: WindowInfo):
+        self._write(new_window)
+
+
+class ReplayStats:
+    """재생 결과"""
+
+    def __init__(self):
+        self.events = 0
+        self.latencies: List[float] = []  # push → 처리 완료 (초)
+        self.lateness: List[float] = []  # 실시간 재생 시 예정 시각 대비 지연 (초)
+        self.wall_seconds = 0.0
+        self.trace_seconds = 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.wall_seconds if self.wall_seconds else 0.0
+
+
+def replay_fast(events: Iterable[TraceEvent], monitor: ScriptedWindowMonitor) -> ReplayStats:
+    """가능한 한 빠르게 재생"""
+    stats = ReplayStats()
+    started = time.perf_counter()
+    for event in events:
+        window = event_to_window(event)
+        t0 = time.perf_counter()
+        monitor.push(window)
+        stats.latencies.append(time.perf_counter() - t0)
+        stats.events += 1
+        stats.trace_seconds = event.t
+    stats.wall_seconds = time.perf_counter() - started
+    return stats
+
+
+class TraceReplayer(QObject):
+    """이벤트 루프에서 트레이스 시간에 맞춰 재생 (speed배속)"""
+
+    finished = Signal()
+
+    def __init__(self, events: Iterable[TraceEvent], monitor: ScriptedWindowMonitor,
+                 speed: float = 1.0):
+        super().__init__()
+        self.monitor = monitor
+        self.speed = speed
+        self.stats = ReplayStats()
+        self._events = iter(events)
+        self._pending: Optional[TraceEvent] = None
+        self._started = 0.0
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._schedule_next()
+
+    def run(self) -> ReplayStats:
+        """재생이 끝날 때까지 이벤트 루프 실행"""
+        loop = QEventLoop()
+        self.finished.connect(loop.quit)
+        self.start()
+        if self._pending is not None:
+            loop.exec()
+        return self.stats
+
+    def _schedule_next(self):
+        self._pending = next(self._events, None)
+        if self._pending is None:
+            self.stats.wall_seconds = time.perf_counter() - self._started
+            self.finished.emit()
+            return
+        due = self._started + self._pending.t / self.speed
+        self._timer.start(max(0, int((due - time.perf_counter()) * 1000)))
+
+    def _on_timeout(self):
+        event = self._pending
+        due = self._started + event.t / self.speed
+        t0 = time.perf_counter()
+        self.stats.lateness.append(max(0.0, t0 - due))
+        self.monitor.push(event_to_window(event))
+        self.stats.latencies.append(time.perf_counter() - t0)
+        self.stats.events += 1
+        self.stats.trace_seconds = event.t
+        self._schedule_next()
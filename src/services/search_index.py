@@ -0,0 +1,93 @@
+"""세션/창 이력 검색 색인 - 창 전환 스트림에서 FTS5 색인을 증분으로 채움
+
+세션 중에 처음 본 창(앱 + 제목)만 메모리에 모아 두었다가 주기적으로, 또는 세션이 끝날 때
+한 트랜잭션으로 저장한다. 전환 기록(record_switch_attempt) 경로에는 아무 비용도 더하지 않는다.
+제목은 SessionManager의 TitleProcessor 설정을 따른다 (hash 모드는 단어별 해시로 색인).
+"""
+from datetime import datetime
+from typing import List, Optional, Set, Tuple
+from PySide6.QtCore import QObject, QTimer
+
+from models.database import Database
+from models.records import WindowInfo
+from services.session_manager import SessionManager, FocusSession
+
+
+class SearchIndexer(QObject):
+    """창 전환/세션 시그널 → history_fts 배치 저장, 검색 API"""
+
+    # 저장 간격 (밀리초)
+    FLUSH_INTERVAL = 30_000
+    # 이만큼 쌓이면 간격을 기다리지 않고 저장
+    MAX_PENDING = 200
+
+    def __init__(self, db: Database, session_manager: SessionManager):
+        super().__init__()
+        self.db = db
+        self.session_manager = session_manager
+        self._pending: List[tuple] = []
+        # 현재 세션에서 이미 색인한 (앱, 제목)
+        self._seen: Set[Tuple[str, Optional[str]]] = set()
+
+        self._flush_timer = QTimer()
+        self._flush_timer.timeout.connect(self.flush)
+
+        session_manager.window_monitor.window_changed.connect(self._on_window_changed)
+        session_manager.session_started.connect(self._on_session_started)
+        session_manager.session_ended.connect(self._on_session_ended)
+
+    def start(self):
+        self._flush_timer.start(self.FLUSH_INTERVAL)
+        session = self.session_manager.current_session
+        if session:
+            # 복구된 세션
+            self._on_session_started(session)
+
+    def stop(self):
+        self._flush_timer.stop()
+        self.flush()
+
+    def _on_session_started(self, session: FocusSession):
+        self._seen.clear()
+        # 세션 메타데이터 (앱/카테고리)
+        self._pending.append((session.id, session.start_time.isoformat(timespec='seconds'),
+                              session.app_name, None, session.category_id))
+        window = self.session_manager.window_monitor.get_current_window()
+        if window:
+            self._add(session.id, window)
+
+    def _on_session_ended(self, _session: FocusSession, _completed: bool):
+        self.flush()
+        self._seen.clear()
+
+    def _on_window_changed(self, _old_window: WindowInfo, new_window: WindowInfo):
+        session = self.session_manager.current_session
+        if session and new_window:
+            self._add(session.id, new_window)
+
+    def _add(self, session_id: str, window: WindowInfo):
+        """세션에서 처음 본 창이면 색인 대기 목록에 추가"""
+        title = self.session_manager.title_processor.index_terms(window.title)
+        key = (window.app_name, title)
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        category = self.session_manager.app_classifier.classify(window).id
+        self._pending.append((session_id, datetime.now().isoformat(timespec='seconds'),
+                              window.app_name, title, category))
+        if len(self._pending) >= self.MAX_PENDING:
+            self.flush()
+
+    def flush(self):
+        """대기 중인 색인을 한 트랜잭션으로 저장"""
+        if self._pending:
+            pending, self._pending = self._pending, []
+            self.db.index_history(pending)
+
+    def search(self, query: str, limit: int = 20) -> List[dict]:
+        """이력 검색 (저장 전인 색인도 포함되도록 먼저 저장)"""
+        self.flush()
+        processor = self.session_manager.title_processor
+        return self.db.search_history(
+            query, limit, title_term=processor.term if processor.mode == 'hash' else None
+        )
@@ -7,7 +7,13 @@ from PySide6.QtCore import QObject, QTimer, Signal
 
 from services.window_monitor import WindowMonitor, WindowInfo, AppClassifier
 from services.notification import NotificationService
+from services.pipeline import FocusPolicy, Transition, Decision
+from services.enforcement import StrictEnforcer
+from services.phase_scheduler import PhaseScheduler, PhasePlan, Phase
 from models.database import Database
+from models.journal import SessionJournal
+from models.records import SwitchEvent
+from utils.title_privacy import TitleProcessor
 
 
 class FocusSession:
@@ -28,6 +34,7 @@ class FocusSession:
         self.paused = False
         self.pause_start: Optional[datetime] = None
         self.total_paused_time = timedelta()
+        self.actual_duration: Optional[int] = None  # 종료 시 DB에 기록된 실제 시간 (분)
 
     @property
     def elapsed_seconds(self) -> int:
@@ -37,6 +44,14 @@ class FocusSession:
             elapsed -= (datetime.now() - self.pause_start)
         return int(elapsed.total_seconds())
 
+    @property
+    def paused_seconds(self) -> float:
+        """일시정지된 시간 합계 (초, 진행 중인 일시정지 포함)"""
+        paused = self.total_paused_time
+        if self.paused and self.pause_start:
+            paused += datetime.now() - self.pause_start
+        return paused.total_seconds()
+
     @property
     def elapsed_minutes(self) -> int:
         """경과 시간 (분)"""
@@ -64,43 +79,117 @@ class FocusSession:
         """목표 시간 달성 여부"""
         return self.elapsed_minutes >= self.target_duration
 
+    def to_dict(self) -> dict:
+        """직렬화 (IPC 전송용)"""
+        return {
+            "id": self.id,
+            "target_duration": self.target_duration,
+            "app_name": self.app_name,
+            "category_id": self.category_id,
+            "start_time": self.start_time.isoformat(),
+            "paused": self.paused,
+            "pause_start": self.pause_start.isoformat() if self.pause_start else None,
+            "total_paused_seconds": self.total_paused_time.total_seconds(),
+            "actual_duration": self.actual_duration,
+            "elapsed_seconds": self.elapsed_seconds,
+            "remaining_seconds": self.remaining_seconds,
+            "progress": self.progress,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FocusSession":
+        """역직렬화 (to_dict의 역)"""
+        session = cls(
+            session_id=data["id"],
+            target_duration=data["target_duration"],
+            app_name=data.get("app_name"),
+            category_id=data.get("category_id")
+        )
+        session.start_time = datetime.fromisoformat(data["start_time"])
+        session.paused = data.get("paused", False)
+        if data.get("pause_start"):
+            session.pause_start = datetime.fromisoformat(data["pause_start"])
+        session.total_paused_time = timedelta(seconds=data.get("total_paused_seconds", 0))
+        session.actual_duration = data.get("actual_duration")
+        return session
+
 
 class SessionManager(QObject):
     """집중 세션 관리자"""
 
+    # 저널 하트비트 간격 (밀리초) - 비정상 종료 시 기록되는 시간의 오차 한도
+    HEARTBEAT_INTERVAL = 15_000
+    # 이 시간(초) 안에 다시 켜지면 세션을 이어감, 넘으면 마지막 하트비트 시각으로 종료
+    RESUME_WINDOW = 300
+
     # 시그널
     session_started = Signal(FocusSession)
     session_ended = Signal(FocusSession, bool)  # (세션, 완료여부)
     session_updated = Signal(FocusSession)  # 매 분마다
     focus_interrupted = Signal(WindowInfo, WindowInfo)  # 집중 중 창 전환 시도
+    switch_recorded = Signal(FocusSession, bool)  # (세션, 차단여부)
+    phase_changed = Signal(object)  # 뽀모도로 단계 전환 (services.phase_scheduler.Phase)
 
     def __init__(
         self,
         db: Database,
         window_monitor: WindowMonitor,
         app_classifier: AppClassifier,
-        notification_service: NotificationService
+        notification_service: NotificationService,
+        title_processor: TitleProcessor = None,
+        journal: SessionJournal = None
     ):
         super().__init__()
         self.db = db
         self.window_monitor = window_monitor
         self.app_classifier = app_classifier
         self.notification_service = notification_service
+        # 전환 기록에 남길 제목 처리 (기본: 저장 안 함)
+        self.title_processor = title_processor or TitleProcessor(mode='off')
 
         self._current_session: Optional[FocusSession] = None
         self._update_timer = QTimer()
         self._update_timer.timeout.connect(self._on_timer_tick)
 
-        # 마지막 작업 창 저장 (복귀용)
-        self._last_work_window: Optional[WindowInfo] = None
+        # 비정상 종료 대비 세션 저널 (하트비트로 마지막 생존 시각 기록)
+        self.journal = journal
+        self._heartbeat_timer = QTimer()
+        self._heartbeat_timer.timeout.connect(self._on_heartbeat)
+
+        # 자리 비움 감지로 자동 일시정지된 상태인지
+        self.idle_detector = None
+        self._idle_paused = False
+
+        # 엄격 모드 (창 조작은 활성 창 소스가 제공, 처음 필요할 때 정책을 실행하는 스레드에서 염)
+        self.enforcer = StrictEnforcer(self.window_monitor.open_actions)
+
+        # 창 전환 정책 (마지막 작업 창 추적 포함)
+        self.policy = FocusPolicy(enforcer=self.enforcer)
 
         # 창 전환 이벤트 연결
         self.window_monitor.window_changed.connect(self._on_window_changed)
 
-        # 설정 로드
+        # 뽀모도로 모드: 휴식 단계 동안 세션을 멈추고 집중 단계마다 목표 시간을 늘림
+        self.phase_scheduler = PhaseScheduler(record_phases=self.db.record_phases)
+        self.phase_scheduler.phase_started.connect(self._on_phase_started)
+
+        # 설정 로드 (설정 파일의 focus 블록은 apply_focus_settings로 덮어씀)
         settings = self.db.get_settings()
+        self.focus_settings = {}
         self.default_duration = settings.get('default_duration', 45)
-        self.strict_mode = settings.get('strict_mode', False)
+        self.strict_mode = bool(settings.get('strict_mode', False))
+        self.pomodoro_mode = bool(settings.get('pomodoro_mode', False))
+        self.break_interval = settings.get('break_interval', 15)
+        self.enforcer.configure(self.strict_mode)
+
+    def apply_focus_settings(self, focus):
+        """설정 파일 focus 블록 적용 (진행 중인 세션에는 다음 세션부터 반영)"""
+        self.focus_settings = dict(focus)
+        self.default_duration = focus.get('default_duration', self.default_duration)
+        self.strict_mode = focus.get('strict_mode', self.strict_mode)
+        self.pomodoro_mode = focus.get('pomodoro_mode', self.pomodoro_mode)
+        self.break_interval = focus.get('break_interval', self.break_interval)
+        self.enforcer.configure(self.strict_mode, focus.get('strict_policy'))
 
     @property
     def current_session(self) -> Optional[FocusSession]:
@@ -122,7 +211,7 @@ class SessionManager(QObject):
         if current_window and not app_name:
             app_name = current_window.app_name
             category = self.app_classifier.classify(current_window)
-            category_id = category['id']
+            category_id = category.id
         else:
             category_id = None
 
@@ -143,8 +232,12 @@ class SessionManager(QObject):
 
         # 타이머 시작 (1분마다 업데이트)
         self._update_timer.start(60000)
+        self._begin_journal()
 
         self.session_started.emit(self._current_session)
+        if self.pomodoro_mode:
+            settings = dict(self.focus_settings, break_interval=self.break_interval)
+            self.phase_scheduler.start(PhasePlan.from_settings(duration, settings), session_id)
         return self._current_session
 
     def end_session(self, completed: bool = None):
@@ -153,28 +246,57 @@ class SessionManager(QObject):
             return
 
         self._update_timer.stop()
+        self._heartbeat_timer.stop()
+        self._idle_paused = False
 
-        # 완료 여부 자동 판단
+        # 완료 여부 자동 판단 (뽀모도로는 집중 단계를 하나라도 채웠으면 완료)
         if completed is None:
-            completed = self._current_session.is_completed
+            if self.phase_scheduler.running:
+                completed = self.phase_scheduler.focus_completed > 0
+            else:
+                completed = self._current_session.is_completed
+        self.phase_scheduler.stop()
 
         # DB 업데이트
-        self.db.end_session(self._current_session.id, completed=completed)
+        self._current_session.actual_duration = self.db.end_session(
+            self._current_session.id, completed=completed,
+            paused_seconds=self._current_session.paused_seconds
+        )
 
         session = self._current_session
         self._current_session = None
+        if self.journal:
+            self.journal.end()
 
         self.session_ended.emit(session, completed)
 
-    def pause_session(self):
-        """세션 일시정지"""
+    def pause_session(self, since: datetime = None):
+        """세션 일시정지 (since: 일시정지로 칠 시작 시각, 기본은 지금)"""
+        if self._current_session and not self._current_session.paused:
+            # 휴식 단계는 이미 멈춰 있으므로 여기는 집중 단계 - 단계 시계도 멈춤
+            self.phase_scheduler.pause()
+            self._pause(since)
+
+    def _pause(self, since: datetime = None):
         if self._current_session and not self._current_session.paused:
             self._current_session.paused = True
-            self._current_session.pause_start = datetime.now()
+            self._current_session.pause_start = max(
+                since or datetime.now(), self._current_session.start_time)
             self._update_timer.stop()
+            self._journal_state()
 
     def resume_session(self):
-        """세션 재개"""
+        """세션 재개 (뽀모도로 휴식 중이면 휴식을 건너뜀)"""
+        if not (self._current_session and self._current_session.paused):
+            return
+        scheduler = self.phase_scheduler
+        if scheduler.running and scheduler.current.is_break and not scheduler.paused:
+            scheduler.skip()
+            return
+        scheduler.resume()
+        self._resume()
+
+    def _resume(self):
         if self._current_session and self._current_session.paused:
             if self._current_session.pause_start:
                 pause_duration = datetime.now() - self._current_session.pause_start
@@ -182,11 +304,111 @@ class SessionManager(QObject):
             self._current_session.paused = False
             self._current_session.pause_start = None
             self._update_timer.start(60000)
+            self._journal_state()
+
+    def _on_phase_started(self, phase: Phase):
+        """휴식 단계는 일시정지, 다음 집중 단계는 재개 + 목표 시간 연장"""
+        session = self._current_session
+        if not session:
+            return
+        if phase.is_break:
+            self._pause()
+        else:
+            if phase.cycle or phase.position:
+                session.target_duration += self.phase_scheduler.plan.focus // 60
+            self._resume()
+        self.phase_changed.emit(phase)
+        self.session_updated.emit(session)
+
+    def _begin_journal(self):
+        if self.journal:
+            self.journal.begin(self._current_session.to_dict())
+            self._heartbeat_timer.start(self.HEARTBEAT_INTERVAL)
+
+    def _journal_state(self):
+        if self.journal and self._current_session:
+            self.journal.record_state(self._current_session.to_dict())
+
+    def _on_heartbeat(self):
+        if self.journal and self._current_session:
+            self.journal.heartbeat()
+
+    def close(self):
+        """앱 종료 - 진행 중인 세션은 마지막 하트비트를 남기고 다음 실행에서 복구"""
+        self._heartbeat_timer.stop()
+        self.enforcer.reset()
+        if self.journal:
+            self._on_heartbeat()
+            self.journal.close()
+
+    def recover_session(self) -> Optional[FocusSession]:
+        """저널에 남은 세션 복구 - 바로 이어갈 수 있으면 재개, 아니면 마지막 하트비트 시각으로 종료
+
+        세션 테이블은 조회하지 않고 저널의 세션 id로 한 행만 갱신한다.
+
+        Returns:
+            이어서 진행하는 세션 (종료 처리했거나 복구할 세션이 없으면 None)
+        """
+        recovered = self.journal.recover() if self.journal else None
+        if not recovered or self._current_session:
+            return None
+
+        session = FocusSession.from_dict(recovered.session)
+        last_seen = recovered.last_seen
+        # 꺼져 있던 시간은 집중 시간이 아님
+        downtime = max(datetime.now() - last_seen, timedelta())
+
+        if downtime.total_seconds() > self.RESUME_WINDOW or session.is_completed:
+            paused = session.total_paused_time
+            if session.paused and session.pause_start:
+                paused += max(last_seen - session.pause_start, timedelta())
+            focused = (last_seen - session.start_time - paused).total_seconds()
+            completed = focused >= session.target_duration * 60
+            session.actual_duration = self.db.end_session(
+                session.id, completed=completed,
+                paused_seconds=paused.total_seconds(), end_time=last_seen
+            )
+            self.journal.end()
+            self.session_ended.emit(session, completed)
+            return None
+
+        if not session.paused:
+            session.total_paused_time += downtime
+        self._current_session = session
+        if not session.paused:
+            self._update_timer.start(60000)
+        self._begin_journal()
+        self.session_started.emit(session)
+        return session
+
+    def attach_idle_detector(self, detector):
+        """자리 비움 동안 세션 시간과 창 폴링을 멈춤 (services.idle_detector.IdleDetector)"""
+        self.idle_detector = detector
+        detector.idle_started.connect(self._on_idle_started)
+        detector.idle_ended.connect(self._on_idle_ended)
+
+    def _on_idle_started(self, since: datetime):
+        """마지막 입력 시점부터 일시정지로 기록 (사용자가 직접 멈춘 세션은 그대로)"""
+        self.window_monitor.stop()
+        if self.is_active:
+            self.pause_session(since=since)
+            self._idle_paused = True
+            self.session_updated.emit(self._current_session)
+
+    def _on_idle_ended(self):
+        """자동으로 멈춘 경우에만 재개"""
+        self.window_monitor.start()
+        if self._idle_paused:
+            self._idle_paused = False
+            if self._current_session and self._current_session.paused:
+                self.resume_session()
+                self.session_updated.emit(self._current_session)
 
     def extend_session(self, minutes: int = 5):
         """세션 시간 연장"""
         if self._current_session:
             self._current_session.target_duration += minutes
+            self._journal_state()
             self.session_updated.emit(self._current_session)
 
     def _on_timer_tick(self):
@@ -194,8 +416,8 @@ class SessionManager(QObject):
         if not self._current_session:
             return
 
-        # 세션 완료 체크
-        if self._current_session.is_completed:
+        # 세션 완료 체크 (뽀모도로는 사용자가 끝낼 때까지 단계 반복)
+        if self._current_session.is_completed and not self.phase_scheduler.running:
             self.end_session(completed=True)
             return
 
@@ -203,44 +425,67 @@ class SessionManager(QObject):
 
     def _on_window_changed(self, old_window: WindowInfo, new_window: WindowInfo):
         """창 전환 이벤트 처리"""
-        if not self._current_session or self._current_session.paused:
+        if not self.is_active:
             return
 
-        # Focus Guardian 앱 자체는 무시
-        if 'focus' in new_window.app_name.lower() or 'python' in new_window.process_name.lower():
+        transition = Transition(
+            old_window, new_window,
+            self.app_classifier.classify(old_window),
+            self.app_classifier.classify(new_window)
+        )
+        self.handle_decision(self.policy.decide(transition))
+
+    def attach_pipeline(self, bridge):
+        """
+        asyncio 파이프라인 사용 (services.pipeline_bridge.PipelineBridge)
+
+        분류와 정책은 파이프라인 스레드에서 실행되고, 여기서는 결정만 처리한다.
+        """
+        self.window_monitor.window_changed.disconnect(self._on_window_changed)
+        bridge.session_active = lambda: self.is_active
+        bridge.policy = self.policy
+        bridge.decision_made.connect(self.handle_decision)
+
+    def handle_decision(self, decision: Optional[Decision]):
+        """정책 결정 처리"""
+        # 파이프라인에서 온 결정이면 그 사이 세션이 끝났을 수 있음
+        if decision is None or not self.is_active:
             return
-        if 'Focus Guardian' in new_window.title:
+        if decision.enforced:
+            # 엄격 모드로 이미 최소화/닫음 - 차단으로 기록만
+            transition = decision.transition
+            self._record_switch(transition.old, transition.new, blocked=True, user_choice=None)
+            self.focus_interrupted.emit(transition.old, transition.new)
+        elif decision.distraction:
+            transition = decision.transition
+            self._handle_distraction(transition.old, transition.new, decision.return_window)
+
+    def _record_switch(self, old_window: WindowInfo, new_window: WindowInfo,
+                       blocked: bool, user_choice: str):
+        """창 전환 시도 기록"""
+        if not self._current_session:
             return
-
-        old_category = self.app_classifier.classify(old_window)
-        new_category = self.app_classifier.classify(new_window)
-
-        # 작업 창이면 마지막 작업 창으로 저장
-        if old_category['type'] == 'work':
-            self._last_work_window = old_window
-
-        # 오직 엔터테인먼트 앱으로 전환할 때만 알림
-        # (작업 앱 간 전환, neutral 앱 전환은 허용)
-        if new_category['type'] == 'entertainment':
-            self._handle_distraction(old_window, new_window)
-
-    def _handle_distraction(self, old_window: WindowInfo, new_window: WindowInfo):
+        process_title = self.title_processor.process
+        self.db.record_switch(SwitchEvent(
+            session_id=self._current_session.id,
+            from_app=old_window.app_name,
+            to_app=new_window.app_name,
+            blocked=blocked,
+            user_choice=user_choice,
+            from_title=process_title(old_window.title),
+            to_title=process_title(new_window.title)
+        ))
+        self.switch_recorded.emit(self._current_session, blocked)
+
+    def _handle_distraction(self, old_window: WindowInfo, new_window: WindowInfo,
+                            return_window: Optional[WindowInfo]):
         """방해 요소 처리 - 토스트 표시"""
         remaining = self._current_session.remaining_minutes
 
-        # 복귀할 작업 창 결정 (마지막 작업 창 또는 이전 창)
-        return_window = self._last_work_window or old_window
-
         def on_choice(choice: str):
             if choice == 'continue':
                 # 창 전환 차단 기록
-                self.db.record_switch_attempt(
-                    session_id=self._current_session.id,
-                    from_app=old_window.app_name,
-                    to_app=new_window.app_name,
-                    blocked=True,
-                    user_choice='continue'
-                )
+                self._record_switch(old_window, new_window, blocked=True, user_choice='continue')
                 # 엔터테인먼트 탭 닫기
                 self.window_monitor.close_tab(new_window.window_id)
                 # 마지막 작업 창으로 자동 복귀
@@ -248,13 +493,7 @@ class SessionManager(QObject):
                     self.window_monitor.activate_window(return_window.window_id)
             elif choice == 'extend':
                 self.extend_session(5)
-                self.db.record_switch_attempt(
-                    session_id=self._current_session.id,
-                    from_app=old_window.app_name,
-                    to_app=new_window.app_name,
-                    blocked=True,
-                    user_choice='extend'
-                )
+                self._record_switch(old_window, new_window, blocked=True, user_choice='extend')
                 # 엔터테인먼트 탭 닫기
                 self.window_monitor.close_tab(new_window.window_id)
                 # 마지막 작업 창으로 자동 복귀
@@ -262,13 +501,7 @@ class SessionManager(QObject):
                     self.window_monitor.activate_window(return_window.window_id)
             elif choice == 'switch':
                 # 전환 허용
-                self.db.record_switch_attempt(
-                    session_id=self._current_session.id,
-                    from_app=old_window.app_name,
-                    to_app=new_window.app_name,
-                    blocked=False,
-                    user_choice='switch'
-                )
+                self._record_switch(old_window, new_window, blocked=False, user_choice='switch')
                 self.pause_session()
 
         self.notification_service.show_focus_reminder(
@@ -0,0 +1,90 @@
+"""오늘의 통계 인메모리 모델"""
+from datetime import datetime, date, timedelta
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from services.session_manager import SessionManager, FocusSession
+
+
+class TodayStats(QObject):
+    """
+    오늘의 통계를 메모리에 유지하는 모델
+
+    시작 시 한 번 DB에서 시드하고, 이후에는 SessionManager 시그널로
+    증분 갱신한다. DB는 자정 롤오버나 명시적 새로고침 때만 조회한다.
+    """
+
+    # 시그널: 통계가 변경되었을 때 발생
+    stats_changed = Signal(dict)
+
+    def __init__(self, session_manager: SessionManager):
+        super().__init__()
+        self.session_manager = session_manager
+        self._date: date = datetime.now().date()
+        self._stats: dict = {}
+
+        # 자정 롤오버 타이머
+        self._rollover_timer = QTimer()
+        self._rollover_timer.setSingleShot(True)
+        self._rollover_timer.timeout.connect(self._on_rollover)
+
+        self.session_manager.session_ended.connect(self._on_session_ended)
+        self.session_manager.switch_recorded.connect(self._on_switch_recorded)
+
+        self.refresh()
+
+    @property
+    def stats(self) -> dict:
+        """현재 통계 (복사본)"""
+        return dict(self._stats)
+
+    def refresh(self):
+        """DB에서 오늘의 통계를 다시 읽기"""
+        self._date = datetime.now().date()
+        self._stats = self.session_manager.db.get_today_stats()
+        self._schedule_rollover()
+        self.stats_changed.emit(self.stats)
+
+    def _schedule_rollover(self):
+        """다음 자정에 롤오버 예약"""
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        # 자정 직후에 깨어나도록 1초 여유
+        self._rollover_timer.start(int((midnight - now).total_seconds() * 1000) + 1000)
+
+    def _on_rollover(self):
+        """자정 롤오버"""
+        if datetime.now().date() == self._date:
+            # 타이머가 일찍 깨어난 경우 다시 예약
+            self._schedule_rollover()
+            return
+        self.refresh()
+
+    def _counts_today(self, session: FocusSession) -> bool:
+        """세션이 오늘 통계에 포함되는지 (DB와 동일하게 시작 날짜 기준)"""
+        return session.start_time.date() == self._date
+
+    def _on_session_ended(self, session: FocusSession, completed: bool):
+        """세션 종료 시 통계 갱신"""
+        if not self._counts_today(session):
+            return
+
+        actual_duration = session.actual_duration
+        if actual_duration is None:
+            actual_duration = int((datetime.now() - session.start_time).total_seconds() / 60)
+
+        self._stats['total_focus_time'] += actual_duration
+        if completed:
+            self._stats['sessions_completed'] += 1
+        else:
+            self._stats['sessions_abandoned'] += 1
+        self.stats_changed.emit(self.stats)
+
+    def _on_switch_recorded(self, session: FocusSession, blocked: bool):
+        """창 전환 기록 시 통계 갱신"""
+        if not self._counts_today(session):
+            return
+
+        self._stats['total_switch_attempts'] += 1
+        if blocked:
+            self._stats['switches_blocked'] += 1
+        self.stats_changed.emit(self.stats)
@@ -1,18 +1,15 @@
-"""창 모니터링 서비스 - Linux X11 환경"""
+"""창 모니터링 서비스 - 활성 창 조회는 services.backends의 창 소스가 담당"""
 import re
 import subprocess
-from dataclasses import dataclass
-from typing import Optional, Callable, List
-from PySide6.QtCore import QObject, QTimer, Signal
+from dataclasses import replace
+from typing import Optional, Callable, List, NamedTuple, Pattern, Tuple
+from PySide6.QtCore import QObject, QSocketNotifier, QTimer, Signal
 
-
-@dataclass
-class WindowInfo:
-    """활성 창 정보"""
-    window_id: str
-    title: str
-    app_name: str
-    process_name: str
+from models.records import WindowInfo, Category, NEUTRAL_CATEGORY
+from utils.aho_corasick import AhoCorasick, as_literal
+from utils.domain_trie import DomainTrie
+from utils.metrics import metrics
+from utils.symbols import symbols
 
 
 class WindowMonitor(QObject):
@@ -21,30 +18,82 @@ class WindowMonitor(QObject):
     # 시그널: 창이 변경되었을 때 발생
     window_changed = Signal(WindowInfo, WindowInfo)  # (이전 창, 새 창)
 
-    def __init__(self, poll_interval: int = 500):
+    def __init__(self, poll_interval: int = 500, source=None, backend: str = None):
         """
         Args:
-            poll_interval: 폴링 간격 (밀리초)
+            poll_interval: 폴링 간격 (밀리초, 이벤트 백엔드면 안전 폴링 간격까지 늘어남)
+            source: 활성 창 소스 (services.backends.base.WindowSource)
+            backend: source가 없을 때 시작 시 고를 백엔드 이름 (None이면 자동 선택)
         """
         super().__init__()
         self.poll_interval = poll_interval
+        self.source = source
+        self.backend = backend
+        self._notifier: Optional[QSocketNotifier] = None
         self._timer = QTimer()
         self._timer.timeout.connect(self._check_active_window)
         self._current_window: Optional[WindowInfo] = None
         self._running = False
+        # 브라우저 탭 URL 제공자 (services.browser_tabs.BrowserTabs)
+        self.browser_tabs = None
+
+    def attach_browser_tabs(self, browser_tabs):
+        """브라우저 확장이 보고한 탭 URL을 창 정보에 붙임"""
+        self.browser_tabs = browser_tabs
+        browser_tabs.tab_activated.connect(self._on_tab_activated)
+
+    def _on_tab_activated(self, url: str):
+        """탭 전환은 다음 폴링을 기다리지 않고 바로 확인"""
+        if self._running:
+            self._check_active_window()
+
+    def _ensure_source(self):
+        """처음 시작할 때 세션에 맞는 백엔드 선택 (열기에 실패하면 다음 후보)"""
+        if self.source is None:
+            from services.backends import select_source
+            self.source = select_source(self.backend)
 
     def start(self):
-        """모니터링 시작"""
+        """모니터링 시작 (이벤트 백엔드면 fd 알림 + 드문 안전 폴링)"""
         if self._running:
             return
+        self._ensure_source()
         self._running = True
         self._current_window = self._get_active_window()
-        self._timer.start(self.poll_interval)
+        interval = self.poll_interval
+        fd = self.source.fileno()
+        if fd is not None:
+            self._notifier = QSocketNotifier(fd, QSocketNotifier.Type.Read)
+            self._notifier.activated.connect(self._on_source_event)
+            interval = max(interval, int(self.source.fallback_interval * 1000))
+        self._timer.start(interval)
 
     def stop(self):
-        """모니터링 중지"""
+        """모니터링 중지 (소스는 열어 둠 - 자리 비움 후 다시 시작)"""
         self._running = False
         self._timer.stop()
+        if self._notifier is not None:
+            self._notifier.setEnabled(False)
+            self._notifier.deleteLater()
+            self._notifier = None
+
+    def close(self):
+        """중지하고 소스 닫기 (종료 시)"""
+        self.stop()
+        if self.source is not None:
+            self.source.close()
+
+    def _on_source_event(self):
+        """백엔드 fd가 읽을 수 있게 됨 - 이벤트 소비 후 바뀌었을 수 있으면 확인"""
+        changed = self.source.drain()
+        if self.source.fileno() is None and self._notifier is not None:
+            # 이벤트 연결이 끊김 - 원래 폴링 간격으로
+            self._notifier.setEnabled(False)
+            self._notifier.deleteLater()
+            self._notifier = None
+            self._timer.setInterval(self.poll_interval)
+        if changed and self._running:
+            self._check_active_window()
 
     def _check_active_window(self):
         """활성 창 확인 및 변경 감지"""
@@ -57,88 +106,37 @@ class WindowMonitor(QObject):
             self._current_window = new_window
             return
 
-        # 창이 변경되었는지 확인 (window_id 또는 title 기반)
+        # 창이 변경되었는지 확인 (window_id, title, 탭 URL 또는 터미널 전경 프로세스 기반)
         if (new_window.window_id != self._current_window.window_id or
-            new_window.title != self._current_window.title):
+            new_window.title != self._current_window.title or
+            new_window.url != self._current_window.url or
+            new_window.process_name != self._current_window.process_name):
             old_window = self._current_window
             self._current_window = new_window
             self.window_changed.emit(old_window, new_window)
 
     def _get_active_window(self) -> Optional[WindowInfo]:
-        """현재 활성 창 정보 가져오기 (xdotool 사용)"""
-        try:
-            # 활성 창 ID 가져오기
-            window_id = subprocess.run(
-                ['xdotool', 'getactivewindow'],
-                capture_output=True, text=True, timeout=1
-            ).stdout.strip()
-
-            if not window_id:
-                return None
-
-            # 창 제목 가져오기
-            title = subprocess.run(
-                ['xdotool', 'getwindowname', window_id],
-                capture_output=True, text=True, timeout=1
-            ).stdout.strip()
-
-            # 창의 PID 가져오기
-            pid_result = subprocess.run(
-                ['xdotool', 'getwindowpid', window_id],
-                capture_output=True, text=True, timeout=1
-            )
-            pid = pid_result.stdout.strip() if pid_result.returncode == 0 else ""
-
-            # 프로세스 이름 가져오기
-            process_name = ""
-            app_name = ""
-            if pid:
-                try:
-                    comm_result = subprocess.run(
-                        ['cat', f'/proc/{pid}/comm'],
-                        capture_output=True, text=True, timeout=1
-                    )
-                    process_name = comm_result.stdout.strip()
-                    app_name = process_name
-                except:
-                    pass
-
-            # WM_CLASS에서 앱 이름 가져오기 (더 정확함)
-            try:
-                xprop_result = subprocess.run(
-                    ['xprop', '-id', window_id, 'WM_CLASS'],
-                    capture_output=True, text=True, timeout=1
-                )
-                if xprop_result.returncode == 0:
-                    # WM_CLASS(STRING) = "instance", "class"
-                    match = re.search(r'"([^"]+)",\s*"([^"]+)"', xprop_result.stdout)
-                    if match:
-                        app_name = match.group(2)  # class name 사용
-            except:
-                pass
-
-            return WindowInfo(
-                window_id=window_id,
-                title=title,
-                app_name=app_name,
-                process_name=process_name
-            )
-
-        except subprocess.TimeoutExpired:
-            return None
-        except FileNotFoundError:
-            # xdotool이 설치되지 않은 경우
-            print("Error: xdotool이 설치되어 있지 않습니다.")
-            print("설치 명령어: sudo apt install xdotool")
-            return None
-        except Exception as e:
-            print(f"창 정보 가져오기 실패: {e}")
-            return None
+        """현재 활성 창 정보 가져오기 (프로브 지연 계측)"""
+        with metrics.timer("monitor.probe_seconds"):
+            window = self._probe_active_window()
+        if window is not None and self.browser_tabs is not None:
+            url = self.browser_tabs.url_for(window)
+            if url != window.url:
+                window = replace(window, url=url)
+        return window
+
+    def _probe_active_window(self) -> Optional[WindowInfo]:
+        """현재 활성 창 정보 가져오기 (선택된 백엔드)"""
+        return self.source.read_window() if self.source is not None else None
 
     def get_current_window(self) -> Optional[WindowInfo]:
         """현재 활성 창 정보 반환"""
         return self._current_window
 
+    def open_actions(self):
+        """선택된 백엔드의 창 조작 수단 (services.backends.actions, 시작 전이거나 없으면 None)"""
+        return self.source.open_actions() if self.source is not None else None
+
     @staticmethod
     def activate_window(window_id: str) -> bool:
         """특정 창을 활성화 (포커스 이동)"""
@@ -172,64 +170,166 @@ class WindowMonitor(QObject):
             return False
 
 
+class ClassifierRules(NamedTuple):
+    """컴파일된 분류 규칙 (불변)"""
+    # 제목 규칙 번호 → 카테고리 (entertainment 우선 정렬, 번호가 작을수록 우선)
+    title_categories: Tuple[Category, ...]
+    # 리터럴 제목 규칙 전체를 한 번에 검사하는 오토마톤
+    title_literals: AhoCorasick
+    # (번호, 컴파일된 정규식) - 리터럴이 아닌 제목 규칙만, 번호 순
+    title_regexes: Tuple[Tuple[int, Pattern], ...]
+    # (소문자 앱 이름, 카테고리)
+    app_rules: Tuple[Tuple[str, Category], ...]
+    # 도메인 → 카테고리 (탭 URL이 있는 창에 먼저 적용)
+    domain_rules: DomainTrie
+
+
+# 이보다 리터럴 제목 규칙이 적으면 오토마톤을 만들지 않음 (측정상 손익분기 약 6개)
+MIN_AUTOMATON_LITERALS = 6
+
+
+def make_category(category: dict) -> Category:
+    """카테고리 설정을 레코드로 (이름은 인터닝)"""
+    return Category(
+        symbols.intern(category['id']),
+        symbols.intern(category['name']),
+        symbols.intern(category['type'])
+    )
+
+
+def compile_rules(categories: List[dict]) -> ClassifierRules:
+    """카테고리 설정을 분류 규칙으로 컴파일 (정규식은 한 번만 컴파일)"""
+    # 카테고리마다 레코드 하나를 만들어 모든 규칙과 분류 결과가 공유
+    records = {id(category): make_category(category) for category in categories}
+
+    title_categories = []
+    literals = []
+    title_regexes = []
+    # entertainment를 먼저 배치해서 YouTube 등을 우선 감지
+    ordered = (
+        [c for c in categories if c.get('type') == 'entertainment'] +
+        [c for c in categories if c.get('type') != 'entertainment']
+    )
+    for category in ordered:
+        for pattern in category.get('title_patterns', []):
+            number = len(title_categories)
+            title_categories.append(records[id(category)])
+            # 단순 문자열은 오토마톤으로, 진짜 정규식만 정규식 엔진으로
+            literal = as_literal(pattern)
+            if literal is not None:
+                literals.append((literal, number, pattern))
+            else:
+                title_regexes.append((number, re.compile(pattern, re.IGNORECASE)))
+
+    # 리터럴이 몇 개 안 되면 파이썬 루프로 도는 오토마톤보다 정규식 몇 번이 빠름
+    if len(literals) < MIN_AUTOMATON_LITERALS:
+        title_regexes.extend((number, re.compile(pattern, re.IGNORECASE))
+                             for _, number, pattern in literals)
+        title_regexes.sort(key=lambda rule: rule[0])
+        literals = []
+
+    app_rules = []
+    for category in categories:
+        for app in category.get('apps', []):
+            app_rules.append((app.lower(), records[id(category)]))
+
+    # 같은 도메인이 여러 카테고리에 있으면 먼저 등록된 entertainment가 이김
+    domain_rules = DomainTrie()
+    for category in ordered:
+        for domain in category.get('domains', []):
+            domain_rules.add(domain, records[id(category)])
+
+    return ClassifierRules(
+        title_categories=tuple(title_categories),
+        title_literals=AhoCorasick((literal, number) for literal, number, _ in literals),
+        title_regexes=tuple(title_regexes),
+        app_rules=tuple(app_rules),
+        domain_rules=domain_rules
+    )
+
+
 class AppClassifier:
     """애플리케이션 분류기"""
 
-    def __init__(self, categories: List[dict]):
+    # 분류 결과 캐시 최대 크기 (넘으면 비움)
+    CACHE_SIZE = 1024
+
+    def __init__(self, categories: List[dict] = None, rules: ClassifierRules = None):
         """
         Args:
             categories: 카테고리 설정 리스트
                 [{"id": "coding", "name": "코딩", "type": "work",
-                  "apps": ["code", "vim"], "title_patterns": ["VSCode"]}]
+                  "apps": ["code", "vim"], "title_patterns": ["VSCode"],
+                  "domains": ["github.com"]}]
+            rules: 미리 컴파일된 규칙 (있으면 categories 대신 사용)
         """
-        self.categories = categories
-
-    def classify(self, window: WindowInfo) -> dict:
+        self.categories = categories or []
+        # 규칙이 주어지지 않으면 첫 분류 시점에 지연 컴파일
+        self._rules: Optional[ClassifierRules] = rules
+        # (제목, 앱 이름, 프로세스 이름, URL) -> 분류 결과
+        self._cache: dict = {}
+
+    def set_rules(self, rules: ClassifierRules):
+        """규칙 교체 (참조 하나만 바꾸므로 원자적)"""
+        self._rules = rules
+        self._cache = {}
+
+    def classify(self, window: WindowInfo) -> Category:
         """
         창 정보를 기반으로 카테고리 분류
 
+        규칙에 미리 만들어 둔 불변 레코드를 돌려주므로 분류마다 할당이 없다.
+
         Returns:
-            {"id": str, "name": str, "type": "work"|"entertainment"|"neutral"}
+            Category(id, name, type="work"|"entertainment"|"neutral")
         """
+        with metrics.timer("classifier.classify_seconds"):
+            key = (window.title, window.app_name, window.process_name, window.url)
+            cache = self._cache
+            result = cache.get(key)
+            if result is not None:
+                metrics.inc("classifier.cache_hits")
+                return result
+
+            metrics.inc("classifier.cache_misses")
+            result = self._classify_uncached(window)
+            if len(cache) >= self.CACHE_SIZE:
+                cache.clear()
+            cache[key] = result
+            return result
+
+    def _classify_uncached(self, window: WindowInfo) -> Category:
+        """규칙을 순서대로 적용해 분류"""
+        rules = self._rules
+        if rules is None:
+            rules = self._rules = compile_rules(self.categories)
+
+        # 0단계: 탭 URL이 있으면 도메인으로 매칭 (규칙 수와 무관하게 O(도메인 길이))
+        if window.url and rules.domain_rules:
+            category = rules.domain_rules.lookup_url(window.url)
+            if category is not None:
+                return category
+
         # 1단계: 창 제목 패턴으로 먼저 매칭 (브라우저 탭 감지용)
-        # entertainment를 먼저 체크해서 YouTube 등을 우선 감지
-        for category in self.categories:
-            if category.get('type') == 'entertainment':
-                for pattern in category.get('title_patterns', []):
-                    if re.search(pattern, window.title, re.IGNORECASE):
-                        return {
-                            "id": category['id'],
-                            "name": category['name'],
-                            "type": category['type']
-                        }
-
-        # 2단계: 나머지 카테고리의 창 제목 패턴 매칭
-        for category in self.categories:
-            if category.get('type') != 'entertainment':
-                for pattern in category.get('title_patterns', []):
-                    if re.search(pattern, window.title, re.IGNORECASE):
-                        return {
-                            "id": category['id'],
-                            "name": category['name'],
-                            "type": category['type']
-                        }
-
-        # 3단계: 앱 이름으로 매칭
+        # entertainment 패턴이 먼저 정렬되어 있고, 맞는 규칙 중 번호가 가장 작은 것이 이김
+        title = window.title
+        best = rules.title_literals.first_match(title) if rules.title_literals else None
+        for number, regex in rules.title_regexes:
+            if best is not None and number > best:
+                break
+            if regex.search(title):
+                best = number
+                break
+        if best is not None:
+            return rules.title_categories[best]
+
+        # 2단계: 앱 이름으로 매칭
         app_name_lower = window.app_name.lower()
         process_lower = window.process_name.lower()
 
-        for category in self.categories:
-            for app in category.get('apps', []):
-                if app.lower() in app_name_lower or app.lower() in process_lower:
-                    return {
-                        "id": category['id'],
-                        "name": category['name'],
-                        "type": category['type']
-                    }
+        for app, category in rules.app_rules:
+            if app in app_name_lower or app in process_lower:
+                return category
 
         # 매칭되지 않으면 neutral 반환
-        return {
-            "id": "neutral",
-            "name": "기타",
-            "type": "neutral"
-        }
+        return NEUTRAL_CATEGORY
@@ -0,0 +1,149 @@
+"""대시보드 차트 위젯 - 미리 집계된 값만 받아 그림 (services.dwell_rollup)"""
+from typing import List, Sequence, Tuple
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QRectF, QPointF
+from PySide6.QtGui import QPainter, QColor, QPolygonF
+
+# 카테고리 색 (분포 순위 순서로 사용)
+PALETTE = ("#6366f1", "#10b981", "#f59e0b", "#3b82f6", "#8b5cf6", "#14b8a6")
+ENTERTAINMENT_COLOR = "#ef4444"
+NEUTRAL_COLOR = "#9ca3af"
+TEXT_COLOR = "#6b7280"
+TRACK_COLOR = "#e5e7eb"
+
+
+def format_minutes(seconds: float) -> str:
+    """체류 시간 표시 (1h 05m / 25m)"""
+    minutes = int(seconds // 60)
+    if minutes >= 60:
+        return f"{minutes // 60}h {minutes % 60:02d}m"
+    return f"{minutes}m"
+
+
+class BarChart(QWidget):
+    """세로 막대 차트 (주간 집중 시간) - 막대 위에 값, 아래에 라벨"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._bars: List[Tuple[str, float]] = []
+        self.setMinimumHeight(96)
+
+    def set_data(self, bars: Sequence[Tuple[str, float]]):
+        """(라벨, 초) 목록"""
+        self._bars = list(bars)
+        self.setToolTip("\n".join(f"{label} {format_minutes(value)}" for label, value in self._bars))
+        self.update()
+
+    def paintEvent(self, event):
+        if not self._bars:
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        label_height = 16
+        top = 4
+        height = self.height() - label_height - top
+        slot = self.width() / len(self._bars)
+        width = min(slot * 0.6, 28)
+        peak = max(value for _, value in self._bars) or 1
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        for i, (label, value) in enumerate(self._bars):
+            x = slot * i + (slot - width) / 2
+            painter.setBrush(QColor(TRACK_COLOR))
+            painter.drawRoundedRect(QRectF(x, top, width, height), 3, 3)
+            filled = height * value / peak
+            if filled > 0:
+                painter.setBrush(QColor(PALETTE[0]))
+                painter.drawRoundedRect(QRectF(x, top + height - filled, width, filled), 3, 3)
+
+        painter.setPen(QColor(TEXT_COLOR))
+        for i, (label, _value) in enumerate(self._bars):
+            painter.drawText(QRectF(slot * i, self.height() - label_height, slot, label_height),
+                             Qt.AlignmentFlag.AlignCenter, label)
+        painter.end()
+
+
+class ShareBar(QWidget):
+    """한 줄 누적 막대 + 범례 (카테고리별 분포)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._parts: List[Tuple[str, float, str]] = []
+        self.setMinimumHeight(40)
+
+    def set_data(self, parts: Sequence[Tuple[str, float, str]]):
+        """(이름, 초, 색) 목록 (많은 순)"""
+        self._parts = [part for part in parts if part[1] > 0]
+        total = sum(value for _, value, _ in self._parts)
+        self.setToolTip("\n".join(f"{name} {value / total:.0%} ({format_minutes(value)})"
+                                  for name, value, _ in self._parts) if total else "")
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        bar_height = 10
+        total = sum(value for _, value, _ in self._parts)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(TRACK_COLOR))
+        painter.drawRoundedRect(QRectF(0, 0, self.width(), bar_height), 4, 4)
+        if not total:
+            painter.end()
+            return
+
+        x = 0.0
+        for _name, value, color in self._parts:
+            width = self.width() * value / total
+            painter.setBrush(QColor(color))
+            painter.drawRect(QRectF(x, 0, width, bar_height))
+            x += width
+
+        # 범례 (들어가는 만큼만)
+        x = 0.0
+        metrics = painter.fontMetrics()
+        for name, value, color in self._parts:
+            text = f"{name} {value / total:.0%}"
+            needed = 12 + metrics.horizontalAdvance(text) + 10
+            if x + needed > self.width():
+                break
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(color))
+            painter.drawEllipse(QRectF(x, bar_height + 10, 8, 8))
+            painter.setPen(QColor(TEXT_COLOR))
+            painter.drawText(QPointF(x + 12, bar_height + 18), text)
+            x += needed
+        painter.end()
+
+
+class Sparkline(QWidget):
+    """작은 꺾은선 (최근 반나절 작업 흐름)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._values: List[float] = []
+        self.setFixedHeight(24)
+
+    def set_values(self, values: Sequence[float]):
+        self._values = list(values)
+        self.update()
+
+    def paintEvent(self, event):
+        if len(self._values) < 2:
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        peak = max(self._values) or 1
+        step = (self.width() - 2) / (len(self._values) - 1)
+        height = self.height() - 4
+        points = [QPointF(1 + step * i, 2 + height * (1 - value / peak))
+                  for i, value in enumerate(self._values)]
+        area = QPolygonF([QPointF(1, self.height()), *points, QPointF(points[-1].x(), self.height())])
+        fill = QColor(PALETTE[0])
+        fill.setAlpha(40)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(fill)
+        painter.drawPolygon(area)
+        painter.setPen(QColor(PALETTE[0]))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawPolyline(QPolygonF(points))
+        painter.end()
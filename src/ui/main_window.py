@@ -1,4 +1,5 @@
 """메인 윈도우 UI"""
+from datetime import datetime
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QProgressBar, QFrame,
@@ -8,6 +9,13 @@ from PySide6.QtCore import Qt, QTimer, Slot
 from PySide6.QtGui import QFont, QIcon, QAction
 
 from services.session_manager import SessionManager, FocusSession
+from services.today_stats import TodayStats
+from services.focus_patterns import FocusPatterns
+from services.dwell_rollup import DwellRollup
+from ui.charts import (BarChart, ShareBar, Sparkline, PALETTE, ENTERTAINMENT_COLOR,
+                       NEUTRAL_COLOR, format_minutes)
+
+WEEKDAYS = "월화수목금토일"
 
 
 class StatsCard(QFrame):
@@ -37,14 +45,22 @@ class StatsCard(QFrame):
 class MainWindow(QMainWindow):
     """메인 윈도우"""
 
-    def __init__(self, session_manager: SessionManager):
+    def __init__(self, session_manager: SessionManager, today_stats: TodayStats = None,
+                 focus_patterns: FocusPatterns = None, dwell_rollup: DwellRollup = None):
         super().__init__()
         self.session_manager = session_manager
+        self.today_stats = today_stats or TodayStats(session_manager)
+        # 집중 시간 추천 (원격 세션 관리자로 붙은 경우 없음)
+        self.focus_patterns = focus_patterns
+        # 주간/카테고리별 차트 (원격 세션 관리자로 붙은 경우 없음)
+        self.dwell_rollup = dwell_rollup
+        self._suggestion_hour = None
 
         self._setup_ui()
         self._setup_tray()
         self._connect_signals()
-        self._update_stats()
+        self._update_stats(self.today_stats.stats)
+        self.refresh_suggestion()
 
         # UI 업데이트 타이머 (1초마다)
         self._ui_timer = QTimer()
@@ -54,7 +70,7 @@ class MainWindow(QMainWindow):
     def _setup_ui(self):
         """UI 구성"""
         self.setWindowTitle("Focus Guardian")
-        self.setFixedSize(400, 500)
+        self.setFixedSize(400, 720 if self.dwell_rollup else 500)
         self.setWindowFlags(Qt.WindowType.WindowCloseButtonHint | Qt.WindowType.WindowMinimizeButtonHint)
 
         # 중앙 위젯
@@ -117,6 +133,14 @@ class MainWindow(QMainWindow):
         time_layout.addStretch()
         layout.addLayout(time_layout)
 
+        # 집중 시간 추천 (누르면 적용)
+        self.suggest_btn = QPushButton()
+        self.suggest_btn.setObjectName("linkBtn")
+        self.suggest_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.suggest_btn.setVisible(False)
+        self.suggest_btn.clicked.connect(self._on_suggest_clicked)
+        layout.addWidget(self.suggest_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+
         # 버튼 영역
         btn_layout = QHBoxLayout()
         btn_layout.setSpacing(12)
@@ -166,11 +190,33 @@ class MainWindow(QMainWindow):
         stats_layout.addWidget(self.defense_card)
         layout.addLayout(stats_layout)
 
+        if self.dwell_rollup:
+            self._setup_charts(layout)
+
         layout.addStretch()
 
         # 스타일 적용
         self._apply_styles()
 
+    def _setup_charts(self, layout: QVBoxLayout):
+        """최근 7일 차트 (체류 시간 집계 셀만 읽음)"""
+        chart_header = QHBoxLayout()
+        title = QLabel("📈 최근 7일")
+        title.setFont(QFont("Sans", 14, QFont.Weight.Bold))
+        chart_header.addWidget(title)
+        chart_header.addStretch()
+        # 최근 12시간 작업 흐름 (30분 단위)
+        self.sparkline = Sparkline()
+        self.sparkline.setFixedWidth(120)
+        self.sparkline.setToolTip("최근 12시간 작업 창 체류 시간 (30분 단위)")
+        chart_header.addWidget(self.sparkline)
+        layout.addLayout(chart_header)
+
+        self.week_chart = BarChart()
+        layout.addWidget(self.week_chart)
+        self.share_bar = ShareBar()
+        layout.addWidget(self.share_bar)
+
     def _apply_styles(self):
         """전체 스타일 적용"""
         self.setStyleSheet("""
@@ -221,6 +267,16 @@ class MainWindow(QMainWindow):
                 background-color: #fef2f2;
             }
 
+            #linkBtn {
+                background-color: transparent;
+                color: #6366f1;
+                border: none;
+                font-size: 12px;
+            }
+            #linkBtn:hover {
+                text-decoration: underline;
+            }
+
             QSpinBox {
                 padding: 8px;
                 border: 1px solid #d1d5db;
@@ -255,6 +311,9 @@ class MainWindow(QMainWindow):
         self.session_manager.session_started.connect(self._on_session_started)
         self.session_manager.session_ended.connect(self._on_session_ended)
         self.session_manager.session_updated.connect(self._on_session_updated)
+        self.today_stats.stats_changed.connect(self._update_stats)
+        if self.dwell_rollup:
+            self.dwell_rollup.rollup_changed.connect(self._refresh_charts)
 
     def _on_tray_activated(self, reason):
         """트레이 아이콘 클릭"""
@@ -271,6 +330,31 @@ class MainWindow(QMainWindow):
         duration = self.duration_spin.value()
         self.session_manager.start_session(duration=duration)
 
+    @Slot()
+    def _on_suggest_clicked(self):
+        """추천 시간 적용"""
+        minutes = self.suggest_btn.property("minutes")
+        if minutes:
+            self.duration_spin.setValue(minutes)
+
+    def refresh_suggestion(self):
+        """지금 시간대 기준 추천 갱신 (메모리 통계만 사용)"""
+        self._suggestion_hour = datetime.now().hour
+        if not self.focus_patterns or self.session_manager.current_session:
+            self.suggest_btn.setVisible(False)
+            return
+        suggestion = self.focus_patterns.suggest_duration(
+            default=getattr(self.session_manager, 'default_duration', 45))
+        if suggestion.completion_rate is None:
+            # 데이터가 아직 부족함
+            self.suggest_btn.setVisible(False)
+            return
+        self.suggest_btn.setProperty("minutes", suggestion.minutes)
+        self.suggest_btn.setText(f"💡 추천 {suggestion.minutes}분 · 이 시간대 완료율 "
+                                 f"{suggestion.completion_rate:.0%}")
+        self.suggest_btn.setToolTip(f"집중 1시간당 전환 시도 {suggestion.distraction_rate:.1f}회")
+        self.suggest_btn.setVisible(True)
+
     @Slot()
     def _on_pause_clicked(self):
         """일시정지/재개 버튼"""
@@ -295,6 +379,7 @@ class MainWindow(QMainWindow):
         self.pause_btn.setVisible(True)
         self.stop_btn.setVisible(True)
         self.duration_spin.setEnabled(False)
+        self.suggest_btn.setVisible(False)
         self.status_label.setText("🎯 집중 중")
         self.status_label.setStyleSheet("color: #6366f1; font-size: 14px;")
 
@@ -305,6 +390,7 @@ class MainWindow(QMainWindow):
         self.pause_btn.setVisible(False)
         self.stop_btn.setVisible(False)
         self.duration_spin.setEnabled(True)
+        self.refresh_suggestion()
         self.progress_bar.setValue(0)
         self.timer_label.setText("00:00")
 
@@ -315,8 +401,6 @@ class MainWindow(QMainWindow):
             self.status_label.setText("준비됨")
             self.status_label.setStyleSheet("color: #6b7280; font-size: 14px;")
 
-        self._update_stats()
-
     @Slot(FocusSession)
     def _on_session_updated(self, session: FocusSession):
         """세션 업데이트"""
@@ -326,6 +410,8 @@ class MainWindow(QMainWindow):
         """UI 업데이트"""
         session = self.session_manager.current_session
         if not session:
+            if datetime.now().hour != self._suggestion_hour:
+                self.refresh_suggestion()
             return
 
         # 타이머 표시 (남은 시간을 초 단위로 계산)
@@ -337,14 +423,25 @@ class MainWindow(QMainWindow):
         # 프로그레스 바
         self.progress_bar.setValue(int(session.progress * 100))
 
-        # 상태
-        if session.paused:
+        # 상태 (원격 세션 관리자에는 뽀모도로 스케줄러가 없음)
+        scheduler = getattr(self.session_manager, 'phase_scheduler', None)
+        on_break = bool(scheduler and scheduler.running and scheduler.current.is_break)
+        if on_break:
+            rest = int(scheduler.remaining())
+            self.status_label.setText(f"☕ 휴식 중 ({rest // 60:02d}:{rest % 60:02d})")
+            self.status_label.setStyleSheet("color: #10b981; font-size: 14px;")
+            self.pause_btn.setText("휴식 건너뛰기")
+        elif session.paused:
             self.status_label.setText("⏸️ 일시정지")
             self.status_label.setStyleSheet("color: #f59e0b; font-size: 14px;")
+        elif scheduler and scheduler.running:
+            self.status_label.setText("🎯 집중 중")
+            self.status_label.setStyleSheet("color: #6366f1; font-size: 14px;")
+            self.pause_btn.setText("일시정지")
 
-    def _update_stats(self):
-        """통계 업데이트"""
-        stats = self.session_manager.db.get_today_stats()
+    @Slot(dict)
+    def _update_stats(self, stats: dict):
+        """통계 업데이트 (인메모리 모델 기준)"""
 
         # 총 집중 시간
         total_minutes = stats.get('total_focus_time', 0)
@@ -364,6 +461,33 @@ class MainWindow(QMainWindow):
         total = stats.get('total_switch_attempts', 0)
         self.defense_card.set_value(f"{blocked}/{total}")
 
+    @Slot()
+    def _refresh_charts(self):
+        """차트 갱신 (보이는 동안만, 기간과 무관하게 최근 7일 셀만 합산)"""
+        if not self.dwell_rollup or not self.isVisible():
+            return
+        rollup = self.dwell_rollup
+        self.week_chart.set_data([(WEEKDAYS[day.weekday()], seconds)
+                                  for day, seconds in rollup.daily_totals(7, 'work')])
+        work_colors = iter(PALETTE)
+        parts = []
+        for category, seconds in rollup.distribution(7):
+            if category.type == 'entertainment':
+                color = ENTERTAINMENT_COLOR
+            elif category.type == 'work':
+                color = next(work_colors, NEUTRAL_COLOR)
+            else:
+                color = NEUTRAL_COLOR
+            parts.append((category.name, seconds, color))
+        self.share_bar.set_data(parts)
+        values = rollup.sparkline.values('work')
+        self.sparkline.set_values(values)
+        self.sparkline.setToolTip(f"최근 12시간 작업 창 체류 시간: {format_minutes(sum(values) * 60)}")
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._refresh_charts()
+
     def closeEvent(self, event):
         """창 닫기 이벤트 - 트레이로 최소화"""
         event.ignore()
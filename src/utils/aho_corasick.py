@@ -0,0 +1,124 @@
+"""Aho-Corasick 다중 문자열 매처 - 여러 리터럴을 텍스트 한 번 훑기로 검사
+
+패턴마다 번호(우선순위)를 붙여 등록하고, 텍스트에 나타나는 패턴 중 가장 작은
+번호를 돌려준다. 대소문자는 re.IGNORECASE와 같은 기준으로 무시한다 (fold) - 대체하는
+정규식 경로와 분류 결과가 같아야 하므로 ß → ss 같은 확장 접기(casefold)는 하지 않는다.
+"""
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# 정규식 특수 문자가 없거나 모두 이스케이프된 패턴 (\. \- 등은 리터럴로 취급)
+_LITERAL = re.compile(r'(?:[^.^$*+?{}\[\]\\|()]|\\[^A-Za-z0-9])*')
+_ESCAPE = re.compile(r'\\(.)')
+
+
+# re.IGNORECASE가 소문자가 달라도 같은 글자로 보는 것들 (re._casefix) → 대표 글자 하나로
+_EQUIVALENTS = str.maketrans({
+    '\u0131': 'i', '\u017f': 's', '\u1e9b': '\u1e61', '\ufb05': '\ufb06',  # ı ſ ẛ ﬅ
+    '\u00b5': '\u03bc', '\u0345': '\u03b9', '\u1fbe': '\u03b9', '\u03c2': '\u03c3',  # µ ͅ ι ς
+    '\u03d0': '\u03b2', '\u03d1': '\u03b8', '\u03d5': '\u03c6', '\u03d6': '\u03c0',  # ϐ ϑ ϕ ϖ
+    '\u03f0': '\u03ba', '\u03f1': '\u03c1', '\u03f5': '\u03b5',  # ϰ ϱ ϵ
+    '\u1fd3': '\u0390', '\u1fe3': '\u03b0',  # ΐ ΰ
+    '\u1c80': '\u0432', '\u1c81': '\u0434', '\u1c82': '\u043e', '\u1c83': '\u0441',  # ᲀ ᲁ ᲂ ᲃ
+    '\u1c84': '\u0442', '\u1c85': '\u0442', '\u1c86': '\u044a', '\u1c87': '\u0463',  # ᲄ ᲅ ᲆ ᲇ
+    '\u1c88': '\ua64b',  # ᲈ
+})
+_HAS_EQUIVALENT = re.compile('[' + ''.join(map(chr, _EQUIVALENTS)) + ']')
+
+
+def fold(text: str) -> str:
+    """re.IGNORECASE와 같은 기준의 대소문자 접기 (글자 수가 바뀌지 않음)"""
+    if text.isascii():
+        return text.lower()
+    if '\u0130' in text:
+        # İ만 str.lower()가 두 글자(i + 윗점)가 됨 - 정규식은 i와 같은 글자로 봄
+        text = text.replace('\u0130', 'i')
+    text = text.lower()
+    if _HAS_EQUIVALENT.search(text):
+        text = text.translate(_EQUIVALENTS)
+    return text
+
+
+def as_literal(pattern: str) -> Optional[str]:
+    """정규식 패턴이 단순 문자열이면 그 문자열, 아니면 None"""
+    if not _LITERAL.fullmatch(pattern):
+        return None
+    return _ESCAPE.sub(r'\1', pattern)
+
+
+class AhoCorasick:
+    """번호 붙은 리터럴 집합에 대한 오토마톤 (불변, 피클 가능)"""
+
+    def __init__(self, patterns: Iterable[Tuple[str, int]]):
+        """
+        Args:
+            patterns: (리터럴, 번호) - 번호가 작을수록 우선
+        """
+        # 상태별 전이, 실패 링크, 해당 상태에서 끝나는 패턴 중 최소 번호 (실패 체인 포함)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._best: List[Optional[int]] = [None]
+        self._size = 0
+
+        for literal, number in patterns:
+            self._add(fold(literal), number)
+        self._build()
+
+    def _add(self, literal: str, number: int):
+        state = 0
+        for ch in literal:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._best.append(None)
+            state = next_state
+        best = self._best[state]
+        if best is None or number < best:
+            self._best[state] = number
+        self._size += 1
+
+    def _build(self):
+        """BFS로 실패 링크를 만들고 최소 번호를 실패 체인을 따라 전파"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(ch, 0)
+                self._fail[child] = fail if fail != child else 0
+                inherited = self._best[self._fail[child]]
+                if inherited is not None and (self._best[child] is None or inherited < self._best[child]):
+                    self._best[child] = inherited
+        # 빈 리터럴은 루트에 등록되어 모든 텍스트에 맞음 → 모든 상태에 전파
+        root_best = self._best[0]
+        if root_best is not None:
+            self._best = [root_best if b is None or root_best < b else b for b in self._best]
+
+    def first_match(self, text: str) -> Optional[int]:
+        """텍스트에 나타나는 패턴 중 가장 작은 번호 (없으면 None)"""
+        goto, fail, best_of = self._goto, self._fail, self._best
+        best = best_of[0]
+        if best == 0:
+            return 0
+        state = 0
+        for ch in fold(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            found = best_of[state]
+            if found is not None and (best is None or found < best):
+                best = found
+                if best == 0:
+                    break
+        return best
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,101 @@
+"""도메인 접미사 트라이 - 호스트 이름을 라벨 수에 비례하는 시간에 매칭
+
+라벨을 뒤에서부터 (com → youtube → www) 따라 내려가므로 규칙 수와 무관하다.
+
+패턴 규칙:
+    youtube.com     youtube.com과 모든 하위 도메인
+    *.netflix.com   하위 도메인만 (netflix.com 자체는 제외)
+여러 패턴이 맞으면 가장 긴(구체적인) 패턴이 이긴다.
+"""
+from typing import Any, Dict, Generic, Optional, TypeVar
+from urllib.parse import urlsplit
+
+
+T = TypeVar("T")
+
+
+class _Node:
+    __slots__ = ('children', 'exact', 'subdomains')
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.exact: Any = None  # 이 도메인 자체에 대한 값
+        self.subdomains: Any = None  # 하위 도메인에 대한 값
+
+
+def normalize_host(host: str) -> str:
+    """소문자, 끝의 점과 포트 제거"""
+    host = host.strip().lower().rstrip('.')
+    if ':' in host and not host.startswith('['):
+        host = host.split(':', 1)[0]
+    return host
+
+
+def host_from_url(url: str) -> Optional[str]:
+    """URL에서 호스트 이름 추출 (http/https가 아니면 None)"""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return None
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        return None
+    return normalize_host(parts.hostname)
+
+
+class DomainTrie(Generic[T]):
+    """역순 도메인 라벨 트라이"""
+
+    def __init__(self):
+        self._root = _Node()
+        self._size = 0
+
+    def add(self, pattern: str, value: T) -> bool:
+        """
+        패턴 등록 (같은 패턴이 이미 있으면 먼저 등록된 값 유지)
+
+        Returns:
+            새로 등록되었으면 True
+        """
+        pattern = normalize_host(pattern)
+        wildcard_only = pattern.startswith('*.')
+        if wildcard_only:
+            pattern = pattern[2:]
+        if not pattern:
+            raise ValueError("빈 도메인 패턴")
+
+        node = self._root
+        for label in reversed(pattern.split('.')):
+            node = node.children.setdefault(label, _Node())
+
+        added = False
+        if node.subdomains is None:
+            node.subdomains = value
+            added = True
+        if not wildcard_only and node.exact is None:
+            node.exact = value
+            added = True
+        self._size += added
+        return added
+
+    def lookup(self, host: str) -> Optional[T]:
+        """호스트 이름에 맞는 가장 구체적인 값 (없으면 None)"""
+        labels = normalize_host(host).split('.')
+        node = self._root
+        best = None
+        for i in range(len(labels) - 1, -1, -1):
+            node = node.children.get(labels[i])
+            if node is None:
+                break
+            if i == 0:
+                if node.exact is not None:
+                    best = node.exact
+            elif node.subdomains is not None:
+                best = node.subdomains
+        return best
+
+    def lookup_url(self, url: str) -> Optional[T]:
+        host = host_from_url(url)
+        return self.lookup(host) if host else None
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,182 @@
+"""핫 패스 계측 - 히스토그램과 카운터
+
+비활성 상태에서는 타이머가 공유 no-op 컨텍스트를 반환하므로
+계측 지점의 비용은 속성 조회와 함수 호출 하나 수준이다.
+"""
+import json
+import os
+import time
+from bisect import bisect_left
+from typing import Dict, Optional
+
+
+# 히스토그램 버킷 상한 (초) - 50µs ~ 5s
+BUCKET_BOUNDS = (
+    0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: int = 1):
+        self.value += amount
+
+    def to_dict(self) -> dict:
+        return {"type": "counter", "value": self.value}
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (초 단위 관측값)"""
+
+    __slots__ = ('buckets', 'count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)  # 마지막은 +Inf
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float):
+        self.buckets[bisect_left(BUCKET_BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """버킷 상한 기준 근사 분위수"""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return BUCKET_BOUNDS[i] if i < len(BUCKET_BOUNDS) else self.max
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "type": "histogram",
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": {
+                **{str(bound): n for bound, n in zip(BUCKET_BOUNDS, self.buckets)},
+                "+Inf": self.buckets[-1]
+            }
+        }
+
+
+class _Timer:
+    """히스토그램에 경과 시간을 기록하는 컨텍스트"""
+
+    __slots__ = ('histogram', 'start')
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start)
+        return False
+
+
+class _NullTimer:
+    """비활성 상태용 no-op 컨텍스트"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """메트릭 레지스트리"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._counters: Dict[str, Counter] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._started_at = time.time()
+
+    def counter(self, name: str) -> Counter:
+        """이름으로 카운터 가져오기 (없으면 생성)"""
+        counter = self._counters.get(name)
+        if counter is None:
+            counter = self._counters[name] = Counter()
+        return counter
+
+    def histogram(self, name: str) -> Histogram:
+        """이름으로 히스토그램 가져오기 (없으면 생성)"""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = Histogram()
+        return histogram
+
+    def inc(self, name: str, amount: int = 1):
+        """카운터 증가 (비활성 시 무시)"""
+        if self.enabled:
+            self.counter(name).inc(amount)
+
+    def observe(self, name: str, value: float):
+        """히스토그램 관측 (비활성 시 무시)"""
+        if self.enabled:
+            self.histogram(name).observe(value)
+
+    def timer(self, name: str):
+        """with 블록의 소요 시간을 기록하는 컨텍스트"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self.histogram(name))
+
+    def reset(self):
+        """모든 메트릭 초기화"""
+        self._counters.clear()
+        self._histograms.clear()
+        self._started_at = time.time()
+
+    def snapshot(self) -> dict:
+        """현재 메트릭을 JSON 직렬화 가능한 딕셔너리로"""
+        metrics = {name: c.to_dict() for name, c in self._counters.items()}
+        metrics.update({name: h.to_dict() for name, h in self._histograms.items()})
+        return {
+            "pid": os.getpid(),
+            "started_at": self._started_at,
+            "timestamp": time.time(),
+            "metrics": dict(sorted(metrics.items()))
+        }
+
+    def dump(self, path: str):
+        """메트릭을 JSON 파일로 저장 (임시 파일 후 교체)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(tmp_path, path)
+
+
+# 프로세스 전역 레지스트리
+metrics = MetricsRegistry()
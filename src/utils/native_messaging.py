@@ -0,0 +1,55 @@
+"""브라우저 네이티브 메시징 프레이밍 - 4바이트 길이(네이티브 바이트 순서) + UTF-8 JSON"""
+import json
+import struct
+from typing import BinaryIO, Optional
+
+
+# 호스트 → 브라우저 최대 크기는 1MB (Chrome/Firefox 공통), 받는 쪽도 같은 상한 적용
+MAX_MESSAGE_SIZE = 1024 * 1024
+
+_LENGTH = struct.Struct("=I")
+
+
+class FramingError(Exception):
+    """잘못된 프레임"""
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def read_message(stream: BinaryIO) -> Optional[dict]:
+    """메시지 하나 읽기 (스트림이 닫혔으면 None)"""
+    header = _read_exact(stream, _LENGTH.size)
+    if not header:
+        return None
+    if len(header) < _LENGTH.size:
+        raise FramingError("길이 헤더가 잘렸습니다")
+    (length,) = _LENGTH.unpack(header)
+    if length > MAX_MESSAGE_SIZE:
+        raise FramingError(f"메시지가 너무 큽니다: {length} 바이트")
+    body = _read_exact(stream, length)
+    if len(body) < length:
+        raise FramingError("메시지 본문이 잘렸습니다")
+    try:
+        message = json.loads(body)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise FramingError(f"잘못된 JSON: {e}")
+    if not isinstance(message, dict):
+        raise FramingError("메시지는 JSON 객체여야 합니다")
+    return message
+
+
+def write_message(stream: BinaryIO, message: dict):
+    """메시지 하나 쓰기"""
+    body = json.dumps(message, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    if len(body) > MAX_MESSAGE_SIZE:
+        raise FramingError(f"메시지가 너무 큽니다: {len(body)} 바이트")
+    stream.write(_LENGTH.pack(len(body)) + body)
+    stream.flush()
@@ -0,0 +1,285 @@
+"""프로세스 트리 - 창 PID에서 실제로 의미 있는 프로세스 이름 찾기
+
+터미널 창의 PID는 터미널 에뮬레이터, Electron/Flatpak 앱은 electron/bwrap 같은 포장
+프로세스라서 process_name만으로는 vim이나 Slack을 알 수 없다.
+
+- 터미널: 자식 셸의 /proc/<pid>/stat tpgid(터미널의 전경 프로세스 그룹)로 전경 작업을 찾음
+- 포장 프로세스: 명령줄(app.asar, 스크립트, flatpak 앱 ID) 또는 조상 중 포장이 아닌 프로세스
+
+조상 체인은 PID별로 캐시하고 시작 시각(starttime)이 같을 때만 재사용한다. 새 프로세스는
+부모의 캐시된 체인에 자신만 붙이므로 stat 한 번이면 되고, 창 전환마다 읽는 파일은 몇 개뿐이다.
+"""
+import os
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+class ProcInfo(NamedTuple):
+    """/proc/<pid>/stat 중 필요한 값"""
+    pid: int
+    ppid: int
+    pgrp: int
+    tpgid: int   # 제어 터미널의 전경 프로세스 그룹 (터미널이 없으면 -1)
+    start: int   # 부팅 후 시작 시각 (clock tick) - PID 재사용 확인용
+    comm: str
+
+
+# 터미널 에뮬레이터 (comm은 15자에서 잘림)
+TERMINALS = frozenset((
+    'gnome-terminal-', 'gnome-terminal', 'konsole', 'xterm', 'uxterm', 'urxvt', 'rxvt',
+    'alacritty', 'kitty', 'tilix', 'terminator', 'wezterm-gui', 'foot', 'st',
+    'xfce4-terminal', 'mate-terminal', 'lxterminal', 'qterminal', 'terminology',
+    'kgx', 'ptyxis', 'ptyxis-agent', 'ghostty',
+))
+SHELLS = frozenset(('sh', 'bash', 'zsh', 'fish', 'dash', 'ksh', 'tcsh', 'csh', 'nu', 'xonsh'))
+# 이름만으로는 무슨 앱인지 알 수 없는 포장/런타임 프로세스
+GENERIC_HOSTS = frozenset((
+    'electron', 'electron32', 'node', 'nodejs', 'bwrap', 'flatpak', 'flatpak-spawn',
+    'python', 'python3', 'java', 'wine', 'wine64', 'wine64-preloader', 'wine-preloader',
+    'mono', 'dotnet', 'env', 'snap', 'sudo', 'steam-runtime', 'appimagelaunche',
+))
+# 조상을 거슬러 올라갈 때 여기서 멈춤
+ROOTS = frozenset(('systemd', 'init', 'gnome-shell', 'plasmashell', 'kwin_x11',
+                   'xfce4-session', 'gnome-session-b', 'sddm', 'gdm', 'lightdm', 'xinit'))
+# 명령줄에서 이름으로 쓰기엔 의미 없는 파일/디렉터리 이름
+_GENERIC_PARTS = frozenset(('app', 'main', 'index', 'cli', '__main__', 'resources', 'lib',
+                            'lib64', 'bin', 'usr', 'opt', 'share', 'dist', 'out', 'build'))
+# 값을 하나 받는 런타임 옵션 (python -W/-X, java -cp, node -r) - 값은 위치 인자가 아님
+_VALUE_FLAGS = frozenset(('-W', '-X', '-cp', '-classpath', '--class-path', '-p', '--module-path',
+                          '--add-modules', '-r', '--require'))
+# 명령줄에 코드를 직접 넘기는 옵션 (python -c, node -e) - 이름으로 쓸 인자가 없음
+_CODE_FLAGS = frozenset(('-c', '-e', '--eval'))
+
+
+def _is_generic(comm: str) -> bool:
+    comm = comm.lower()
+    return comm in GENERIC_HOSTS or comm.startswith('python3.')
+
+
+def _stem(path: str) -> str:
+    name = os.path.basename(path.rstrip('/'))
+    for suffix in ('.asar', '.jar', '.js', '.mjs', '.py', '.exe', '.appimage', '.AppImage', '.dll'):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def name_from_cmdline(args: List[str]) -> Optional[str]:
+    """포장 프로세스 명령줄에서 앱 이름 추출 (못 찾으면 None)"""
+    if not args:
+        return None
+    host = os.path.basename(args[0]).lower()
+    rest = args[1:]
+    if host in ('flatpak', 'flatpak-spawn'):
+        # flatpak run [옵션] com.slack.Slack [인자]
+        if 'run' in rest:
+            for arg in rest[rest.index('run') + 1:]:
+                if not arg.startswith('-'):
+                    return arg.rsplit('.', 1)[-1]
+        return None
+    if host == 'bwrap' and '--' in rest:
+        rest = rest[rest.index('--') + 1:]
+        return _stem(rest[0]) if rest else None
+    skip = False
+    for i, arg in enumerate(rest):
+        if skip:
+            skip = False
+            continue
+        if arg in _CODE_FLAGS:
+            return None
+        if arg == '-m' and i + 1 < len(rest):
+            # python -m 모듈
+            return rest[i + 1].split('.', 1)[0]
+        if arg == '-jar' and i + 1 < len(rest):
+            # java -jar 앱.jar
+            return _name_from_path(rest[i + 1])
+        if arg in _VALUE_FLAGS:
+            skip = True
+            continue
+        if arg.startswith('-'):
+            continue
+        return _name_from_path(arg)
+    return None
+
+
+def _name_from_path(arg: str) -> Optional[str]:
+    """위치 인자 경로에서 이름 - 의미 없는 이름이면 위 디렉터리 이름 사용
+    (/usr/lib/slack/resources/app.asar → slack)"""
+    parts = [part for part in arg.split('/') if part]
+    while parts:
+        name = _stem(parts.pop())
+        if name and name.lower() not in _GENERIC_PARTS:
+            return name
+    return None
+
+
+class ProcessTree:
+    """/proc 기반 조상/자식 조회와 창 프로세스 이름 해석 (캐시)"""
+
+    # 캐시 최대 크기 (넘으면 비움)
+    CACHE_SIZE = 1024
+    # 조상을 거슬러 올라갈 최대 깊이
+    MAX_DEPTH = 16
+
+    def __init__(self, proc_root: str = '/proc'):
+        self.proc_root = proc_root
+        # PID → 조상 체인 (자신부터 위로)
+        self._ancestry: Dict[int, Tuple[ProcInfo, ...]] = {}
+        # (PID, 시작 시각) → 명령줄에서 찾은 이름 (없으면 '')
+        self._cmdline_names: Dict[Tuple[int, int], str] = {}
+        # task/*/children을 못 읽는 커널이면 /proc 전체 스캔으로 대신함
+        self._children_supported = True
+
+    # === /proc 읽기 ===
+    def stat(self, pid: int) -> Optional[ProcInfo]:
+        """/proc/<pid>/stat 읽기 (프로세스가 없으면 None)"""
+        try:
+            with open(f'{self.proc_root}/{pid}/stat', 'rb') as f:
+                data = f.read().decode('utf-8', 'replace')
+        except OSError:
+            return None
+        # comm에 공백이나 ')'가 들어갈 수 있으므로 마지막 ')' 기준으로 자름
+        close = data.rfind(')')
+        fields = data[close + 2:].split()
+        try:
+            return ProcInfo(pid, int(fields[1]), int(fields[2]), int(fields[5]), int(fields[19]),
+                            data[data.find('(') + 1:close])
+        except (IndexError, ValueError):
+            return None
+
+    def cmdline(self, pid: int) -> List[str]:
+        try:
+            with open(f'{self.proc_root}/{pid}/cmdline', 'rb') as f:
+                data = f.read()
+        except OSError:
+            return []
+        return [arg.decode('utf-8', 'replace') for arg in data.split(b'\0') if arg]
+
+    def children(self, pid: int) -> List[int]:
+        """직계 자식 PID (스레드가 만든 자식 포함)"""
+        if self._children_supported:
+            try:
+                tasks = os.listdir(f'{self.proc_root}/{pid}/task')
+            except OSError:
+                return []
+            result = []
+            try:
+                for task in tasks:
+                    with open(f'{self.proc_root}/{pid}/task/{task}/children') as f:
+                        result.extend(int(child) for child in f.read().split())
+                return result
+            except FileNotFoundError:
+                self._children_supported = False
+            except OSError:
+                return result
+        # CONFIG_PROC_CHILDREN이 없는 커널 - 전체 스캔 (느리지만 터미널 창에서만)
+        result = []
+        for entry in os.listdir(self.proc_root):
+            if entry.isdigit():
+                info = self.stat(int(entry))
+                if info and info.ppid == pid:
+                    result.append(info.pid)
+        return result
+
+    # === 조상 ===
+    def ancestry(self, pid: int) -> Tuple[ProcInfo, ...]:
+        """
+        자신부터 위로 조상 체인 (없는 프로세스면 빈 튜플)
+
+        자신의 stat은 매번 읽고(tpgid가 바뀌므로), 시작 시각이 캐시와 같으면 나머지는
+        캐시를 쓴다. 새 프로세스는 부모의 캐시된 체인을 이어 붙인다.
+        """
+        info = self.stat(pid)
+        if info is None:
+            self._ancestry.pop(pid, None)
+            return ()
+        cached = self._ancestry.get(pid)
+        if cached and cached[0].start == info.start:
+            return (info,) + cached[1:]
+
+        chain = [info]
+        current = info
+        while len(chain) < self.MAX_DEPTH and current.ppid > 1:
+            parent_chain = self._ancestry.get(current.ppid)
+            # 부모는 자식보다 먼저 시작했어야 함 (아니면 PID가 재사용된 것)
+            if parent_chain and parent_chain[0].start <= current.start:
+                chain.extend(parent_chain[:self.MAX_DEPTH - len(chain)])
+                break
+            parent = self.stat(current.ppid)
+            if parent is None:
+                break
+            chain.append(parent)
+            current = parent
+
+        if len(self._ancestry) + len(chain) > self.CACHE_SIZE:
+            self._ancestry.clear()
+        result = tuple(chain)
+        # 새로 읽은 조상도 등록 (형제 프로세스는 부모 체인을 그대로 씀)
+        for i in range(len(result) - 1, -1, -1):
+            self._ancestry.setdefault(result[i].pid, result[i:])
+        self._ancestry[pid] = result
+        return result
+
+    # === 이름 해석 ===
+    def _cmdline_name(self, proc: ProcInfo) -> str:
+        key = (proc.pid, proc.start)
+        name = self._cmdline_names.get(key)
+        if name is None:
+            name = name_from_cmdline(self.cmdline(proc.pid)) or ''
+            if len(self._cmdline_names) >= self.CACHE_SIZE:
+                self._cmdline_names.clear()
+            self._cmdline_names[key] = name
+        return name
+
+    def _host_name(self, chain: Tuple[ProcInfo, ...]) -> Optional[str]:
+        """포장 프로세스의 앱 이름 - 명령줄, 없으면 포장이 아닌 가장 가까운 조상"""
+        name = self._cmdline_name(chain[0])
+        if name:
+            return name
+        for ancestor in chain[1:]:
+            comm = ancestor.comm.lower()
+            if comm in ROOTS or comm in TERMINALS or comm in SHELLS:
+                break
+            if not _is_generic(comm):
+                return ancestor.comm
+        return None
+
+    def _foreground(self, terminal: ProcInfo, title: str) -> Optional[str]:
+        """터미널의 전경 작업 이름 (모든 셸이 프롬프트 상태면 None)"""
+        title = title.lower()
+        candidates = []
+        for child_pid in self.children(terminal.pid):
+            shell = self.stat(child_pid)
+            # tpgid가 셸 자신의 그룹이면 프롬프트에서 대기 중
+            if shell is None or shell.tpgid <= 0 or shell.tpgid == shell.pgrp:
+                continue
+            job = self.stat(shell.tpgid)
+            if job is None:
+                continue
+            name = job.comm
+            if _is_generic(name):
+                # python/node 스크립트는 스크립트 이름, 그것도 없으면(REPL 등) 터미널 그대로
+                name = self._cmdline_name(job)
+                if not name:
+                    continue
+            candidates.append((name.lower() in title, job.start, name))
+        if not candidates:
+            return None
+        # 탭이 여러 개면 창 제목에 이름이 보이는 작업, 없으면 가장 최근에 시작한 작업
+        return max(candidates)[2]
+
+    def resolve(self, pid: int, title: str = '') -> Optional[str]:
+        """
+        창 프로세스 대신 분류에 쓸 이름
+
+        Returns:
+            터미널이면 전경 작업, 포장 프로세스면 실제 앱 이름, 그 외/못 찾으면 None
+        """
+        chain = self.ancestry(pid)
+        if not chain:
+            return None
+        comm = chain[0].comm.lower()
+        if comm in TERMINALS:
+            return self._foreground(chain[0], title)
+        if _is_generic(comm):
+            return self._host_name(chain)
+        return None
@@ -0,0 +1,43 @@
+"""시작 단계별 시간 측정"""
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+
+class StartupProfiler:
+    """시작 단계별 소요 시간 기록기 (비활성 시 기록하지 않음)"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._origin = time.perf_counter()
+        self._stages: List[Tuple[str, float, float]] = []  # (이름, 시작 오프셋, 소요 시간)
+
+    @contextmanager
+    def stage(self, name: str):
+        """단계 측정 컨텍스트"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self._stages.append((name, start - self._origin, end - start))
+
+    def mark(self, name: str):
+        """시작 시점 기준 이정표 기록"""
+        if self.enabled:
+            self._stages.append((name, time.perf_counter() - self._origin, 0.0))
+
+    def report(self, stream=None):
+        """단계별 소요 시간 출력"""
+        if not self.enabled:
+            return
+        stream = stream or sys.stderr
+        print("[startup] stage                         at(ms)   took(ms)", file=stream)
+        for name, offset, duration in self._stages:
+            print(f"[startup] {name:<28} {offset * 1000:8.1f} {duration * 1000:10.1f}", file=stream)
+        total = time.perf_counter() - self._origin
+        print(f"[startup] {'total':<28} {total * 1000:8.1f}", file=stream)
@@ -0,0 +1,42 @@
+"""심볼 테이블 - 자주 반복되는 문자열을 하나의 인스턴스로 공유
+
+폴링마다 subprocess 출력에서 새로 만들어지는 앱/프로세스 이름을 테이블의
+인스턴스로 바꿔서, 오래 살아남는 객체(캐시 키, 세션, 기록)가 같은 문자열을
+가리키게 한다. sys.intern과 달리 크기에 상한이 있다.
+"""
+from typing import Dict, Optional
+
+
+class SymbolTable:
+    """문자열 인터닝 테이블"""
+
+    def __init__(self, max_size: int = 4096):
+        """
+        Args:
+            max_size: 최대 심볼 수 (넘으면 비움 - 종류가 적은 문자열 전용)
+        """
+        self.max_size = max_size
+        self._table: Dict[str, str] = {}
+
+    def intern(self, value: Optional[str]) -> Optional[str]:
+        """테이블의 같은 문자열 반환 (없으면 등록)"""
+        if value is None:
+            return None
+        table = self._table
+        symbol = table.get(value)
+        if symbol is not None:
+            return symbol
+        if len(table) >= self.max_size:
+            table.clear()
+        # setdefault는 원자적이라 파이프라인 스레드에서 불러도 안전
+        return table.setdefault(value, value)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def clear(self):
+        self._table.clear()
+
+
+# 전역 심볼 테이블
+symbols = SymbolTable()
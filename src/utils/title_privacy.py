@@ -0,0 +1,139 @@
+"""창 제목 개인정보 처리 - 정규화 + 키 기반 BLAKE2 해시
+
+같은 키로 해시한 제목은 같은 값이 되므로 "같은 창에 얼마나 머물렀나" 같은 분석은
+그대로 할 수 있고, 키가 없으면 흔한 제목을 사전 대입해서 되돌릴 수도 없다.
+키는 설치마다 무작위로 만들어 데이터베이스 옆에 저장한다.
+"""
+import os
+import re
+import hashlib
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional
+
+
+# 제목 저장 방식: off (저장 안 함), hash (키 해시), plain (원문)
+TITLE_MODES = ('off', 'hash', 'plain')
+
+KEY_PATH = Path.home() / ".config" / "focus-guardian" / "title.key"
+KEY_SIZE = 32
+
+# 앞쪽 알림 카운터/배지: "(3) Discord", "[12] Inbox", "● main.py", "* notes.txt"
+_LEADING_BADGE = re.compile(r'^(?:\s*(?:[(\[]\d+\+?[)\]]|[●•◦⬤*]+))+\s*')
+# 구분자나 끝 앞의 카운터: "Inbox (12) - Mail", "Slack | general (3)"
+_INLINE_COUNTER = re.compile(r'\s*\(\d+\+?\)(?=\s*(?:[-—|·:]\s|$))')
+_SPACES = re.compile(r'\s+')
+# 검색 색인 단어 (FTS5 unicode61 토크나이저와 같은 기준)
+_WORDS = re.compile(r'\w+')
+
+
+def fold_word(word: str) -> str:
+    """해시 전에 단어 정규화 - 평문 색인의 unicode61 remove_diacritics 2처럼 악센트를 떼고
+    대소문자를 접음 (Résumé → resume). 한글 음절은 다시 조합해서 그대로 둠"""
+    decomposed = unicodedata.normalize('NFKD', word)
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return unicodedata.normalize('NFC', stripped).casefold()
+
+
+def normalize_title(title: str) -> str:
+    """알림 카운터/읽지 않음 배지를 지우고 공백 정리"""
+    title = _LEADING_BADGE.sub('', title)
+    title = _INLINE_COUNTER.sub('', title)
+    return _SPACES.sub(' ', title).strip()
+
+
+def search_words(text: str) -> List[str]:
+    """검색어/제목 → 단어 목록"""
+    return _WORDS.findall(text)
+
+
+def load_or_create_key(path: Path = KEY_PATH) -> bytes:
+    """해시 키 읽기 (없으면 생성, 소유자만 읽기 가능)"""
+    path = Path(path)
+    try:
+        key = path.read_bytes()
+        if len(key) == KEY_SIZE:
+            return key
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    key = os.urandom(KEY_SIZE)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(key)
+    return key
+
+
+class TitleProcessor:
+    """제목 → 저장할 값 (원문 제목별로 결과를 기억)"""
+
+    # 기억할 원문 제목 수 (넘으면 비움)
+    MEMO_SIZE = 4096
+
+    def __init__(self, mode: str = 'hash', key: bytes = None, normalize: bool = True,
+                 digest_size: int = 16):
+        """
+        Args:
+            mode: 'off' | 'hash' | 'plain'
+            key: BLAKE2 키 (hash 모드에서 필수, 최대 64바이트)
+            normalize: 카운터/배지 제거 여부
+            digest_size: 해시 길이 (바이트)
+        """
+        if mode not in TITLE_MODES:
+            raise ValueError(f"알 수 없는 제목 저장 방식: {mode}")
+        if mode == 'hash' and not key:
+            raise ValueError("hash 모드에는 키가 필요합니다")
+        self.mode = mode
+        self.normalize = normalize
+        self._key = key
+        self._digest_size = digest_size
+        self._memo: Dict[str, Optional[str]] = {}
+
+    @classmethod
+    def from_config(cls, privacy: Mapping, key_path: Path = KEY_PATH) -> "TitleProcessor":
+        """설정의 privacy 블록으로 생성 (hash 모드일 때만 키 파일 접근)"""
+        mode = privacy.get('store_titles', 'hash')
+        return cls(
+            mode=mode,
+            key=load_or_create_key(key_path) if mode == 'hash' else None,
+            normalize=privacy.get('normalize_titles', True)
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != 'off'
+
+    def process(self, title: Optional[str]) -> Optional[str]:
+        """저장할 제목 (off 모드이거나 제목이 없으면 None)"""
+        if not title or self.mode == 'off':
+            return None
+        memo = self._memo
+        result = memo.get(title)
+        if result is not None:
+            return result
+
+        value = normalize_title(title) if self.normalize else title
+        if self.mode == 'hash':
+            value = hashlib.blake2b(value.encode('utf-8'), key=self._key,
+                                    digest_size=self._digest_size).hexdigest()
+        if len(memo) >= self.MEMO_SIZE:
+            memo.clear()
+        memo[title] = value
+        return value
+
+    def term(self, word: str) -> str:
+        """검색 색인용 단어 하나 (hash 모드는 단어별 키 해시 - 같은 단어는 같은 토큰)"""
+        if self.mode != 'hash':
+            # 평문은 FTS5 토크나이저가 악센트/대소문자를 접음
+            return word.lower()
+        word = fold_word(word)
+        return 'h' + hashlib.blake2b(word.encode('utf-8'), key=self._key, digest_size=8).hexdigest()
+
+    def index_terms(self, title: Optional[str]) -> Optional[str]:
+        """검색 색인에 넣을 제목 (off 모드이거나 제목이 없으면 None)"""
+        if not title or self.mode == 'off':
+            return None
+        value = normalize_title(title) if self.normalize else title
+        if self.mode == 'plain':
+            return value
+        return ' '.join(self.term(word) for word in search_words(value))
@@ -0,0 +1,97 @@
+"""창 활동 트레이스 파일 포맷
+
+gzip으로 압축한 JSON Lines. 첫 줄은 헤더이고 이후 각 줄은 다음 중 하나다.
+    ["s", "문자열"]                               문자열 테이블에 추가 (인덱스는 등장 순서)
+    [dt_ms, window_id, title, app_name, process_name]
+                                                  이전 이벤트 이후 dt_ms 밀리초 뒤의 활성 창
+                                                  (문자열 자리에는 문자열 테이블 인덱스)
+같은 제목과 앱 이름이 반복되므로 문자열 테이블만으로도 크기가 크게 줄어든다.
+"""
+import gzip
+import json
+from typing import Iterable, Iterator, NamedTuple
+
+
+TRACE_FORMAT = "focus-guardian-trace"
+TRACE_VERSION = 1
+
+
+class TraceEvent(NamedTuple):
+    """트레이스 이벤트 - t초 시점에 활성 창이 바뀜"""
+    t: float
+    window_id: str
+    title: str
+    app_name: str
+    process_name: str
+
+
+class TraceWriter:
+    """트레이스 파일 쓰기"""
+
+    def __init__(self, path: str, meta: dict = None):
+        self._file = gzip.open(path, 'wt', encoding='utf-8')
+        self._strings = {}
+        self._last_ms = 0
+        header = {"format": TRACE_FORMAT, "version": TRACE_VERSION}
+        if meta:
+            header["meta"] = meta
+        self._write(header)
+
+    def _write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+        self._file.write("\n")
+
+    def _intern(self, text: str) -> int:
+        index = self._strings.get(text)
+        if index is None:
+            index = self._strings[text] = len(self._strings)
+            self._write(["s", text])
+        return index
+
+    def write(self, event: TraceEvent):
+        """이벤트 추가 (시간 순서대로)"""
+        t_ms = int(round(event.t * 1000))
+        fields = [self._intern(event.window_id), self._intern(event.title),
+                  self._intern(event.app_name), self._intern(event.process_name)]
+        self._write([t_ms - self._last_ms] + fields)
+        self._last_ms = t_ms
+
+    def write_all(self, events: Iterable[TraceEvent]):
+        for event in events:
+            self.write(event)
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def read_trace(path: str) -> Iterator[TraceEvent]:
+    """트레이스 파일 읽기 (스트리밍)"""
+    strings = []
+    t_ms = 0
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        header = json.loads(f.readline())
+        if header.get("format") != TRACE_FORMAT or header.get("version") != TRACE_VERSION:
+            raise ValueError(f"지원하지 않는 트레이스 파일: {path}")
+        for line in f:
+            record = json.loads(line)
+            if record[0] == "s":
+                strings.append(record[1])
+                continue
+            t_ms += record[0]
+            yield TraceEvent(t_ms / 1000, *(strings[i] for i in record[1:5]))
+
+
+def read_trace_meta(path: str) -> dict:
+    """트레이스 헤더의 메타데이터"""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return json.loads(f.readline()).get("meta", {})
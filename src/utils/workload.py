@@ -0,0 +1,131 @@
+"""합성 창 전환 워크로드 생성기
+
+체류 시간은 로그정규분포, 창 안의 제목 변화(탭 이동, 알림 카운터 등)는
+지수분포 간격으로 발생시키고, 일정 확률로 최근 창들 사이를 빠르게 오가는
+alt-tab 버스트를 섞는다. 같은 시드는 항상 같은 트레이스를 만든다.
+"""
+import math
+import random
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+from utils.traces import TraceEvent
+
+
+class AppProfile(NamedTuple):
+    """생성 대상 앱"""
+    kind: str  # 'work' | 'entertainment' | 'neutral'
+    app_name: str
+    process_name: str
+    titles: Tuple[str, ...]  # {n}은 임의 숫자로 치환
+    dwell_median: float  # 체류 시간 중앙값 (초)
+    churn_interval: float  # 제목 변화 평균 간격 (초), 0이면 변화 없음
+
+
+APPS: Tuple[AppProfile, ...] = (
+    AppProfile("work", "Code", "code",
+               ("{n}.py - project - Visual Studio Code", "README.md - project - Visual Studio Code"),
+               90, 45),
+    AppProfile("work", "jetbrains-pycharm", "pycharm",
+               ("project – models/{n}.py", "project – tests/test_{n}.py"), 120, 60),
+    AppProfile("work", "Gnome-terminal", "gnome-terminal-",
+               ("user@host: ~/project", "user@host: ~/project/src/{n}", "vim notes-{n}.md"), 40, 20),
+    AppProfile("work", "firefox", "firefox",
+               ("Issue #{n} · org/project · GitHub — Mozilla Firefox",
+                "python - How to {n} - Stack Overflow — Mozilla Firefox",
+                "Documentation {n} — Mozilla Firefox"), 50, 25),
+    AppProfile("entertainment", "firefox", "firefox",
+               ("Video {n} - YouTube — Mozilla Firefox", "Twitch — Mozilla Firefox",
+                "Home / Twitter — Mozilla Firefox"), 150, 40),
+    AppProfile("entertainment", "discord", "discord",
+               ("#general | Server {n} - Discord", "({n}) Discord"), 60, 15),
+    AppProfile("entertainment", "Slack", "slack",
+               ("Slack | general | Team", "({n}) Slack | random | Team"), 45, 15),
+    AppProfile("neutral", "Nautilus", "nautilus", ("Downloads", "Documents/{n}"), 15, 0),
+    AppProfile("neutral", "Gnome-control-center", "gnome-control-center", ("Settings",), 20, 0),
+)
+
+# 프로필별 앱 종류 가중치
+MIXES: Dict[str, Dict[str, float]] = {
+    "work": {"work": 0.85, "entertainment": 0.05, "neutral": 0.10},
+    "mixed": {"work": 0.60, "entertainment": 0.25, "neutral": 0.15},
+    "entertainment": {"work": 0.20, "entertainment": 0.70, "neutral": 0.10},
+}
+
+
+class WorkloadGenerator:
+    """통계적으로 그럴듯한 창 전환 트레이스 생성기"""
+
+    def __init__(
+        self,
+        mix: str = "mixed",
+        seed: int = 0,
+        burst_probability: float = 0.15,
+        dwell_sigma: float = 1.0
+    ):
+        """
+        Args:
+            mix: 'work' | 'mixed' | 'entertainment'
+            seed: 난수 시드 (재현용)
+            burst_probability: 전환 시 alt-tab 버스트가 일어날 확률
+            dwell_sigma: 체류 시간 로그정규분포의 sigma
+        """
+        if mix not in MIXES:
+            raise ValueError(f"알 수 없는 워크로드 혼합: {mix} (가능: {', '.join(MIXES)})")
+        self.mix = mix
+        self.seed = seed
+        self.burst_probability = burst_probability
+        self.dwell_sigma = dwell_sigma
+        self._rng = random.Random(seed)
+        self._by_kind: Dict[str, List[AppProfile]] = {}
+        for app in APPS:
+            self._by_kind.setdefault(app.kind, []).append(app)
+        # 앱별 창 ID (같은 앱은 같은 창으로 재방문)
+        self._window_ids: Dict[AppProfile, str] = {
+            app: str(0x3a00003 + i * 0x100000) for i, app in enumerate(APPS)
+        }
+
+    def _pick_app(self) -> AppProfile:
+        weights = MIXES[self.mix]
+        kind = self._rng.choices(list(weights), weights=list(weights.values()))[0]
+        return self._rng.choice(self._by_kind[kind])
+
+    def _title(self, app: AppProfile) -> str:
+        return self._rng.choice(app.titles).replace("{n}", str(self._rng.randrange(1, 500)))
+
+    def _dwell(self, app: AppProfile) -> float:
+        return self._rng.lognormvariate(math.log(app.dwell_median), self.dwell_sigma)
+
+    def _event(self, t: float, app: AppProfile, title: str) -> TraceEvent:
+        return TraceEvent(t, self._window_ids[app], title, app.app_name, app.process_name)
+
+    def generate(self, duration: float) -> Iterator[TraceEvent]:
+        """duration초 분량의 이벤트 생성"""
+        t = 0.0
+        recent: List[Tuple[AppProfile, str]] = []
+        while t < duration:
+            app = self._pick_app()
+            title = self._title(app)
+            yield self._event(t, app, title)
+            recent = ([(app, title)] + [r for r in recent if r[0] is not app])[:4]
+
+            # 체류 중 제목 변화
+            end = t + self._dwell(app)
+            if app.churn_interval > 0:
+                t_churn = t + self._rng.expovariate(1 / app.churn_interval)
+                while t_churn < end and t_churn < duration:
+                    title = self._title(app)
+                    yield self._event(t_churn, app, title)
+                    t_churn += self._rng.expovariate(1 / app.churn_interval)
+            t = end
+
+            # alt-tab 버스트: 최근 창들 사이를 0.2~1.5초 간격으로 오감
+            if len(recent) > 1 and self._rng.random() < self.burst_probability:
+                for _ in range(self._rng.randint(2, 6)):
+                    t += self._rng.uniform(0.2, 1.5)
+                    if t >= duration:
+                        break
+                    burst_app, burst_title = self._rng.choice(recent[1:])
+                    yield self._event(t, burst_app, burst_title)
+                    recent.remove((burst_app, burst_title))
+                    recent.insert(0, (burst_app, burst_title))
+                t += self._rng.uniform(0.2, 1.5)
@@ -9,6 +9,11 @@ update-desktop-database ~/.local/share/applications/ 2>/dev/null || true
 
 echo "✓ 앱 바로가기 제거 완료"
 
+# 브라우저 네이티브 메시징 호스트 등록 해제
+rm -f ~/.mozilla/native-messaging-hosts/focus_guardian.json
+rm -f ~/.config/google-chrome/NativeMessagingHosts/focus_guardian.json
+rm -f ~/.config/chromium/NativeMessagingHosts/focus_guardian.json
+
 # 설정 파일 제거 여부 확인
 read -p "설정 및 데이터도 삭제하시겠습니까? (y/N): " -n 1 -r
 echo